@@ -0,0 +1,9 @@
+"""Performance benchmarks for the analysis pipeline.
+
+Standalone runner (no pytest-benchmark dependency):
+
+    python -m benchmarks.run --charts 10000 --out benchmarks/results/latest.json
+    python -m benchmarks.compare benchmarks/baseline.json benchmarks/results/latest.json
+
+See benchmarks/README.md.
+"""
@@ -0,0 +1,183 @@
+"""Analysis-service benchmark.
+
+Replays the charts written by the pillars suite through
+``SajuOrchestrator.analyze`` and times every ``_call_*`` stage, the
+pillars-pure phase, the Stage-3 engines and ``KoreanLabelEnricher``
+(``overlay``, which the orchestrators call, and ``enrich``) inside it. Each analysis result is then fed to ``LLMGuardV11.decide``.
+``tests/golden_cases/*.json`` and ``tests/llm_guard_v1.1_cases.jsonl`` are
+replayed on their own.
+
+    python -m benchmarks.analysis_suite --charts-in charts.jsonl --out analysis.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+for _path in (
+    REPO_ROOT,
+    REPO_ROOT / "services" / "analysis-service",
+    REPO_ROOT / "services" / "common",
+):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
+
+from app.core.climate_advice import ClimateAdvice  # noqa: E402
+from app.core.gyeokguk_classifier import GyeokgukClassifier  # noqa: E402
+from app.core.luck_flow import LuckFlow  # noqa: E402
+from app.core.pattern_profiler import PatternProfiler  # noqa: E402
+from app.core.saju_orchestrator import SajuOrchestrator  # noqa: E402
+from app.guard.llm_guard_v1_1 import LLMGuardV11  # noqa: E402
+
+from benchmarks.stats import StageRecorder  # noqa: E402
+
+GOLDEN_CASES_DIR = REPO_ROOT / "tests" / "golden_cases"
+GUARD_CASES_PATH = REPO_ROOT / "tests" / "llm_guard_v1.1_cases.jsonl"
+GUARD_POLICY_PATH = REPO_ROOT / "policy" / "llm_guard_policy_v1.1.json"
+
+# Fixed candidate answer so LLMGuardV11 runs its full rule chain on every chart
+CANDIDATE_ANSWER = "일간의 힘이 중화에 가깝고, 용신을 보완하는 흐름이 도움이 될 수 있습니다."
+
+STAGE3_ENGINES = ("luck_flow", "gyeokguk", "climate_advice", "pattern")
+
+
+class _TimedProxy:
+    """Forwards to ``target`` with some methods timed (engines may use __slots__)."""
+
+    def __init__(self, target, **timed) -> None:
+        self._target = target
+        for method, fn in timed.items():
+            setattr(self, method, fn)
+
+    def __getattr__(self, name):
+        return getattr(self._target, name)
+
+
+def instrument(orchestrator: SajuOrchestrator, recorder: StageRecorder) -> None:
+    """Wrap the orchestrator's stage methods on the instance (class is untouched)."""
+    for name in dir(orchestrator):
+        if name.startswith("_call_"):
+            stage = f"orchestrator.{name[len('_call_'):]}"
+            setattr(orchestrator, name, recorder.wrap(stage, getattr(orchestrator, name)))
+    orchestrator._analyze_pillars = recorder.wrap(
+        "orchestrator.pillars_phase", orchestrator._analyze_pillars
+    )
+    for attr in STAGE3_ENGINES:
+        engine = getattr(orchestrator, attr)
+        timed = recorder.wrap(f"orchestrator.stage3.{attr}", engine.run)
+        setattr(orchestrator, attr, _TimedProxy(engine, run=timed))
+    korean = orchestrator.korean
+    orchestrator.korean = _TimedProxy(
+        korean,
+        overlay=recorder.wrap("KoreanLabelEnricher.overlay", korean.overlay),
+        enrich=recorder.wrap("KoreanLabelEnricher.enrich", korean.enrich),
+    )
+
+
+def _guard_payload(result: dict) -> dict:
+    # The guard's "evidence" is the full analysis (strength/relations/ten_gods/...)
+    return {
+        "evidence": result,
+        "candidate_answer": CANDIDATE_ANSWER,
+        "engine_summaries": result.get("engine_summaries", {}),
+        "policy_context": {"locale": "ko-KR"},
+    }
+
+
+def run_charts(charts_in: Path, warmup: int, pillars_cache_size: int, recorder: StageRecorder):
+    orchestrator = SajuOrchestrator(pillars_cache_size=pillars_cache_size)
+    instrument(orchestrator, recorder)
+    guard = LLMGuardV11(GUARD_POLICY_PATH)
+
+    with charts_in.open(encoding="utf-8") as fh:
+        charts = [json.loads(line) for line in fh if line.strip()]
+
+    # Warm-up replays the head of the chart set unrecorded
+    recorder.enabled = False
+    for chart in charts[:warmup]:
+        orchestrator.analyze(chart["pillars"], chart["birth_context"])
+    recorder.enabled = True
+
+    for chart in charts:
+        result = recorder.time(
+            "SajuOrchestrator.analyze",
+            orchestrator.analyze,
+            chart["pillars"],
+            chart["birth_context"],
+        )
+        if result.get("status") != "success":
+            recorder.error("SajuOrchestrator.analyze")
+            continue
+        recorder.time("LLMGuardV11.decide", guard.decide, _guard_payload(result))
+    return len(charts)
+
+
+def run_golden(repeat: int, recorder: StageRecorder) -> int:
+    engines = {
+        "luck_flow": LuckFlow(),
+        "gyeokguk": GyeokgukClassifier(),
+        "climate_advice": ClimateAdvice(),
+        "pattern": PatternProfiler(),
+    }
+    cases = [
+        json.loads(path.read_text(encoding="utf-8"))
+        for path in sorted(GOLDEN_CASES_DIR.glob("case_*.json"))
+    ]
+    for _ in range(repeat):
+        for case in cases:
+            for name, engine in engines.items():
+                recorder.time(f"golden.stage3.{name}", engine.run, case)
+    return len(cases)
+
+
+def run_guard_cases(repeat: int, recorder: StageRecorder) -> int:
+    guard = LLMGuardV11(GUARD_POLICY_PATH)
+    payloads = []
+    with GUARD_CASES_PATH.open(encoding="utf-8") as fh:
+        for line in fh:
+            if not line.strip():
+                continue
+            payload = dict(json.loads(line)["input"])
+            payload.setdefault(
+                "candidate_answer", (payload.get("llm_output") or {}).get("text", "")
+            )
+            payloads.append(payload)
+    for _ in range(repeat):
+        for payload in payloads:
+            recorder.time("golden.LLMGuardV11.decide", guard.decide, payload)
+    return len(payloads)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--charts-in", type=Path, required=True)
+    parser.add_argument("--warmup", type=int, default=50)
+    parser.add_argument("--golden-repeat", type=int, default=100)
+    parser.add_argument(
+        "--pillars-cache",
+        type=int,
+        default=0,
+        help="Orchestrator pillars cache size (default 0: every chart runs every engine)",
+    )
+    parser.add_argument("--out", type=Path, required=True)
+    args = parser.parse_args()
+
+    recorder = StageRecorder()
+    charts = run_charts(args.charts_in, args.warmup, args.pillars_cache, recorder)
+    golden = run_golden(args.golden_repeat, recorder)
+    guard_cases = run_guard_cases(args.golden_repeat, recorder)
+
+    result = {
+        "suite": "analysis",
+        "inputs": {"charts": charts, "golden_cases": golden, "guard_cases": guard_cases},
+        "stages": recorder.summary(),
+    }
+    args.out.write_text(json.dumps(result, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Compare a benchmark report against a baseline; exit 1 on regression.
+
+    python -m benchmarks.compare benchmarks/baseline.json benchmarks/results/latest.json
+    python -m benchmarks.compare BASE CURRENT --tolerance 0.10 --metrics p50_ms p99_ms
+
+A stage regresses when a metric exceeds ``baseline * (1 + tolerance)`` and
+the absolute increase is above ``--min-delta-ms``, so sub-microsecond stages
+do not fail on timer noise. Stages missing from the current report fail too;
+new stages are listed but never fail.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+DEFAULT_METRICS = ("p50_ms", "p95_ms")
+DEFAULT_TOLERANCE = 0.20
+DEFAULT_MIN_DELTA_MS = 0.05
+
+
+@dataclass(frozen=True, slots=True)
+class Regression:
+    stage: str
+    metric: str
+    baseline: float | None
+    current: float | None
+
+    def describe(self) -> str:
+        if self.current is None:
+            return f"{self.stage}: missing from current report"
+        ratio = self.current / self.baseline if self.baseline else float("inf")
+        return (
+            f"{self.stage} {self.metric}: {self.baseline:.3f} -> {self.current:.3f} ms "
+            f"({ratio:.2f}x)"
+        )
+
+
+def compare(
+    baseline: Dict[str, Dict[str, float]],
+    current: Dict[str, Dict[str, float]],
+    metrics: Sequence[str] = DEFAULT_METRICS,
+    tolerance: float = DEFAULT_TOLERANCE,
+    min_delta_ms: float = DEFAULT_MIN_DELTA_MS,
+) -> List[Regression]:
+    """Return the regressions of ``current`` stage stats against ``baseline``."""
+    regressions: List[Regression] = []
+    for stage, base in baseline.items():
+        cur = current.get(stage)
+        if cur is None:
+            regressions.append(Regression(stage, "", None, None))
+            continue
+        for metric in metrics:
+            b, c = base[metric], cur[metric]
+            if c > b * (1.0 + tolerance) and c - b > min_delta_ms:
+                regressions.append(Regression(stage, metric, b, c))
+    return regressions
+
+
+def _load_stages(path: Path) -> Dict[str, Dict[str, float]]:
+    return json.loads(path.read_text(encoding="utf-8"))["stages"]
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare benchmark reports.")
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("current", type=Path)
+    parser.add_argument("--metrics", nargs="+", default=list(DEFAULT_METRICS))
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--min-delta-ms", type=float, default=DEFAULT_MIN_DELTA_MS)
+    args = parser.parse_args(argv)
+
+    baseline = _load_stages(args.baseline)
+    current = _load_stages(args.current)
+    regressions = compare(baseline, current, args.metrics, args.tolerance, args.min_delta_ms)
+
+    for stage in sorted(set(current) - set(baseline)):
+        print(f"new stage (not compared): {stage}")
+    if regressions:
+        print(f"{len(regressions)} regression(s) beyond {args.tolerance:.0%}:")
+        for regression in regressions:
+            print(f"  {regression.describe()}")
+        return 1
+    print(f"No regressions across {len(baseline)} stages ({', '.join(args.metrics)}).")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+"""Pillars-service benchmark: ``PillarsEngine.compute`` over the synthetic charts.
+
+Runs in its own interpreter (pillars-service and analysis-service both ship a
+top-level ``app`` package). Besides the timings it writes the resulting
+charts as JSONL, which the analysis suite replays.
+
+    python -m benchmarks.pillars_suite --charts 10000 --charts-out charts.jsonl --out pillars.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+for _path in (
+    REPO_ROOT,
+    REPO_ROOT / "services" / "pillars-service",
+    REPO_ROOT / "services" / "common",
+):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
+
+from app.core.engine import PillarsEngine  # noqa: E402
+from app.models import PillarsComputeRequest  # noqa: E402
+
+from benchmarks.charts import DEFAULT_SEED, synthetic_births  # noqa: E402
+from benchmarks.stats import StageRecorder  # noqa: E402
+
+STAGE = "PillarsEngine.compute"
+
+
+def run(charts: int, seed: int, warmup: int, charts_out: Path) -> dict:
+    engine = PillarsEngine()
+    recorder = StageRecorder()
+
+    with charts_out.open("w", encoding="utf-8") as fh:
+        for i, birth in enumerate(synthetic_births(charts + warmup, seed)):
+            recorder.enabled = i >= warmup
+            request = PillarsComputeRequest(
+                localDateTime=birth["local_dt"], timezone=birth["timezone"]
+            )
+            try:
+                response = recorder.time(STAGE, engine.compute, request)
+            except Exception:
+                recorder.error(STAGE)
+                continue
+            if i < warmup:
+                continue
+            pillars = response.pillars
+            aware = birth["local_dt"].replace(tzinfo=ZoneInfo(birth["timezone"]))
+            chart = {
+                "pillars": {
+                    "year": pillars.year.pillar,
+                    "month": pillars.month.pillar,
+                    "day": pillars.day.pillar,
+                    "hour": pillars.hour.pillar,
+                },
+                "birth_context": {
+                    "birth_dt": aware.isoformat(),
+                    "gender": birth["gender"],
+                    "timezone": birth["timezone"],
+                },
+            }
+            fh.write(json.dumps(chart, ensure_ascii=False) + "\n")
+
+    return {"suite": "pillars", "stages": recorder.summary()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--charts", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--warmup", type=int, default=50)
+    parser.add_argument("--charts-out", type=Path, required=True)
+    parser.add_argument("--out", type=Path, required=True)
+    args = parser.parse_args()
+
+    result = run(args.charts, args.seed, args.warmup, args.charts_out)
+    args.out.write_text(json.dumps(result, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
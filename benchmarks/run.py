@@ -0,0 +1,133 @@
+"""Run every benchmark suite and write one JSON report.
+
+    python -m benchmarks.run                       # 10k charts -> benchmarks/results/latest.json
+    python -m benchmarks.run --charts 2000 --write-baseline
+
+Each suite runs in a fresh interpreter because pillars-service and
+analysis-service both expose a top-level ``app`` package.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+
+from benchmarks.charts import DEFAULT_SEED
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+BENCH_DIR = REPO_ROOT / "benchmarks"
+DEFAULT_OUT = BENCH_DIR / "results" / "latest.json"
+BASELINE_PATH = BENCH_DIR / "baseline.json"
+REPORT_SCHEMA = "saju-bench/1"
+
+
+def _run_suite(module: str, *args: str) -> None:
+    cmd = [sys.executable, "-m", module, *args]
+    env = dict(os.environ, PYTHONPATH=str(REPO_ROOT))
+    subprocess.run(cmd, cwd=REPO_ROOT, env=env, check=True)
+
+
+def _git_revision() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def run(args: argparse.Namespace) -> dict:
+    with tempfile.TemporaryDirectory(prefix="saju-bench-") as tmp:
+        tmp_dir = Path(tmp)
+        charts = tmp_dir / "charts.jsonl"
+        pillars_out = tmp_dir / "pillars.json"
+        analysis_out = tmp_dir / "analysis.json"
+
+        _run_suite(
+            "benchmarks.pillars_suite",
+            f"--charts={args.charts}",
+            f"--seed={args.seed}",
+            f"--warmup={args.warmup}",
+            f"--charts-out={charts}",
+            f"--out={pillars_out}",
+        )
+        _run_suite(
+            "benchmarks.analysis_suite",
+            f"--charts-in={charts}",
+            f"--warmup={args.warmup}",
+            f"--golden-repeat={args.golden_repeat}",
+            f"--pillars-cache={args.pillars_cache}",
+            f"--out={analysis_out}",
+        )
+        pillars = json.loads(pillars_out.read_text(encoding="utf-8"))
+        analysis = json.loads(analysis_out.read_text(encoding="utf-8"))
+
+    return {
+        "schema": REPORT_SCHEMA,
+        "meta": {
+            "created_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "git_revision": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "charts": args.charts,
+            "seed": args.seed,
+            "warmup": args.warmup,
+            "golden_repeat": args.golden_repeat,
+            "pillars_cache": args.pillars_cache,
+            "inputs": analysis.get("inputs", {}),
+        },
+        "stages": {**pillars["stages"], **analysis["stages"]},
+    }
+
+
+def print_table(report: dict) -> None:
+    header = f"{'stage':<44}{'count':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'ops/s':>11}"
+    print(header)
+    print("-" * len(header))
+    for stage, s in report["stages"].items():
+        print(
+            f"{stage:<44}{s['count']:>8}{s['p50_ms']:>10.3f}{s['p95_ms']:>10.3f}"
+            f"{s['p99_ms']:>10.3f}{s['throughput_per_s']:>11.1f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the saju benchmark suites.")
+    parser.add_argument("--charts", type=int, default=10_000, help="synthetic charts (default 10k)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--warmup", type=int, default=50)
+    parser.add_argument("--golden-repeat", type=int, default=100)
+    parser.add_argument("--pillars-cache", type=int, default=0)
+    parser.add_argument("--out", type=Path, default=DEFAULT_OUT)
+    parser.add_argument(
+        "--write-baseline",
+        action="store_true",
+        help=f"also write the report to {BASELINE_PATH.relative_to(REPO_ROOT)}",
+    )
+    args = parser.parse_args()
+
+    report = run(args)
+    text = json.dumps(report, indent=2, ensure_ascii=False) + "\n"
+    args.out.parent.mkdir(parents=True, exist_ok=True)
+    args.out.write_text(text, encoding="utf-8")
+    if args.write_baseline:
+        BASELINE_PATH.write_text(text, encoding="utf-8")
+
+    print_table(report)
+    print(f"\nReport written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
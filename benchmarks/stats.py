@@ -0,0 +1,78 @@
+"""Per-stage latency recorder and percentile summary (stdlib only)."""
+
+from __future__ import annotations
+
+import functools
+import math
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, List
+
+_clock = time.perf_counter
+
+
+def percentile(sorted_samples: List[float], q: float) -> float:
+    """Nearest-rank percentile of an ascending list (q in 0..100)."""
+    if not sorted_samples:
+        return 0.0
+    rank = max(1, math.ceil(q / 100.0 * len(sorted_samples)))
+    return sorted_samples[rank - 1]
+
+
+class StageRecorder:
+    """Collects wall-time samples per named stage.
+
+    Recording can be paused (``enabled = False``) so warm-up iterations run
+    through the same wrapped callables without being counted.
+    """
+
+    def __init__(self) -> None:
+        self.samples: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.enabled = True
+
+    def record(self, stage: str, seconds: float) -> None:
+        if self.enabled:
+            self.samples[stage].append(seconds)
+
+    def time(self, stage: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        start = _clock()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            self.record(stage, _clock() - start)
+
+    def wrap(self, stage: str, fn: Callable[..., Any]) -> Callable[..., Any]:
+        """Return ``fn`` timed under ``stage`` on every call."""
+
+        @functools.wraps(fn)
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            start = _clock()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.record(stage, _clock() - start)
+
+        return timed
+
+    def error(self, stage: str) -> None:
+        if self.enabled:
+            self.errors[stage] += 1
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """p50/p95/p99/mean/max in milliseconds and serial throughput per stage."""
+        out: Dict[str, Dict[str, float]] = {}
+        for stage in sorted(self.samples):
+            samples = sorted(self.samples[stage])
+            total = sum(samples)
+            out[stage] = {
+                "count": len(samples),
+                "errors": self.errors.get(stage, 0),
+                "p50_ms": round(percentile(samples, 50) * 1e3, 4),
+                "p95_ms": round(percentile(samples, 95) * 1e3, 4),
+                "p99_ms": round(percentile(samples, 99) * 1e3, 4),
+                "mean_ms": round(total / len(samples) * 1e3, 4),
+                "max_ms": round(samples[-1] * 1e3, 4),
+                "throughput_per_s": round(len(samples) / total, 1) if total > 0 else 0.0,
+            }
+        return out
@@ -5,6 +5,7 @@ Tests ALL engines with real data - NO stubs or hardcoded values
 """
 import json
 import sys
+from collections.abc import Mapping
 from datetime import datetime
 from pathlib import Path
 
@@ -57,6 +58,7 @@ print("STEP 2: Run Full Orchestrator")
 print("-" * 80)
 
 try:
+    from app.core.records import json_default
     from app.core.saju_orchestrator import SajuOrchestrator
 
     orchestrator = SajuOrchestrator()
@@ -129,9 +131,9 @@ for engine_name in engines:
         engine_result = result[engine_name]
 
         # Pretty print based on type
-        if isinstance(engine_result, dict):
+        if isinstance(engine_result, Mapping):
             # Show key structure
-            print(f"Type: dict with {len(engine_result)} keys")
+            print(f"Type: {type(engine_result).__name__} with {len(engine_result)} keys")
             print(f"Keys: {list(engine_result.keys())}")
 
             # Show sample values for important keys
@@ -264,6 +266,6 @@ print("=" * 80)
 # Save full result to file
 output_file = Path(__file__).parent / "test_result_2000_09_14_full.json"
 with open(output_file, "w", encoding="utf-8") as f:
-    json.dump(result, f, ensure_ascii=False, indent=2)
+    json.dump(result, f, ensure_ascii=False, indent=2, default=json_default)
 
 print(f"Full result saved to: {output_file}")
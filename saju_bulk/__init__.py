@@ -0,0 +1,7 @@
+"""Bulk chart export: stream birth records through the pillars and analysis engines.
+
+    saju-bulk births.csv charts.jsonl --workers 8
+    python -m saju_bulk births.jsonl charts.parquet --format parquet --resume
+
+See saju_bulk/README.md.
+"""
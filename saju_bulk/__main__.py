@@ -0,0 +1,3 @@
+from saju_bulk.cli import main
+
+main()
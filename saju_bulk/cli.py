@@ -0,0 +1,268 @@
+"""``saju-bulk``: export charts for a CSV/JSONL file of birth records.
+
+    saju-bulk births.csv charts.jsonl --workers 8
+    saju-bulk births.jsonl charts.parquet --format parquet
+    saju-bulk births.csv charts.jsonl --resume          # continue after a crash
+    saju-bulk births.csv pillars.jsonl --pillars-only   # skip SajuOrchestrator
+
+Input records need ``local_datetime`` (or ``birth_dt``); ``id``, ``timezone``
+(default Asia/Seoul) and ``gender`` are optional. Records are read lazily and
+sent to a ``ProcessPoolExecutor`` in chunks; at most ``2 x workers`` chunks
+are in flight, and results are written in input order, so memory stays
+bounded by the chunk size regardless of the input length. Rows that fail get
+an ``error`` field instead of pillars; the run carries on. Rows whose analysis
+came back with ``status: error`` count as errors as well.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from itertools import count, islice
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from saju_bulk import engines
+from saju_bulk.sinks import (
+    FORMATS,
+    INPUT_FORMATS,
+    Checkpoint,
+    detect_input_format,
+    open_sink,
+    read_records,
+)
+
+DEFAULT_CHUNK_SIZE = 256
+DEFAULT_PART_ROWS = 50_000
+INFLIGHT_PER_WORKER = 2
+
+
+@dataclass
+class BulkConfig:
+    input: Path
+    output: Path
+    format: str = "jsonl"
+    input_format: Optional[str] = None
+    workers: int = 1
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+    analysis: bool = True
+    resume: bool = False
+    limit: Optional[int] = None
+    part_rows: int = DEFAULT_PART_ROWS
+    progress_interval: float = 5.0
+
+
+@dataclass
+class BulkStats:
+    rows: int = 0
+    errors: int = 0
+    resumed_from: int = 0
+    seconds: float = 0.0
+    rows_per_s: float = 0.0
+    complete: bool = False
+
+
+class _Progress:
+    """Prints rows/s to stderr at most every ``interval`` seconds."""
+
+    def __init__(self, stats: BulkStats, interval: float) -> None:
+        self.stats = stats
+        self.interval = interval
+        self.start = time.perf_counter()
+        self._last = self.start
+
+    def update(self, final: bool = False) -> None:
+        now = time.perf_counter()
+        self.stats.seconds = round(now - self.start, 3)
+        elapsed = max(now - self.start, 1e-9)
+        self.stats.rows_per_s = round(self.stats.rows / elapsed, 1)
+        if self.interval > 0 and (final or now - self._last >= self.interval):
+            self._last = now
+            print(
+                f"[saju-bulk] {self.stats.resumed_from + self.stats.rows} rows"
+                f"  {self.stats.rows_per_s:.1f} rows/s  errors={self.stats.errors}",
+                file=sys.stderr,
+                flush=True,
+            )
+
+
+def _is_error(row: Dict[str, Any]) -> bool:
+    if "error" in row:
+        return True
+    analysis = row.get("analysis")
+    return isinstance(analysis, dict) and analysis.get("status") == "error"
+
+
+def _chunks(
+    records: Iterator[Dict[str, Any]], first_row: int, size: int
+) -> Iterator[List[Tuple[int, Dict[str, Any]]]]:
+    numbered = zip(count(first_row), records)
+    while True:
+        chunk = list(islice(numbered, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _load_checkpoint(config: BulkConfig, input_path: str) -> Checkpoint:
+    fresh = Checkpoint(input=input_path, format=config.format, analysis=config.analysis)
+    if not config.resume:
+        return fresh
+    checkpoint = Checkpoint.load(config.output)
+    if checkpoint is None:
+        return fresh
+    if (checkpoint.input, checkpoint.format, checkpoint.analysis) != (
+        fresh.input,
+        fresh.format,
+        fresh.analysis,
+    ):
+        raise ValueError(
+            f"{Checkpoint.path_for(config.output)} belongs to a different run "
+            f"(input={checkpoint.input}, format={checkpoint.format}, "
+            f"analysis={checkpoint.analysis})"
+        )
+    return checkpoint
+
+
+def run(config: BulkConfig) -> BulkStats:
+    """Export every record of ``config.input``; returns throughput statistics."""
+    config.input = config.input.resolve()
+    config.output = config.output.resolve()
+    input_format = config.input_format or detect_input_format(config.input)
+
+    checkpoint = _load_checkpoint(config, str(config.input))
+    stats = BulkStats(resumed_from=checkpoint.rows_done)
+    if checkpoint.complete:
+        stats.complete = True
+        return stats
+
+    records = islice(read_records(config.input, input_format), checkpoint.rows_done, None)
+    if config.limit is not None:
+        records = islice(records, config.limit)
+    chunks = _chunks(records, checkpoint.rows_done, config.chunk_size)
+
+    sink = open_sink(config.format, config.output, checkpoint, config.part_rows)
+    progress = _Progress(stats, config.progress_interval)
+
+    def write(rows: List[Dict[str, Any]]) -> None:
+        sink.write(rows)
+        stats.rows += len(rows)
+        stats.errors += sum(1 for r in rows if _is_error(r))
+        if sink.pending() >= sink.commit_rows:
+            sink.commit(checkpoint)
+            checkpoint.rows_done = stats.resumed_from + stats.rows
+            checkpoint.save(config.output)
+        progress.update()
+
+    try:
+        if config.workers <= 0:
+            _run_inline(config, chunks, write)
+        else:
+            _run_pool(config, chunks, write)
+        sink.commit(checkpoint)
+        checkpoint.rows_done = stats.resumed_from + stats.rows
+        # A --limit run stops early on purpose; leave it resumable
+        checkpoint.complete = config.limit is None or stats.rows < config.limit
+        checkpoint.save(config.output)
+    finally:
+        sink.close()
+
+    stats.complete = checkpoint.complete
+    progress.update(final=True)
+    return stats
+
+
+def _run_inline(
+    config: BulkConfig,
+    chunks: Iterator[List[Tuple[int, Dict[str, Any]]]],
+    write: Callable[[List[Dict[str, Any]]], None],
+) -> None:
+    worker = engines.BulkWorker(analysis=config.analysis)
+    for chunk in chunks:
+        write(worker.process(chunk))
+
+
+def _run_pool(
+    config: BulkConfig,
+    chunks: Iterator[List[Tuple[int, Dict[str, Any]]]],
+    write: Callable[[List[Dict[str, Any]]], None],
+) -> None:
+    max_inflight = config.workers * INFLIGHT_PER_WORKER
+    with ProcessPoolExecutor(
+        max_workers=config.workers,
+        initializer=engines.init_worker,
+        initargs=(config.analysis,),
+    ) as pool:
+        inflight: deque = deque()
+        for chunk in chunks:
+            inflight.append(pool.submit(engines.process_chunk, chunk))
+            if len(inflight) >= max_inflight:
+                write(inflight.popleft().result())
+        while inflight:
+            write(inflight.popleft().result())
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="saju-bulk", description="Export pillars and analysis for many birth records."
+    )
+    parser.add_argument("input", type=Path, help="CSV (with header) or JSONL birth records")
+    parser.add_argument("output", type=Path, help="JSONL file or Parquet directory")
+    parser.add_argument("--format", choices=FORMATS, default=None, help="output format")
+    parser.add_argument("--input-format", choices=INPUT_FORMATS, default=None)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="worker processes (0 runs in-process)",
+    )
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument(
+        "--part-rows",
+        type=int,
+        default=DEFAULT_PART_ROWS,
+        help="rows per Parquet part file (each part is a commit)",
+    )
+    parser.add_argument("--pillars-only", action="store_true", help="skip SajuOrchestrator.analyze")
+    parser.add_argument(
+        "--resume", action="store_true", help="continue from the output's checkpoint"
+    )
+    parser.add_argument("--limit", type=int, default=None, help="process at most N records")
+    parser.add_argument(
+        "--progress-interval", type=float, default=5.0, help="seconds between reports (0: off)"
+    )
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = build_parser().parse_args(argv)
+    fmt = args.format or ("parquet" if args.output.suffix == ".parquet" else "jsonl")
+    config = BulkConfig(
+        input=args.input,
+        output=args.output,
+        format=fmt,
+        input_format=args.input_format,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        analysis=not args.pillars_only,
+        resume=args.resume,
+        limit=args.limit,
+        part_rows=args.part_rows,
+        progress_interval=args.progress_interval,
+    )
+    try:
+        stats = run(config)
+    except (OSError, ValueError, RuntimeError) as exc:
+        print(f"saju-bulk: {exc}", file=sys.stderr)
+        sys.exit(2)
+    print(json.dumps(asdict(stats)))
+
+
+if __name__ == "__main__":
+    main()
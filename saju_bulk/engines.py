@@ -0,0 +1,204 @@
+"""Warm per-process engines for bulk runs.
+
+pillars-service and analysis-service both ship a top-level ``app`` package.
+analysis-service keeps ``app`` (its modules import ``app.core...``); the
+pillars-service package only uses relative imports, so it is loaded a second
+time under the ``pillars_app`` alias. Each worker process builds one
+``PillarsCalculator`` and one ``SajuOrchestrator`` and reuses them for every
+chunk it is handed.
+
+Rows leave a worker as plain dicts and lists: orchestrator stage results are
+``app.core.records`` objects, and the parent process, which has no
+analysis-service on ``sys.path``, could not unpickle them.
+"""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import sys
+from collections.abc import Mapping
+from datetime import datetime
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+PILLARS_PACKAGE = "pillars_app"
+DEFAULT_TIMEZONE = "Asia/Seoul"
+
+# Input column names; ``birth_dt`` is accepted as an alias of ``local_datetime``
+DATETIME_FIELDS = ("local_datetime", "birth_dt")
+
+PREWARM_RECORD = {"id": "prewarm", "local_datetime": "1992-07-15T23:40:00", "gender": "M"}
+
+_SEARCH_PATHS = (
+    REPO_ROOT,
+    REPO_ROOT / "services" / "analysis-service",
+    REPO_ROOT / "services" / "common",
+)
+
+
+def load_pillars_package() -> ModuleType:
+    """Import pillars-service's ``app`` package as ``pillars_app`` (idempotent)."""
+    module = sys.modules.get(PILLARS_PACKAGE)
+    if module is not None:
+        return module
+    init = REPO_ROOT / "services" / "pillars-service" / "app" / "__init__.py"
+    spec = importlib.util.spec_from_file_location(
+        PILLARS_PACKAGE, init, submodule_search_locations=[str(init.parent)]
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[PILLARS_PACKAGE] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _to_plain(value: Any, json_default: Callable[[Any], Any]) -> Any:
+    """Copy of ``value`` with every ``Mapping`` view (records) turned into a ``dict``.
+
+    ``json_default`` is ``app.core.records.json_default``, which knows how to
+    flatten records; lists and tuples are copied, other values are shared.
+    """
+    if type(value) is dict:
+        return {key: _to_plain(item, json_default) for key, item in value.items()}
+    if isinstance(value, Mapping):
+        return _to_plain(json_default(value), json_default)
+    if isinstance(value, list):
+        return [_to_plain(item, json_default) for item in value]
+    if isinstance(value, tuple):
+        return tuple(_to_plain(item, json_default) for item in value)
+    return value
+
+
+def parse_record(record: Dict[str, Any]) -> Tuple[datetime, str, Optional[str]]:
+    """Return ``(naive local datetime, timezone, gender)`` for one input record."""
+    error = record.get("_parse_error")
+    if error:
+        raise ValueError(error)
+    raw = next((record[f] for f in DATETIME_FIELDS if record.get(f)), None)
+    if raw is None:
+        raise ValueError("missing local_datetime")
+    timezone = record.get("timezone") or DEFAULT_TIMEZONE
+    local_dt = datetime.fromisoformat(str(raw).strip())
+    if local_dt.tzinfo is not None:
+        from saju_common.tz_registry import get_zone
+
+        local_dt = local_dt.astimezone(get_zone(timezone)).replace(tzinfo=None)
+    return local_dt, timezone, record.get("gender") or None
+
+
+class BulkWorker:
+    """Pillars calculator plus (optionally) the analysis orchestrator."""
+
+    def __init__(self, *, analysis: bool = True) -> None:
+        for path in _SEARCH_PATHS:
+            if str(path) not in sys.path:
+                sys.path.insert(0, str(path))
+
+        load_pillars_package()
+        pillars = importlib.import_module(f"{PILLARS_PACKAGE}.core.pillars")
+        from saju_common.tz_registry import get_zone
+
+        self._get_zone = get_zone
+        self.calculator = pillars.default_calculator()
+        self.orchestrator = None
+        if analysis:
+            # Policies come from the PolicyBundle, whose paths are anchored at the
+            # repository root, so the caller's working directory is left alone
+            from app.core.records import json_default
+            from app.core.saju_orchestrator import SajuOrchestrator
+
+            self._json_default = json_default
+            self.orchestrator = SajuOrchestrator()
+
+    def prewarm(self) -> None:
+        """Load solar-term tables, zone data and policies before the first chunk."""
+        self.process([(-1, PREWARM_RECORD)])
+
+    def process(self, rows: List[Tuple[int, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Compute one output row per ``(row number, input record)``, in order."""
+        out: List[Dict[str, Any]] = []
+        parsed: List[Tuple[int, Dict[str, Any], datetime, str, Optional[str]]] = []
+        for row, record in rows:
+            try:
+                parsed.append((row, record, *parse_record(record)))
+            except (TypeError, ValueError) as exc:
+                out.append(_error_row(row, record, exc))
+
+        batch = self._compute_pillars([(local_dt, tz) for _, _, local_dt, tz, _ in parsed])
+        for (row, record, local_dt, timezone, gender), pillars in zip(parsed, batch):
+            if isinstance(pillars, Exception):
+                out.append(_error_row(row, record, pillars))
+                continue
+            try:
+                out.append(self._build_row(row, record, local_dt, timezone, gender, pillars))
+            except Exception as exc:  # one bad chart must not fail the chunk
+                out.append(_error_row(row, record, exc))
+        out.sort(key=lambda item: item["row"])
+        return out
+
+    def _compute_pillars(self, items: List[Tuple[datetime, str]]) -> List[Any]:
+        try:
+            return self.calculator.compute_many(items)
+        except Exception:
+            pass
+        # Isolate the failing items so the rest of the chunk still succeeds
+        results: List[Any] = []
+        for item in items:
+            try:
+                results.extend(self.calculator.compute_many([item]))
+            except Exception as exc:
+                results.append(exc)
+        return results
+
+    def _build_row(
+        self,
+        row: int,
+        record: Dict[str, Any],
+        local_dt: datetime,
+        timezone: str,
+        gender: Optional[str],
+        pillars: Any,
+    ) -> Dict[str, Any]:
+        chart = {
+            "year": pillars.year,
+            "month": pillars.month,
+            "day": pillars.day,
+            "hour": pillars.hour,
+        }
+        birth_dt = local_dt.replace(tzinfo=self._get_zone(timezone)).isoformat()
+        result: Dict[str, Any] = {
+            "row": row,
+            "id": record.get("id"),
+            "birth_dt": birth_dt,
+            "timezone": timezone,
+            "pillars": chart,
+            "month_term": pillars.month_term,
+        }
+        if self.orchestrator is not None:
+            birth_context = {"birth_dt": birth_dt, "gender": gender, "timezone": timezone}
+            analysis = self.orchestrator.analyze(chart, birth_context)
+            result["analysis"] = _to_plain(analysis, self._json_default)
+        return result
+
+
+def _error_row(row: int, record: Dict[str, Any], exc: Exception) -> Dict[str, Any]:
+    return {"row": row, "id": record.get("id"), "error": f"{type(exc).__name__}: {exc}"}
+
+
+# ---------------------------------------------------------------------------
+# ProcessPoolExecutor entry points (one BulkWorker per worker process)
+# ---------------------------------------------------------------------------
+
+_worker: Optional[BulkWorker] = None
+
+
+def init_worker(analysis: bool) -> None:
+    global _worker
+    _worker = BulkWorker(analysis=analysis)
+    _worker.prewarm()
+
+
+def process_chunk(rows: List[Tuple[int, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    return _worker.process(rows)
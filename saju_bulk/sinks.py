@@ -0,0 +1,198 @@
+"""Streaming record sources, output sinks and the resume checkpoint.
+
+Inputs are read lazily (CSV with a header row, or JSONL objects). Outputs are
+JSONL (one file, fsynced per commit) or Parquet (a directory of
+``part-NNNNN.parquet`` files, one per commit; requires ``pyarrow``). After
+every commit the checkpoint records how many input rows are durable and where
+the output ends, so ``--resume`` truncates any partial tail and continues.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import os
+from collections.abc import Mapping
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+FORMATS = ("jsonl", "parquet")
+INPUT_FORMATS = ("csv", "jsonl")
+
+CHECKPOINT_SUFFIX = ".checkpoint.json"
+CHECKPOINT_VERSION = 1
+
+
+def _json_default(obj: Any) -> Any:
+    # Orchestrator stage results are read-only Mapping records; anything else as text
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    return str(obj)
+
+
+def detect_input_format(path: Path) -> str:
+    suffix = path.suffix.lower()
+    if suffix == ".csv":
+        return "csv"
+    if suffix in (".jsonl", ".ndjson"):
+        return "jsonl"
+    raise ValueError(f"Cannot infer input format from {path.name}; pass --input-format")
+
+
+def read_records(path: Path, fmt: str) -> Iterator[Dict[str, Any]]:
+    """Yield input records one at a time; unparsable JSONL lines carry ``_parse_error``."""
+    if fmt == "csv":
+        with path.open(newline="", encoding="utf-8") as fh:
+            yield from csv.DictReader(fh)
+        return
+    with path.open(encoding="utf-8") as fh:
+        for line in fh:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as exc:
+                yield {"_parse_error": f"invalid JSON: {exc}"}
+                continue
+            yield record if isinstance(record, dict) else {"_parse_error": "not a JSON object"}
+
+
+@dataclass
+class Checkpoint:
+    """Durable progress of one export (written atomically next to the output)."""
+
+    input: str
+    format: str
+    analysis: bool
+    rows_done: int = 0
+    output_bytes: int = 0
+    parts: int = 0
+    complete: bool = False
+    version: int = CHECKPOINT_VERSION
+
+    @staticmethod
+    def path_for(output: Path) -> Path:
+        return output.with_name(output.name + CHECKPOINT_SUFFIX)
+
+    @classmethod
+    def load(cls, output: Path) -> Optional["Checkpoint"]:
+        path = cls.path_for(output)
+        if not path.exists():
+            return None
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data.get("version") != CHECKPOINT_VERSION:
+            raise ValueError(f"Unsupported checkpoint version in {path}")
+        return cls(**data)
+
+    def save(self, output: Path) -> None:
+        path = self.path_for(output)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(json.dumps(asdict(self)), encoding="utf-8")
+        os.replace(tmp, path)
+
+
+class JsonlSink:
+    """Appends rows to one JSONL file; every commit is flushed and fsynced."""
+
+    commit_rows = 1
+
+    def __init__(self, path: Path, checkpoint: Checkpoint) -> None:
+        self.path = path
+        if checkpoint.output_bytes:
+            size = path.stat().st_size if path.exists() else 0
+            if size < checkpoint.output_bytes:
+                raise ValueError(f"{path} is shorter than its checkpoint; cannot resume")
+            self._fh = path.open("r+b")
+            # Drop anything written after the last durable commit
+            self._fh.truncate(checkpoint.output_bytes)
+            self._fh.seek(checkpoint.output_bytes)
+        else:
+            self._fh = path.open("wb")
+        self._pending = 0
+
+    def pending(self) -> int:
+        return self._pending
+
+    def write(self, rows: List[Dict[str, Any]]) -> None:
+        encode = json.dumps
+        self._fh.write(
+            "".join(
+                encode(r, ensure_ascii=False, default=_json_default) + "\n" for r in rows
+            ).encode()
+        )
+        self._pending += len(rows)
+
+    def commit(self, checkpoint: Checkpoint) -> None:
+        self._fh.flush()
+        os.fsync(self._fh.fileno())
+        checkpoint.output_bytes = self._fh.tell()
+        self._pending = 0
+
+    def close(self) -> None:
+        self._fh.close()
+
+
+class ParquetSink:
+    """Buffers rows and writes one Parquet part file per commit."""
+
+    COLUMNS = ("row", "id", "birth_dt", "timezone", "year", "month", "day", "hour")
+
+    def __init__(self, path: Path, checkpoint: Checkpoint, part_rows: int = 50_000) -> None:
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as exc:  # optional dependency
+            raise RuntimeError("--format parquet requires pyarrow (pip install pyarrow)") from exc
+        self._pa, self._pq = pa, pq
+        self.path = path
+        self.commit_rows = part_rows
+        path.mkdir(parents=True, exist_ok=True)
+        for stale in path.glob("part-*.parquet"):
+            if int(stale.stem.split("-")[1]) >= checkpoint.parts:
+                stale.unlink()
+        self._buffer: List[Dict[str, Any]] = []
+
+    def pending(self) -> int:
+        return len(self._buffer)
+
+    def write(self, rows: List[Dict[str, Any]]) -> None:
+        self._buffer.extend(rows)
+
+    def commit(self, checkpoint: Checkpoint) -> None:
+        if not self._buffer:
+            return
+        columns: Dict[str, List[Any]] = {name: [] for name in self.COLUMNS}
+        columns.update(month_term=[], error=[], analysis=[])
+        for r in self._buffer:
+            pillars = r.get("pillars") or {}
+            columns["row"].append(r["row"])
+            columns["id"].append(None if r.get("id") is None else str(r["id"]))
+            columns["birth_dt"].append(r.get("birth_dt"))
+            columns["timezone"].append(r.get("timezone"))
+            for position in ("year", "month", "day", "hour"):
+                columns[position].append(pillars.get(position))
+            columns["month_term"].append(r.get("month_term"))
+            columns["error"].append(r.get("error"))
+            analysis = r.get("analysis")
+            columns["analysis"].append(
+                None
+                if analysis is None
+                else json.dumps(analysis, ensure_ascii=False, default=_json_default)
+            )
+        part = self.path / f"part-{checkpoint.parts:05d}.parquet"
+        tmp = part.with_name(part.name + ".tmp")
+        self._pq.write_table(self._pa.table(columns), tmp)
+        os.replace(tmp, part)
+        checkpoint.parts += 1
+        self._buffer = []
+
+    def close(self) -> None:
+        self._buffer = []
+
+
+def open_sink(fmt: str, path: Path, checkpoint: Checkpoint, part_rows: int):
+    if fmt == "parquet":
+        return ParquetSink(path, checkpoint, part_rows)
+    return JsonlSink(path, checkpoint)
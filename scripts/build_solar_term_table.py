@@ -0,0 +1,34 @@
+"""Compile data/terms_YYYY.csv into the mmap-loadable data/solar_terms.bin table."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+COMMON_SRC = REPO_ROOT / "services" / "common"
+if str(COMMON_SRC) not in sys.path:
+    sys.path.append(str(COMMON_SRC))
+
+from saju_common.solar_term_binary import COMPILED_TABLE_NAME, compile_term_table, load_term_table
+
+DATA_DIR = REPO_ROOT / "data"
+
+
+def main(table_path: Path, out_path: Path) -> None:
+    compiled = compile_term_table(table_path, out_path)
+    index = load_term_table(compiled)
+    years = index.years
+    print(
+        f"Compiled {len(index)} terms ({years[0]}-{years[-1]}) "
+        f"into {compiled} ({compiled.stat().st_size} bytes)"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--data-dir", type=Path, default=DATA_DIR)
+    parser.add_argument("--out", type=Path, default=None)
+    args = parser.parse_args()
+    main(args.data_dir, args.out or args.data_dir / COMPILED_TABLE_NAME)
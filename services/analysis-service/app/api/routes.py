@@ -2,39 +2,81 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, status
+import asyncio
+from typing import Optional
 
-from ..core import AnalysisEngine
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
+
+from services.common.responses import FastJSONResponse, dumps_json
+
+from ..core import AnalysisEngine, EngineRegistry, get_registry
 from ..core.llm_guard import LLMGuard
+from ..core.offload import AnalysisOffloader, PoolSaturated
 from ..models import AnalysisRequest, AnalysisResponse
 
 router = APIRouter(tags=["analysis"])
 
 
-def get_engine() -> AnalysisEngine:
-    """Provide an analysis engine instance."""
-    return AnalysisEngine()
+def get_engines() -> EngineRegistry:
+    """Resolve the current registry once per request.
+
+    FastAPI caches a dependency per request, so the engine and the guard below
+    come from the same policy snapshot even if a hot-reload swaps the registry
+    while the request is running.
+    """
+    return get_registry()
+
+
+def get_engine(registry: EngineRegistry = Depends(get_engines)) -> AnalysisEngine:
+    """Provide the process-wide analysis engine (built once, shared by all requests)."""
+    return registry.engine
 
 
-def get_llm_guard() -> LLMGuard:
+def get_llm_guard(registry: EngineRegistry = Depends(get_engines)) -> LLMGuard:
     """Provide the LLM guard singleton."""
-    return LLMGuard.default()
+    return registry.llm_guard
+
+
+def get_offloader(request: Request) -> Optional[AnalysisOffloader]:
+    """Provide the worker pool started by the lifespan hook (None: analyze in-process)."""
+    return getattr(request.app.state, "offloader", None)
+
+
+def _analyze_json(registry: EngineRegistry, payload: AnalysisRequest) -> bytes:
+    return dumps_json(registry.analyze(payload))
 
 
 @router.post(
     "/analyze",
     status_code=status.HTTP_200_OK,
     response_model=AnalysisResponse,
+    response_class=FastJSONResponse,
 )
-def analyze(
+async def analyze(
     payload: AnalysisRequest,
-    engine: AnalysisEngine = Depends(get_engine),
-    guard: LLMGuard = Depends(get_llm_guard),
-) -> AnalysisResponse:
-    """Return ten gods / relations / strength analysis."""
-    response = engine.analyze(payload)
-    llm_payload = guard.prepare_payload(response)
-    final_response = guard.postprocess(
-        response, llm_payload, structure_primary=response.structure.primary, topic_tags=[]
-    )
-    return final_response
+    registry: EngineRegistry = Depends(get_engines),
+    offloader: Optional[AnalysisOffloader] = Depends(get_offloader),
+) -> FastJSONResponse:
+    """Return ten gods / relations / strength analysis.
+
+    The CPU-bound pipeline never runs on the event loop: it goes to the worker
+    pool when one is configured, else to the threadpool. The response is
+    serialized once, next to the analysis, and sent as-is (``response_model``
+    only documents the schema).
+    """
+    if offloader is None:
+        return FastJSONResponse(await run_in_threadpool(_analyze_json, registry, payload))
+    try:
+        return FastJSONResponse(await offloader.analyze_json(payload))
+    except PoolSaturated as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(exc),
+            headers={"Retry-After": str(exc.retry_after)},
+        ) from None
+    except asyncio.TimeoutError:
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail=f"Analysis exceeded {offloader.timeout}s deadline",
+        ) from None
@@ -1,5 +1,12 @@
 """Core analysis components."""
 
 from .engine import AnalysisEngine
+from .registry import EngineRegistry, get_registry, init_registry, reload_registry
 
-__all__ = ["AnalysisEngine"]
+__all__ = [
+    "AnalysisEngine",
+    "EngineRegistry",
+    "get_registry",
+    "init_registry",
+    "reload_registry",
+]
@@ -14,22 +14,14 @@
 
 from __future__ import annotations
 
-import hashlib
 import json
+import sys
 from pathlib import Path
 from typing import Dict, List, Tuple
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[4] / "services" / "common"))
 
-# --- 인라인 시그니처 유틸리티 (infra.signatures 대체) ----------------------
-def _canonical_json_signature(obj) -> str:
-    """
-    Compute SHA-256 signature of canonical JSON.
-    Uses deterministic dict ordering (sort_keys=True).
-    For strict RFC-8785 compliance, use canonicaljson library.
-    """
-    canonical_str = json.dumps(obj, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
-    return hashlib.sha256(canonical_str.encode("utf-8")).hexdigest()
-
+from saju_common.signing import sha256_signature  # noqa: E402
 
 # --- 상수 --------------------------------------------------------------------
 ELEMENTS: List[str] = ["wood", "fire", "earth", "metal", "water"]
@@ -91,9 +83,7 @@ def _validate_policy(data: dict | None) -> Dict[str, Dict[str, float | int]]:
 
 _OVERRIDE = _try_load_override()
 POLICY_SPEC: Dict[str, Dict[str, float | int]] = _OVERRIDE if _OVERRIDE else _validate_policy(None)
-POLICY_SIGNATURE: str = _canonical_json_signature(
-    {"version": POLICY_VERSION, "policy": POLICY_SPEC}
-)
+POLICY_SIGNATURE: str = sha256_signature({"version": POLICY_VERSION, "policy": POLICY_SPEC})
 
 
 # --- 정규화 유틸 -------------------------------------------------------------
@@ -52,9 +52,13 @@ except ImportError:
 class AnalysisEngine:
     """Main analysis engine that orchestrates all Saju analysis components."""
 
-    def __init__(self):
-        """Initialize the engine with a SajuOrchestrator instance."""
-        self.orchestrator = SajuOrchestrator()
+    def __init__(self, policy_bundle=None):
+        """Initialize the engine with a SajuOrchestrator instance.
+
+        Args:
+            policy_bundle: PolicyBundle for the orchestrator (default: process bundle)
+        """
+        self.orchestrator = SajuOrchestrator(policy_bundle=policy_bundle)
 
     def analyze(self, request: AnalysisRequest) -> AnalysisResponse:
         """Run complete Saju analysis.
@@ -156,13 +160,16 @@ class AnalysisEngine:
         # Extract recommendation
         recommendation_data = result.get("recommendation", {})
 
-        # Build trace
-        trace = result.get("trace", {})
+        # Build trace (stage timings, when enabled, ride along with the default trace)
+        trace = dict(result.get("trace", {}))
+        timings = trace.pop("timings", None)
         if not trace:
             trace = {
                 "orchestrator_keys": list(result.keys()),
                 "pillars": pillars,
             }
+        if timings is not None:
+            trace["timings"] = timings
 
         # Construct AnalysisResponse
         return AnalysisResponse(
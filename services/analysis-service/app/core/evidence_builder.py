@@ -13,31 +13,24 @@ Stage-1 엔진 산출물(void/yuanjin/wuxing_adjust)을 공통 스키마 단일
 
 from __future__ import annotations
 
-import hashlib
-import json
 import re
+import sys
 from datetime import datetime, timezone
-from typing import Any, Dict, List
+from pathlib import Path
+from typing import Any, Dict, List, Optional
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[4] / "services" / "common"))
 
-# --- 인라인 시그니처 유틸리티 (infra.signatures 대체) ----------------------
-def _canonical_json_signature(obj) -> str:
-    """
-    Compute SHA-256 signature of canonical JSON.
-    Uses deterministic dict ordering (sort_keys=True).
-    For strict RFC-8785 compliance, use canonicaljson library.
-    """
-    canonical_str = json.dumps(obj, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
-    return hashlib.sha256(canonical_str.encode("utf-8")).hexdigest()
-
-
-# Alias for compatibility
-sha256_signature = _canonical_json_signature
-canonical_dumps = lambda obj: json.dumps(
-    obj, ensure_ascii=False, sort_keys=True, separators=(",", ":")
+# 공용 서명 모듈 (sha256_signature/canonical_dumps는 기존 import 경로 호환용으로 재노출)
+from saju_common.signing import (  # noqa: E402
+    Canonical,
+    canonical_dumps,
+    canonical_object,
+    object_signature,
+    policy_signature,
+    sha256_signature,
 )
 
-
 # --- 정책/상수 ---------------------------------------------------------------
 POLICY_VERSION: str = "evidence_v1.0.0"
 ALLOWED_TYPES: List[str] = [
@@ -65,7 +58,8 @@ POLICY_SPEC: Dict[str, Any] = {
     "required_fields": REQUIRED_FIELDS,
     "created_at_format": "YYYY-MM-DDTHH:MM:SSZ",
 }
-POLICY_SIGNATURE: str = sha256_signature(POLICY_SPEC)
+POLICY_SIGNATURE: str = policy_signature(POLICY_SPEC)
+_FALLBACK_WUXING_SIGNATURE: str = sha256_signature({"fallback": "wuxing_adjust"})
 
 
 # --- 헬퍼 --------------------------------------------------------------------
@@ -102,19 +96,29 @@ def _validate_section_shape(section: Dict[str, Any]) -> Dict[str, Any]:
     return out
 
 
+def _encode_fields(section: Dict[str, Any]) -> Dict[str, Canonical]:
+    """필드별 캐노니컬 인코딩(섹션당 1회, 이후 서명/봉투에서 재사용)."""
+    return {k: Canonical(canonical_dumps(v)) for k, v in section.items()}
+
+
 def _canonical_section_signature(section: Dict[str, Any]) -> str:
     """섹션의 캐노니컬 서명(자기참조 필드 제외)."""
     base = _validate_section_shape(section)
-    return sha256_signature(base)
+    return object_signature(_encode_fields(base))
 
 
-def _canonical_evidence_signature(ev: Dict[str, Any]) -> str:
-    """Evidence 전체의 캐노니컬 서명(evidence_signature 제외)."""
+def _canonical_evidence_signature(
+    ev: Dict[str, Any], fragments: Optional[List[Canonical]] = None
+) -> str:
+    """
+    Evidence 전체의 캐노니컬 서명(evidence_signature 제외).
+    fragments가 주어지면 섹션을 재직렬화하지 않고 인코딩된 조각을 스트리밍한다.
+    """
     base = {
         "evidence_version": ev["evidence_version"],
-        "sections": ev.get("sections", []),
+        "sections": fragments if fragments is not None else ev.get("sections", []),
     }
-    return sha256_signature(base)
+    return object_signature(base)
 
 
 def _normalize_inputs(inputs: Dict[str, Any], created_at: str) -> List[Dict[str, Any]]:
@@ -188,7 +192,7 @@ def _normalize_inputs(inputs: Dict[str, Any], created_at: str) -> List[Dict[str,
                 engine_version, engine_signature = _WV, _WS
         except Exception:
             engine_version = engine_version or "combination_element_v1.2.0"
-            engine_signature = engine_signature or sha256_signature({"fallback": "wuxing_adjust"})
+            engine_signature = engine_signature or _FALLBACK_WUXING_SIGNATURE
         sec = {
             "type": "wuxing_adjust",
             "engine_version": engine_version,
@@ -204,9 +208,9 @@ def _normalize_inputs(inputs: Dict[str, Any], created_at: str) -> List[Dict[str,
     return sections
 
 
-# --- 공개 API ----------------------------------------------------------------
-def add_section(ev: Dict[str, Any], section: Dict[str, Any]) -> Dict[str, Any]:
-    """Evidence 객체에 섹션을 추가한다(중복 type 금지). section_signature를 부여한다."""
+# --- 내부 구현 ----------------------------------------------------------------
+def _add_section(ev: Dict[str, Any], section: Dict[str, Any]) -> Canonical:
+    """섹션을 추가하고, 서명 포함 섹션의 캐노니컬 조각을 반환한다."""
     if "evidence_version" not in ev:
         ev["evidence_version"] = POLICY_VERSION
     ev.setdefault("sections", [])
@@ -214,25 +218,41 @@ def add_section(ev: Dict[str, Any], section: Dict[str, Any]) -> Dict[str, Any]:
     if any(s.get("type") == section.get("type") for s in ev["sections"]):
         raise ValueError(f"섹션 타입 중복: {section.get('type')}")
     base = _validate_section_shape(section)
-    sig = _canonical_section_signature(base)
+    fields = _encode_fields(base)
+    sig = object_signature(fields)
     full = dict(base)
     full["section_signature"] = sig
     ev["sections"].append(full)
-    return ev
+    fields["section_signature"] = Canonical(canonical_dumps(sig))
+    return canonical_object(fields)
 
 
-def finalize_evidence(ev: Dict[str, Any]) -> Dict[str, Any]:
-    """sections를 type 오름차순으로 정렬하고 evidence_signature를 계산한다."""
+def _finalize_evidence(
+    ev: Dict[str, Any], fragments: Optional[Dict[str, Canonical]] = None
+) -> Dict[str, Any]:
     if "sections" not in ev or not ev["sections"]:
         raise ValueError("sections가 비어 있습니다.")
     # 정렬(결정적)
     ev["sections"] = sorted(ev["sections"], key=lambda s: s["type"])
+    ordered = [fragments[s["type"]] for s in ev["sections"]] if fragments is not None else None
     # evidence_signature 부여
     ev["evidence_version"] = ev.get("evidence_version") or POLICY_VERSION
-    ev["evidence_signature"] = _canonical_evidence_signature(ev)
+    ev["evidence_signature"] = _canonical_evidence_signature(ev, ordered)
+    return ev
+
+
+# --- 공개 API ----------------------------------------------------------------
+def add_section(ev: Dict[str, Any], section: Dict[str, Any]) -> Dict[str, Any]:
+    """Evidence 객체에 섹션을 추가한다(중복 type 금지). section_signature를 부여한다."""
+    _add_section(ev, section)
     return ev
 
 
+def finalize_evidence(ev: Dict[str, Any]) -> Dict[str, Any]:
+    """sections를 type 오름차순으로 정렬하고 evidence_signature를 계산한다."""
+    return _finalize_evidence(ev)
+
+
 def build_evidence(inputs: Dict[str, Any]) -> Dict[str, Any]:
     """
     엔진 원시 출력 묶음(inputs)을 Evidence로 수집.
@@ -241,6 +261,6 @@ def build_evidence(inputs: Dict[str, Any]) -> Dict[str, Any]:
     created_at = _now_utc_iso()
     ev: Dict[str, Any] = {"evidence_version": POLICY_VERSION, "sections": []}
     sections = _normalize_inputs(inputs or {}, created_at)
-    for sec in sections:
-        add_section(ev, sec)
-    return finalize_evidence(ev)
+    # 섹션별 캐노니컬 조각을 보관해 evidence_signature 계산 시 재직렬화를 피한다
+    fragments = {sec["type"]: _add_section(ev, sec) for sec in sections}
+    return _finalize_evidence(ev, fragments)
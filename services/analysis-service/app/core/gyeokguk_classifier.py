@@ -4,77 +4,26 @@ try:
 except ImportError:
     from policy_loader import load_policy_json, resolve_policy_path  # noqa: F401
 
-
-def _get(d, path, default=None):
-    cur = d
-    for p in path.split("."):
-        if not isinstance(cur, dict):
-            return default
-        if p not in cur:
-            return default
-        cur = cur[p]
-    return cur
-
-
-def _map_elem(x):
-    m = {
-        "목": "wood",
-        "화": "fire",
-        "토": "earth",
-        "금": "metal",
-        "수": "water",
-        "wood": "wood",
-        "fire": "fire",
-        "earth": "earth",
-        "metal": "metal",
-        "water": "water",
-    }
-    return m.get(x, x)
-
-
-def _any_flag(need, have):
-    return bool(set(need).intersection(set(have or [])))
+try:
+    from .rule_compiler import RuleContext, RuleProgram
+except ImportError:
+    from rule_compiler import RuleContext, RuleProgram
 
 
 class GyeokgukClassifier:
-    def __init__(self, policy_file: str = "gyeokguk_policy_v1.json"):
-        self.policy = load_policy_json(policy_file)
+    def __init__(self, policy_file: str = "gyeokguk_policy_v1.json", bundle=None):
+        self.policy = (bundle.get if bundle is not None else load_policy_json)(policy_file)
+        self.program = RuleProgram(
+            (r.get("id", f"rule_{i}"), r["when"]) for i, r in enumerate(self.policy["rules"])
+        )
 
     def _match(self, ctx: dict):
-        for rule in self.policy["rules"]:
-            w = rule["when"]
-            if "strength.phase_in" in w and _get(ctx, "strength.phase") not in set(
-                w["strength.phase_in"]
-            ):
-                continue
-            if "strength.elements_any" in w:
-                ok = False
-                for token in w["strength.elements_any"]:
-                    lv, el = token.split(":")
-                    if el == "primary":
-                        el = _get(ctx, "yongshin.primary")
-                    el = _map_elem(el)
-                    if _get(ctx, f"strength.elements.{el}") == lv:
-                        ok = True
-                        break
-                if not ok:
-                    continue
-            if "relation.flags_any" in w:
-                if not set(w["relation.flags_any"]).intersection(
-                    set(_get(ctx, "relation.flags", []) or [])
-                ):
-                    continue
-            if "yongshin.primary_in" in w and _get(ctx, "yongshin.primary") not in set(
-                w["yongshin.primary_in"]
-            ):
-                continue
-            bi = _get(ctx, "climate.balance_index", 0)
-            if "climate.balance_index_gte" in w and not (bi >= w["climate.balance_index_gte"]):
-                continue
-            if "climate.balance_index_lte" in w and not (bi <= w["climate.balance_index_lte"]):
-                continue
-            return rule["emit"]
-        return None
+        i = self.program.first_match(RuleContext.from_ctx(ctx))
+        return None if i is None else self.policy["rules"][i]["emit"]
+
+    def rule_stats(self):
+        """Per-rule evaluation counts and timings (see RuleProgram.stats)."""
+        return self.program.stats()
 
     def run(self, ctx: dict) -> dict:
         emit = self._match(ctx) or {
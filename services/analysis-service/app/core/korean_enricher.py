@@ -5,14 +5,21 @@ Korean Label Enricher for LLM Payload
 Enriches analysis response payloads with Korean labels (_ko fields) for LLM consumption.
 Non-invasive approach: adds Korean labels without modifying original engine outputs.
 
+``enrich`` returns an independent enriched copy. ``overlay`` shares the original
+values instead: labelled nodes become ``LabelOverlay`` views whose labels are
+merged in only when the payload is serialized (``iter_json`` streams it).
+
 Version: 1.0.0
 Status: Production Ready
 """
 
 import json
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .records import json_default
 
 # Policy file paths (relative to repository root)
 REPO_ROOT = Path(__file__).parent.parent.parent.parent.parent
@@ -24,6 +31,17 @@ SHENSHA_POLICY_PATH = POLICY_DIR / "shensha_v2_policy.json"
 JIAZI_POLICY_PATH = POLICY_DIR / "sixty_jiazi.json"
 
 
+# (source key, label key, lookup table)
+LabelRule = Tuple[str, str, Dict[str, str]]
+
+
+def _read_policy(path: Path, bundle=None) -> Dict[str, Any]:
+    if bundle is not None:
+        return bundle.get_path(path)
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
 @dataclass(slots=True)
 class KoreanLabelEnricher:
     """
@@ -37,7 +55,8 @@ class KoreanLabelEnricher:
 
     Usage:
         enricher = KoreanLabelEnricher.from_files()
-        enriched_payload = enricher.enrich(original_payload)
+        enriched_payload = enricher.enrich(original_payload)  # independent copy
+        labelled = enricher.overlay(original_payload)  # shares original values
     """
 
     # From localization_ko_v1.json
@@ -58,11 +77,19 @@ class KoreanLabelEnricher:
     shensha_ko: Dict[str, str] = field(default_factory=dict)
     jiazi_ko: Dict[str, str] = field(default_factory=dict)
 
+    _rules: Dict[str, Tuple[LabelRule, ...]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._rules = self._compile_rules()
+
     @classmethod
-    def from_files(cls) -> "KoreanLabelEnricher":
+    def from_files(cls, bundle=None) -> "KoreanLabelEnricher":
         """
         Load all Korean mappings from policy files.
 
+        Args:
+            bundle: ``PolicyBundle`` to read the files from (default: open them)
+
         Returns:
             KoreanLabelEnricher instance with all mappings loaded
 
@@ -71,13 +98,12 @@ class KoreanLabelEnricher:
             json.JSONDecodeError: If policy files are malformed
         """
         # Load localization_ko_v1.json
-        with open(LOCALIZATION_KO_PATH, "r", encoding="utf-8") as f:
-            loc_data = json.load(f)
+        loc_data = _read_policy(LOCALIZATION_KO_PATH, bundle)
 
         # Load policy files
-        gyeokguk_ko = cls._load_gyeokguk_labels()
-        shensha_ko = cls._load_shensha_labels()
-        jiazi_ko = cls._load_jiazi_labels()
+        gyeokguk_ko = cls._load_gyeokguk_labels(bundle)
+        shensha_ko = cls._load_shensha_labels(bundle)
+        jiazi_ko = cls._load_jiazi_labels(bundle)
 
         # Filter out metadata fields (starting with _)
         def clean_dict(d: Dict[str, Any]) -> Dict[str, str]:
@@ -101,10 +127,9 @@ class KoreanLabelEnricher:
         )
 
     @staticmethod
-    def _load_gyeokguk_labels() -> Dict[str, str]:
+    def _load_gyeokguk_labels(bundle=None) -> Dict[str, str]:
         """Load gyeokguk Korean labels from gyeokguk_policy.json."""
-        with open(GYEOKGUK_POLICY_PATH, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _read_policy(GYEOKGUK_POLICY_PATH, bundle)
 
         mapping = {}
         for entry in data.get("patterns", []):
@@ -116,10 +141,9 @@ class KoreanLabelEnricher:
         return mapping
 
     @staticmethod
-    def _load_shensha_labels() -> Dict[str, str]:
+    def _load_shensha_labels(bundle=None) -> Dict[str, str]:
         """Load shensha Korean labels from shensha_v2_policy.json."""
-        with open(SHENSHA_POLICY_PATH, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _read_policy(SHENSHA_POLICY_PATH, bundle)
 
         mapping = {}
         for entry in data.get("shensha_catalog", []):
@@ -132,15 +156,14 @@ class KoreanLabelEnricher:
         return mapping
 
     @staticmethod
-    def _load_jiazi_labels() -> Dict[str, str]:
+    def _load_jiazi_labels(bundle=None) -> Dict[str, str]:
         """
         Load sixty jiazi Korean labels from sixty_jiazi.json.
 
         Creates mapping from romanized keys (e.g., "JIAZI") to Korean labels (e.g., "갑자").
         Extracts jiazi part only (without nayin) from label_ko.
         """
-        with open(JIAZI_POLICY_PATH, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _read_policy(JIAZI_POLICY_PATH, bundle)
 
         mapping = {}
         for entry in data.get("records", []):
@@ -161,6 +184,37 @@ class KoreanLabelEnricher:
 
         return mapping
 
+    def _compile_rules(self) -> Dict[str, Tuple[LabelRule, ...]]:
+        """Bind each labelled field to its lookup table (done once per enricher)."""
+        return {
+            "roles": (
+                ("tengod", "tengod_ko", self.ten_gods_ko),
+                ("role", "role_ko", self.role_ko),
+            ),
+            "structure": (
+                ("primary", "primary_ko", self.gyeokguk_ko),
+                ("secondary", "secondary_ko", self.gyeokguk_ko),
+                ("confidence", "confidence_ko", self.confidence_ko),
+                ("validity", "validity_ko", self.validity_ko),
+            ),
+            "strength": (
+                ("level", "level_ko", self.strength_ko),
+                ("month_state", "month_state_ko", self.month_state_ko),
+            ),
+            "luck_direction": (("direction", "direction_ko", self.luck_direction_ko),),
+            "shensha": (
+                ("key", "label_ko", self.shensha_ko),
+                ("pillar", "pillar_ko", self.pillar_ko),
+            ),
+            "relations": (("type", "type_ko", self.relation_types_ko),),
+            "recommendation": (("action", "action_ko", self.recommendation_ko),),
+            "pillars": (
+                ("jiazi", "jiazi_ko", self.jiazi_ko),
+                ("stem", "stem_ko", self.jiazi_ko),
+                ("branch", "branch_ko", self.jiazi_ko),
+            ),
+        }
+
     def enrich(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """
         Add Korean labels to payload for LLM consumption.
@@ -168,172 +222,162 @@ class KoreanLabelEnricher:
         Adds *_ko fields alongside original fields without modifying original values.
         Handles missing mappings gracefully by preserving original values.
 
+        Returns a plain, independent copy; use ``overlay`` to avoid copying the
+        payload when the result is only read or serialized.
+
         Args:
             payload: Original analysis response payload
 
         Returns:
             Enriched payload with Korean labels added
         """
-        # Deep copy to avoid modifying original
-        enriched = self._deep_copy(payload)
-
-        # Enrich each section
-        self._enrich_ten_gods(enriched)
-        self._enrich_structure(enriched)
-        self._enrich_strength(enriched)
-        self._enrich_luck_direction(enriched)
-        self._enrich_shensha(enriched)
-        self._enrich_relations(enriched)
-        self._enrich_recommendation(enriched)
-        self._enrich_pillars(enriched)
-
-        # Add enrichment metadata
+        return self._deep_copy(self.overlay(payload))
+
+    def overlay(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Add Korean labels as an overlay that shares the original values.
+
+        Only the containers on the path to a labelled node are shallow-copied;
+        each labelled node is wrapped in a ``LabelOverlay`` view, so the *_ko
+        fields read like regular keys and are merged in only when the result is
+        serialized (``json.dumps(..., default=json_default)`` or ``iter_json``).
+        Everything else is shared with ``payload`` and must be treated as
+        read-only; the returned top-level dict itself may be extended.
+
+        Args:
+            payload: Original analysis response payload
+
+        Returns:
+            Shallow copy of payload with labelled nodes replaced by overlays
+        """
+        enriched = dict(payload)
+        copied = {id(enriched)}
+        for path, labels in self._collect_labels(payload):
+            node = enriched
+            for key in path[:-1]:
+                child = node[key]
+                if id(child) not in copied:
+                    child = list(child) if isinstance(child, list) else dict(child)
+                    copied.add(id(child))
+                    node[key] = child
+                node = child
+            node[path[-1]] = LabelOverlay(node[path[-1]], labels)
+
         enriched["_enrichment"] = {
             "korean_labels_added": True,
             "locale": "ko-KR",
             "enricher_version": "1.0.0",
             "mappings_count": 141,
         }
-
         return enriched
 
-    def _enrich_ten_gods(self, payload: Dict[str, Any]) -> None:
-        """Enrich ten gods labels in all sections."""
-        # Enrich branch_tengods section
-        if "branch_tengods" in payload:
-            for pillar_data in payload["branch_tengods"].values():
-                if isinstance(pillar_data, dict) and "roles" in pillar_data:
-                    for role_entry in pillar_data["roles"]:
-                        if "tengod" in role_entry:
-                            tengod = role_entry["tengod"]
-                            role_entry["tengod_ko"] = self.ten_gods_ko.get(tengod, tengod)
-                        if "role" in role_entry:
-                            role = role_entry["role"]
-                            role_entry["role_ko"] = self.role_ko.get(role, role)
-
-    def _enrich_structure(self, payload: Dict[str, Any]) -> None:
-        """Enrich gyeokguk (structure) labels."""
-        if "structure" in payload:
-            struct = payload["structure"]
-
-            # Primary structure
-            if "primary" in struct:
-                primary = struct["primary"]
-                struct["primary_ko"] = self.gyeokguk_ko.get(primary, primary)
-
-            # Secondary structure
-            if "secondary" in struct:
-                secondary = struct["secondary"]
-                struct["secondary_ko"] = self.gyeokguk_ko.get(secondary, secondary)
-
-            # Confidence
-            if "confidence" in struct:
-                confidence = struct["confidence"]
-                struct["confidence_ko"] = self.confidence_ko.get(confidence, confidence)
-
-            # Validity (성격/가격/파격/불성립)
-            if "validity" in struct:
-                validity = struct["validity"]
-                struct["validity_ko"] = self.validity_ko.get(validity, validity)
-
-    def _enrich_strength(self, payload: Dict[str, Any]) -> None:
-        """Enrich strength (강약) labels."""
-        if "strength" in payload:
-            strength = payload["strength"]
-
-            if "level" in strength:
-                level = strength["level"]
-                strength["level_ko"] = self.strength_ko.get(level, level)
-
-            # Enrich month state if present
-            if "month_state" in strength:
-                state = strength["month_state"]
-                strength["month_state_ko"] = self.month_state_ko.get(state, state)
-
-    def _enrich_luck_direction(self, payload: Dict[str, Any]) -> None:
-        """Enrich luck direction (대운 방향) labels."""
-        if "luck_direction" in payload:
-            luck = payload["luck_direction"]
-
-            if "direction" in luck:
-                direction = luck["direction"]
-                luck["direction_ko"] = self.luck_direction_ko.get(direction, direction)
-
-    def _enrich_shensha(self, payload: Dict[str, Any]) -> None:
-        """Enrich shensha (신살) labels."""
-        if "shensha" in payload and "list" in payload["shensha"]:
-            for shensha_entry in payload["shensha"]["list"]:
-                # Shensha key
-                if "key" in shensha_entry:
-                    key = shensha_entry["key"]
-                    shensha_entry["label_ko"] = self.shensha_ko.get(key, key)
-
-                # Pillar
-                if "pillar" in shensha_entry:
-                    pillar = shensha_entry["pillar"]
-                    shensha_entry["pillar_ko"] = self.pillar_ko.get(pillar, pillar)
-
-    def _enrich_relations(self, payload: Dict[str, Any]) -> None:
-        """Enrich relations (관계) labels."""
-        if "relations" in payload and "list" in payload["relations"]:
-            for relation_entry in payload["relations"]["list"]:
-                # Relation type
-                if "type" in relation_entry:
-                    rel_type = relation_entry["type"]
-                    relation_entry["type_ko"] = self.relation_types_ko.get(rel_type, rel_type)
-
-                # Pillars
-                if "pillars" in relation_entry:
-                    pillars = relation_entry["pillars"]
-                    relation_entry["pillars_ko"] = [self.pillar_ko.get(p, p) for p in pillars]
-
-    def _enrich_recommendation(self, payload: Dict[str, Any]) -> None:
-        """Enrich recommendation (추천) labels."""
-        if "recommendation" in payload:
-            rec = payload["recommendation"]
-
-            if "action" in rec:
-                action = rec["action"]
-                rec["action_ko"] = self.recommendation_ko.get(action, action)
-
-    def _enrich_pillars(self, payload: Dict[str, Any]) -> None:
-        """Enrich pillar labels and jiazi labels in pillars section."""
-        if "pillars" not in payload:
-            return
-
-        for pillar_name, pillar_data in payload["pillars"].items():
-            if not isinstance(pillar_data, dict):
-                continue
-
-            # Add pillar name Korean label
-            pillar_data["pillar_ko"] = self.pillar_ko.get(pillar_name, pillar_name)
-
-            # Enrich jiazi (stem-branch combination)
-            if "jiazi" in pillar_data:
-                jiazi = pillar_data["jiazi"]
-                pillar_data["jiazi_ko"] = self.jiazi_ko.get(jiazi, jiazi)
-
-            # Enrich stem if it's a jiazi key
-            if "stem" in pillar_data:
-                stem = pillar_data["stem"]
-                pillar_data["stem_ko"] = self.jiazi_ko.get(stem, stem)
-
-            # Enrich branch if it's a jiazi key
-            if "branch" in pillar_data:
-                branch = pillar_data["branch"]
-                pillar_data["branch_ko"] = self.jiazi_ko.get(branch, branch)
+    def _collect_labels(self, payload: Mapping) -> List[Tuple[Tuple[Any, ...], Dict[str, Any]]]:
+        """Korean labels per node, as ``(path from payload, {label key: label})``."""
+        rules = self._rules
+        found: List[Tuple[Tuple[Any, ...], Dict[str, Any]]] = []
+
+        def add(path: Tuple[Any, ...], labels: Dict[str, Any]) -> None:
+            if labels:
+                found.append((path, labels))
+
+        # Ten gods in the branch_tengods section
+        branch_tengods = payload.get("branch_tengods")
+        if isinstance(branch_tengods, Mapping):
+            for pillar, pillar_data in branch_tengods.items():
+                if isinstance(pillar_data, Mapping) and "roles" in pillar_data:
+                    for i, role_entry in enumerate(pillar_data["roles"]):
+                        path = ("branch_tengods", pillar, "roles", i)
+                        add(path, _labels(role_entry, rules["roles"]))
+
+        # Single-node sections: structure, strength, luck direction, recommendation
+        for section in ("structure", "strength", "luck_direction", "recommendation"):
+            node = payload.get(section)
+            if isinstance(node, Mapping):
+                add((section,), _labels(node, rules[section]))
+
+        # List sections: shensha and relations entries
+        for section in ("shensha", "relations"):
+            node = payload.get(section)
+            if isinstance(node, Mapping) and "list" in node:
+                for i, entry in enumerate(node["list"]):
+                    labels = _labels(entry, rules[section])
+                    if section == "relations" and "pillars" in entry:
+                        labels["pillars_ko"] = [self.pillar_ko.get(p, p) for p in entry["pillars"]]
+                    add((section, "list", i), labels)
+
+        # Pillars: pillar name and jiazi labels
+        pillars = payload.get("pillars")
+        if isinstance(pillars, Mapping):
+            for pillar_name, pillar_data in pillars.items():
+                if isinstance(pillar_data, Mapping):
+                    labels = {"pillar_ko": self.pillar_ko.get(pillar_name, pillar_name)}
+                    labels.update(_labels(pillar_data, rules["pillars"]))
+                    add(("pillars", pillar_name), labels)
+
+        return found
 
     @staticmethod
     def _deep_copy(obj: Any) -> Any:
         """
         Deep copy without using copy.deepcopy (for performance).
 
-        Handles dict, list, and primitive types.
+        Handles dict, list, and primitive types; label overlays are merged into
+        plain dicts. Immutable stage records (``app.core.records``) are shared,
+        not copied.
         """
-        if isinstance(obj, dict):
+        if isinstance(obj, (dict, LabelOverlay)):
             return {k: KoreanLabelEnricher._deep_copy(v) for k, v in obj.items()}
         elif isinstance(obj, list):
             return [KoreanLabelEnricher._deep_copy(item) for item in obj]
         else:
-            # Primitives (str, int, float, bool, None) are immutable
+            # Primitives and frozen records are immutable
             return obj
+
+
+def _labels(node: Mapping, rules: Tuple[LabelRule, ...]) -> Dict[str, Any]:
+    """Labels for the fields of ``node`` (an unmapped value is its own label)."""
+    return {dst: table.get(node[src], node[src]) for src, dst, table in rules if src in node}
+
+
+class LabelOverlay(Mapping):
+    """Read-only view of ``base`` with Korean ``labels`` added as extra keys.
+
+    Iterates the base keys first, then the labels, which is the layout a copied
+    and enriched dict had.
+    """
+
+    __slots__ = ("base", "labels")
+
+    def __init__(self, base: Mapping, labels: Dict[str, Any]) -> None:
+        self.base = base
+        self.labels = labels
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self.labels:
+            return self.labels[key]
+        return self.base[key]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.base
+        for key in self.labels:
+            if key not in self.base:
+                yield key
+
+    def __len__(self) -> int:
+        return len(self.base) + sum(1 for key in self.labels if key not in self.base)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.labels or key in self.base
+
+    def __repr__(self) -> str:
+        return f"LabelOverlay({dict(self)!r})"
+
+
+def iter_json(payload: Any, *, ensure_ascii: bool = False, indent: Optional[int] = None):
+    """Encode ``payload`` chunk by chunk, writing overlay labels inline.
+
+    Streams large results (e.g. to a socket or file) without first building a
+    merged copy or the whole JSON string.
+    """
+    encoder = json.JSONEncoder(ensure_ascii=ensure_ascii, indent=indent, default=json_default)
+    return encoder.iterencode(payload)
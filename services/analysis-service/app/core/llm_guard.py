@@ -1,7 +1,15 @@
-"""LLM validation and guard utilities for analysis responses."""
+"""LLM validation and guard utilities for analysis responses.
+
+Validation mode (``ANALYSIS_VALIDATE``):
+    strict    dump the engine response and re-validate it before the guards run
+    trusted   (default) guard the in-process response directly; it was validated
+              when the engine built it, so the dump/validate round trip is skipped
+LLM output passed to ``postprocess`` is always validated.
+"""
 
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
 from typing import Iterable
 
@@ -9,6 +17,16 @@ from ..models import AnalysisResponse
 from .recommendation import RecommendationGuard
 from .text_guard import TextGuard
 
+VALIDATE_ENV = "ANALYSIS_VALIDATE"
+STRICT = "strict"
+TRUSTED = "trusted"
+
+
+def validation_mode() -> str:
+    """``ANALYSIS_VALIDATE`` (default ``trusted``); unknown values mean ``strict``."""
+    mode = os.getenv(VALIDATE_ENV, TRUSTED).strip().lower()
+    return mode if mode in (STRICT, TRUSTED) else STRICT
+
 
 @dataclass(slots=True)
 class LLMGuard:
@@ -18,17 +36,29 @@ class LLMGuard:
     recommendation_guard: RecommendationGuard
 
     @classmethod
-    def default(cls) -> "LLMGuard":
+    def default(cls, bundle=None) -> "LLMGuard":
+        if bundle is not None:
+            return cls(
+                text_guard=TextGuard.from_policy(bundle.get("text_guard_policy_v1.json")),
+                recommendation_guard=RecommendationGuard.from_policy(
+                    bundle.get("recommendation_policy_v1.json")
+                ),
+            )
         return cls(
             text_guard=TextGuard.from_file(),
             recommendation_guard=RecommendationGuard.from_file(),
         )
 
-    def prepare_payload(self, response: AnalysisResponse) -> dict:
-        """Convert response to plain dict before giving it to an LLM."""
-        # Pydantic ensures structure; raising early if invalid.
-        AnalysisResponse.model_validate(response.model_dump())
-        return response.model_dump()
+    def prepare_payload(self, response: AnalysisResponse, *, validate: str = STRICT) -> dict:
+        """Convert response to plain dict before giving it to an LLM.
+
+        ``strict`` re-validates the dump, raising early if invalid; ``trusted``
+        only dumps.
+        """
+        payload = response.model_dump()
+        if validate == STRICT:
+            AnalysisResponse.model_validate(payload)
+        return payload
 
     def postprocess(
         self,
@@ -45,6 +75,16 @@ class LLMGuard:
         if candidate.trace != original.trace:
             raise ValueError("LLM output modified trace metadata")
 
+        return self.enforce(candidate, structure_primary=structure_primary, topic_tags=topic_tags)
+
+    def enforce(
+        self,
+        candidate: AnalysisResponse,
+        *,
+        structure_primary: str | None = None,
+        topic_tags: Iterable[str] | None = None,
+    ) -> AnalysisResponse:
+        """Apply the text and recommendation guards to ``candidate`` in place."""
         # Text guard for trace notes (향후 확장 대비).
         notes = candidate.trace.get("notes")
         if isinstance(notes, str):
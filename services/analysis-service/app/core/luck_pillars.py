@@ -25,14 +25,17 @@ LuckCalculator v1.0 — Policy-driven decade luck (大運) generator
 """
 from __future__ import annotations
 
-import copy
-import hashlib
-import json
 import math
+import sys
 from dataclasses import dataclass
 from datetime import datetime
+from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[4] / "services" / "common"))
+
+from saju_common.signing import sha256_signature  # noqa: E402
+
 # 60갑자 시퀀스 (결정적)
 SEXAGENARY = [
     "甲子",
@@ -313,9 +316,4 @@ class LuckCalculator:
 
     @staticmethod
     def _sha256_canonical(obj_with_sig: Dict[str, Any]) -> str:
-        o = copy.deepcopy(obj_with_sig)
-        o.pop("policy_signature", None)
-        data = json.dumps(o, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode(
-            "utf-8"
-        )
-        return hashlib.sha256(data).hexdigest()
+        return sha256_signature(obj_with_sig, exclude=("policy_signature",))
@@ -206,7 +206,7 @@ class MasterOrchestrator:
         s3 = self.stage3.analyze(stage3_ctx)
 
         # Post processing
-        enriched = self.korean.enrich(
+        enriched = self.korean.overlay(
             {
                 "pillars": pillars,
                 "season": season,
@@ -0,0 +1,280 @@
+"""Run analyses in a pool of warm worker processes.
+
+``SajuOrchestrator.analyze`` is pure-Python CPU work, so threads only contend
+for the GIL. ``AnalysisOffloader`` sends each request to a
+``ProcessPoolExecutor`` whose workers build (and prewarm) the engine registry
+once, which lets one pod use every core while the event loop stays free for
+health checks and I/O.
+
+Backpressure: at most ``max_pending`` analyses may be queued or running.
+Beyond that ``analyze`` raises ``PoolSaturated`` immediately (the route answers
+503 with ``Retry-After``) instead of growing an unbounded queue. A deadline
+(``timeout``) answers the request and cancels the job if it has not been handed
+to a worker yet; a job already running cannot be interrupted, so it keeps its
+pending slot until it ends.
+
+A worker that dies (OOM kill, segfault) breaks its whole
+``ProcessPoolExecutor``. The affected requests get ``PoolRestarting`` (also
+503 with ``Retry-After``), and the pool is replaced in the background with the
+same warm-up as ``restart``.
+
+``analyze_json`` serializes the response in the worker and returns the JSON
+body, so the parent neither unpickles a model tree nor encodes it again.
+
+Stage-timing histograms (``ANALYSIS_STAGE_TIMING``) observed in a worker are
+returned alongside its result and recorded in the parent, which serves
+/metrics. ``restart`` warms the replacement workers up before swapping them
+in, so a policy reload does not send requests to cold processes.
+
+Configuration (env):
+    ANALYSIS_WORKERS       worker processes; 0 (default) analyzes in-process
+    ANALYSIS_MAX_PENDING   queued + running jobs before 503 (default 4 x workers)
+    ANALYSIS_TIMEOUT       per-request deadline in seconds (default 10)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, List, Optional, Tuple
+
+from services.common.responses import dumps_json
+
+from ..instrumentation.stage_timer import Sample, buffer_samples, drain_samples, record_samples
+from ..models import AnalysisRequest, AnalysisResponse
+
+logger = logging.getLogger(__name__)
+
+WORKERS_ENV = "ANALYSIS_WORKERS"
+MAX_PENDING_ENV = "ANALYSIS_MAX_PENDING"
+TIMEOUT_ENV = "ANALYSIS_TIMEOUT"
+
+DEFAULT_TIMEOUT = 10.0
+PENDING_PER_WORKER = 4
+RETRY_AFTER_SECONDS = 1
+# Roughly how long replacement workers take to build and prewarm their registries
+RESTART_RETRY_AFTER_SECONDS = 5
+
+
+class PoolSaturated(RuntimeError):
+    """Every pending slot is taken; the caller should retry later."""
+
+    def __init__(self, pending: int, retry_after: int = RETRY_AFTER_SECONDS) -> None:
+        super().__init__(f"Analysis pool saturated ({pending} pending)")
+        self.retry_after = retry_after
+
+
+class PoolRestarting(PoolSaturated):
+    """A worker died and the pool is being replaced; the caller should retry later."""
+
+    def __init__(self, retry_after: int = RESTART_RETRY_AFTER_SECONDS) -> None:
+        RuntimeError.__init__(self, "Analysis worker pool is restarting after a worker died")
+        self.retry_after = retry_after
+
+
+# --- worker process -----------------------------------------------------------
+
+
+def _init_worker() -> None:
+    """Build and prewarm the registry (and tz offset tables) once per worker process."""
+    from saju_common.tz_registry import prewarm_zones
+
+    from .registry import get_registry
+
+    buffer_samples()  # this process's /metrics is never scraped; see _run_analysis
+    prewarm_zones()
+    get_registry().prewarm()
+
+
+def _run_analysis(payload: AnalysisRequest) -> Tuple[AnalysisResponse, List[Sample]]:
+    """Analyze ``payload``; also return the metric samples buffered since the last job."""
+    from .registry import get_registry
+
+    return get_registry().analyze(payload), drain_samples()
+
+
+def _run_analysis_json(payload: AnalysisRequest) -> Tuple[bytes, List[Sample]]:
+    response, samples = _run_analysis(payload)
+    return dumps_json(response), samples
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+# --- parent process -----------------------------------------------------------
+
+
+def _int_from_env(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+def _float_from_env(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+class AnalysisOffloader:
+    """Bounded, deadline-aware front of a warm ``ProcessPoolExecutor``."""
+
+    def __init__(
+        self,
+        workers: int,
+        *,
+        max_pending: Optional[int] = None,
+        timeout: Optional[float] = DEFAULT_TIMEOUT,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("AnalysisOffloader needs at least one worker")
+        self.workers = workers
+        self.max_pending = max_pending or workers * PENDING_PER_WORKER
+        self.timeout = timeout
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._restart_lock = threading.Lock()
+        self._recovering = False
+        self._pool = self._new_pool()
+
+    @classmethod
+    def from_env(cls) -> Optional["AnalysisOffloader"]:
+        """Offloader configured from ``ANALYSIS_*`` env vars; None when workers is 0."""
+        workers = _int_from_env(WORKERS_ENV, 0)
+        if workers <= 0:
+            return None
+        timeout = _float_from_env(TIMEOUT_ENV, DEFAULT_TIMEOUT)
+        return cls(
+            workers,
+            max_pending=_int_from_env(MAX_PENDING_ENV, 0) or None,
+            timeout=timeout if timeout > 0 else None,
+        )
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        # spawn: the parent runs uvicorn and watcher threads, which fork() would copy mid-state
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+        )
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def _release(self, _future: Future) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    def submit(self, fn: Any, *args: Any) -> Future:
+        """Submit ``fn(*args)`` if a pending slot is free, else raise ``PoolSaturated``."""
+        with self._lock:
+            if self._pending >= self.max_pending:
+                raise PoolSaturated(self._pending)
+            self._pending += 1
+        pool = self._pool
+        try:
+            future = pool.submit(fn, *args)
+        except BaseException as exc:
+            with self._lock:
+                self._pending -= 1
+            if isinstance(exc, BrokenProcessPool):
+                self._replace_broken(pool)
+                raise PoolRestarting() from exc
+            raise
+        # Released when the job really ends, not when the awaiting request gives up
+        future.add_done_callback(self._release)
+        return future
+
+    async def run(self, fn: Any, *args: Any, timeout: Optional[float] = None) -> Any:
+        """Await ``fn(*args)`` in a worker within ``timeout`` (default: ``self.timeout``).
+
+        Raises ``PoolSaturated`` (``PoolRestarting`` when a worker died) or
+        ``asyncio.TimeoutError``. If the awaiting task is cancelled (client
+        gone, deadline hit) a job still waiting in the queue is dropped.
+        """
+        pool = self._pool
+        future = self.submit(fn, *args)
+        deadline = self.timeout if timeout is None else timeout
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), deadline)
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            future.cancel()
+            raise
+        except BrokenProcessPool as exc:
+            self._replace_broken(pool)
+            raise PoolRestarting() from exc
+
+    async def _run_recorded(self, fn: Any, payload: Any, timeout: Optional[float]) -> Any:
+        result, samples = await self.run(fn, payload, timeout=timeout)
+        record_samples(samples)
+        return result
+
+    async def analyze(
+        self, payload: AnalysisRequest, timeout: Optional[float] = None
+    ) -> AnalysisResponse:
+        """Run the full analysis pipeline for ``payload`` in a worker."""
+        return await self._run_recorded(_run_analysis, payload, timeout)
+
+    async def analyze_json(
+        self, payload: AnalysisRequest, timeout: Optional[float] = None
+    ) -> bytes:
+        """Like ``analyze``, but return the response already serialized to JSON."""
+        return await self._run_recorded(_run_analysis_json, payload, timeout)
+
+    def _warm_up(self, pool: ProcessPoolExecutor) -> List[Future]:
+        # One ping per worker; each worker builds and prewarms its registry first
+        return [pool.submit(_ping) for _ in range(self.workers)]
+
+    async def prewarm(self) -> None:
+        """Start every worker (each builds and prewarms its registry) before serving."""
+        await asyncio.gather(*(asyncio.wrap_future(f) for f in self._warm_up(self._pool)))
+
+    def restart(self) -> None:
+        """Replace the pool with fresh, prewarmed workers (e.g. after a policy reload).
+
+        Blocks until the new workers are warm; requests keep going to the old
+        pool meanwhile. Queued and running jobs finish on the old workers, which
+        exit afterwards.
+        """
+        with self._restart_lock:
+            pool = self._new_pool()
+            try:
+                for future in self._warm_up(pool):
+                    future.result()
+            except BaseException:
+                pool.shutdown(wait=False, cancel_futures=True)
+                raise
+            old, self._pool = self._pool, pool
+            old.shutdown(wait=False)
+        logger.info("Analysis worker pool restarted (%d workers)", self.workers)
+
+    def _replace_broken(self, pool: ProcessPoolExecutor) -> None:
+        """Restart (once, in a background thread) after a worker of ``pool`` died."""
+        with self._lock:
+            if pool is not self._pool or self._recovering:
+                return
+            self._recovering = True
+        logger.error("Analysis worker died; replacing the worker pool")
+        threading.Thread(target=self._recover, name="analysis-pool-recovery", daemon=True).start()
+
+    def _recover(self) -> None:
+        try:
+            self.restart()
+        except Exception:
+            # The pool stays broken; the next failing request tries again
+            logger.exception("Replacing the broken analysis worker pool failed")
+        finally:
+            with self._lock:
+                self._recovering = False
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=True, cancel_futures=True)
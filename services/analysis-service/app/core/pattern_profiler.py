@@ -4,103 +4,39 @@ try:
 except ImportError:
     from policy_loader import load_policy_json, resolve_policy_path  # noqa: F401
 
-
-def _get(d, path, default=None):
-    cur = d
-    for p in path.split("."):
-        if not isinstance(cur, dict):
-            return default
-        if p not in cur:
-            return default
-        cur = cur[p]
-    return cur
-
-
-def _map_elem(x):
-    m = {
-        "목": "wood",
-        "화": "fire",
-        "토": "earth",
-        "금": "metal",
-        "수": "water",
-        "wood": "wood",
-        "fire": "fire",
-        "earth": "earth",
-        "metal": "metal",
-        "water": "water",
-    }
-    return m.get(x, x)
-
-
-def _any_flag(need, have):
-    return bool(set(need).intersection(set(have or [])))
+try:
+    from .rule_compiler import RuleContext, RuleProgram, get_path
+except ImportError:
+    from rule_compiler import RuleContext, RuleProgram, get_path
 
 
 class PatternProfiler:
-    def __init__(self, policy_file: str = "pattern_profiler_policy_v1.json"):
-        p = load_policy_json(policy_file)
+    def __init__(self, policy_file: str = "pattern_profiler_policy_v1.json", bundle=None):
+        p = (bundle.get if bundle is not None else load_policy_json)(policy_file)
         self.policy = p
         self.tags_catalog = set(p["tags_catalog"])
+        self.program = RuleProgram(
+            (r.get("id", f"rule_{i}"), r["when"]) for i, r in enumerate(p["rules"])
+        )
 
-    def _match_when(self, when: dict, ctx: dict) -> bool:
-        if "strength.phase_in" in when and _get(ctx, "strength.phase") not in set(
-            when["strength.phase_in"]
-        ):
-            return False
-        if "strength.elements_any" in when:
-            ok = False
-            for token in when["strength.elements_any"]:
-                lv, el = token.split(":")
-                if el == "primary":
-                    el = _get(ctx, "yongshin.primary")
-                el = _map_elem(el)
-                if _get(ctx, f"strength.elements.{el}") == lv:
-                    ok = True
-                    break
-            if not ok:
-                return False
-        if "relation.flags_any" in when:
-            if not set(when["relation.flags_any"]).intersection(
-                set(_get(ctx, "relation.flags", []) or [])
-            ):
-                return False
-        if "yongshin.primary_in" in when and _get(ctx, "yongshin.primary") not in set(
-            when["yongshin.primary_in"]
-        ):
-            return False
-        bi = _get(ctx, "climate.balance_index", 0)
-        if "climate.balance_index_gte" in when and not (bi >= when["climate.balance_index_gte"]):
-            return False
-        if "climate.balance_index_lte" in when and not (bi <= when["climate.balance_index_lte"]):
-            return False
-        if "climate.flags_any" in when:
-            if not set(when["climate.flags_any"]).intersection(
-                set(_get(ctx, "climate.flags", []) or [])
-            ):
-                return False
-        if "luck_flow.trend_in" in when and _get(ctx, "luck_flow.trend") not in set(
-            when["luck_flow.trend_in"]
-        ):
-            return False
-        if "gyeokguk.type_in" in when and _get(ctx, "gyeokguk.type") not in set(
-            when["gyeokguk.type_in"]
-        ):
-            return False
-        return True
+    def rule_stats(self):
+        """Per-rule evaluation counts and timings (see RuleProgram.stats)."""
+        return self.program.stats()
 
     def run(self, ctx: dict) -> dict:
         tags, briefs = [], {"one_liner": "", "key_points": []}
-        for r in self.policy["rules"]:
-            if self._match_when(r["when"], ctx):
-                for t in r["emit"]["tags"]:
-                    if t in self.tags_catalog and t not in tags:
-                        tags.append(t)
-                bt = r["emit"].get("brief_templates")
-                if bt:
-                    if "one_liner" in bt and not briefs["one_liner"]:
-                        briefs["one_liner"] = bt["one_liner"]
-                    if "key_points" in bt:
-                        briefs["key_points"].extend(bt["key_points"])
+        rules = self.policy["rules"]
+        for i in self.program.all_matches(RuleContext.from_ctx(ctx)):
+            r = rules[i]
+            for t in r["emit"]["tags"]:
+                if t in self.tags_catalog and t not in tags:
+                    tags.append(t)
+            bt = r["emit"].get("brief_templates")
+            if bt:
+                if "one_liner" in bt and not briefs["one_liner"]:
+                    briefs["one_liner"] = bt["one_liner"]
+                if "key_points" in bt:
+                    briefs["key_points"].extend(bt["key_points"])
         return {
             "engine": "pattern_profiler",
             "policy_version": self.policy["policy_version"],
@@ -109,5 +45,5 @@ class PatternProfiler:
                 "one_liner": briefs["one_liner"][:120].replace("\\n", " "),
                 "key_points": [k[:80] for k in briefs["key_points"][:5]],
             },
-            "evidence_ref": f"pattern_profiler/{_get(ctx,'luck_flow.trend','-')}/{_get(ctx,'gyeokguk.type','-')}",
+            "evidence_ref": f"pattern_profiler/{get_path(ctx,'luck_flow.trend','-')}/{get_path(ctx,'gyeokguk.type','-')}",
         }
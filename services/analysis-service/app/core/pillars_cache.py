@@ -0,0 +1,109 @@
+"""Bounded LRU cache for the pillars-pure phase of ``SajuOrchestrator``.
+
+Everything the orchestrator computes before luck (strength, relations, ten gods,
+twelve stages, elements, climate, yongshin, shensha, void, yuanjin, Stage-3) is
+a function of the four pillar strings and the loaded policies only. Results are
+cached under ``(year, month, day, hour, policy_signature)``, where the signature
+is the ``PolicyBundle.bundle_hash`` the orchestrator was built from; the key space is at
+most 60⁴ per policy set and real traffic repeats charts heavily.
+
+Cached values are shared between requests and must be treated as read-only.
+Stage results are frozen records (``app.core.records``); the remaining dicts
+are only read, or shared by the Korean label overlay, which copies just the
+containers it labels.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable
+
+CACHE_SIZE_ENV = "ANALYSIS_PILLARS_CACHE_SIZE"
+DEFAULT_CACHE_SIZE = 4096
+
+
+def cache_size_from_env() -> int:
+    """Cache capacity from ``ANALYSIS_PILLARS_CACHE_SIZE`` (0 disables caching)."""
+    return max(0, int(os.getenv(CACHE_SIZE_ENV, DEFAULT_CACHE_SIZE)))
+
+
+@dataclass(frozen=True, slots=True)
+class CacheStats:
+    """Point-in-time counters of a :class:`PillarsAnalysisCache`."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+
+class PillarsAnalysisCache:
+    """Thread-safe LRU with hit/miss/eviction counters.
+
+    ``maxsize=0`` disables storage: every lookup is a miss and computes afresh.
+    """
+
+    __slots__ = ("_maxsize", "_entries", "_lock", "_hits", "_misses", "_evictions")
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE) -> None:
+        if maxsize < 0:
+            raise ValueError(f"maxsize must be >= 0, got {maxsize}")
+        self._maxsize = maxsize
+        self._entries: OrderedDict[Hashable, Dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_compute(
+        self, key: Hashable, compute: Callable[[], Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Return the cached value for ``key``, computing and storing it on a miss.
+
+        ``compute`` runs outside the lock; exceptions propagate and nothing is stored.
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return value
+            self._misses += 1
+
+        value = compute()
+        if self._maxsize == 0:
+            return value
+
+        with self._lock:
+            existing = self._entries.get(key)
+            if existing is not None:
+                # Another thread filled the slot while we computed; keep one copy.
+                self._entries.move_to_end(key)
+                return existing
+            self._entries[key] = value
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+        return value
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+                maxsize=self._maxsize,
+            )
+
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
@@ -27,7 +27,10 @@ class RecommendationGuard:
     @classmethod
     def from_file(cls, path: Path = POLICY_PATH) -> "RecommendationGuard":
         with path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+            return cls.from_policy(json.load(f))
+
+    @classmethod
+    def from_policy(cls, data: Dict[str, object]) -> "RecommendationGuard":
         return cls(
             require_structure=data.get("require_structure", True),
             fallback_action=data.get("fallback_when_no_structure", "suppress"),
@@ -0,0 +1,157 @@
+"""Typed, slotted, immutable records for orchestrator stage results.
+
+``SajuOrchestrator`` used to build a fresh nested dict per stage, which
+``KoreanLabelEnricher`` then deep-copied and ``AnalysisEngine`` read once more
+into Pydantic models. The strength, relations, ten gods, twelve stages and
+luck stages now return frozen ``__slots__`` dataclasses instead:
+
+- no per-instance ``__dict__`` and no defensive copies: the enricher shares
+  records instead of copying them, and cached pillars-phase records are safe to
+  share across requests because they cannot be mutated;
+- each record is also a read-only ``Mapping`` over its fields, so existing
+  consumers (``result["strength"]["grade_code"]``, ``.get()``, ``in``, ``==``
+  against dicts) keep working unchanged;
+- serialization happens once, at the edge: ``json.dumps(result,
+  default=json_default)`` writes records in place without building an
+  intermediate plain-dict tree.
+
+Nested engine payloads (``details``, ``by_pillar``, luck ``pillars``) are the
+engines' own objects, referenced rather than copied; treat them as read-only.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, fields
+from typing import Any, ClassVar, Dict, FrozenSet, Iterator, List, Optional, Tuple, Type, TypeVar
+
+R = TypeVar("R", bound="Record")
+
+
+class Record(Mapping):
+    """Read-only ``Mapping`` view over the fields of a slotted dataclass."""
+
+    __slots__ = ()
+
+    _keys: ClassVar[Tuple[str, ...]] = ()
+    _key_set: ClassVar[FrozenSet[str]] = frozenset()
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._key_set:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._key_set
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in self._key_set else default
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Shallow ``dict`` of the fields, in declaration order."""
+        return {key: getattr(self, key) for key in self._keys}
+
+    @classmethod
+    def from_mapping(cls: Type[R], data: Mapping) -> R:
+        """Build from an engine's output dict (keys beyond the fields are ignored)."""
+        return cls(**{key: data[key] for key in cls._keys if key in data})
+
+
+def record(cls: Type[R]) -> Type[R]:
+    """Class decorator: frozen slotted dataclass that keeps ``Mapping`` equality."""
+    # eq=False keeps Mapping.__eq__, so records compare equal to matching dicts
+    cls = dataclass(frozen=True, slots=True, eq=False)(cls)
+    cls._keys = tuple(f.name for f in fields(cls))
+    cls._key_set = frozenset(cls._keys)
+    return cls
+
+
+def json_default(obj: Any) -> Any:
+    """``json.dumps(..., default=json_default)`` hook that writes records in place.
+
+    Other read-only ``Mapping`` views (e.g. Korean label overlays) are merged here.
+    """
+    if isinstance(obj, Record):
+        return obj.to_dict()
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+@record
+class StrengthRecord(Record):
+    """StrengthEvaluator v2 result (score, grade and their breakdown)."""
+
+    score_raw: float
+    score: float
+    score_normalized: float
+    grade_code: str
+    bin: str
+    phase: str
+    details: Dict[str, Any]
+    policy: Dict[str, float]
+
+
+@record
+class RelationsRecord(Record):
+    """RelationTransformer result for the four branches."""
+
+    priority_hit: Optional[str]
+    transform_to: Optional[str]
+    boosts: List[Dict[str, str]]
+    notes: List[str]
+    extras: Dict[str, object]
+
+
+@record
+class TenGodsRecord(Record):
+    """TenGodsCalculator result (per pillar, counts, dominant/missing)."""
+
+    policy_version: str
+    by_pillar: Dict[str, Dict[str, Any]]
+    summary: Dict[str, int]
+    dominant: List[str]
+    missing: List[str]
+    policy_signature: str
+
+    @classmethod
+    def empty(cls) -> "TenGodsRecord":
+        return cls("ten_gods_v1.0", {}, {}, [], [], "")
+
+
+@record
+class TwelveStagesRecord(Record):
+    """TwelveStagesCalculator result (per pillar, counts, dominant/weakest)."""
+
+    policy_version: str
+    by_pillar: Dict[str, Dict[str, str]]
+    summary: Dict[str, int]
+    dominant: List[str]
+    weakest: List[str]
+
+    @classmethod
+    def empty(cls) -> "TwelveStagesRecord":
+        return cls("twelve_stages_v1.0", {}, {}, [], [])
+
+
+@record
+class LuckRecord(Record):
+    """LuckCalculator result (direction, start age, decade pillars)."""
+
+    policy_version: str
+    direction: str
+    start_age: float
+    method: str
+    pillars: List[Dict[str, Any]]
+    current_luck: Optional[Dict[str, Any]]
+    policy_signature: str
+
+    @classmethod
+    def empty(cls) -> "LuckRecord":
+        return cls("luck_pillars_v1", "forward", 0.0, "solar_term_interval", [], None, "")
@@ -0,0 +1,157 @@
+"""Process-wide engine registry for the analysis service.
+
+Building a ``SajuOrchestrator`` reads ~20 policy JSON files, so the API must not
+construct one per request. The registry is created once (at app startup via the
+lifespan hook, or lazily on first use) and shared by every worker thread. All
+engines held here are read-only after construction, which makes sharing safe.
+
+With policy hot-reload enabled, ``reload_registry`` builds a complete registry
+from the new ``PolicyBundle`` and then swaps the module-level reference. A
+request resolves the registry once, so it runs on a single snapshot even if a
+reload lands mid-request.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sys
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[4] / "services" / "common"))
+
+from saju_common.policy_bundle import PolicyBundle, get_policy_bundle
+
+from ..models import AnalysisRequest, AnalysisResponse
+from .engine import AnalysisEngine
+from .llm_guard import TRUSTED, LLMGuard, validation_mode
+
+logger = logging.getLogger(__name__)
+
+PREWARM_ENV = "ANALYSIS_PREWARM"
+
+# Canned chart used to exercise every engine once before serving traffic.
+PREWARM_REQUEST = {
+    "pillars": {
+        "year": {"pillar": "壬申"},
+        "month": {"pillar": "辛未"},
+        "day": {"pillar": "丁丑"},
+        "hour": {"pillar": "庚子"},
+    },
+    "options": {
+        "include_trace": True,
+        "birth_dt": "1992-07-15T23:40:00",
+        "gender": "M",
+        "timezone": "Asia/Seoul",
+    },
+}
+
+
+@dataclass(frozen=True, slots=True)
+class EngineRegistry:
+    """Immutable bundle of long-lived engines shared across requests."""
+
+    engine: AnalysisEngine
+    llm_guard: LLMGuard
+    policy_bundle: PolicyBundle
+    validate: str = TRUSTED
+
+    @classmethod
+    def build(cls, bundle: PolicyBundle | None = None) -> "EngineRegistry":
+        bundle = bundle if bundle is not None else get_policy_bundle()
+        return cls(
+            engine=AnalysisEngine(policy_bundle=bundle),
+            llm_guard=LLMGuard.default(bundle),
+            policy_bundle=bundle,
+            validate=validation_mode(),
+        )
+
+    def analyze(self, payload: AnalysisRequest, *, validate: str | None = None) -> AnalysisResponse:
+        """Full ``/v2/analyze`` pipeline: orchestrator analysis, then LLM guard.
+
+        ``validate`` (default: the registry's ``ANALYSIS_VALIDATE`` mode) picks
+        between the strict dump/validate round trip and guarding in place.
+        """
+        response = self.engine.analyze(payload)
+        primary = response.structure.primary
+        if (validate or self.validate) == TRUSTED:
+            return self.llm_guard.enforce(response, structure_primary=primary, topic_tags=[])
+        llm_payload = self.llm_guard.prepare_payload(response)
+        return self.llm_guard.postprocess(
+            response, llm_payload, structure_primary=primary, topic_tags=[]
+        )
+
+    def prewarm(self) -> Dict[str, Any]:
+        """Run the canned chart through every orchestrator engine once.
+
+        Returns the orchestrator status so callers can log or assert on it.
+        """
+        request = AnalysisRequest.model_validate(PREWARM_REQUEST)
+        pillars = self.engine._extract_pillars(request)
+        birth_context = self.engine._extract_birth_context(request.options)
+        result = self.engine.orchestrator.analyze(pillars, birth_context)
+        status = result.get("status", "unknown")
+        if status != "success":
+            logger.warning(
+                "Analysis prewarm finished with status=%s: %s",
+                status,
+                result.get("error_message"),
+            )
+            return {"status": status, "error_message": result.get("error_message")}
+
+        logger.info("Analysis prewarm completed")
+        return {"status": status, "engines_used": result["meta"]["engines_used"]}
+
+
+_registry: EngineRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def get_registry() -> EngineRegistry:
+    """Return the process-wide registry, building it on first use."""
+    global _registry
+    registry = _registry
+    if registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = EngineRegistry.build()
+            registry = _registry
+    return registry
+
+
+def init_registry(*, prewarm: bool | None = None) -> EngineRegistry:
+    """Build the registry eagerly (lifespan startup) and optionally prewarm it.
+
+    When ``prewarm`` is ``None`` the ``ANALYSIS_PREWARM`` env var decides.
+    """
+    registry = get_registry()
+    if prewarm is None:
+        prewarm = os.getenv(PREWARM_ENV, "").lower() in ("1", "true", "yes")
+    if prewarm:
+        registry.prewarm()
+    return registry
+
+
+def reload_registry(bundle: PolicyBundle) -> EngineRegistry:
+    """Build a registry from ``bundle`` and make it current (policy reload hook).
+
+    The new registry is prewarmed before the swap when ``ANALYSIS_PREWARM`` is
+    set, so the first requests after a reload do not pay for lazy loading.
+    """
+    global _registry
+    registry = EngineRegistry.build(bundle)
+    if os.getenv(PREWARM_ENV, "").lower() in ("1", "true", "yes"):
+        registry.prewarm()
+    with _registry_lock:
+        _registry = registry
+    return registry
+
+
+def reset_registry() -> None:
+    """Drop the cached registry (test helper)."""
+    global _registry
+    with _registry_lock:
+        _registry = None
@@ -9,20 +9,14 @@ Policy: policy/relation_weight_policy_v1.0.json
 
 from __future__ import annotations
 
-# Inline signature utilities (until infra/signatures.py is created)
-import hashlib
 import json
+import sys
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-try:
-    from canonicaljson import encode_canonical_json
-except ImportError:
-    import json as json_fallback
-
-    def encode_canonical_json(obj):
-        return json_fallback.dumps(obj, sort_keys=True, separators=(",", ":")).encode("utf-8")
+sys.path.insert(0, str(Path(__file__).resolve().parents[4] / "services" / "common"))
 
+from saju_common.signing import canonical_bytes, sha256_signature  # noqa: E402
 
 POLICY_VERSION = "relation_weight_v1.0.0"
 TWELVE_BRANCHES = ["子", "丑", "寅", "卯", "辰", "巳", "午", "未", "申", "酉", "戌", "亥"]
@@ -64,16 +58,12 @@ DESTRUCTS = {"木": "土", "土": "水", "水": "火", "火": "金", "金": "木
 
 def _canonical_json(obj: Any) -> bytes:
     """RFC-8785 approximate canonical JSON serialization"""
-    if isinstance(obj, dict):
-        cleaned = {k: v for k, v in obj.items() if k != "policy_signature"}
-        return encode_canonical_json(cleaned)
-    return encode_canonical_json(obj)
+    return canonical_bytes(obj, exclude=("policy_signature",))
 
 
 def _sign_data(obj: Any) -> str:
     """Generate SHA-256 signature for canonical JSON"""
-    canonical = _canonical_json(obj)
-    return hashlib.sha256(canonical).hexdigest()
+    return sha256_signature(obj, exclude=("policy_signature",))
 
 
 class RelationWeightEvaluator:
@@ -82,10 +72,11 @@ class RelationWeightEvaluator:
     based on contextual conditions.
     """
 
-    def __init__(self, policy_path: Optional[str] = None):
+    def __init__(self, policy_path: Optional[str] = None, bundle=None):
         """
         Args:
             policy_path: Path to relation_weight_policy JSON. Defaults to policy/ directory.
+            bundle: ``PolicyBundle`` to read ``policy_path`` from instead of opening it
         """
         if policy_path is None:
             repo_root = (
@@ -93,15 +84,20 @@ class RelationWeightEvaluator:
             )  # services/analysis-service/app/core/ -> root
             policy_path = str(repo_root / "policy" / "relation_weight_policy_v1.0.json")
 
-        self.policy = self._load_policy(policy_path)
+        if bundle is not None:
+            self.policy = self._validate_policy(bundle.get_path(policy_path))
+        else:
+            self.policy = self._load_policy(policy_path)
         self.policy_map = {r["relation"]: r for r in self.policy["relations"]}
 
     @staticmethod
     def _load_policy(path: str) -> Dict[str, Any]:
         """Load and validate policy JSON"""
         with open(path, encoding="utf-8") as f:
-            policy = json.load(f)
+            return RelationWeightEvaluator._validate_policy(json.load(f))
 
+    @staticmethod
+    def _validate_policy(policy: Dict[str, Any]) -> Dict[str, Any]:
         # Validate version
         if policy.get("policy_version") != POLICY_VERSION:
             raise ValueError(
@@ -71,18 +71,28 @@ class RelationResult:
 class RelationTransformer:
     """Evaluate relation transformations according to policy priority."""
 
-    def __init__(self, policy: Dict[str, object]) -> None:
+    def __init__(
+        self,
+        policy: Dict[str, object],
+        five_he_policy: Optional[Dict[str, object]] = None,
+        zixing_policy: Optional[Dict[str, object]] = None,
+    ) -> None:
+        """Optional policies left as ``None`` are read from their default files."""
         self._policy = policy
         self._definitions = policy.get("definitions", {})
         self._priority = policy.get("priority", [])
-        self._five_he_policy: Dict[str, object] = {}
-        if FIVE_HE_POLICY_PATH is not None:
-            with FIVE_HE_POLICY_PATH.open("r", encoding="utf-8") as f:
-                self._five_he_policy = json.load(f)
-        self._zixing_policy: Dict[str, object] = {}
-        if ZIXING_POLICY_PATH is not None:
-            with ZIXING_POLICY_PATH.open("r", encoding="utf-8") as f:
-                self._zixing_policy = json.load(f)
+        if five_he_policy is None:
+            five_he_policy = {}
+            if FIVE_HE_POLICY_PATH is not None:
+                with FIVE_HE_POLICY_PATH.open("r", encoding="utf-8") as f:
+                    five_he_policy = json.load(f)
+        self._five_he_policy: Dict[str, object] = five_he_policy
+        if zixing_policy is None:
+            zixing_policy = {}
+            if ZIXING_POLICY_PATH is not None:
+                with ZIXING_POLICY_PATH.open("r", encoding="utf-8") as f:
+                    zixing_policy = json.load(f)
+        self._zixing_policy: Dict[str, object] = zixing_policy
 
     @classmethod
     def from_file(cls, path: Optional[Path] = None) -> "RelationTransformer":
@@ -91,6 +101,22 @@ class RelationTransformer:
             data = json.load(f)
         return cls(data)
 
+    @classmethod
+    def from_bundle(cls, bundle) -> "RelationTransformer":
+        """Build from a ``PolicyBundle`` (same file fallbacks as the module paths)."""
+
+        def first(*names: str) -> Optional[Dict[str, object]]:
+            return next((bundle.get(n) for n in names if n in bundle), None)
+
+        policy = first("relation_transform_rules_v1_1.json", "relation_transform_rules.json")
+        if policy is None:
+            raise FileNotFoundError("Policy file not found: relation_transform_rules_v1_1.json")
+        return cls(
+            policy,
+            five_he_policy=first("five_he_policy_v1_2.json", "five_he_policy_v1.json") or {},
+            zixing_policy=first("zixing_rules_v1.json") or {},
+        )
+
     def evaluate(self, ctx: RelationContext) -> RelationResult:
         extras: Dict[str, object] = {}
         priority_entry: Optional[Tuple[str, Optional[str], List[Dict[str, str]], List[str]]] = None
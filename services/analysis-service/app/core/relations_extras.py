@@ -16,8 +16,8 @@ class RelationContext:
 
 
 class RelationAnalyzer:
-    def __init__(self, policy_file: str = "relation_policy_v1.json"):
-        p = load_policy_json(policy_file)
+    def __init__(self, policy_file: str = "relation_policy_v1.json", bundle=None):
+        p = (bundle.get if bundle is not None else load_policy_json)(policy_file)
         self.policy = p
         self.five_he_cfg = p.get("five_he_policy", {})
         self.sanhe_groups = p.get("sanhe_groups", {})
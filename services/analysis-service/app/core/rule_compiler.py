@@ -0,0 +1,319 @@
+# -*- coding: utf-8 -*-
+"""
+Shared compiler for Stage-3 rule policies.
+
+GyeokgukClassifier, LuckFlow, PatternProfiler and ClimateAdvice all select rules
+with the same ``when`` vocabulary (``strength.phase_in``, ``relation.flags_any``,
+``strength.elements_any: ["high:primary"]``, ...). Instead of re-interpreting
+dotted paths and rebuilding sets per rule per request, each policy is compiled
+once at load time into a :class:`RuleProgram` of pre-bound predicate closures.
+
+Per request the engine context is flattened once into a :class:`RuleContext`;
+every predicate then reads plain attributes.
+
+Each program keeps per-rule evaluation and match counts, plus cumulative
+evaluation time when ``STAGE3_RULE_TIMINGS=1`` (``RuleProgram.stats()``).
+Counters are updated without a lock and may undercount slightly under heavy
+thread contention.
+
+Version: 1.0.0
+Date: 2025-10-16
+"""
+from __future__ import annotations
+
+import logging
+import os
+from dataclasses import dataclass
+from operator import attrgetter
+from time import perf_counter_ns
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+ELEMENT_ALIASES = {
+    "목": "wood",
+    "화": "fire",
+    "토": "earth",
+    "금": "metal",
+    "수": "water",
+    "wood": "wood",
+    "fire": "fire",
+    "earth": "earth",
+    "metal": "metal",
+    "water": "water",
+}
+
+TIMINGS_ENV = "STAGE3_RULE_TIMINGS"
+
+# Boolean context paths usable directly as ``when`` keys (LuckFlow transitions).
+TRUTHY_PATHS = (
+    "daewoon.turning_to_support_primary",
+    "daewoon.turning_to_counter_primary",
+    "sewoon.supports_primary",
+    "sewoon.counters_primary",
+)
+
+
+def get_path(d: Any, path: str, default: Any = None) -> Any:
+    """Resolve a dotted ``path`` in nested dicts, returning ``default`` if absent."""
+    cur = d
+    for p in path.split("."):
+        if not isinstance(cur, dict):
+            return default
+        if p not in cur:
+            return default
+        cur = cur[p]
+    return cur
+
+
+def map_element(x: Any) -> Any:
+    """Normalise Korean/English element names to English (unknown values pass through)."""
+    return ELEMENT_ALIASES.get(x, x)
+
+
+@dataclass(slots=True)
+class RuleContext:
+    """Flat view of a Stage-3 engine context, extracted once per request.
+
+    Not frozen (frozen dataclass construction is several times slower); treat
+    instances as read-only.
+    """
+
+    phase: Any
+    elements: Mapping[str, Any]
+    primary: Any
+    primary_element: str
+    relation_flags: frozenset
+    climate_flags: frozenset
+    balance_index: Any
+    season: Any
+    luck_flow_trend: Any
+    gyeokguk_type: Any
+    truthy: Mapping[str, bool]
+
+    @classmethod
+    def from_ctx(cls, ctx: dict) -> "RuleContext":
+        """Equivalent to resolving every path with :func:`get_path`, in one pass."""
+        strength = _section(ctx, "strength")
+        yongshin = _section(ctx, "yongshin")
+        relation = _section(ctx, "relation")
+        climate = _section(ctx, "climate")
+        daewoon = _section(ctx, "daewoon")
+        sewoon = _section(ctx, "sewoon")
+        elements = strength.get("elements", _EMPTY)
+        primary = yongshin.get("primary")
+        return cls(
+            phase=strength.get("phase"),
+            elements=elements if isinstance(elements, dict) else _EMPTY,
+            primary=primary,
+            primary_element=str(ELEMENT_ALIASES.get(primary, primary)),
+            relation_flags=frozenset(relation.get("flags") or ()),
+            climate_flags=frozenset(climate.get("flags") or ()),
+            balance_index=climate.get("balance_index", 0),
+            # Support both nested (context.season) and flat (season) structures
+            season=_section(ctx, "context").get("season") or ctx.get("season"),
+            luck_flow_trend=_section(ctx, "luck_flow").get("trend"),
+            gyeokguk_type=_section(ctx, "gyeokguk").get("type"),
+            truthy={
+                "daewoon.turning_to_support_primary": bool(
+                    daewoon.get("turning_to_support_primary")
+                ),
+                "daewoon.turning_to_counter_primary": bool(
+                    daewoon.get("turning_to_counter_primary")
+                ),
+                "sewoon.supports_primary": bool(sewoon.get("supports_primary")),
+                "sewoon.counters_primary": bool(sewoon.get("counters_primary")),
+            },
+        )
+
+
+_EMPTY: Mapping[str, Any] = {}
+
+
+def _section(ctx: dict, key: str) -> Mapping[str, Any]:
+    value = ctx.get(key)
+    return value if isinstance(value, dict) else _EMPTY
+
+
+Predicate = Callable[[RuleContext], bool]
+
+
+# ------------ condition builders (run once per rule at compile time) ------------
+def _member(attr: str) -> Callable[[Any], Predicate]:
+    get = attrgetter(attr)
+
+    def build(allowed: Any) -> Predicate:
+        if isinstance(allowed, (list, tuple, set)):
+            allowed = frozenset(allowed)
+        return lambda c: get(c) in allowed
+
+    return build
+
+
+def _intersects(attr: str) -> Callable[[Any], Predicate]:
+    get = attrgetter(attr)
+
+    def build(needed: Any) -> Predicate:
+        isdisjoint = frozenset(needed).isdisjoint
+        return lambda c: not isdisjoint(get(c))
+
+    return build
+
+
+def _contains_all(attr: str) -> Callable[[Any], Predicate]:
+    get = attrgetter(attr)
+
+    def build(needed: Any) -> Predicate:
+        issubset = frozenset(needed).issubset
+        return lambda c: issubset(get(c))
+
+    return build
+
+
+def _truthy(path: str) -> Callable[[Any], Predicate]:
+    def build(expected: Any) -> Predicate:
+        expected = bool(expected)
+        return lambda c: c.truthy[path] is expected
+
+    return build
+
+
+def _elements_any(tokens: Any) -> Predicate:
+    """``["high:primary", "low:wood"]`` → any element at the given level."""
+    levels: List[Tuple[Any, Optional[str]]] = []
+    for token in tokens:
+        level, element = token.split(":")
+        levels.append((level, None if element == "primary" else str(map_element(element))))
+    compiled = tuple(levels)
+
+    def check(c: RuleContext) -> bool:
+        for level, key in compiled:
+            if c.elements.get(c.primary_element if key is None else key) == level:
+                return True
+        return False
+
+    return check
+
+
+def _balance(expected: Mapping[str, Any]) -> Predicate:
+    """``{"wood": "high", "fire": "low"}`` → every element at its level."""
+    items = tuple(expected.items())
+    return lambda c: all(c.elements.get(k) == v for k, v in items)
+
+
+def _balance_gte(threshold: Any) -> Predicate:
+    return lambda c: c.balance_index >= threshold
+
+
+def _balance_lte(threshold: Any) -> Predicate:
+    return lambda c: c.balance_index <= threshold
+
+
+CONDITIONS: Dict[str, Callable[[Any], Predicate]] = {
+    "strength.phase_in": _member("phase"),
+    "strength.elements_any": _elements_any,
+    "yongshin.primary_in": _member("primary"),
+    "relation.flags_any": _intersects("relation_flags"),
+    "climate.flags_any": _intersects("climate_flags"),
+    "climate.balance_index_gte": _balance_gte,
+    "climate.balance_index_lte": _balance_lte,
+    "luck_flow.trend_in": _member("luck_flow_trend"),
+    "gyeokguk.type_in": _member("gyeokguk_type"),
+    # ClimateAdvice advice_table vocabulary
+    "season": _member("season"),
+    "strength_phase": _member("phase"),
+    "balance": _balance,
+    "imbalance_flags": _contains_all("climate_flags"),
+    **{path: _truthy(path) for path in TRUTHY_PATHS},
+}
+
+
+def compile_when(when: Mapping[str, Any], rule_id: str = "?") -> Tuple[Predicate, ...]:
+    """Compile one ``when`` clause into predicates that must all hold.
+
+    Unknown condition keys are ignored (as the interpreters always did) but logged.
+    """
+    predicates = []
+    for key, arg in when.items():
+        build = CONDITIONS.get(key)
+        if build is None:
+            logger.warning("Ignoring unsupported rule condition %r in %s", key, rule_id)
+            continue
+        predicates.append(build(arg))
+    return tuple(predicates)
+
+
+@dataclass(frozen=True, slots=True)
+class RuleStats:
+    """Evaluation counters of one compiled rule."""
+
+    rule_id: str
+    evaluations: int
+    matches: int
+    total_ns: int
+
+
+class RuleProgram:
+    """Ordered list of compiled rules with per-rule counters.
+
+    Evaluation and match counts are always kept. Per-rule wall time is only
+    measured when ``timings`` is true (default: ``STAGE3_RULE_TIMINGS`` env),
+    since two clock reads per rule cost about as much as the rule itself.
+    """
+
+    __slots__ = ("rule_ids", "timings", "_rules", "_evaluations", "_matches", "_elapsed_ns")
+
+    def __init__(
+        self, rules: Iterable[Tuple[str, Mapping[str, Any]]], *, timings: Optional[bool] = None
+    ):
+        rules = list(rules)
+        self.rule_ids: Tuple[str, ...] = tuple(rule_id for rule_id, _ in rules)
+        self.timings = timings_from_env() if timings is None else timings
+        self._rules = tuple(compile_when(when, rule_id) for rule_id, when in rules)
+        self._evaluations = [0] * len(rules)
+        self._matches = [0] * len(rules)
+        self._elapsed_ns = [0] * len(rules)
+
+    def __len__(self) -> int:
+        return len(self._rules)
+
+    def _eval(self, i: int, c: RuleContext) -> bool:
+        start = perf_counter_ns() if self.timings else 0
+        ok = True
+        for predicate in self._rules[i]:
+            if not predicate(c):
+                ok = False
+                break
+        if start:
+            self._elapsed_ns[i] += perf_counter_ns() - start
+        self._evaluations[i] += 1
+        if ok:
+            self._matches[i] += 1
+        return ok
+
+    def first_match(self, c: RuleContext) -> Optional[int]:
+        """Index of the first rule whose conditions all hold, or ``None``."""
+        for i in range(len(self._rules)):
+            if self._eval(i, c):
+                return i
+        return None
+
+    def all_matches(self, c: RuleContext) -> List[int]:
+        """Indices of every matching rule, in policy order."""
+        return [i for i in range(len(self._rules)) if self._eval(i, c)]
+
+    def stats(self) -> List[RuleStats]:
+        return [
+            RuleStats(rule_id, self._evaluations[i], self._matches[i], self._elapsed_ns[i])
+            for i, rule_id in enumerate(self.rule_ids)
+        ]
+
+    def reset_stats(self) -> None:
+        n = len(self._rules)
+        self._evaluations[:] = [0] * n
+        self._matches[:] = [0] * n
+        self._elapsed_ns[:] = [0] * n
+
+
+def timings_from_env() -> bool:
+    return os.getenv(TIMINGS_ENV, "").lower() in ("1", "true", "yes")
@@ -6,10 +6,17 @@ Works with actual engine APIs - no wrappers, no adapters.
 
 from __future__ import annotations
 
+import sys
+import time
 from datetime import datetime
+from pathlib import Path
 from typing import Any, Dict, List, Tuple
 from zoneinfo import ZoneInfo
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[4] / "services" / "common"))
+
+from saju_common.policy_bundle import PolicyBundle, get_policy_bundle
+
 from app.core.climate import ClimateContext, ClimateEvaluator
 
 # Stage-3 engines (MVP policy-driven engines)
@@ -24,7 +31,14 @@ from app.core.luck import ShenshaCatalog
 from app.core.luck_flow import LuckFlow
 from app.core.luck_pillars import LuckCalculator
 from app.core.pattern_profiler import PatternProfiler
-from app.core.recommendation import RecommendationGuard
+from app.core.pillars_cache import PillarsAnalysisCache, cache_size_from_env
+from app.core.records import (
+    LuckRecord,
+    RelationsRecord,
+    StrengthRecord,
+    TenGodsRecord,
+    TwelveStagesRecord,
+)
 from app.core.relation_weight import RelationWeightEvaluator
 from app.core.relations import RelationContext, RelationTransformer
 from app.core.relations_extras import RelationAnalyzer
@@ -34,13 +48,21 @@ from app.core.school import SchoolProfileManager
 # Core engines
 from app.core.strength_v2 import StrengthEvaluator
 from app.core.ten_gods import TenGodsCalculator
-from app.core.text_guard import TextGuard
 from app.core.twelve_stages import TwelveStagesCalculator
 
 # Meta engines
 from app.core.void import apply_void_flags, explain_void
 from app.core.yongshin_selector_v2 import YongshinSelector
 from app.core.yuanjin import apply_yuanjin_flags, explain_yuanjin
+from app.instrumentation.stage_timer import (
+    StageTimer,
+    stage_timing_enabled,
+    timings_in_response_enabled,
+)
+
+PILLAR_ORDER = ("year", "month", "day", "hour")
+
+SIGNED_BATCH_POLICIES = "saju_codex_batch_all_v2_6_signed/policies"
 
 # Season mapping from branch
 BRANCH_TO_SEASON = {
@@ -153,56 +175,82 @@ class SajuOrchestrator:
     22. TextGuard
     """
 
-    def __init__(self):
-        """Initialize all engines with their factory methods."""
+    def __init__(
+        self,
+        pillars_cache_size: int | None = None,
+        stage_timing: bool | None = None,
+        timings_in_response: bool | None = None,
+        policy_bundle: PolicyBundle | None = None,
+    ):
+        """Initialize all engines with their factory methods.
+
+        Args:
+            pillars_cache_size: LRU capacity for pillars-pure results
+                (default: ``ANALYSIS_PILLARS_CACHE_SIZE`` env or 4096; 0 disables)
+            stage_timing: Time every ``_call_*`` stage into Prometheus histograms
+                (default: ``ANALYSIS_STAGE_TIMING`` env; off costs nothing)
+            timings_in_response: Also return the timings as ``trace.timings``
+                (default: ``ANALYSIS_STAGE_TIMINGS_RESPONSE`` env; implies stage_timing)
+            policy_bundle: Verified, frozen policies every engine reads from
+                (default: the process-wide ``get_policy_bundle()``)
+        """
+        bundle = policy_bundle if policy_bundle is not None else get_policy_bundle()
+        self.policy_bundle = bundle
+
         # Core engines
-        self.strength = StrengthEvaluator()  # v2 uses __init__, loads policies internally
-        self.relations = RelationTransformer.from_file()
-        self.relation_weight = RelationWeightEvaluator()
-        self.relations_analyzer = RelationAnalyzer()  # For extras like banhe
-        self.climate = ClimateEvaluator.from_file()
-        self.yongshin = YongshinSelector()
-        self.shensha = ShenshaCatalog()
-
-        # Ten Gods calculator
-        import json
-        from pathlib import Path
-
-        policy_path = Path("saju_codex_batch_all_v2_6_signed/policies/branch_tengods_policy.json")
-        with open(policy_path, encoding="utf-8") as f:
-            ten_gods_policy = json.load(f)
-        self.ten_gods = TenGodsCalculator(ten_gods_policy, output_policy_version="ten_gods_v1.0")
-
-        # Twelve Stages calculator
-        lifecycle_path = Path("saju_codex_batch_all_v2_6_signed/policies/lifecycle_stages.json")
-        with open(lifecycle_path, encoding="utf-8") as f:
-            lifecycle_policy = json.load(f)
+        self.strength = StrengthEvaluator(bundle=bundle)
+        self.relations = RelationTransformer.from_bundle(bundle)
+        self.relation_weight = RelationWeightEvaluator(bundle=bundle)
+        self.relations_analyzer = RelationAnalyzer(bundle=bundle)  # For extras like banhe
+        self.climate = ClimateEvaluator(bundle.get("climate_map_v1.json"))
+        self.yongshin = YongshinSelector(bundle=bundle)
+        self.shensha = ShenshaCatalog(bundle.get("shensha_catalog_v1.json"))
+
+        # Ten Gods / Twelve Stages / Luck Pillars (pinned to the v2.6 signed batch)
+        self.ten_gods = TenGodsCalculator(
+            bundle.get_path(f"{SIGNED_BATCH_POLICIES}/branch_tengods_policy.json"),
+            output_policy_version="ten_gods_v1.0",
+        )
         self.twelve_stages = TwelveStagesCalculator(
-            lifecycle_policy, output_policy_version="twelve_stages_v1.0"
+            bundle.get_path(f"{SIGNED_BATCH_POLICIES}/lifecycle_stages.json"),
+            output_policy_version="twelve_stages_v1.0",
         )
-
-        # Luck Pillars calculator
-        luck_pillars_path = Path(
-            "saju_codex_batch_all_v2_6_signed/policies/luck_pillars_policy.json"
+        self.luck = LuckCalculator(
+            bundle.get_path(f"{SIGNED_BATCH_POLICIES}/luck_pillars_policy.json")
         )
-        with open(luck_pillars_path, encoding="utf-8") as f:
-            luck_pillars_policy = json.load(f)
-        self.luck = LuckCalculator(luck_pillars_policy)
 
         # Stage-3 engines (4 MVP policy-driven engines)
-        self.climate_advice = ClimateAdvice()
-        self.luck_flow = LuckFlow()
-        self.gyeokguk = GyeokgukClassifier()
-        self.pattern = PatternProfiler()
+        self.climate_advice = ClimateAdvice(bundle=bundle)
+        self.luck_flow = LuckFlow(bundle=bundle)
+        self.gyeokguk = GyeokgukClassifier(bundle=bundle)
+        self.pattern = PatternProfiler(bundle=bundle)
 
         # Post-processing engines
         # Note: build_evidence is a function, not a class
         self.summaries = EngineSummariesBuilder()
-        self.korean = KoreanLabelEnricher.from_files()
-        self.school = SchoolProfileManager.load()
-        self.reco = RecommendationGuard.from_file()
-        self.llm_guard = LLMGuard.default()
-        self.text_guard = TextGuard.from_file()
+        self.korean = KoreanLabelEnricher.from_files(bundle)
+        self.school = SchoolProfileManager.from_policy(bundle.get("school_profiles_v1.json"))
+        self.llm_guard = LLMGuard.default(bundle)
+        self.reco = self.llm_guard.recommendation_guard
+        self.text_guard = self.llm_guard.text_guard
+
+        # Memoized pillars-pure phase (see _analyze_pillars); the bundle hash
+        # changes whenever any policy file does
+        self.policy_signature = bundle.bundle_hash
+        self.pillars_cache = PillarsAnalysisCache(
+            cache_size_from_env() if pillars_cache_size is None else pillars_cache_size
+        )
+
+        # Per-stage timing (wraps the _call_* methods on this instance only)
+        if timings_in_response is None:
+            timings_in_response = timings_in_response_enabled()
+        if stage_timing is None:
+            stage_timing = stage_timing_enabled()
+        self.timings_in_response = timings_in_response
+        self.stage_timer: StageTimer | None = None
+        if stage_timing or timings_in_response:
+            self.stage_timer = StageTimer()
+            self.stage_timer.instrument(self)
 
     def analyze(self, pillars: Dict[str, str], birth_context: Dict[str, Any]) -> Dict[str, Any]:
         """Run complete Saju analysis.
@@ -213,105 +261,35 @@ class SajuOrchestrator:
 
         Returns:
             Complete analysis result with all engine outputs
+            (plus ``trace.timings`` when timings_in_response is on)
         """
+        timer = self.stage_timer
+        if timer is None:
+            return self._analyze(pillars, birth_context)
+
+        with timer.request() as timings:
+            start = time.perf_counter()
+            result = self._analyze(pillars, birth_context)
+            timer.observe_request(time.perf_counter() - start, result.get("status", "error"))
+        if self.timings_in_response:
+            result.setdefault("trace", {})["timings"] = timings
+        return result
+
+    def _analyze(self, pillars: Dict[str, str], birth_context: Dict[str, Any]) -> Dict[str, Any]:
         try:
             # 1. Parse and validate inputs
             self._validate_inputs(pillars, birth_context)
 
-            # 2. Decompose pillars
-            stems, branches = self._decompose_pillars(pillars)
-            season = BRANCH_TO_SEASON.get(branches[1], "unknown")  # month branch
-
-            # 3. Call StrengthEvaluator
-            strength_result = self._call_strength(pillars, stems, branches)
-
-            # 4. Call RelationTransformer
-            relations_result = self._call_relations(pillars, branches)
-
-            # 5. Call RelationWeightEvaluator (add weights to relations)
-            weighted_relations = self._call_relation_weight(
-                relations_result, pillars, stems, branches
-            )
-
-            # 6. Call RelationsExtras (detect banhe_groups)
-            banhe_groups = self._call_relations_extras(branches)
-
-            # 6.5. Call TenGodsCalculator
-            ten_gods_result = self._call_ten_gods(pillars)
+            # 2-16. Pillars-pure phase, memoized per (pillars, policy signature)
+            key = (*(pillars[pos] for pos in PILLAR_ORDER), self.policy_signature)
+            pure = self.pillars_cache.get_or_compute(key, lambda: self._analyze_pillars(pillars))
 
-            # 6.6. Call TwelveStagesCalculator
-            twelve_stages_result = self._call_twelve_stages(pillars)
+            # 11. Birth-context phase: call LuckCalculator
+            luck_result = self._call_luck(pillars, birth_context, pillars["day"][0])
 
-            # 7. Calculate raw elements distribution
-            elements_raw = self._calculate_elements(stems, branches, strength_result)
-
-            # 8. Call CombinationElement (transform elements based on weighted relations)
-            elements, combination_trace = self._call_combination_element(
-                weighted_relations, elements_raw
-            )
-
-            # 9. Call ClimateEvaluator
-            climate_result = self._call_climate(branches[1])  # month branch
-
-            # 10. Call YongshinSelector (with transformed elements)
-            yongshin_result = self._call_yongshin(
-                stems[2],  # day stem
-                season,
-                strength_result,
-                weighted_relations,  # Use weighted relations
-                climate_result,
-                elements,  # Use transformed elements
-            )
-
-            # 11. Call LuckCalculator
-            luck_result = self._call_luck(pillars, birth_context, stems[2])
-
-            # 12. Call ShenshaCatalog
-            shensha_result = self._call_shensha()
-
-            # 13. Call VoidCalculator (공망)
-            void_result = self._call_void(pillars["day"], branches)
-
-            # 14. Call YuanjinDetector (원진)
-            yuanjin_result = self._call_yuanjin(branches)
-
-            # 15. Build Stage-3 context and call Stage-3 engines
-            stage3_context = self._build_stage3_context(
-                season,
-                strength_result,
-                weighted_relations,  # Use weighted relations
-                climate_result,
-                yongshin_result,
-                elements,  # Use transformed elements
-            )
-            # Call Stage-3 engines in dependency order
-            lf = self.luck_flow.run(stage3_context)
-            gk = self.gyeokguk.run({**stage3_context, "luck_flow": lf})
-            ca = self.climate_advice.run(stage3_context)
-            pp = self.pattern.run({**stage3_context, "luck_flow": lf, "gyeokguk": gk})
-            stage3_result = {"luck_flow": lf, "gyeokguk": gk, "climate_advice": ca, "pattern": pp}
-
-            # 16. Combine all results
-            combined = {
-                "season": season,
-                "strength": strength_result,
-                "relations": relations_result,
-                "relations_weighted": weighted_relations,  # NEW: Weighted relations
-                "relations_extras": {"banhe_groups": banhe_groups},  # NEW: Extra relations
-                "climate": climate_result,
-                "elements_distribution_raw": elements_raw,  # NEW: Raw elements before transformation
-                "elements_distribution": elements_raw,  # Use RAW elements (original distribution)
-                "elements_distribution_transformed": elements,  # Transformed elements (for reference)
-                "combination_trace": combination_trace,  # NEW: Transformation trace
-                "yongshin": yongshin_result,
-                "luck": luck_result,
-                "shensha": shensha_result,
-                "void": void_result,
-                "yuanjin": yuanjin_result,
-                "ten_gods": ten_gods_result,  # NEW: Ten Gods analysis
-                "twelve_stages": twelve_stages_result,  # NEW: Twelve Stages analysis
-                "stage3": stage3_result,
-            }
+            # Fresh top-level dict per request; "luck" keeps its slot in the key order
+            combined = {**pure, "luck": luck_result}
+            stage3_result = combined["stage3"]
 
             # 17. Call EvidenceBuilder (collect evidence for all engines)
             evidence_result = self._call_evidence_builder(combined, pillars, birth_context)
@@ -320,7 +298,7 @@ class SajuOrchestrator:
             summaries_result = self._call_engine_summaries(combined, evidence_result)
 
             # 19. Call KoreanLabelEnricher
-            enriched = self.korean.enrich(combined)
+            enriched = self._call_korean_enricher(combined)
 
             # 20. Add SchoolProfileManager
             school_profile = self.school.get_profile()
@@ -385,6 +363,99 @@ class SajuOrchestrator:
                 "traceback": traceback.format_exc(),
             }
 
+    def _analyze_pillars(self, pillars: Dict[str, str]) -> Dict[str, Any]:
+        """Run every engine that depends only on the four pillars.
+
+        The result is cached by ``analyze`` and shared across requests, so it
+        must not be mutated by callers.
+        """
+        # 2. Decompose pillars
+        stems, branches = self._decompose_pillars(pillars)
+        season = BRANCH_TO_SEASON.get(branches[1], "unknown")  # month branch
+
+        # 3. Call StrengthEvaluator
+        strength_result = self._call_strength(pillars, stems, branches)
+
+        # 4. Call RelationTransformer
+        relations_result = self._call_relations(pillars, branches)
+
+        # 5. Call RelationWeightEvaluator (add weights to relations)
+        weighted_relations = self._call_relation_weight(relations_result, pillars, stems, branches)
+
+        # 6. Call RelationsExtras (detect banhe_groups)
+        banhe_groups = self._call_relations_extras(branches)
+
+        # 6.5. Call TenGodsCalculator
+        ten_gods_result = self._call_ten_gods(pillars)
+
+        # 6.6. Call TwelveStagesCalculator
+        twelve_stages_result = self._call_twelve_stages(pillars)
+
+        # 7. Calculate raw elements distribution
+        elements_raw = self._calculate_elements(stems, branches, strength_result)
+
+        # 8. Call CombinationElement (transform elements based on weighted relations)
+        elements, combination_trace = self._call_combination_element(
+            weighted_relations, elements_raw
+        )
+
+        # 9. Call ClimateEvaluator
+        climate_result = self._call_climate(branches[1])  # month branch
+
+        # 10. Call YongshinSelector (with transformed elements)
+        yongshin_result = self._call_yongshin(
+            stems[2],  # day stem
+            season,
+            strength_result,
+            weighted_relations,  # Use weighted relations
+            climate_result,
+            elements,  # Use transformed elements
+        )
+
+        # (11. LuckCalculator runs in the birth-context phase, see analyze)
+
+        # 12. Call ShenshaCatalog
+        shensha_result = self._call_shensha()
+
+        # 13. Call VoidCalculator (공망)
+        void_result = self._call_void(pillars["day"], branches)
+
+        # 14. Call YuanjinDetector (원진)
+        yuanjin_result = self._call_yuanjin(branches)
+
+        # 15. Build Stage-3 context and call Stage-3 engines
+        stage3_context = self._build_stage3_context(
+            season,
+            strength_result,
+            weighted_relations,  # Use weighted relations
+            climate_result,
+            yongshin_result,
+            elements,  # Use transformed elements
+        )
+        stage3_result = self._call_stage3(stage3_context)
+
+        # 16. Combine all pillars-pure results
+        return {
+            "season": season,
+            "strength": strength_result,
+            "relations": relations_result,
+            "relations_weighted": weighted_relations,  # NEW: Weighted relations
+            "relations_extras": {"banhe_groups": banhe_groups},  # NEW: Extra relations
+            "climate": climate_result,
+            "elements_distribution_raw": elements_raw,  # NEW: Raw elements before transformation
+            "elements_distribution": elements_raw,  # Use RAW elements (original distribution)
+            "elements_distribution_transformed": elements,  # Transformed elements (for reference)
+            "combination_trace": combination_trace,  # NEW: Transformation trace
+            "yongshin": yongshin_result,
+            "luck": None,  # Filled in by the birth-context phase
+            "shensha": shensha_result,
+            "void": void_result,
+            "yuanjin": yuanjin_result,
+            "ten_gods": ten_gods_result,  # NEW: Ten Gods analysis
+            "twelve_stages": twelve_stages_result,  # NEW: Twelve Stages analysis
+            "stage3": stage3_result,
+        }
+
     # Helper methods for input processing
 
     def _validate_inputs(self, pillars: Dict[str, str], birth_context: Dict[str, Any]):
@@ -420,7 +491,7 @@ class SajuOrchestrator:
         return counts
 
     def _calculate_elements(
-        self, stems: List[str], branches: List[str], strength_result: Dict
+        self, stems: List[str], branches: List[str], strength_result: StrengthRecord
     ) -> Dict[str, float]:
         """Calculate element distribution from stems and branches."""
         # Start with basic counts
@@ -449,7 +520,7 @@ class SajuOrchestrator:
 
     def _call_strength(
         self, pillars: Dict[str, str], stems: List[str], branches: List[str]
-    ) -> Dict[str, Any]:
+    ) -> StrengthRecord:
         """Call StrengthEvaluator v2 with simplified API."""
         # v2 API: evaluate(pillars, season)
         # Returns: {"strength": {score_raw, score, score_normalized, grade_code, bin, phase, details}}
@@ -457,22 +528,22 @@ class SajuOrchestrator:
         result = self.strength.evaluate(pillars, season)
 
         # Extract strength dict from wrapper
-        return result.get("strength", result)
+        return StrengthRecord.from_mapping(result.get("strength", result))
 
-    def _call_relations(self, pillars: Dict[str, str], branches: List[str]) -> Dict[str, Any]:
+    def _call_relations(self, pillars: Dict[str, str], branches: List[str]) -> RelationsRecord:
         """Call RelationTransformer with RelationContext."""
         # RelationContext takes branches list and month_branch
         ctx = RelationContext(branches=branches, month_branch=branches[1])  # Month is index 1
         result = self.relations.evaluate(ctx)
 
-        # Convert RelationResult to dict for orchestrator use
-        return {
-            "priority_hit": result.priority_hit,
-            "transform_to": result.transform_to,
-            "boosts": result.boosts,
-            "notes": result.notes,
-            "extras": result.extras,
-        }
+        # Freeze RelationResult into an immutable record for orchestrator use
+        return RelationsRecord(
+            priority_hit=result.priority_hit,
+            transform_to=result.transform_to,
+            boosts=result.boosts,
+            notes=result.notes,
+            extras=result.extras,
+        )
 
     def _call_climate(self, month_branch: str) -> Dict[str, Any]:
         """Call ClimateEvaluator with ClimateContext."""
@@ -485,7 +556,7 @@ class SajuOrchestrator:
         self,
         day_stem: str,
         season: str,
-        strength_result: Dict,
+        strength_result: StrengthRecord,
         relations_result: Dict,
         climate_result: Dict,
         elements: Dict[str, float],
@@ -558,7 +629,7 @@ class SajuOrchestrator:
 
     def _call_luck(
         self, pillars: Dict[str, str], birth_context: Dict[str, Any], day_stem: str
-    ) -> Dict[str, Any]:
+    ) -> LuckRecord:
         """Call LuckCalculator v1.0 to generate decade luck pillars.
 
         Args:
@@ -567,7 +638,7 @@ class SajuOrchestrator:
             day_stem: Day stem for Hook labeling (optional, for future use)
 
         Returns:
-            Dict with keys:
+            LuckRecord with fields:
                 - policy_version: "luck_pillars_v1"
                 - direction: "forward" | "reverse"
                 - start_age: float (when 대운 starts)
@@ -576,15 +647,7 @@ class SajuOrchestrator:
                 - current_luck: dict or null
                 - policy_signature: SHA-256 hex
         """
-        import sys
-        from pathlib import Path as _Path
-
-        # Add services/common to path for saju_common import
-        common_path = str(_Path(__file__).resolve().parents[4] / "services" / "common")
-        if common_path not in sys.path:
-            sys.path.insert(0, common_path)
-
-        from saju_common import BasicTimeResolver, FileSolarTermLoader
+        from saju_common import BasicTimeResolver, get_solar_term_index
 
         # 1. Parse birth_dt to datetime with timezone
         birth_dt_str = birth_context.get("birth_dt")
@@ -599,32 +662,14 @@ class SajuOrchestrator:
 
         if birth_dt is None:
             # Fallback: return minimal structure
-            return {
-                "policy_version": "luck_pillars_v1",
-                "direction": "forward",
-                "start_age": 0.0,
-                "method": "solar_term_interval",
-                "pillars": [],
-                "current_luck": None,
-                "policy_signature": "",
-            }
+            return LuckRecord.empty()
 
-        # 2. Calculate solar terms for start_age (reuse FileSolarTermLoader)
-        term_data_path = _Path(__file__).resolve().parents[4] / "data"
-        term_loader = FileSolarTermLoader(term_data_path)
+        # 2. Calculate solar terms for start_age (shared in-memory SolarTermIndex)
+        term_data_path = Path(__file__).resolve().parents[4] / "data"
         resolver = BasicTimeResolver()
 
         birth_utc = resolver.to_utc(birth_dt, tz)
-        year = birth_utc.year
-        terms = list(term_loader.load_year(year)) + list(term_loader.load_year(year + 1))
-
-        next_term = next((e for e in terms if e.utc_time > birth_utc), None)
-        prev_term = None
-        for entry in terms:
-            if entry.utc_time <= birth_utc:
-                prev_term = entry
-            else:
-                break
+        prev_term, next_term = get_solar_term_index(term_data_path).window(birth_utc)
 
         solar_terms = {}
         if next_term:
@@ -664,23 +709,15 @@ class SajuOrchestrator:
         # 6. Call LuckCalculator v1.0
         try:
             result = self.luck.evaluate(birth_ctx, pillars_formatted)
-            return result
+            return LuckRecord.from_mapping(result)
         except Exception as e:
             print(f"LuckCalculator.evaluate() failed: {e}, returning empty structure")
-            return {
-                "policy_version": "luck_pillars_v1",
-                "direction": "forward",
-                "start_age": 0.0,
-                "method": "solar_term_interval",
-                "pillars": [],
-                "current_luck": None,
-                "policy_signature": "",
-            }
+            return LuckRecord.empty()
 
     def _build_stage3_context(
         self,
         season: str,
-        strength_result: Dict,
+        strength_result: StrengthRecord,
         relations_result: Dict,
         climate_result: Dict,
         yongshin_result: Dict,
@@ -723,6 +760,14 @@ class SajuOrchestrator:
             "yongshin": {"primary": yongshin_primary},
         }
 
+    def _call_stage3(self, stage3_context: Dict[str, Any]) -> Dict[str, Any]:
+        """Call the Stage-3 engines in dependency order."""
+        lf = self.luck_flow.run(stage3_context)
+        gk = self.gyeokguk.run({**stage3_context, "luck_flow": lf})
+        ca = self.climate_advice.run(stage3_context)
+        pp = self.pattern.run({**stage3_context, "luck_flow": lf, "gyeokguk": gk})
+        return {"luck_flow": lf, "gyeokguk": gk, "climate_advice": ca, "pattern": pp}
+
     def _call_shensha(self) -> Dict[str, Any]:
         """Call ShenshaCatalog to get list of enabled shensha."""
         return self.shensha.list_enabled(pro_mode=False)
@@ -807,7 +852,7 @@ class SajuOrchestrator:
 
     def _call_relation_weight(
         self,
-        relations_result: Dict[str, Any],
+        relations_result: RelationsRecord,
         pillars: Dict[str, str],
         stems: List[str],
         branches: List[str],
@@ -864,7 +909,7 @@ class SajuOrchestrator:
             print(f"RelationsExtras failed: {e}, returning empty dict")
             return {"five_he": {}, "zixing": {}, "banhe": []}
 
-    def _call_ten_gods(self, pillars: Dict[str, str]) -> Dict[str, Any]:
+    def _call_ten_gods(self, pillars: Dict[str, str]) -> TenGodsRecord:
         """Call TenGodsCalculator to determine Ten Gods for each position."""
         try:
             # Convert pillars format from "庚辰" to {"stem": "庚", "branch": "辰"}
@@ -877,19 +922,12 @@ class SajuOrchestrator:
                     formatted_pillars[pos] = {"stem": "", "branch": ""}
 
             result = self.ten_gods.evaluate(formatted_pillars)
-            return result
+            return TenGodsRecord.from_mapping(result)
         except Exception as e:
             print(f"TenGodsCalculator failed: {e}, returning empty result")
-            return {
-                "policy_version": "ten_gods_v1.0",
-                "by_pillar": {},
-                "summary": {},
-                "dominant": [],
-                "missing": [],
-                "policy_signature": "",
-            }
+            return TenGodsRecord.empty()
 
-    def _call_twelve_stages(self, pillars: Dict[str, str]) -> Dict[str, Any]:
+    def _call_twelve_stages(self, pillars: Dict[str, str]) -> TwelveStagesRecord:
         """Call TwelveStagesCalculator to determine lifecycle stage for each position."""
         try:
             # Convert pillars format from "庚辰" to {"stem": "庚", "branch": "辰"}
@@ -902,16 +940,10 @@ class SajuOrchestrator:
                     formatted_pillars[pos] = {"stem": "", "branch": ""}
 
             result = self.twelve_stages.evaluate(formatted_pillars)
-            return result
+            return TwelveStagesRecord.from_mapping(result)
         except Exception as e:
             print(f"TwelveStagesCalculator failed: {e}, returning empty result")
-            return {
-                "policy_version": "twelve_stages_v1.0",
-                "by_pillar": {},
-                "summary": {},
-                "dominant": [],
-                "weakest": [],
-            }
+            return TwelveStagesRecord.empty()
 
     def _call_combination_element(
         self, weighted_relations: Dict[str, Any], elements_raw: Dict[str, float]
@@ -1030,6 +1062,10 @@ class SajuOrchestrator:
             print(f"EngineSummariesBuilder.build() failed: {e}, returning minimal summaries")
             return {"error": str(e)}
 
+    def _call_korean_enricher(self, combined: Dict[str, Any]) -> Dict[str, Any]:
+        """Call KoreanLabelEnricher (adds *_ko labels as an overlay, no copy)."""
+        return self.korean.overlay(combined)
+
     def _call_llm_guard(
         self, enriched: Dict[str, Any], summaries: Dict[str, Any]
     ) -> Dict[str, Any]:
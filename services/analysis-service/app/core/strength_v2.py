@@ -38,15 +38,16 @@ class StrengthEvaluator:
         """이론적 범위 계산 (MAX - MIN)"""
         return self.THEORETICAL_MAX - self.THEORETICAL_MIN
 
-    def __init__(self):
-        self.wang_map = load_policy_json("seasons_wang_map_v2.json")
-        self.zanggan = load_policy_json("zanggan_table.json")["by_branch"]
-        self.grading = load_policy_json("strength_grading_tiers_v1.json")
+    def __init__(self, bundle=None):
+        load_policy = bundle.get if bundle is not None else load_policy_json
+        self.wang_map = load_policy("seasons_wang_map_v2.json")
+        self.zanggan = load_policy("zanggan_table.json")["by_branch"]
+        self.grading = load_policy("strength_grading_tiers_v1.json")
         # Adjustment 5: Sort tiers by min (descending) for defensive grading
         self._tiers_sorted = sorted(self.grading["tiers"], key=lambda t: t["min"], reverse=True)
         # Adjustment 6: Load lifecycle stages policy with variant support
         try:
-            self.lifecycle = load_policy_json("lifecycle_stages.json")
+            self.lifecycle = load_policy("lifecycle_stages.json")
             self.variant = self.lifecycle.get("variant", "orthodox")
             self.stage_weights = self.lifecycle.get("weights", {})
             self.damping = self.lifecycle.get("damping", {"on_chong": 1.0, "on_hai": 1.0})
@@ -4,17 +4,27 @@ TenGodsCalculator v1.0
 - 입력: pillars(연/월/일/시: stem/branch), policy(JSON: mapping_rules, ten_gods_labels, relations, branches_hidden)
 - 처리: 일간 대비 각 천간/지장간의 십성 판정, 지장간 포함 집계
 - 출력: by_pillar, summary, dominant, missing, policy_version, policy_signature
+- 성능: 생성 시 정책을 10×10(일간×천간) 정수 테이블 + 지지별 지장간 벡터로 컴파일,
+        평가는 테이블 인덱싱만 수행 (evaluate_many 로 배치 처리)
 - 서명: RFC-8785 스타일(키정렬+minified) 기반 SHA-256 (CI에서 재검증 권장)
 """
 from __future__ import annotations
 
-import copy
-import hashlib
-import json
-from typing import Any, Dict
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[4] / "services" / "common"))
+
+from saju_common.signing import sha256_signature  # noqa: E402
 
 HEAVENLY_STEMS = ["甲", "乙", "丙", "丁", "戊", "己", "庚", "辛", "壬", "癸"]
 EARTHLY_BRANCHES = ["子", "丑", "寅", "卯", "辰", "巳", "午", "未", "申", "酉", "戌", "亥"]
+STEM_INDEX = {s: i for i, s in enumerate(HEAVENLY_STEMS)}
+BRANCH_INDEX = {b: i for i, b in enumerate(EARTHLY_BRANCHES)}
+
+# 정책상 매핑 불가한 (일간, 천간) 조합 표시
+_UNMAPPED = -1
 
 STEM_TO_ELEMENT = {
     "甲": "木",
@@ -62,6 +72,21 @@ class TenGodsCalculator:
         self._mapping = policy["mapping_rules"]
         self._branches_hidden = policy["branches_hidden"]
 
+        # 컴파일된 테이블
+        #   _labels[i]          : 십성 라벨(zh)
+        #   _stem_table[d][t]   : 일간 d 대비 천간 t 의 라벨 id (10×10)
+        #   _hidden_stems[b]    : 지지 b 의 지장간 천간 id 벡터 (정책 순서, 중복 제거)
+        self._labels: Tuple[str, ...] = tuple(dict.fromkeys(self._ten_gods_label_map_zh.values()))
+        label_ids = {label: i for i, label in enumerate(self._labels)}
+        self._stem_table: Tuple[Tuple[int, ...], ...] = tuple(
+            tuple(self._compile_cell(day, tgt, label_ids) for tgt in HEAVENLY_STEMS)
+            for day in HEAVENLY_STEMS
+        )
+        self._hidden_stems: Tuple[Tuple[int, ...], ...] = tuple(
+            tuple(dict.fromkeys(STEM_INDEX[h["stem"]] for h in self._branches_hidden.get(br, [])))
+            for br in EARTHLY_BRANCHES
+        )
+
     # ------------ 공개 API ------------
     def evaluate(self, pillars: Dict[str, Dict[str, str]]) -> Dict[str, Any]:
         """
@@ -74,7 +99,8 @@ class TenGodsCalculator:
         """
         self._validate_input(pillars)
 
-        day_stem = pillars["day"]["stem"]
+        d = STEM_INDEX[pillars["day"]["stem"]]
+        row = self._stem_table[d]
         out = {
             "policy_version": self.output_policy_version,
             "by_pillar": {},
@@ -88,12 +114,12 @@ class TenGodsCalculator:
         for slot in ("year", "month", "day", "hour"):
             stem = pillars[slot]["stem"]
             br = pillars[slot]["branch"]
-            vs_day = self._rel_label(day_stem, stem)  # 천간 대비 십성(zh)
+            vs_day = self._label(d, row[STEM_INDEX[stem]], stem)  # 천간 대비 십성(zh)
 
-            hidden_map = {}
-            for h in self._branches_hidden.get(br, []):
-                hs = h["stem"]
-                hidden_map[hs] = self._rel_label(day_stem, hs)
+            hidden_map = {
+                HEAVENLY_STEMS[h]: self._label(d, row[h], HEAVENLY_STEMS[h])
+                for h in self._hidden_stems[BRANCH_INDEX[br]]
+            }
 
             out["by_pillar"][slot] = {
                 "stem": stem,
@@ -121,10 +147,32 @@ class TenGodsCalculator:
 
         return out
 
+    def evaluate_many(self, charts: Iterable[Dict[str, Dict[str, str]]]) -> List[Dict[str, Any]]:
+        """여러 명식을 순서대로 평가 (evaluate 와 동일한 출력의 리스트)."""
+        return [self.evaluate(pillars) for pillars in charts]
+
+    def ten_god_for(self, day_stem: str, target_stem: str) -> str:
+        """
+        (일간, 천간) → 십성 라벨(zh). LuckCalculator(tengods_resolver=...) 콜백 시그니처와 동일.
+        """
+        d = STEM_INDEX[day_stem]
+        return self._label(d, self._stem_table[d][STEM_INDEX[target_stem]], target_stem)
+
     # ------------ 내부 로직 ------------
+    def _label(self, d: int, label_id: int, target_stem: str) -> str:
+        if label_id == _UNMAPPED:
+            raise ValueError(f"Unmappable relation: day={HEAVENLY_STEMS[d]}, target={target_stem}")
+        return self._labels[label_id]
+
+    def _compile_cell(self, day_stem: str, target_stem: str, label_ids: Dict[str, int]) -> int:
+        try:
+            return label_ids[self._rel_label(day_stem, target_stem)]
+        except (KeyError, ValueError):
+            return _UNMAPPED
+
     def _rel_label(self, day_stem: str, target_stem: str) -> str:
         """
-        일간 vs 타겟천간 십성 라벨(zh)을 정책 규칙(mapping_rules)에 따라 반환
+        일간 vs 타겟천간 십성 라벨(zh)을 정책 규칙(mapping_rules)에 따라 반환 (테이블 컴파일용)
         """
         e_day = STEM_TO_ELEMENT[day_stem]
         e_tgt = STEM_TO_ELEMENT[target_stem]
@@ -174,7 +222,4 @@ class TenGodsCalculator:
         RFC-8785 스타일: 키 정렬 + 최소 구분자 (간이 구현).
         policy_signature 필드는 제외하고 해시.
         """
-        obj = copy.deepcopy(obj_with_sig)
-        obj.pop("policy_signature", None)
-        data = json.dumps(obj, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
-        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+        return sha256_signature(obj_with_sig, exclude=("policy_signature",))
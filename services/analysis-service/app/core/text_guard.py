@@ -9,7 +9,7 @@ import sys
 from dataclasses import dataclass
 from pathlib import Path
 from pathlib import Path as _Path
-from typing import Iterable, List
+from typing import Dict, Iterable, List
 
 sys.path.insert(0, str(_Path(__file__).resolve().parents[4] / "services" / "common"))
 from policy_loader import resolve_policy_path
@@ -28,7 +28,10 @@ class TextGuard:
     @classmethod
     def from_file(cls, path: Path = POLICY_PATH) -> "TextGuard":
         with path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+            return cls.from_policy(json.load(f))
+
+    @classmethod
+    def from_policy(cls, data: Dict[str, object]) -> "TextGuard":
         return cls(
             forbidden_terms=data.get("forbidden_terms", []),
             advice_verbs=data.get("advice_verbs", []),
@@ -9,13 +9,24 @@ the earthly branches:
 - 제왕 (Peak) - 쇠 (Decline) - 병 (Sickness) - 사 (Death)
 - 묘 (Tomb) - 절 (Extinction) - 태 (Embryo) - 양 (Nurture)
 
+The policy mappings are compiled at construction into a dense 10×12
+(stem × branch) table of stage ids, so evaluation is plain table indexing.
+
 Version: 1.0.0
 Date: 2025-10-12 KST
 Policy: lifecycle_stages.json v1.1
 """
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, List, Tuple
+
+HEAVENLY_STEMS = ["甲", "乙", "丙", "丁", "戊", "己", "庚", "辛", "壬", "癸"]
+EARTHLY_BRANCHES = ["子", "丑", "寅", "卯", "辰", "巳", "午", "未", "申", "酉", "戌", "亥"]
+STEM_INDEX = {s: i for i, s in enumerate(HEAVENLY_STEMS)}
+BRANCH_INDEX = {b: i for i, b in enumerate(EARTHLY_BRANCHES)}
+
+UNKNOWN_STAGE = "未知"
+_UNKNOWN_ID = 0
 
 
 class TwelveStagesCalculator:
@@ -29,6 +40,22 @@ class TwelveStagesCalculator:
         self.mappings = policy["mappings"]
         self.labels = policy.get("labels", {})
 
+        # Compiled tables: _stages[id] = (zh, ko, en); id 0 is the unknown stage.
+        # _stage_table[stem][branch] = stage id (10×12).
+        stages: Dict[str, int] = {UNKNOWN_STAGE: _UNKNOWN_ID}
+        self._stage_table: Tuple[Tuple[int, ...], ...] = tuple(
+            tuple(
+                stages.setdefault(
+                    self.mappings.get(stem, {}).get(branch, UNKNOWN_STAGE), len(stages)
+                )
+                for branch in EARTHLY_BRANCHES
+            )
+            for stem in HEAVENLY_STEMS
+        )
+        self._stages: Tuple[Tuple[str, str, str], ...] = tuple(
+            (zh, self._translate(zh, "zh", "ko"), self._translate(zh, "zh", "en")) for zh in stages
+        )
+
     def evaluate(self, pillars: Dict[str, Dict[str, str]]) -> Dict[str, Any]:
         """
         Calculate Twelve Stages for all four pillars.
@@ -66,9 +93,7 @@ class TwelveStagesCalculator:
             stem = pillars[pos]["stem"]
             branch = pillars[pos]["branch"]
 
-            stage_zh = self.mappings.get(stem, {}).get(branch, "未知")
-            stage_ko = self._translate(stage_zh, "zh", "ko")
-            stage_en = self._translate(stage_zh, "zh", "en")
+            stage_zh, stage_ko, stage_en = self._stages[self._stage_id(stem, branch)]
 
             out["by_pillar"][pos] = {
                 "stem": stem,
@@ -79,7 +104,7 @@ class TwelveStagesCalculator:
             }
 
             # Count for summary
-            if stage_zh != "未知":
+            if stage_zh != UNKNOWN_STAGE:
                 out["summary"][stage_zh] = out["summary"].get(stage_zh, 0) + 1
 
         # Determine dominant (most common) and weakest stages
@@ -93,6 +118,22 @@ class TwelveStagesCalculator:
 
         return out
 
+    def evaluate_many(self, charts: Iterable[Dict[str, Dict[str, str]]]) -> List[Dict[str, Any]]:
+        """Evaluate several charts; same output as calling ``evaluate`` on each."""
+        return [self.evaluate(pillars) for pillars in charts]
+
+    def lifecycle_for(self, stem: str, branch: str) -> Dict[str, str]:
+        """Stage labels for one (stem, branch); fits LuckCalculator's ``lifecycle_resolver``."""
+        stage_zh, stage_ko, stage_en = self._stages[self._stage_id(stem, branch)]
+        return {"stage_zh": stage_zh, "stage_ko": stage_ko, "stage_en": stage_en}
+
+    def _stage_id(self, stem: str, branch: str) -> int:
+        s = STEM_INDEX.get(stem)
+        b = BRANCH_INDEX.get(branch)
+        if s is None or b is None:
+            return _UNKNOWN_ID
+        return self._stage_table[s][b]
+
     def _translate(self, zh_label: str, from_lang: str, to_lang: str) -> str:
         """Translate stage label between languages."""
         if from_lang != "zh" or zh_label == "未知":
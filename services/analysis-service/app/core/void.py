@@ -15,23 +15,14 @@ KO-first 실무 구현.
 
 from __future__ import annotations
 
-import hashlib
 import json
+import sys
 from pathlib import Path
 from typing import Dict, Iterable, List, Tuple
 
-# --- 인라인 시그니처 유틸리티 (infra.signatures 대체) ----------------------
-
-
-def _canonical_json_signature(obj) -> str:
-    """
-    Compute SHA-256 signature of canonical JSON.
-    Uses deterministic dict ordering (sort_keys=True).
-    For strict RFC-8785 compliance, use canonicaljson library.
-    """
-    canonical_str = json.dumps(obj, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
-    return hashlib.sha256(canonical_str.encode("utf-8")).hexdigest()
+sys.path.insert(0, str(Path(__file__).resolve().parents[4] / "services" / "common"))
 
+from saju_common.signing import policy_signature  # noqa: E402
 
 # --- 상수(간지/테이블) -------------------------------------------------------
 STEMS: List[str] = ["甲", "乙", "丙", "丁", "戊", "己", "庚", "辛", "壬", "癸"]
@@ -168,7 +159,7 @@ def _validate_and_canonicalize_policy(data: dict) -> Dict[int, List[str]]:
 
 _OVERRIDE_SPEC = _try_load_override()
 POLICY_SPEC: Dict[int, List[str]] = _OVERRIDE_SPEC if _OVERRIDE_SPEC else dict(_DEFAULT_POLICY_SPEC)
-POLICY_SIGNATURE: str = _canonical_json_signature(POLICY_SPEC)
+POLICY_SIGNATURE: str = policy_signature(POLICY_SPEC)
 
 
 # --- 내부 유틸 ---------------------------------------------------------------
@@ -25,8 +25,9 @@ class YongshinSelector:
       (optional) elements_dist: {'wood':ratio,...} (0~1)
     """
 
-    def __init__(self):
-        self.policy = load_policy_json("yongshin_dual_policy_v1.json")
+    def __init__(self, bundle=None):
+        load_policy = bundle.get if bundle is not None else load_policy_json
+        self.policy = load_policy("yongshin_dual_policy_v1.json")
 
     # --- helpers ---------------------------------------------------------
     def _day_elem(self, day_stem: str) -> str:
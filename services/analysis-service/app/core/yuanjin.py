@@ -15,22 +15,14 @@ KO-first 원진 탐지기 v1.1
 
 from __future__ import annotations
 
-import hashlib
 import json
+import sys
 from pathlib import Path
 from typing import Dict, Iterable, List, Set, Tuple
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[4] / "services" / "common"))
 
-# --- 인라인 시그니처 유틸리티 (infra.signatures 대체) ----------------------
-def _canonical_json_signature(obj) -> str:
-    """
-    Compute SHA-256 signature of canonical JSON.
-    Uses deterministic dict ordering (sort_keys=True).
-    For strict RFC-8785 compliance, use canonicaljson library.
-    """
-    canonical_str = json.dumps(obj, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
-    return hashlib.sha256(canonical_str.encode("utf-8")).hexdigest()
-
+from saju_common.signing import policy_signature  # noqa: E402
 
 # --- 상수 --------------------------------------------------------------------
 BRANCHES: List[str] = ["子", "丑", "寅", "卯", "辰", "巳", "午", "未", "申", "酉", "戌", "亥"]
@@ -119,7 +111,7 @@ _POLICY_PAIRS: List[List[str]] = (
 
 # 서명을 위한 결정적 사양 객체
 _POLICY_SPEC: Dict[str, List[List[str]]] = {"pairs": _POLICY_PAIRS}
-POLICY_SIGNATURE: str = _canonical_json_signature(_POLICY_SPEC)
+POLICY_SIGNATURE: str = policy_signature(_POLICY_SPEC)
 
 
 # --- 내부 유틸 ---------------------------------------------------------------
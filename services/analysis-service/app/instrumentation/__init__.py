@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+"""Instrumentation and observability modules.
+
+``stage_timer`` is stdlib-only; ``metrics`` (prometheus_client) is imported
+only when stage timing is enabled.
+"""
+
+from .stage_timer import (
+    STAGE_TIMING_ENV,
+    STAGE_TIMINGS_RESPONSE_ENV,
+    StageTimer,
+    stage_timing_enabled,
+    timings_in_response_enabled,
+)
+
+__all__ = [
+    "STAGE_TIMING_ENV",
+    "STAGE_TIMINGS_RESPONSE_ENV",
+    "StageTimer",
+    "stage_timing_enabled",
+    "timings_in_response_enabled",
+]
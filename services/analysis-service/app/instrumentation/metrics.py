@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""
+Prometheus Metrics for Analysis Service
+Per-stage orchestrator latency and allocation histograms (stage timing only)
+"""
+
+from prometheus_client import Histogram
+
+# Whole-request latency
+analysis_duration = Histogram(
+    "saju_analysis_duration_seconds",
+    "SajuOrchestrator.analyze latency (seconds)",
+    ["status"],
+    buckets=[0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5],
+)
+# Labels:
+# - status: "success"|"error"
+
+# Per-stage latency
+stage_duration = Histogram(
+    "saju_analysis_stage_duration_seconds",
+    "Orchestrator stage latency (seconds)",
+    ["stage"],
+    buckets=[0.00001, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.05],
+)
+# Labels:
+# - stage: "strength"|"relations"|...|"luck"|"evidence_builder"|"korean_enricher"|"pillars_phase"
+
+# Per-stage net allocated memory blocks (sys.getallocatedblocks delta)
+stage_allocated_blocks = Histogram(
+    "saju_analysis_stage_allocated_blocks",
+    "Net memory blocks allocated by an orchestrator stage",
+    ["stage"],
+    buckets=[0, 10, 50, 100, 500, 1000, 5000, 10000, 50000],
+)
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""
+Per-stage timing hook for SajuOrchestrator.
+
+When enabled, every ``_call_*`` method (plus the pillars-pure phase) of one
+orchestrator instance is wrapped to record wall time and the net number of
+allocated memory blocks (``sys.getallocatedblocks`` delta; nested stages are
+included in their parent). Samples go to the Prometheus histograms in
+``metrics`` and, inside ``StageTimer.request()``, to a per-request dict that
+the orchestrator can return as ``trace.timings``.
+
+When disabled nothing is wrapped, so the orchestrator runs its plain bound
+methods and pays nothing.
+
+Analysis worker processes (``ANALYSIS_WORKERS``) call ``buffer_samples()``:
+their histogram samples are then kept and shipped back with each result
+(``drain_samples``), and the parent, which serves /metrics, records them with
+``record_samples``.
+
+Env:
+    ANALYSIS_STAGE_TIMING=1            wrap stages, export histograms
+    ANALYSIS_STAGE_TIMINGS_RESPONSE=1  also return trace.timings (implies timing)
+"""
+
+from __future__ import annotations
+
+import functools
+import os
+import sys
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+STAGE_TIMING_ENV = "ANALYSIS_STAGE_TIMING"
+STAGE_TIMINGS_RESPONSE_ENV = "ANALYSIS_STAGE_TIMINGS_RESPONSE"
+
+STAGE_PREFIX = "_call_"
+PILLARS_PHASE = "pillars_phase"
+
+_TRUTHY = ("1", "true", "yes")
+
+# (kind, label, seconds, allocated blocks); label is the status for "request"
+# samples and the stage name for "stage" samples
+Sample = Tuple[str, str, float, int]
+REQUEST_SAMPLE = "request"
+STAGE_SAMPLE = "stage"
+
+_buffered: Optional[List[Sample]] = None
+
+
+def _env_flag(name: str) -> bool:
+    return os.getenv(name, "").lower() in _TRUTHY
+
+
+def timings_in_response_enabled() -> bool:
+    """``ANALYSIS_STAGE_TIMINGS_RESPONSE`` is set."""
+    return _env_flag(STAGE_TIMINGS_RESPONSE_ENV)
+
+
+def stage_timing_enabled() -> bool:
+    """``ANALYSIS_STAGE_TIMING`` (or the response flag, which implies it) is set."""
+    return _env_flag(STAGE_TIMING_ENV) or timings_in_response_enabled()
+
+
+def buffer_samples() -> None:
+    """Keep this process's metric samples for ``drain_samples`` instead of exporting them."""
+    global _buffered
+    if _buffered is None:
+        _buffered = []
+
+
+def drain_samples() -> List[Sample]:
+    """Return and clear the samples buffered since the last call."""
+    if not _buffered:
+        return []
+    samples = list(_buffered)
+    del _buffered[:]
+    return samples
+
+
+def record_samples(samples: Iterable[Sample]) -> None:
+    """Observe samples drained in another process into this process's histograms."""
+    samples = list(samples)
+    if not samples:
+        return
+    from . import metrics
+
+    for sample in samples:
+        _observe_sample(metrics, sample)
+
+
+def _export(metrics: Any, sample: Sample) -> None:
+    if _buffered is not None:
+        _buffered.append(sample)
+    else:
+        _observe_sample(metrics, sample)
+
+
+def _observe_sample(metrics: Any, sample: Sample) -> None:
+    kind, label, seconds, allocated_blocks = sample
+    if kind == REQUEST_SAMPLE:
+        metrics.analysis_duration.labels(status=label).observe(seconds)
+    else:
+        metrics.stage_duration.labels(stage=label).observe(seconds)
+        metrics.stage_allocated_blocks.labels(stage=label).observe(max(allocated_blocks, 0))
+
+
+class StageTimer:
+    """Records wall time and allocation count per orchestrator stage."""
+
+    def __init__(self, *, export_metrics: bool = True) -> None:
+        self._current: ContextVar[Optional[Dict[str, Dict[str, float]]]] = ContextVar(
+            "saju_stage_timings", default=None
+        )
+        self._metrics = None
+        if export_metrics:
+            from . import metrics
+
+            self._metrics = metrics
+
+    def instrument(self, orchestrator: Any) -> None:
+        """Wrap the stage methods of ``orchestrator`` (instance attributes only)."""
+        for name in dir(type(orchestrator)):
+            if name.startswith(STAGE_PREFIX):
+                stage = name[len(STAGE_PREFIX) :]
+                setattr(orchestrator, name, self.wrap(stage, getattr(orchestrator, name)))
+        orchestrator._analyze_pillars = self.wrap(PILLARS_PHASE, orchestrator._analyze_pillars)
+
+    def wrap(self, stage: str, fn: Callable[..., Any]) -> Callable[..., Any]:
+        """Return ``fn`` timed under ``stage``."""
+        observe = self._observe
+        clock = time.perf_counter
+        blocks = sys.getallocatedblocks
+
+        @functools.wraps(fn)
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            blocks_before = blocks()
+            start = clock()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                observe(stage, clock() - start, blocks() - blocks_before)
+
+        return timed
+
+    @contextmanager
+    def request(self) -> Iterator[Dict[str, Dict[str, float]]]:
+        """Collect this request's stage timings into the yielded dict."""
+        timings: Dict[str, Dict[str, float]] = {}
+        token = self._current.set(timings)
+        try:
+            yield timings
+        finally:
+            self._current.reset(token)
+
+    def observe_request(self, seconds: float, status: str) -> None:
+        if self._metrics is not None:
+            _export(self._metrics, (REQUEST_SAMPLE, status, seconds, 0))
+
+    def _observe(self, stage: str, seconds: float, allocated_blocks: int) -> None:
+        if self._metrics is not None:
+            _export(self._metrics, (STAGE_SAMPLE, stage, seconds, allocated_blocks))
+        timings = self._current.get()
+        if timings is not None:
+            timings[stage] = {"ms": round(seconds * 1e3, 3), "alloc_blocks": allocated_blocks}
@@ -2,9 +2,17 @@
 
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, HTTPException, Response
+from fastapi.responses import PlainTextResponse
+
 from services.common import create_service_app
 
 from .api import router
+from .core import init_registry, reload_registry
+from .core.offload import AnalysisOffloader
+from .instrumentation import stage_timing_enabled
 
 APP_META = {
     "app": "saju-analysis-service",
@@ -12,9 +20,52 @@ APP_META = {
     "rule_id": "KR_classic_v1.4",
 }
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Build the shared engine registry once per process before serving.
+
+    With ``ANALYSIS_WORKERS=N`` analyses run in N warm worker processes, started
+    here. The tz offset tables for ``SAJU_PREWARM_ZONES`` are built up front too.
+    With ``POLICY_HOT_RELOAD=1`` a policy watcher rebuilds the registry (and
+    restarts the workers) when a policy file changes; new requests use the new
+    snapshot, in-flight ones finish on the old one.
+    """
+    # saju_common is importable once .core has put services/common on sys.path
+    from saju_common.policy_watcher import start_policy_watcher
+    from saju_common.tz_registry import prewarm_zones
+
+    app.state.engines = init_registry()
+    prewarm_zones()
+    offloader = AnalysisOffloader.from_env()
+    app.state.offloader = offloader
+    hooks = [reload_registry]
+    if offloader is not None:
+        await offloader.prewarm()
+        hooks.append(lambda bundle: offloader.restart())
+    watcher = start_policy_watcher(*hooks)
+    yield
+    if watcher is not None:
+        watcher.stop()
+    if offloader is not None:
+        offloader.shutdown()
+
+
 app = create_service_app(
     app_name=APP_META["app"],
     version=APP_META["version"],
     rule_id=APP_META["rule_id"],
+    lifespan=lifespan,
 )
 app.include_router(router, prefix="/v2")
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Prometheus metrics endpoint (per-stage orchestrator timings)."""
+    if not stage_timing_enabled():
+        raise HTTPException(status_code=404, detail="Metrics disabled")
+
+    from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,120 @@
+"""Compiled lookup tables of TenGodsCalculator / TwelveStagesCalculator."""
+
+import itertools
+import json
+import random
+from pathlib import Path
+
+import pytest
+from app.core.luck_pillars import LuckCalculator
+from app.core.ten_gods import EARTHLY_BRANCHES, HEAVENLY_STEMS, TenGodsCalculator
+from app.core.twelve_stages import TwelveStagesCalculator
+
+POLICY_DIR = Path(__file__).resolve().parents[3] / "saju_codex_batch_all_v2_6_signed" / "policies"
+
+
+def _load(name: str) -> dict:
+    return json.loads((POLICY_DIR / name).read_text(encoding="utf-8"))
+
+
+@pytest.fixture(scope="module")
+def ten_gods() -> TenGodsCalculator:
+    return TenGodsCalculator(_load("branch_tengods_policy.json"))
+
+
+@pytest.fixture(scope="module")
+def twelve_stages() -> TwelveStagesCalculator:
+    return TwelveStagesCalculator(_load("lifecycle_stages.json"))
+
+
+def _random_charts(n: int, seed: int = 60):
+    rng = random.Random(seed)
+    return [
+        {
+            pos: {"stem": rng.choice(HEAVENLY_STEMS), "branch": rng.choice(EARTHLY_BRANCHES)}
+            for pos in ("year", "month", "day", "hour")
+        }
+        for _ in range(n)
+    ]
+
+
+def test_ten_gods_table_matches_policy_rules(ten_gods):
+    for day, target in itertools.product(HEAVENLY_STEMS, HEAVENLY_STEMS):
+        assert ten_gods.ten_god_for(day, target) == ten_gods._rel_label(day, target)
+
+
+def test_ten_gods_hidden_stems_follow_policy(ten_gods):
+    policy = _load("branch_tengods_policy.json")
+    result = ten_gods.evaluate(
+        {pos: {"stem": "乙", "branch": "辰"} for pos in ("year", "month", "day", "hour")}
+    )
+    expected = [h["stem"] for h in policy["branches_hidden"]["辰"]]
+    assert list(result["by_pillar"]["year"]["hidden"]) == expected
+
+
+def test_ten_gods_evaluate_many_matches_evaluate(ten_gods):
+    charts = _random_charts(200)
+    assert ten_gods.evaluate_many(charts) == [ten_gods.evaluate(c) for c in charts]
+
+
+def test_ten_gods_invalid_stem_still_rejected(ten_gods):
+    chart = _random_charts(1)[0]
+    chart["hour"]["stem"] = "X"
+    with pytest.raises(ValueError, match="Invalid stem"):
+        ten_gods.evaluate(chart)
+
+
+def test_twelve_stages_table_matches_policy_mappings(twelve_stages):
+    policy = _load("lifecycle_stages.json")
+    labels = policy["labels"]
+    for stem, branch in itertools.product(HEAVENLY_STEMS, EARTHLY_BRANCHES):
+        stage_zh = policy["mappings"][stem][branch]
+        idx = labels["zh"].index(stage_zh)
+        assert twelve_stages.lifecycle_for(stem, branch) == {
+            "stage_zh": stage_zh,
+            "stage_ko": labels["ko"][idx],
+            "stage_en": labels["en"][idx],
+        }
+
+
+def test_twelve_stages_unknown_inputs_map_to_unknown(twelve_stages):
+    chart = {pos: {"stem": "", "branch": ""} for pos in ("year", "month", "day", "hour")}
+    result = twelve_stages.evaluate(chart)
+    assert result["by_pillar"]["day"]["stage_zh"] == "未知"
+    assert result["by_pillar"]["day"]["stage_ko"] == "未知"
+    assert result["summary"] == {}
+
+
+def test_twelve_stages_evaluate_many_matches_evaluate(twelve_stages):
+    charts = _random_charts(200, seed=12)
+    assert twelve_stages.evaluate_many(charts) == [twelve_stages.evaluate(c) for c in charts]
+
+
+def test_luck_calculator_uses_table_resolvers(ten_gods, twelve_stages):
+    luck = LuckCalculator(
+        _load("luck_pillars_policy.json"),
+        tengods_resolver=ten_gods.ten_god_for,
+        lifecycle_resolver=twelve_stages.lifecycle_for,
+        day_stem_for_labels="乙",
+    )
+    pillars = {
+        "year": {"stem": "庚", "branch": "辰"},
+        "month": {"stem": "乙", "branch": "酉"},
+        "day": {"stem": "乙", "branch": "亥"},
+        "hour": {"stem": "辛", "branch": "巳"},
+    }
+    birth_ctx = {
+        "sex": "male",
+        "birth_ts": "2000-09-14T10:00:00+09:00",
+        "age_years_decimal": 25.0,
+        "luck": {"start_age": 7.98},
+        "solar_terms": {},
+    }
+    decades = luck.evaluate(birth_ctx, pillars)["pillars"]
+    assert len(decades) == 10
+    for item in decades:
+        stem, branch = item["pillar"]
+        assert item["ten_god"] == ten_gods.ten_god_for("乙", stem)
+        assert (
+            item["lifecycle"]["stage_zh"] == twelve_stages.lifecycle_for(stem, branch)["stage_zh"]
+        )
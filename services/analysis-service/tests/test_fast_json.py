@@ -0,0 +1,89 @@
+"""Tests for single-pass JSON responses and the trusted validation mode."""
+
+import json
+from pathlib import Path
+
+import pytest
+from app.core.korean_enricher import LabelOverlay
+from app.core.llm_guard import STRICT, TRUSTED, validation_mode
+from app.core.records import LuckRecord
+from app.core.registry import EngineRegistry
+from app.main import app
+from app.models import AnalysisRequest
+from fastapi.encoders import jsonable_encoder
+from fastapi.testclient import TestClient
+
+from services.common import responses
+from services.common.responses import FastJSONResponse, dumps_json
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+REQUEST = {"pillars": {}, "options": {"include_trace": True}}
+
+
+@pytest.fixture(scope="module")
+def registry():
+    with pytest.MonkeyPatch.context() as mp:
+        # Orchestrator policies are resolved relative to the repository root.
+        mp.chdir(REPO_ROOT)
+        yield EngineRegistry.build()
+
+
+@pytest.fixture(scope="module")
+def response(registry):
+    return registry.analyze(AnalysisRequest.model_validate(REQUEST))
+
+
+def test_model_serializes_like_fastapi(response):
+    assert json.loads(dumps_json(response)) == jsonable_encoder(response)
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_plain_data_and_mapping_views(monkeypatch, use_orjson):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(responses, "orjson", None)
+    content = {
+        "luck": LuckRecord.empty(),
+        "strength": LabelOverlay({"level": "weak"}, {"level_ko": "신약"}),
+        "label": "정관격",
+    }
+
+    body = dumps_json(content)
+
+    assert json.loads(body) == {
+        "luck": LuckRecord.empty().to_dict(),
+        "strength": {"level": "weak", "level_ko": "신약"},
+        "label": "정관격",
+    }
+    assert "정관격".encode() in body
+
+
+def test_prerendered_bytes_are_sent_as_is():
+    assert FastJSONResponse(b'{"a":1}').body == b'{"a":1}'
+
+
+def test_trusted_mode_matches_strict(registry, response):
+    strict = registry.analyze(AnalysisRequest.model_validate(REQUEST), validate=STRICT)
+    assert registry.validate == TRUSTED
+    assert strict.model_dump(exclude={"trace"}) == response.model_dump(exclude={"trace"})
+    assert strict.recommendation == response.recommendation
+
+
+def test_validation_mode_from_env(monkeypatch):
+    monkeypatch.delenv("ANALYSIS_VALIDATE", raising=False)
+    assert validation_mode() == TRUSTED
+    monkeypatch.setenv("ANALYSIS_VALIDATE", "STRICT")
+    assert validation_mode() == STRICT
+    monkeypatch.setenv("ANALYSIS_VALIDATE", "lenient")
+    assert validation_mode() == STRICT
+
+
+def test_route_sends_single_pass_json(monkeypatch):
+    monkeypatch.chdir(REPO_ROOT)
+    response = TestClient(app).post("/v2/analyze", json=REQUEST)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json()["recommendation"]["action"]
@@ -5,10 +5,12 @@ Tests for Korean Label Enricher
 Test suite for KoreanLabelEnricher class covering all 141 mappings.
 """
 
+import json
 from pathlib import Path
 
 import pytest
-from app.core.korean_enricher import KoreanLabelEnricher
+from app.core.korean_enricher import KoreanLabelEnricher, LabelOverlay, iter_json
+from app.core.records import json_default
 
 # Test data paths
 REPO_ROOT = Path(__file__).parent.parent.parent.parent
@@ -386,6 +388,53 @@ class TestKoreanLabelEnricherEdgeCases:
             assert "pillar_ko" in entry
 
 
+class TestKoreanLabelOverlay:
+    """Test the zero-copy overlay mode."""
+
+    @pytest.fixture
+    def enricher(self):
+        return KoreanLabelEnricher.from_files()
+
+    @pytest.fixture
+    def payload(self):
+        return {
+            "strength": {"level": "weak", "basis": {"score": 0.4}},
+            "shensha": {"list": [{"key": "TIAN_E_GUIREN", "pillar": "year"}], "enabled": True},
+            "relations": {"list": [{"type": "banhe", "pillars": ["year", "month"]}]},
+            "pillars": {"year": {"jiazi": "JIAZI"}, "month": "not-a-dict"},
+            "elements": {"wood": 0.2, "fire": 0.8},
+        }
+
+    def test_overlay_reads_like_enrich(self, enricher, payload):
+        overlay = enricher.overlay(payload)
+
+        assert isinstance(overlay["strength"], LabelOverlay)
+        assert overlay["strength"]["level_ko"] == "신약"
+        assert overlay["shensha"]["list"][0]["label_ko"] == "천을귀인"
+        assert overlay["relations"]["list"][0]["pillars_ko"] == ["연주", "월주"]
+        assert overlay["pillars"]["year"]["jiazi_ko"] == "갑자"
+        assert overlay == enricher.enrich(payload)
+
+    def test_overlay_shares_original_values(self, enricher, payload):
+        overlay = enricher.overlay(payload)
+
+        # Unlabelled sections and values are the original objects
+        assert overlay["elements"] is payload["elements"]
+        assert overlay["strength"]["basis"] is payload["strength"]["basis"]
+        assert overlay["pillars"]["month"] == "not-a-dict"
+        # Only containers on a labelled path are copied; the original is untouched
+        assert overlay["shensha"] is not payload["shensha"]
+        assert "level_ko" not in payload["strength"]
+        assert "_enrichment" not in payload
+
+    def test_labels_merged_at_serialization(self, enricher, payload):
+        expected = json.dumps(enricher.enrich(payload), ensure_ascii=False)
+        overlay = enricher.overlay(payload)
+
+        assert json.dumps(overlay, ensure_ascii=False, default=json_default) == expected
+        assert "".join(iter_json(overlay)) == expected
+
+
 class TestLLMGuardIntegration:
     """Test integration with LLMGuard."""
 
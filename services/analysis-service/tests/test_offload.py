@@ -0,0 +1,171 @@
+"""Tests for the process-pool offload of /v2/analyze."""
+
+import asyncio
+import os
+import time
+
+import pytest
+from app.core.offload import AnalysisOffloader, PoolRestarting, PoolSaturated
+from app.instrumentation import STAGE_TIMING_ENV
+from app.instrumentation.stage_timer import drain_samples, record_samples
+from app.main import app
+from app.models import AnalysisRequest
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+PAYLOAD = {
+    "pillars": {
+        "year": {"pillar": "壬申"},
+        "month": {"pillar": "辛未"},
+        "day": {"pillar": "丁丑"},
+        "hour": {"pillar": "庚子"},
+    },
+    "options": {"include_trace": True},
+}
+
+
+@pytest.fixture(scope="module")
+def offloader():
+    offloader = AnalysisOffloader(1, max_pending=2, timeout=5)
+    asyncio.run(offloader.prewarm())
+    yield offloader
+    offloader.shutdown()
+
+
+def test_runs_in_a_warm_worker_process(offloader):
+    worker_pid = asyncio.run(offloader.run(os.getpid))
+    assert worker_pid != os.getpid()
+    assert offloader.pending == 0
+
+
+def _wait_idle(offloader, seconds=2.0):
+    deadline = time.monotonic() + seconds
+    while offloader.pending and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return offloader.pending
+
+
+def test_saturated_pool_rejects_immediately(offloader):
+    first = offloader.submit(time.sleep, 0.3)
+    second = offloader.submit(time.sleep, 0)
+    with pytest.raises(PoolSaturated) as excinfo:
+        offloader.submit(time.sleep, 0)
+    assert excinfo.value.retry_after >= 1
+
+    first.result(), second.result()
+    assert _wait_idle(offloader) == 0
+
+
+def test_deadline_raises_and_releases_slot(offloader):
+    async def scenario():
+        running = offloader.submit(time.sleep, 0.3)
+        with pytest.raises(asyncio.TimeoutError):
+            await offloader.run(os.getpid, timeout=0.05)
+        return running
+
+    running = asyncio.run(scenario())
+    running.result()
+    # The abandoned job is dropped, or releases its slot as soon as it ends
+    assert _wait_idle(offloader) == 0
+
+
+def test_restart_swaps_in_warm_workers(offloader):
+    old_pid = asyncio.run(offloader.run(os.getpid))
+    offloader.restart()
+
+    # Workers were started (and ran their initializer) before restart returned
+    assert offloader._pool._processes
+    assert asyncio.run(offloader.run(os.getpid)) != old_pid
+    assert _wait_idle(offloader) == 0
+
+
+def test_dead_worker_answers_503_and_pool_recovers():
+    offloader = AnalysisOffloader(1, timeout=30)
+    try:
+        asyncio.run(offloader.prewarm())
+        broken = offloader._pool
+        with pytest.raises(PoolRestarting) as excinfo:
+            asyncio.run(offloader.run(os._exit, 1))  # the worker dies mid-job
+        assert excinfo.value.retry_after >= 1
+
+        deadline = time.monotonic() + 60
+        while offloader._pool is broken and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert offloader._pool is not broken
+        assert asyncio.run(offloader.run(os.getpid)) != os.getpid()
+        assert _wait_idle(offloader) == 0
+    finally:
+        offloader.shutdown()
+
+
+def _stage_count(stage):
+    return (
+        REGISTRY.get_sample_value("saju_analysis_stage_duration_seconds_count", {"stage": stage})
+        or 0.0
+    )
+
+
+def test_worker_stage_timings_reach_parent_metrics(monkeypatch):
+    monkeypatch.setenv(STAGE_TIMING_ENV, "1")  # inherited by the spawned worker
+    offloader = AnalysisOffloader(1, timeout=30)
+    try:
+        asyncio.run(offloader.prewarm())
+        # The worker's prewarm analysis was buffered instead of observed locally
+        samples = asyncio.run(offloader.run(drain_samples))
+    finally:
+        offloader.shutdown()
+
+    assert ("stage", "evidence_builder") in {sample[:2] for sample in samples}
+    before = _stage_count("evidence_builder")
+    record_samples(samples)
+    assert _stage_count("evidence_builder") > before
+
+
+def test_analyze_json_records_returned_samples(offloader, monkeypatch):
+    async def fake_run(fn, payload, timeout=None):
+        return b"{}", [("stage", "offload_probe", 0.002, 3)]
+
+    monkeypatch.setattr(offloader, "run", fake_run)
+    before = _stage_count("offload_probe")
+
+    body = asyncio.run(offloader.analyze_json(AnalysisRequest.model_validate(PAYLOAD)))
+
+    assert body == b"{}"
+    assert _stage_count("offload_probe") == before + 1
+
+
+class _SaturatedOffloader:
+    timeout = 1.0
+
+    async def analyze_json(self, payload):
+        raise PoolSaturated(8, retry_after=2)
+
+
+class _RestartingOffloader:
+    timeout = 1.0
+
+    async def analyze_json(self, payload):
+        raise PoolRestarting(retry_after=5)
+
+
+class _SlowOffloader:
+    timeout = 0.01
+
+    async def analyze_json(self, payload):
+        raise asyncio.TimeoutError
+
+
+@pytest.mark.parametrize(
+    ("fake", "status", "retry_after"),
+    [
+        (_SaturatedOffloader(), 503, "2"),
+        (_RestartingOffloader(), 503, "5"),
+        (_SlowOffloader(), 504, None),
+    ],
+)
+def test_route_maps_backpressure_and_deadline(monkeypatch, fake, status, retry_after):
+    monkeypatch.setattr(app.state, "offloader", fake, raising=False)
+    response = TestClient(app).post("/v2/analyze", json=PAYLOAD)
+
+    assert response.status_code == status
+    assert response.headers.get("Retry-After") == retry_after
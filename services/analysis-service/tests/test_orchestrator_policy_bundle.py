@@ -0,0 +1,36 @@
+"""SajuOrchestrator reads every engine policy from one PolicyBundle."""
+
+import pytest
+from app.core.saju_orchestrator import SajuOrchestrator
+from saju_common.policy_bundle import FrozenDict, PolicyBundle, get_policy_bundle
+
+PILLARS = {"year": "壬申", "month": "辛未", "day": "丁丑", "hour": "庚子"}
+BIRTH_CONTEXT = {"birth_dt": "1992-07-15T23:40:00", "gender": "M", "timezone": "Asia/Seoul"}
+
+
+@pytest.fixture(scope="module")
+def bundle():
+    return PolicyBundle.build()
+
+
+def test_engines_share_frozen_bundle_policies(bundle):
+    orchestrator = SajuOrchestrator(pillars_cache_size=0, policy_bundle=bundle)
+
+    assert orchestrator.policy_bundle is bundle
+    assert orchestrator.policy_signature == bundle.bundle_hash
+    assert orchestrator.gyeokguk.policy is bundle.get("gyeokguk_policy_v1.json")
+    assert orchestrator.strength.grading is bundle.get("strength_grading_tiers_v1.json")
+    assert isinstance(orchestrator.yongshin.policy, FrozenDict)
+
+
+def test_does_not_depend_on_cwd(bundle, tmp_path, monkeypatch):
+    # The v2.6 batch policies used to be opened relative to the CWD
+    monkeypatch.chdir(tmp_path)
+    orchestrator = SajuOrchestrator(pillars_cache_size=0, policy_bundle=bundle)
+
+    result = orchestrator.analyze(PILLARS, BIRTH_CONTEXT)
+    assert result["status"] == "success"
+
+
+def test_default_is_process_bundle():
+    assert SajuOrchestrator(pillars_cache_size=0).policy_bundle is get_policy_bundle()
@@ -0,0 +1,130 @@
+"""Tests for the memoized pillars-pure phase of SajuOrchestrator."""
+
+import threading
+from pathlib import Path
+
+import pytest
+from app.core.pillars_cache import PillarsAnalysisCache
+from app.core.saju_orchestrator import SajuOrchestrator
+from saju_common.policy_bundle import PolicyBundle, get_policy_bundle
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+PILLARS = {"year": "壬申", "month": "辛未", "day": "丁丑", "hour": "庚子"}
+
+
+def _volatile_free(result):
+    """Drop fields that legitimately differ between calls (timestamps)."""
+    result = dict(result)
+    result.pop("meta")
+    result.pop("evidence")
+    return result
+
+
+@pytest.fixture(scope="module")
+def orchestrators():
+    # Orchestrator policies are resolved relative to the repository root.
+    with pytest.MonkeyPatch.context() as mp:
+        mp.chdir(REPO_ROOT)
+        yield SajuOrchestrator(pillars_cache_size=8), SajuOrchestrator(pillars_cache_size=0)
+
+
+class TestPillarsAnalysisCache:
+    def test_hit_miss_and_eviction_counters(self):
+        cache = PillarsAnalysisCache(maxsize=2)
+        calls = []
+
+        def compute(tag):
+            return lambda: calls.append(tag) or {"tag": tag}
+
+        assert cache.get_or_compute("a", compute("a")) == {"tag": "a"}
+        assert cache.get_or_compute("b", compute("b")) == {"tag": "b"}
+        assert cache.get_or_compute("a", compute("a")) == {"tag": "a"}  # hit, a is now newest
+        cache.get_or_compute("c", compute("c"))  # evicts b
+        cache.get_or_compute("b", compute("b"))  # miss again, evicts a
+
+        assert calls == ["a", "b", "c", "b"]
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.evictions) == (1, 4, 2)
+        assert (stats.size, stats.maxsize) == (2, 2)
+
+    def test_zero_size_disables_storage(self):
+        cache = PillarsAnalysisCache(maxsize=0)
+        cache.get_or_compute("a", dict)
+        cache.get_or_compute("a", dict)
+        assert len(cache) == 0
+        assert cache.stats().misses == 2
+
+    def test_failed_compute_is_not_cached(self):
+        cache = PillarsAnalysisCache(maxsize=4)
+
+        def boom():
+            raise RuntimeError("engine failed")
+
+        with pytest.raises(RuntimeError):
+            cache.get_or_compute("a", boom)
+        assert len(cache) == 0
+
+    def test_concurrent_fill_keeps_single_value(self):
+        cache = PillarsAnalysisCache(maxsize=4)
+        barrier = threading.Barrier(8)
+        seen = []
+
+        def worker():
+            barrier.wait()
+            seen.append(cache.get_or_compute("k", lambda: {"v": object()}))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(cache) == 1
+        assert cache.stats().hits + cache.stats().misses == 8
+
+    def test_negative_size_rejected(self):
+        with pytest.raises(ValueError):
+            PillarsAnalysisCache(maxsize=-1)
+
+
+def test_cache_key_tracks_policy_bundle(orchestrators, tmp_path):
+    cached, _ = orchestrators
+    assert cached.policy_signature == get_policy_bundle().bundle_hash
+
+    def bundle_hash():
+        return PolicyBundle.build([tmp_path], extra_dirs=()).bundle_hash
+
+    (tmp_path / "a.json").write_text('{"x": 1}', encoding="utf-8")
+    before = bundle_hash()
+    assert bundle_hash() == before
+    (tmp_path / "a.json").write_text('{"x": 2}', encoding="utf-8")
+    assert bundle_hash() != before
+
+
+def test_cached_analysis_matches_uncached(orchestrators):
+    cached, uncached = orchestrators
+    context = {"birth_dt": "1992-07-15T23:40:00", "gender": "M", "timezone": "Asia/Seoul"}
+
+    first = cached.analyze(PILLARS, context)
+    second = cached.analyze(PILLARS, context)
+    reference = uncached.analyze(PILLARS, context)
+
+    assert first["status"] == "success"
+    assert _volatile_free(first) == _volatile_free(second) == _volatile_free(reference)
+    assert first["evidence"]["sections"] == reference["evidence"]["sections"]
+    assert cached.pillars_cache.stats().hits >= 1
+
+
+def test_birth_context_is_not_cached(orchestrators):
+    cached, _ = orchestrators
+    male = cached.analyze(
+        PILLARS, {"birth_dt": "1992-07-15T23:40:00", "gender": "M", "timezone": "Asia/Seoul"}
+    )
+    hits = cached.pillars_cache.stats().hits
+    female = cached.analyze(
+        PILLARS, {"birth_dt": "1992-07-15T23:40:00", "gender": "F", "timezone": "Asia/Seoul"}
+    )
+
+    assert cached.pillars_cache.stats().hits == hits + 1
+    assert male["luck"]["direction"] != female["luck"]["direction"]
+    assert male["strength"] == female["strength"]
@@ -0,0 +1,100 @@
+"""Tests for the immutable stage records returned by SajuOrchestrator."""
+
+import copy
+import dataclasses
+import json
+import pickle
+from pathlib import Path
+
+import pytest
+from app.core.korean_enricher import KoreanLabelEnricher
+from app.core.records import (
+    LuckRecord,
+    RelationsRecord,
+    StrengthRecord,
+    TenGodsRecord,
+    TwelveStagesRecord,
+    json_default,
+)
+from app.core.saju_orchestrator import SajuOrchestrator
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+PILLARS = {"year": "壬申", "month": "辛未", "day": "丁丑", "hour": "庚子"}
+CONTEXT = {"birth_dt": "1992-07-15T23:40:00", "gender": "M", "timezone": "Asia/Seoul"}
+
+
+def _strength():
+    return StrengthRecord(
+        score_raw=42.0,
+        score=42.0,
+        score_normalized=0.42,
+        grade_code="중화",
+        bin="balanced",
+        phase="旺",
+        details={"month_stem_effect": 0.0},
+        policy={"clamp_min": 0.0},
+    )
+
+
+@pytest.fixture(scope="module")
+def result():
+    with pytest.MonkeyPatch.context() as mp:
+        mp.chdir(REPO_ROOT)
+        yield SajuOrchestrator(pillars_cache_size=0).analyze(PILLARS, CONTEXT)
+
+
+class TestRecord:
+    def test_reads_like_a_dict(self):
+        strength = _strength()
+        assert strength["grade_code"] == strength.grade_code == "중화"
+        assert strength.get("missing", "n/a") == "n/a"
+        assert "score" in strength and "missing" not in strength
+        assert list(strength)[:2] == ["score_raw", "score"]
+        assert strength == strength.to_dict()
+        with pytest.raises(KeyError):
+            strength["missing"]
+
+    def test_is_frozen_and_slotted(self):
+        strength = _strength()
+        assert not hasattr(strength, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            strength.score = 1.0
+        with pytest.raises(TypeError):
+            strength["score"] = 1.0
+
+    def test_from_mapping_ignores_unknown_keys(self):
+        data = dict(_strength(), extra="ignored")
+        assert StrengthRecord.from_mapping(data) == _strength()
+
+    def test_pickle_and_deepcopy_round_trip(self):
+        strength = _strength()
+        assert pickle.loads(pickle.dumps(strength)) == strength
+        assert copy.deepcopy(strength) == strength
+
+    def test_json_default_serializes_in_place(self):
+        payload = {"strength": _strength(), "luck": LuckRecord.empty()}
+        decoded = json.loads(json.dumps(payload, default=json_default))
+        assert decoded["strength"] == _strength().to_dict()
+        assert decoded["luck"]["pillars"] == []
+        with pytest.raises(TypeError):
+            json.dumps({"x": object()}, default=json_default)
+
+
+def test_orchestrator_returns_records(result):
+    assert result["status"] == "success"
+    assert isinstance(result["strength"], StrengthRecord)
+    assert isinstance(result["relations"], RelationsRecord)
+    assert isinstance(result["ten_gods"], TenGodsRecord)
+    assert isinstance(result["twelve_stages"], TwelveStagesRecord)
+    assert isinstance(result["luck"], LuckRecord)
+    assert len(result["luck"]["pillars"]) > 0
+
+    decoded = json.loads(json.dumps(result, ensure_ascii=False, default=json_default))
+    assert decoded["strength"]["grade_code"] == result["strength"]["grade_code"]
+    assert decoded["ten_gods"]["summary"] == result["ten_gods"]["summary"]
+
+
+def test_enricher_shares_records_instead_of_copying(result):
+    enriched = KoreanLabelEnricher.from_files().enrich({"strength": result["strength"]})
+    assert enriched["strength"] is result["strength"]
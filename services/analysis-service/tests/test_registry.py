@@ -0,0 +1,92 @@
+"""Tests for the process-wide analysis engine registry."""
+
+import threading
+from pathlib import Path
+
+import pytest
+from app.core import registry as registry_module
+from app.core.registry import (
+    EngineRegistry,
+    get_registry,
+    init_registry,
+    reload_registry,
+    reset_registry,
+)
+from saju_common.policy_bundle import PolicyBundle
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+
+@pytest.fixture(autouse=True)
+def _fresh_registry(monkeypatch):
+    # Orchestrator policies are resolved relative to the repository root.
+    monkeypatch.chdir(REPO_ROOT)
+    reset_registry()
+    yield
+    reset_registry()
+
+
+def test_get_registry_returns_same_instance():
+    first = get_registry()
+    second = get_registry()
+    assert first is second
+    assert first.engine is second.engine
+
+
+def test_registry_is_immutable():
+    registry = get_registry()
+    with pytest.raises(AttributeError):
+        registry.engine = None  # type: ignore[misc]
+
+
+def test_concurrent_first_use_builds_once(monkeypatch):
+    calls = []
+    original_build = EngineRegistry.build.__func__
+
+    def counting_build(cls):
+        calls.append(1)
+        return original_build(cls)
+
+    monkeypatch.setattr(EngineRegistry, "build", classmethod(counting_build))
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(get_registry())) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+
+
+def test_prewarm_runs_canned_chart():
+    summary = get_registry().prewarm()
+    assert summary["status"] == "success"
+    assert "LuckCalculator" in summary["engines_used"]
+
+
+def test_init_registry_prewarm_from_env(monkeypatch):
+    seen = []
+    monkeypatch.setattr(EngineRegistry, "prewarm", lambda self: seen.append(self))
+    monkeypatch.setenv(registry_module.PREWARM_ENV, "1")
+    registry = init_registry()
+    assert seen == [registry]
+
+    seen.clear()
+    monkeypatch.setenv(registry_module.PREWARM_ENV, "0")
+    init_registry()
+    assert seen == []
+
+
+def test_reload_swaps_registry_for_new_requests():
+    old = get_registry()
+    bundle = PolicyBundle.build()
+
+    new = reload_registry(bundle)
+
+    assert get_registry() is new and new is not old
+    assert new.policy_bundle is bundle
+    assert new.engine.orchestrator.policy_bundle is bundle
+    # A request that already resolved the old registry finishes on it
+    assert old.prewarm()["status"] == "success"
@@ -0,0 +1,101 @@
+"""Tests for the shared Stage-3 rule compiler."""
+
+import logging
+
+import pytest
+from app.core.climate_advice import ClimateAdvice
+from app.core.gyeokguk_classifier import GyeokgukClassifier
+from app.core.luck_flow import LuckFlow
+from app.core.pattern_profiler import PatternProfiler
+from app.core.rule_compiler import RuleContext, RuleProgram, get_path
+
+CTX = {
+    "season": "겨울",
+    "strength": {"phase": "왕", "elements": {"wood": "high", "water": "low", "fire": "low"}},
+    "relation": {"flags": ["chong", "harm"]},
+    "climate": {"balance_index": 1, "flags": ["dryness"]},
+    "yongshin": {"primary": "목"},
+    "daewoon": {"turning_to_support_primary": True},
+}
+
+
+def test_context_matches_dotted_path_lookup():
+    c = RuleContext.from_ctx(CTX)
+    assert c.phase == get_path(CTX, "strength.phase")
+    assert c.primary_element == "wood"
+    assert c.relation_flags == frozenset({"chong", "harm"})
+    assert c.balance_index == 1
+    assert c.truthy["daewoon.turning_to_support_primary"] is True
+    assert c.truthy["sewoon.supports_primary"] is False
+
+    nested = RuleContext.from_ctx({"context": {"season": "봄"}, "season": "겨울"})
+    assert nested.season == "봄"
+    assert nested.balance_index == 0
+    assert nested.elements == {}
+
+
+@pytest.mark.parametrize(
+    "when, expected",
+    [
+        ({"strength.phase_in": ["왕", "상"]}, True),
+        ({"strength.phase_in": ["휴"]}, False),
+        ({"strength.elements_any": ["high:primary"]}, True),
+        ({"strength.elements_any": ["low:primary", "low:수"]}, True),
+        ({"strength.elements_any": ["normal:primary"]}, False),
+        ({"relation.flags_any": ["sanhe", "harm"]}, True),
+        ({"climate.flags_any": ["humidity"]}, False),
+        ({"climate.balance_index_gte": 1, "climate.balance_index_lte": 1}, True),
+        ({"climate.balance_index_gte": 2}, False),
+        ({"yongshin.primary_in": ["목", "화"]}, True),
+        ({"daewoon.turning_to_support_primary": True}, True),
+        ({"sewoon.counters_primary": True}, False),
+        ({"season": ["겨울"], "balance": {"water": "low", "fire": "low"}}, True),
+        ({"imbalance_flags": ["dryness", "coldness"]}, False),
+        ({}, True),
+    ],
+)
+def test_compiled_conditions(when, expected):
+    program = RuleProgram([("r", when)])
+    assert (program.first_match(RuleContext.from_ctx(CTX)) == 0) is expected
+
+
+def test_unknown_condition_is_ignored_with_warning(caplog):
+    with caplog.at_level(logging.WARNING):
+        program = RuleProgram([("r", {"no.such_key": 1})])
+    assert "no.such_key" in caplog.text
+    assert program.first_match(RuleContext.from_ctx(CTX)) == 0
+
+
+def test_stats_count_evaluations_and_matches():
+    program = RuleProgram(
+        [
+            ("miss", {"strength.phase_in": ["휴"]}),
+            ("hit", {"strength.phase_in": ["왕"]}),
+            ("never", {}),
+        ],
+        timings=True,
+    )
+    c = RuleContext.from_ctx(CTX)
+    assert program.first_match(c) == 1
+    assert program.all_matches(c) == [1, 2]
+
+    stats = {s.rule_id: s for s in program.stats()}
+    assert (stats["miss"].evaluations, stats["miss"].matches) == (2, 0)
+    assert (stats["hit"].evaluations, stats["hit"].matches) == (2, 2)
+    assert (stats["never"].evaluations, stats["never"].matches) == (1, 1)
+    assert stats["hit"].total_ns > 0
+
+    program.reset_stats()
+    assert all(s.evaluations == 0 for s in program.stats())
+
+
+def test_engines_expose_rule_stats():
+    engines = [GyeokgukClassifier(), LuckFlow(), PatternProfiler(), ClimateAdvice()]
+    for engine in engines:
+        engine.run(CTX)
+        stats = engine.rule_stats()
+        assert len(stats) == len(engine.program)
+        assert stats[0].evaluations == 1
+
+    climate_advice = engines[-1]
+    assert climate_advice.run(CTX)["matched_policy_id"] == "WATER_DEFICIT_IN_WINTER"
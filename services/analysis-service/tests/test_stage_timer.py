@@ -0,0 +1,90 @@
+"""Tests for opt-in per-stage timing in SajuOrchestrator."""
+
+from pathlib import Path
+
+import pytest
+from app.core.saju_orchestrator import SajuOrchestrator
+from app.instrumentation import STAGE_TIMING_ENV, STAGE_TIMINGS_RESPONSE_ENV, StageTimer, metrics
+from prometheus_client import REGISTRY
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+PILLARS = {"year": "壬申", "month": "辛未", "day": "丁丑", "hour": "庚子"}
+BIRTH_CONTEXT = {"birth_dt": "1992-07-15T23:40:00", "gender": "M", "timezone": "Asia/Seoul"}
+
+
+@pytest.fixture(autouse=True)
+def _repo_root(monkeypatch):
+    # Orchestrator policies are resolved relative to the repository root.
+    monkeypatch.chdir(REPO_ROOT)
+    monkeypatch.delenv(STAGE_TIMING_ENV, raising=False)
+    monkeypatch.delenv(STAGE_TIMINGS_RESPONSE_ENV, raising=False)
+
+
+def _stage_count(stage):
+    return (
+        REGISTRY.get_sample_value("saju_analysis_stage_duration_seconds_count", {"stage": stage})
+        or 0.0
+    )
+
+
+def test_off_by_default_leaves_methods_unwrapped():
+    orchestrator = SajuOrchestrator(pillars_cache_size=0)
+
+    assert orchestrator.stage_timer is None
+    assert "_call_luck" not in vars(orchestrator)
+    result = orchestrator.analyze(PILLARS, BIRTH_CONTEXT)
+    assert result["status"] == "success"
+    assert "trace" not in result
+
+
+def test_env_enables_timing_without_response_block(monkeypatch):
+    monkeypatch.setenv(STAGE_TIMING_ENV, "1")
+    orchestrator = SajuOrchestrator(pillars_cache_size=0)
+    before = _stage_count("evidence_builder")
+
+    result = orchestrator.analyze(PILLARS, BIRTH_CONTEXT)
+
+    assert isinstance(orchestrator.stage_timer, StageTimer)
+    assert "trace" not in result
+    assert _stage_count("evidence_builder") == before + 1
+
+
+def test_timings_in_response():
+    orchestrator = SajuOrchestrator(pillars_cache_size=0, timings_in_response=True)
+    success_before = (
+        REGISTRY.get_sample_value("saju_analysis_duration_seconds_count", {"status": "success"})
+        or 0.0
+    )
+
+    result = orchestrator.analyze(PILLARS, BIRTH_CONTEXT)
+
+    timings = result["trace"]["timings"]
+    for stage in ("pillars_phase", "stage3", "luck", "evidence_builder", "korean_enricher"):
+        assert timings[stage]["ms"] >= 0.0
+        assert isinstance(timings[stage]["alloc_blocks"], int)
+    assert (
+        REGISTRY.get_sample_value("saju_analysis_duration_seconds_count", {"status": "success"})
+        == success_before + 1
+    )
+
+
+def test_timings_are_per_request():
+    orchestrator = SajuOrchestrator(pillars_cache_size=8, timings_in_response=True)
+
+    first = orchestrator.analyze(PILLARS, BIRTH_CONTEXT)
+    second = orchestrator.analyze(PILLARS, BIRTH_CONTEXT)
+
+    assert "pillars_phase" in first["trace"]["timings"]
+    # Cache hit: the pillars-pure phase does not run again
+    assert "pillars_phase" not in second["trace"]["timings"]
+    assert "luck" in second["trace"]["timings"]
+
+
+def test_timer_without_request_context_only_exports_metrics():
+    timer = StageTimer()
+    before = _stage_count("unit")
+
+    assert timer.wrap("unit", lambda x: x * 2)(21) == 42
+    assert _stage_count("unit") == before + 1
+    assert metrics.stage_allocated_blocks is not None
@@ -1,9 +1,9 @@
-import csv
 from dataclasses import dataclass
-from datetime import datetime
 from pathlib import Path
 from typing import Iterable
 
+from services.common.saju_common import SolarTermIndex, get_solar_term_index
+
 from ..models import TermEntry
 
 
@@ -13,22 +13,27 @@ class SolarTermLoader:
 
     table_path: Path
 
-    def load_year(self, year: int) -> Iterable[TermEntry]:
-        """Yield solar term entries for the given year from a CSV file."""
-        file_path = self.table_path / f"terms_{year}.csv"
-        if not file_path.exists():
-            raise FileNotFoundError(f"Solar term table missing for {year}: {file_path}")
+    @property
+    def index(self) -> SolarTermIndex:
+        """Shared in-memory index for ``table_path`` (CSV set parsed once per process)."""
+        return get_solar_term_index(self.table_path)
 
-        with file_path.open("r", encoding="utf-8") as csvfile:
-            reader = csv.DictReader(csvfile)
-            for row in reader:
-                utc_time = datetime.fromisoformat(row["utc_time"].replace("Z", "+00:00"))
-                yield TermEntry(
-                    term=row["term"],
-                    lambda_deg=float(row["lambda_deg"]),
-                    utc_time=utc_time,
-                    local_time=utc_time,  # placeholder, conversion handled in service
-                    delta_t_seconds=float(row["delta_t_seconds"]),
-                    source=row["source"],
-                    algo_version=row["algo_version"],
-                )
+    def load_year(self, year: int) -> Iterable[TermEntry]:
+        """Return solar term entries for the given year."""
+        index = self.index
+        if not index.has_year(year):
+            raise FileNotFoundError(
+                f"Solar term table missing for {year}: {self.table_path / f'terms_{year}.csv'}"
+            )
+        return [
+            TermEntry(
+                term=record.term,
+                lambda_deg=record.lambda_deg,
+                utc_time=record.utc_time,
+                local_time=record.utc_time,  # placeholder, conversion handled in service
+                delta_t_seconds=record.delta_t_seconds,
+                source=record.source,
+                algo_version=record.algo_version,
+            )
+            for record in index.year_entries(year)
+        ]
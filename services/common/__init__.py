@@ -4,6 +4,13 @@ from .app_factory import create_service_app
 
 # policy_loader is imported separately to avoid circular deps
 from .policy_loader import resolve_policy_path
+from .responses import FastJSONResponse, dumps_json
 from .trace import TraceMetadata
 
-__all__ = ["create_service_app", "TraceMetadata", "resolve_policy_path"]
+__all__ = [
+    "create_service_app",
+    "TraceMetadata",
+    "resolve_policy_path",
+    "FastJSONResponse",
+    "dumps_json",
+]
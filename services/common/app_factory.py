@@ -2,13 +2,24 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Callable
 
 from fastapi import FastAPI
 
 
-def create_service_app(*, app_name: str, version: str, rule_id: str) -> FastAPI:
-    """Create a FastAPI application with standard metadata and health endpoints."""
+def create_service_app(
+    *,
+    app_name: str,
+    version: str,
+    rule_id: str,
+    lifespan: Callable[[FastAPI], Any] | None = None,
+) -> FastAPI:
+    """Create a FastAPI application with standard metadata and health endpoints.
+
+    ``lifespan`` is forwarded to FastAPI so services can build long-lived engines
+    once at startup instead of per request. ``/health`` is async, so it is
+    answered on the event loop even while every threadpool worker is busy.
+    """
     metadata: dict[str, Any] = {
         "app": app_name,
         "version": version,
@@ -19,10 +30,11 @@ def create_service_app(*, app_name: str, version: str, rule_id: str) -> FastAPI:
         version=version,
         summary=f"{app_name} service",
         contact={"name": "Codex Team"},
+        lifespan=lifespan,
     )
 
     @app.get("/health", tags=["internal"], name="health")
-    def health() -> dict[str, Any]:  # pragma: no cover - simple pass-through
+    async def health() -> dict[str, Any]:  # pragma: no cover - simple pass-through
         return {"status": "ok", **metadata}
 
     @app.get("/", tags=["meta"], name="root")
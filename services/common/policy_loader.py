@@ -7,6 +7,7 @@ Search order:
 Usage:
   from services.common.policy_loader import resolve_policy_path, load_policy_json
   data = load_policy_json("luck_flow_policy_v1.json")
+Services should prefer the frozen, load-once ``saju_common.policy_bundle``.
 """
 import json
 import os
@@ -26,14 +27,18 @@ LEGACY_DIRS = [
 ]
 
 
-def search_candidates(filename: str) -> List[Path]:
-    candidates = []
+def search_dirs() -> List[Path]:
+    dirs = []
     env_dir = os.getenv("POLICY_DIR")
     if env_dir:
-        candidates.append(Path(env_dir))
-    candidates.append(CANONICAL)
-    candidates.extend(LEGACY_DIRS)
-    return [Path(d) / filename for d in candidates]
+        dirs.append(Path(env_dir))
+    dirs.append(CANONICAL)
+    dirs.extend(LEGACY_DIRS)
+    return dirs
+
+
+def search_candidates(filename: str) -> List[Path]:
+    return [d / filename for d in search_dirs()]
 
 
 def resolve_policy_path(filename: str) -> Path:
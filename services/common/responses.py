@@ -0,0 +1,56 @@
+"""Single-pass JSON responses for FastAPI routes in the 사주 앱 v1.4 suite.
+
+A route that returns a model with ``response_model`` set makes FastAPI validate
+the model again, turn it into plain Python objects and only then ``json.dumps``
+the result. Large nested responses built and validated in-process do not need
+any of that. Returning ``FastJSONResponse`` serializes them exactly once:
+
+- Pydantic models via ``model_dump_json`` (pydantic-core, no intermediate dicts);
+- anything else via ``orjson`` when it is installed, else compact ``json.dumps``.
+  Read-only ``Mapping`` views (stage records, label overlays) are written in place;
+- ``bytes`` are sent as-is (e.g. a body already serialized in a worker process).
+
+Keep ``response_model`` on the route: it still documents the schema in OpenAPI.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Mapping
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json", by_alias=True)
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_json(content: Any) -> bytes:
+    """UTF-8 JSON body for ``content`` (a model, plain data or Mapping views)."""
+    if isinstance(content, BaseModel):
+        return content.model_dump_json(by_alias=True).encode("utf-8")
+    if orjson is not None:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, separators=(",", ":"), default=_default
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """``JSONResponse`` that serializes its content once (see module docstring)."""
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return dumps_json(content)
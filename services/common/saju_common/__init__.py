@@ -7,6 +7,10 @@ and hyphened module name issues.
 Public API:
 - Protocols: TimeResolver, SolarTermLoader, DeltaTPolicy
 - Implementations: BasicTimeResolver, TableSolarTermLoader, SimpleDeltaT
+- Solar terms: SolarTermIndex (shared, bisect-based lookup over data/terms_*.csv)
+- Signing: canonical JSON + SHA-256 (sha256_signature, policy_signature, canonical_object)
+- Policies: PolicyBundle (every policy loaded, verified and frozen once),
+  PolicyWatcher (hot-reload: rebuild and swap the bundle on file changes)
 - Tables: SEASON_ELEMENT_BOOST, BRANCH_TO_SEASON, etc.
 - Factories: get_default_*()
 
@@ -40,6 +44,15 @@ from .builtins import (
 from .file_solar_term_loader import FileSolarTermLoader, SolarTermEntry
 from .interfaces import DeltaTPolicy, SolarTermLoader, TimeResolver
 
+# Verified, frozen policy snapshot
+from .policy_bundle import (
+    PolicyBundle,
+    PolicySignatureError,
+    get_policy_bundle,
+    set_policy_bundle,
+)
+from .policy_watcher import PolicyWatcher, start_policy_watcher
+
 # Mapping tables
 from .seasons import (
     BRANCH_TO_ELEMENT,
@@ -51,6 +64,19 @@ from .seasons import (
     STEM_TO_ELEMENT,
 )
 
+# Canonical JSON signing
+from .signing import (
+    Canonical,
+    canonical_dumps,
+    canonical_object,
+    object_signature,
+    policy_signature,
+    sha256_signature,
+)
+
+# Shared solar term index
+from .solar_term_index import SolarTermIndex, SolarTermRecord, get_solar_term_index
+
 # Timezone handling
 from .timezone_handler import (
     CITY_LMT_OFFSETS,
@@ -61,6 +87,15 @@ from .timezone_handler import (
     get_saju_adjusted_time,
 )
 
+# Shared timezone registry
+from .tz_registry import (
+    ZoneTransitions,
+    get_transitions,
+    get_zone,
+    has_offset_change_near,
+    prewarm_zones,
+)
+
 __all__ = [
     # Protocols
     "TimeResolver",
@@ -73,6 +108,24 @@ __all__ = [
     # File-based loaders
     "FileSolarTermLoader",
     "SolarTermEntry",
+    # Solar term index
+    "SolarTermIndex",
+    "SolarTermRecord",
+    "get_solar_term_index",
+    # Signing
+    "Canonical",
+    "canonical_dumps",
+    "canonical_object",
+    "object_signature",
+    "policy_signature",
+    "sha256_signature",
+    # Policy bundle
+    "PolicyBundle",
+    "PolicySignatureError",
+    "get_policy_bundle",
+    "set_policy_bundle",
+    "PolicyWatcher",
+    "start_policy_watcher",
     # Factories
     "get_default_time_resolver",
     "get_default_solar_term_loader",
@@ -92,6 +145,12 @@ __all__ = [
     "CITY_LMT_OFFSETS",
     "MODERN_LMT_OFFSETS",
     "TimezoneWarning",
+    # Timezone registry
+    "ZoneTransitions",
+    "get_transitions",
+    "prewarm_zones",
+    "get_zone",
+    "has_offset_change_near",
 ]
 
 __version__ = "1.0.0"
@@ -20,10 +20,10 @@ Date: 2025-10-09 KST
 from __future__ import annotations
 
 from datetime import date, datetime, timezone
-from zoneinfo import ZoneInfo
 
 from .interfaces import DeltaTPolicy, SolarTermLoader, TimeResolver
 from .seasons import BRANCH_TO_SEASON, GREGORIAN_MONTH_TO_BRANCH
+from .tz_registry import get_zone, to_utc
 
 
 class BasicTimeResolver(TimeResolver):
@@ -42,17 +42,15 @@ class BasicTimeResolver(TimeResolver):
 
     def to_utc(self, dt: datetime, tz: str) -> datetime:
         """Convert local datetime to UTC"""
-        if dt.tzinfo is None:
-            # Assume dt is in local timezone
-            dt = dt.replace(tzinfo=ZoneInfo(tz))
-        return dt.astimezone(ZoneInfo("UTC"))
+        # Naive dt is local time in tz
+        return to_utc(dt, tz)
 
     def from_utc(self, dt: datetime, tz: str) -> datetime:
         """Convert UTC datetime to local timezone"""
         if dt.tzinfo is None:
             # Assume dt is UTC
             dt = dt.replace(tzinfo=timezone.utc)
-        return dt.astimezone(ZoneInfo(tz))
+        return dt.astimezone(get_zone(tz))
 
 
 class TableSolarTermLoader(SolarTermLoader):
@@ -9,14 +9,14 @@ import json
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional
-from zoneinfo import ZoneInfo
+from typing import Any, Dict, Optional, Tuple
 
 from policy_loader import resolve_policy_path
 
 # Import from parent saju_common package
 from saju_common import BasicTimeResolver as TimeResolver
 from saju_common import FileSolarTermLoader
+from saju_common.tz_registry import get_zone
 
 # Use policy loader for flexible path resolution
 LUCK_POLICY_PATH = resolve_policy_path("luck_policy_v1.json")
@@ -37,14 +37,19 @@ class LuckContext:
 class LuckCalculator:
     """Calculate luck cycle start age and direction."""
 
-    def __init__(self) -> None:
-        with LUCK_POLICY_PATH.open("r", encoding="utf-8") as f:
-            self._policy = json.load(f)
+    def __init__(self, policy: Dict[str, Any] | None = None) -> None:
+        if policy is None:
+            with LUCK_POLICY_PATH.open("r", encoding="utf-8") as f:
+                policy = json.load(f)
+        self._policy = policy
         self._term_loader = FileSolarTermLoader(TERM_DATA_PATH)
         self._resolver = TimeResolver()
 
     def compute_start_age(
-        self, ctx: LuckContext, direction: Optional[str] = None
+        self,
+        ctx: LuckContext,
+        direction: Optional[str] = None,
+        window: Optional[Tuple[Any, Any]] = None,
     ) -> Dict[str, float | str]:
         """
         Calculate luck cycle start age based on direction.
@@ -56,19 +61,13 @@ class LuckCalculator:
         Args:
             ctx: LuckContext with birth datetime and timezone
             direction: "forward" or "backward" (default: "forward")
+            window: ``(prev_term, next_term)`` around the birth instant, if the
+                caller already looked it up (skips the second index lookup)
         """
         birth_utc = self._resolver.to_utc(ctx.local_dt, ctx.timezone)
-        year = birth_utc.year
-        terms = list(self._term_loader.load_year(year)) + list(
-            self._term_loader.load_year(year + 1)
-        )
-        next_term = next((entry for entry in terms if entry.utc_time > birth_utc), None)
-        prev_term = None
-        for entry in terms:
-            if entry.utc_time <= birth_utc:
-                prev_term = entry
-            else:
-                break
+        if window is None:
+            window = self._term_loader.index.window(birth_utc)
+        prev_term, next_term = window
         if not next_term or not prev_term:
             return {"start_age": 0.0, "interval_days": 0.0, "prev_term": None, "next_term": None}
 
@@ -166,7 +165,7 @@ class LuckCalculator:
         if isinstance(birth_dt, str):
             birth_dt = datetime.fromisoformat(birth_dt.replace("Z", "+00:00"))
             if birth_dt.tzinfo is None:
-                birth_dt = birth_dt.replace(tzinfo=ZoneInfo(timezone))
+                birth_dt = birth_dt.replace(tzinfo=get_zone(timezone))
 
         if birth_dt is None:
             raise ValueError("birth_dt is required for luck calculation")
@@ -29,7 +29,11 @@ class SchoolProfileManager:
             SchoolProfileManager instance with loaded profiles
         """
         with POLICY_PATH.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+            return cls.from_policy(json.load(f))
+
+    @classmethod
+    def from_policy(cls, data: Dict[str, object]) -> "SchoolProfileManager":
+        """Build from already-loaded ``school_profiles_v1.json`` data."""
         default_id = data.get("default_profile") or data.get("default", "practical_balanced")
         return cls(profiles=data.get("profiles", {}), default_id=default_id)
 
@@ -17,9 +17,11 @@ SHENSHA_CATALOG_PATH = resolve_policy_path("shensha_catalog_v1.json")
 class ShenshaCatalog:
     """Manage shensha (神煞) catalog and enabled stars list."""
 
-    def __init__(self) -> None:
-        with SHENSHA_CATALOG_PATH.open("r", encoding="utf-8") as f:
-            self._catalog = json.load(f)
+    def __init__(self, catalog: Dict[str, object] | None = None) -> None:
+        if catalog is None:
+            with SHENSHA_CATALOG_PATH.open("r", encoding="utf-8") as f:
+                catalog = json.load(f)
+        self._catalog = catalog
 
     def list_enabled(self, pro_mode: bool = False) -> Dict[str, object]:
         """
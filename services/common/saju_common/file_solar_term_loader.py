@@ -19,12 +19,13 @@ Version: 1.0.0
 Date: 2025-10-10
 """
 
-import csv
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Iterable
 
+from .solar_term_index import SolarTermIndex, get_solar_term_index
+
 
 @dataclass(slots=True)
 class SolarTermEntry:
@@ -45,6 +46,9 @@ class FileSolarTermLoader:
     """
     Loads solar terms from CSV files in data/ directory.
 
+    Rows come from the shared :class:`SolarTermIndex`, so the CSV set is parsed
+    once per process rather than on every call.
+
     CSV Format:
         term,lambda_deg,utc_time,delta_t_seconds,source,algo_version
         小寒,0,2000-01-06T00:56:26Z,62.93,SAJU_LITE_REFINED,v1.5.10+astro
@@ -57,7 +61,7 @@ class FileSolarTermLoader:
 
     def load_year(self, year: int) -> Iterable[SolarTermEntry]:
         """
-        Yield solar term entries for the given year.
+        Return solar term entries for the given year.
 
         Args:
             year: Year to load (e.g., 2000)
@@ -74,16 +78,18 @@ class FileSolarTermLoader:
             >>> len(terms)
             24
         """
-        file_path = self.table_path / f"terms_{year}.csv"
-
-        if not file_path.exists():
+        index = self.index
+        if not index.has_year(year):
             raise FileNotFoundError(
-                f"Solar term data missing for year {year}. " f"Expected file: {file_path}"
+                f"Solar term data missing for year {year}. "
+                f"Expected file: {self.table_path / f'terms_{year}.csv'}"
             )
-
-        with file_path.open("r", encoding="utf-8") as csvfile:
-            reader = csv.DictReader(csvfile)
-            for row in reader:
-                # Parse ISO 8601 UTC timestamp
-                utc_time = datetime.fromisoformat(row["utc_time"].replace("Z", "+00:00"))
-                yield SolarTermEntry(term=row["term"], utc_time=utc_time)
+        return [
+            SolarTermEntry(term=record.term, utc_time=record.utc_time)
+            for record in index.year_entries(year)
+        ]
+
+    @property
+    def index(self) -> SolarTermIndex:
+        """Shared index backing this loader's ``table_path``."""
+        return get_solar_term_index(self.table_path)
@@ -0,0 +1,313 @@
+"""
+Policy bundle: every policy JSON loaded, verified and frozen once.
+
+Engines used to resolve policies on their own: ``load_policy_json`` stats up to
+seven directories per lookup, and several engines open CWD-relative paths.
+A ``PolicyBundle`` reads all ``*.json`` files of the policy directories once,
+verifies embedded ``policy_signature`` fields, deep-freezes the parsed data and
+exposes an aggregate ``bundle_hash`` (SHA-256 over every file's path and
+bytes) that downstream caches use as part of their key.
+
+Lookups:
+    bundle.get(name)       by file name, in ``policy_loader`` search order
+                           (POLICY_DIR env, ./policy, legacy dirs)
+    bundle.get_path(path)  by repo-relative or absolute path (pinned files,
+                           including ./policies, ./rulesets and the v1 bundle,
+                           which are not on the search path)
+
+Frozen data is a ``dict``/``list`` subclass that rejects mutation, so it still
+serializes, compares and ``isinstance``-checks like the plain JSON value.
+``copy.deepcopy`` returns a plain, mutable copy.
+
+Signatures use the form ``tools/sign_policies.py`` writes: canonical JSON of
+the policy without its ``policy_signature`` field. A mismatch is logged, or
+raises ``PolicySignatureError`` when ``POLICY_BUNDLE_STRICT=1``.
+
+Usage:
+    >>> from saju_common.policy_bundle import get_policy_bundle
+    >>> bundle = get_policy_bundle()
+    >>> bundle.get("gyeokguk_policy_v1.json")["policy_version"]
+    'gyeokguk_policy_v1'
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from .signing import sha256_signature
+
+logger = logging.getLogger(__name__)
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+# Read into the bundle but not on the by-name search path (pinned by path)
+EXTRA_DIRS = (
+    REPO_ROOT / "policies",
+    REPO_ROOT / "rulesets",
+    REPO_ROOT / "saju_codex_bundle_v1" / "policy",
+)
+
+STRICT_ENV = "POLICY_BUNDLE_STRICT"
+
+VERIFIED = "verified"
+MISMATCH = "mismatch"
+UNSIGNED = "unsigned"
+
+SIGNATURE_FIELD = "policy_signature"
+
+
+class PolicySignatureError(ValueError):
+    """A policy's embedded signature does not match its content (strict mode)."""
+
+
+# --- deep freeze --------------------------------------------------------------
+
+
+def _readonly(self, *args: Any, **kwargs: Any) -> None:
+    raise TypeError(f"{type(self).__name__} is read-only (policy data is shared)")
+
+
+class FrozenDict(dict):
+    """Read-only ``dict``; ``copy.deepcopy`` thaws it into a plain dict."""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __copy__(self) -> Dict[Any, Any]:
+        return dict(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Dict[Any, Any]:
+        return thaw(self)
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+
+class FrozenList(list):
+    """Read-only ``list``; ``copy.deepcopy`` thaws it into a plain list."""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = extend = insert = remove = pop = clear = sort = reverse = _readonly
+
+    def __copy__(self) -> list:
+        return list(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> list:
+        return thaw(self)
+
+    def __reduce__(self):
+        return (FrozenList, (list(self),))
+
+
+def freeze(value: Any) -> Any:
+    """Recursively convert parsed JSON into ``FrozenDict``/``FrozenList``."""
+    if isinstance(value, dict):
+        return FrozenDict((k, freeze(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return FrozenList(freeze(v) for v in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Plain, mutable deep copy of (possibly frozen) JSON data."""
+    if isinstance(value, dict):
+        return {k: thaw(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [thaw(v) for v in value]
+    return value
+
+
+# --- bundle -------------------------------------------------------------------
+
+
+def _default_search_dirs() -> Tuple[Path, ...]:
+    try:
+        from policy_loader import search_dirs
+    except ImportError:
+        from services.common.policy_loader import search_dirs
+    return tuple(search_dirs())
+
+
+def _display_path(path: Path) -> str:
+    try:
+        return path.relative_to(REPO_ROOT).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+def signature_status(data: Any) -> str:
+    """``verified``/``mismatch`` for signed policies, ``unsigned`` otherwise."""
+    if not isinstance(data, dict):
+        return UNSIGNED
+    stored = data.get(SIGNATURE_FIELD)
+    if not isinstance(stored, str) or len(stored) != 64:
+        return UNSIGNED  # missing, "UNSIGNED", "PENDING", ...
+    actual = sha256_signature(data, exclude=(SIGNATURE_FIELD,))
+    return VERIFIED if actual == stored else MISMATCH
+
+
+@dataclass(frozen=True, slots=True)
+class PolicyEntry:
+    """One policy file of a bundle."""
+
+    name: str
+    path: Path
+    sha256: str
+    signature: str
+    data: Any
+
+
+class PolicyBundle:
+    """Immutable snapshot of every policy file; safe to share across threads."""
+
+    __slots__ = ("dirs", "bundle_hash", "_by_name", "_by_path")
+
+    def __init__(self, dirs: Sequence[Path], entries: Iterable[PolicyEntry], search_dirs: int):
+        self.dirs: Tuple[Path, ...] = tuple(dirs)
+        self._by_path: Dict[Path, PolicyEntry] = {}
+        self._by_name: Dict[str, PolicyEntry] = {}
+        searchable = {d.resolve() for d in self.dirs[:search_dirs]}
+        for entry in entries:
+            self._by_path[entry.path] = entry
+            if entry.path.parent in searchable:
+                # Directories are scanned in search order; first hit wins
+                self._by_name.setdefault(entry.name, entry)
+
+        digest = hashlib.sha256()
+        for path in sorted(self._by_path, key=_display_path):
+            digest.update(_display_path(path).encode("utf-8"))
+            digest.update(b"\0")
+            digest.update(self._by_path[path].sha256.encode("ascii"))
+            digest.update(b"\n")
+        self.bundle_hash: str = digest.hexdigest()
+
+    @classmethod
+    def build(
+        cls,
+        search_dirs: Optional[Iterable[Path]] = None,
+        extra_dirs: Iterable[Path] = EXTRA_DIRS,
+        *,
+        strict: Optional[bool] = None,
+    ) -> "PolicyBundle":
+        """Read, verify and freeze every ``*.json`` in the given directories.
+
+        ``search_dirs`` defaults to the ``policy_loader`` search order; missing
+        directories are skipped. With ``strict`` (default: ``POLICY_BUNDLE_STRICT``
+        env) a signature mismatch raises ``PolicySignatureError``.
+        """
+        if strict is None:
+            strict = os.getenv(STRICT_ENV, "").lower() in ("1", "true", "yes")
+        search = [Path(d) for d in (_default_search_dirs() if search_dirs is None else search_dirs)]
+        dirs = search + [Path(d) for d in extra_dirs]
+
+        entries = []
+        seen = set()
+        for directory in dirs:
+            if not directory.is_dir():
+                continue
+            for path in sorted(directory.glob("*.json")):
+                path = path.resolve()
+                if path in seen:
+                    continue
+                seen.add(path)
+                raw = path.read_bytes()
+                try:
+                    data = json.loads(raw)
+                except ValueError as exc:
+                    raise ValueError(f"Invalid policy JSON: {path}: {exc}") from exc
+                status = signature_status(data)
+                if status == MISMATCH:
+                    if strict:
+                        raise PolicySignatureError(f"policy_signature mismatch: {path}")
+                    logger.warning("policy_signature mismatch: %s", _display_path(path))
+                entries.append(
+                    PolicyEntry(
+                        name=path.name,
+                        path=path,
+                        sha256=hashlib.sha256(raw).hexdigest(),
+                        signature=status,
+                        data=freeze(data),
+                    )
+                )
+        return cls(dirs, entries, search_dirs=len(search))
+
+    def __len__(self) -> int:
+        return len(self._by_path)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._by_name
+
+    def entry(self, name: str) -> PolicyEntry:
+        """Entry for file ``name`` (first match in search order)."""
+        try:
+            return self._by_name[name]
+        except KeyError:
+            raise FileNotFoundError(
+                f"Policy file not found: {name}\nSearched in:\n- "
+                + "\n- ".join(map(str, self.dirs))
+            ) from None
+
+    def get(self, name: str) -> Any:
+        """Frozen data of policy file ``name`` (same resolution as ``load_policy_json``)."""
+        return self.entry(name).data
+
+    def path(self, name: str) -> Path:
+        """Resolved path of policy file ``name``."""
+        return self.entry(name).path
+
+    def get_path(self, path: str | Path) -> Any:
+        """Frozen data of the policy at ``path`` (repo-relative or absolute)."""
+        path = Path(path)
+        if not path.is_absolute():
+            path = REPO_ROOT / path
+        try:
+            return self._by_path[path.resolve()].data
+        except KeyError:
+            raise FileNotFoundError(f"Policy file not in bundle: {path}") from None
+
+    def index(self) -> Dict[str, str]:
+        """``{repo-relative path: sha256}`` for every file (cf. ``policy_index.json``)."""
+        return {_display_path(p): e.sha256 for p, e in sorted(self._by_path.items())}
+
+    def changed_files(self, other: "PolicyBundle") -> List[str]:
+        """Repo-relative paths added, removed or modified between two bundles."""
+        mine, theirs = self.index(), other.index()
+        return sorted(p for p in mine.keys() | theirs.keys() if mine.get(p) != theirs.get(p))
+
+    def signatures(self) -> Mapping[str, str]:
+        """``{repo-relative path: verified|mismatch|unsigned}`` for every file."""
+        return {_display_path(p): e.signature for p, e in sorted(self._by_path.items())}
+
+
+_bundle: Optional[PolicyBundle] = None
+_bundle_lock = threading.Lock()
+
+
+def get_policy_bundle() -> PolicyBundle:
+    """Return the process-wide bundle, building it on first use."""
+    global _bundle
+    bundle = _bundle
+    if bundle is None:
+        with _bundle_lock:
+            if _bundle is None:
+                _bundle = PolicyBundle.build()
+            bundle = _bundle
+    return bundle
+
+
+def set_policy_bundle(bundle: Optional[PolicyBundle]) -> None:
+    """Replace the process-wide bundle (``None`` rebuilds on next use)."""
+    global _bundle
+    with _bundle_lock:
+        _bundle = bundle
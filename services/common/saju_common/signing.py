@@ -0,0 +1,151 @@
+"""
+Canonical JSON signing shared by every engine.
+
+Canonical form is the one the engines have always signed: ``json.dumps`` with
+sorted keys, compact separators and ``ensure_ascii=False``, UTF-8 encoded,
+hashed with SHA-256 (RFC-8785 approximation; identical to ``canonicaljson``
+for the int/str/list/dict payloads the engines emit).
+
+Three parts:
+    canonical_dumps / sha256_signature
+        One pre-built C encoder instead of a new ``JSONEncoder`` per call.
+        Top-level self-referencing fields (``policy_signature``) are dropped
+        with ``exclude=`` on a shallow copy, never ``copy.deepcopy``.
+    policy_signature
+        Signature of an immutable policy object, computed once per object and
+        memoized in a small bounded LRU.
+    Canonical / canonical_object / object_signature
+        Pre-encoded fragments. A nested section is encoded once; enclosing
+        objects splice the fragment in verbatim instead of re-serializing it.
+
+Usage:
+    >>> from saju_common.signing import sha256_signature
+    >>> out = {"pillars": [...], "policy_signature": None}
+    >>> out["policy_signature"] = sha256_signature(out, exclude=("policy_signature",))
+
+Version: 1.0.0
+Date: 2025-10-16
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Iterable, Mapping, Optional, Tuple
+
+_ENCODER = json.JSONEncoder(ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+_encode = _ENCODER.encode
+
+
+class Canonical(str):
+    """A string that already holds the canonical JSON encoding of a value."""
+
+    __slots__ = ()
+
+
+def canonical_dumps(obj: Any, exclude: Optional[Iterable[str]] = None) -> str:
+    """Canonical JSON text of ``obj``, optionally without some top-level keys."""
+    if exclude and isinstance(obj, dict):
+        skip = frozenset(exclude)
+        obj = {k: v for k, v in obj.items() if k not in skip}
+    return _encode(obj)
+
+
+def canonical_bytes(obj: Any, exclude: Optional[Iterable[str]] = None) -> bytes:
+    """UTF-8 canonical JSON of ``obj``."""
+    return canonical_dumps(obj, exclude).encode("utf-8")
+
+
+def sha256_signature(obj: Any, exclude: Optional[Iterable[str]] = None) -> str:
+    """SHA-256 hex digest of the canonical JSON of ``obj``."""
+    return hashlib.sha256(canonical_dumps(obj, exclude).encode("utf-8")).hexdigest()
+
+
+# --- memoized policy signatures ----------------------------------------------
+# id(policy) -> (policy, signature), least recently used first. The policy is
+# kept alive so its id cannot be reused by another object while the entry
+# exists; the bound stops reloaded or ad-hoc policies accumulating.
+POLICY_SIGNATURE_CACHE_SIZE = 128
+_POLICY_SIGNATURES: "OrderedDict[int, Tuple[Any, str]]" = OrderedDict()
+_POLICY_LOCK = threading.Lock()
+
+
+def policy_signature(policy: Any, exclude: Optional[Iterable[str]] = None) -> str:
+    """
+    Signature of a loaded policy, computed on first use and memoized.
+
+    Policies are treated as immutable after load: mutating a policy object
+    after it has been signed is not detected. Sign a copy instead.
+    """
+    key = id(policy)
+    with _POLICY_LOCK:
+        entry = _POLICY_SIGNATURES.get(key)
+        if entry is not None and entry[0] is policy:
+            _POLICY_SIGNATURES.move_to_end(key)
+            return entry[1]
+    signature = sha256_signature(policy, exclude)
+    with _POLICY_LOCK:
+        _POLICY_SIGNATURES[key] = (policy, signature)
+        _POLICY_SIGNATURES.move_to_end(key)
+        while len(_POLICY_SIGNATURES) > POLICY_SIGNATURE_CACHE_SIZE:
+            _POLICY_SIGNATURES.popitem(last=False)
+    return signature
+
+
+# --- pre-encoded fragments and streaming --------------------------------------
+def _write_value(value: Any, parts: list) -> None:
+    if isinstance(value, Canonical):
+        parts.append(value)
+    elif isinstance(value, (list, tuple)) and any(isinstance(v, Canonical) for v in value):
+        parts.append("[")
+        for i, item in enumerate(value):
+            if i:
+                parts.append(",")
+            _write_value(item, parts)
+        parts.append("]")
+    else:
+        parts.append(_encode(value))
+
+
+def _write_object(fields: Mapping[str, Any], parts: list) -> None:
+    parts.append("{")
+    for i, key in enumerate(sorted(fields)):
+        if not isinstance(key, str):
+            raise TypeError(f"canonical object keys must be str, got {type(key).__name__}")
+        if i:
+            parts.append(",")
+        parts.append(_encode(key))
+        parts.append(":")
+        _write_value(fields[key], parts)
+    parts.append("}")
+
+
+def canonical_object(fields: Mapping[str, Any]) -> Canonical:
+    """
+    Canonical encoding of an object whose values may be :class:`Canonical`.
+
+    ``Canonical`` values (and lists of them) are spliced in as-is; any other
+    value is encoded normally. The result equals ``canonical_dumps`` of the
+    decoded object.
+    """
+    parts: list = []
+    _write_object(fields, parts)
+    return Canonical("".join(parts))
+
+
+def object_signature(fields: Mapping[str, Any]) -> str:
+    """Signature of an object whose values may be :class:`Canonical` fragments."""
+    return hashlib.sha256(canonical_object(fields).encode("utf-8")).hexdigest()
+
+
+__all__ = [
+    "Canonical",
+    "canonical_bytes",
+    "canonical_dumps",
+    "canonical_object",
+    "object_signature",
+    "policy_signature",
+    "sha256_signature",
+]
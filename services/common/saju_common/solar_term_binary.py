@@ -0,0 +1,216 @@
+"""
+Compiled binary solar term table (``data/solar_terms.bin``).
+
+``scripts/build_solar_term_table.py`` compiles every ``data/terms_YYYY.csv`` into
+one columnar file. At runtime the file is memory-mapped read-only, so cold
+start is a single ``mmap`` and forked workers share the same physical pages.
+
+File layout (little-endian):
+
+    header   <8sHHIII32s32s
+             magic b"SJTERMS\\0", format version, record size, record count,
+             strings length, reserved, sha256(source CSVs), sha256(strings+columns)
+    strings  UTF-8 JSON {"terms": [...], "meta": [[source, algo_version], ...],
+             "sources": [[csv name, size], ...]}
+    padding  zero bytes up to an 8-byte boundary
+    columns  int64 UTC epoch × count, float32 λ × count, float32 ΔT × count,
+             uint8 term id × count, uint8 meta id × count
+
+Rows are sorted by epoch. Integer columns are exposed as zero-copy
+``memoryview`` casts over the mapping; the float32 columns are decoded (and
+rounded) once into ``array('d')``. Lookups therefore index native sequences,
+never ``struct`` unpacking.
+
+The loader checks magic, version, record size and the payload digest, and
+that the CSVs next to the table are the ones it was compiled from: names and
+sizes first (a ``stat`` per file), then the SHA-256 of their contents (~10 ms,
+still well below parsing them). The content check can be switched off with
+``verify_sources=False`` or ``SAJU_TERMS_VERIFY_SOURCES=0``. Any mismatch
+raises :class:`SolarTermTableError`; callers fall back to parsing the CSVs.
+
+Version: 2.0.0
+Date: 2025-10-16
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Any
+
+from .solar_term_index import SolarTermIndex, read_term_rows
+
+COMPILED_TABLE_NAME = "solar_terms.bin"
+
+MAGIC = b"SJTERMS\0"
+FORMAT_VERSION = 2
+HEADER = struct.Struct("<8sHHIII32s32s")
+# (SolarTermIndex column, array typecode), stored in this order
+COLUMNS = (
+    ("epochs", "q"),
+    ("lambda_deg", "f"),
+    ("delta_t", "f"),
+    ("term_ids", "B"),
+    ("meta_ids", "B"),
+)
+RECORD_SIZE = sum(array(code).itemsize for _, code in COLUMNS)
+_ALIGN = 8
+_LITTLE_ENDIAN = sys.byteorder == "little"
+VERIFY_SOURCES_ENV = "SAJU_TERMS_VERIFY_SOURCES"
+_FALSY = ("0", "false", "no")
+
+# float32 columns are rounded back to the CSV precision on read so the
+# compiled table yields the same values as the CSV path.
+_FLOAT_DIGITS = 4
+
+
+class SolarTermTableError(ValueError):
+    """Raised when a compiled table is malformed or stale."""
+
+
+def source_stats(table_path: Path) -> list[list[Any]]:
+    """``[name, size]`` of every ``terms_YYYY.csv`` (cheap staleness check)."""
+    return [[p.name, p.stat().st_size] for p in sorted(table_path.glob("terms_*.csv"))]
+
+
+def source_digest(table_path: Path) -> bytes:
+    """SHA-256 over the names and raw bytes of every ``terms_YYYY.csv``."""
+    digest = hashlib.sha256()
+    for file_path in sorted(table_path.glob("terms_*.csv")):
+        digest.update(file_path.name.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(file_path.read_bytes())
+    return digest.digest()
+
+
+def compile_term_table(table_path: Path, out_path: Path | None = None) -> Path:
+    """Compile ``table_path/terms_*.csv`` into the binary table and return its path."""
+    out_path = out_path or table_path / COMPILED_TABLE_NAME
+    rows = sorted(read_term_rows(table_path), key=lambda r: r[0])
+    if not rows:
+        raise SolarTermTableError(f"No terms_*.csv files under {table_path}")
+
+    term_names: dict[str, int] = {}
+    meta: dict[tuple[str, str], int] = {}
+    columns = {name: array(code) for name, code in COLUMNS}
+    for epoch, term, lambda_deg, delta_t, source, algo_version in rows:
+        columns["epochs"].append(epoch)
+        columns["lambda_deg"].append(lambda_deg)
+        columns["delta_t"].append(delta_t)
+        columns["term_ids"].append(term_names.setdefault(term, len(term_names)))
+        columns["meta_ids"].append(meta.setdefault((source, algo_version), len(meta)))
+
+    strings = json.dumps(
+        {
+            "terms": list(term_names),
+            "meta": [list(m) for m in meta],
+            "sources": source_stats(table_path),
+        },
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+    padding = b"\0" * (-(HEADER.size + len(strings)) % _ALIGN)
+    body = bytearray()
+    for column in columns.values():
+        if not _LITTLE_ENDIAN:
+            column.byteswap()
+        body += column.tobytes()
+    payload = strings + padding + bytes(body)
+
+    header = HEADER.pack(
+        MAGIC,
+        FORMAT_VERSION,
+        RECORD_SIZE,
+        len(rows),
+        len(strings),
+        0,
+        source_digest(table_path),
+        hashlib.sha256(payload).digest(),
+    )
+    tmp_path = out_path.with_suffix(out_path.suffix + ".tmp")
+    tmp_path.write_bytes(header + payload)
+    tmp_path.replace(out_path)
+    return out_path
+
+
+def _column(buffer: mmap.mmap, offset: int, count: int, code: str) -> Any:
+    """One stored column: a zero-copy cast for integers, decoded ``array('d')`` for floats."""
+    raw = memoryview(buffer)[offset : offset + count * array(code).itemsize]
+    if code != "f" and _LITTLE_ENDIAN:
+        return raw.cast(code)
+
+    values = array(code)
+    values.frombytes(raw)
+    raw.release()
+    if not _LITTLE_ENDIAN:
+        values.byteswap()
+    if code != "f":
+        return values
+    # float32 is rounded back to the CSV precision so the compiled table
+    # yields the same values as the CSV path.
+    return array("d", [round(v, _FLOAT_DIGITS) for v in values])
+
+
+def load_term_table(path: Path, *, verify_sources: bool | None = None) -> SolarTermIndex:
+    """Memory-map a compiled table and wrap it in a :class:`SolarTermIndex`.
+
+    When the CSV directory next to ``path`` exists, its file names, sizes and
+    (unless ``verify_sources`` is false; default: the ``SAJU_TERMS_VERIFY_SOURCES``
+    environment variable, on when unset) content digest must match the ones
+    recorded at compile time.
+    """
+    if verify_sources is None:
+        verify_sources = os.environ.get(VERIFY_SOURCES_ENV, "1").lower() not in _FALSY
+
+    with path.open("rb") as fh:
+        buffer = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+    try:
+        if len(buffer) < HEADER.size:
+            raise SolarTermTableError(f"{path}: truncated header")
+        magic, version, record_size, count, strings_len, _, src_digest, payload_digest = (
+            HEADER.unpack_from(buffer, 0)
+        )
+        if magic != MAGIC:
+            raise SolarTermTableError(f"{path}: bad magic {magic!r}")
+        if version != FORMAT_VERSION or record_size != RECORD_SIZE:
+            raise SolarTermTableError(
+                f"{path}: format v{version}/{record_size}B, expected "
+                f"v{FORMAT_VERSION}/{RECORD_SIZE}B"
+            )
+        base = HEADER.size + strings_len
+        base += -base % _ALIGN
+        if len(buffer) != base + count * RECORD_SIZE:
+            raise SolarTermTableError(f"{path}: size does not match {count} records")
+        if hashlib.sha256(buffer[HEADER.size :]).digest() != payload_digest:
+            raise SolarTermTableError(f"{path}: payload checksum mismatch")
+
+        strings = json.loads(bytes(buffer[HEADER.size : HEADER.size + strings_len]))
+        table_path = path.parent
+        if any(table_path.glob("terms_*.csv")):
+            if source_stats(table_path) != strings["sources"]:
+                raise SolarTermTableError(f"{path}: stale, source CSVs changed since compile")
+            if verify_sources and source_digest(table_path) != src_digest:
+                raise SolarTermTableError(f"{path}: stale, source CSVs changed since compile")
+
+        columns = {}
+        offset = base
+        for name, code in COLUMNS:
+            columns[name] = _column(buffer, offset, count, code)
+            offset += count * array(code).itemsize
+    except Exception:
+        buffer.close()
+        raise
+
+    return SolarTermIndex(
+        **columns,
+        term_names=tuple(strings["terms"]),
+        meta=tuple(tuple(m) for m in strings["meta"]),
+        buffer=buffer,
+    )
@@ -0,0 +1,256 @@
+"""
+Immutable in-memory solar term index.
+
+Loads every ``terms_YYYY.csv`` in a data directory exactly once and keeps the
+rows as sorted epoch-second arrays, so every "which term covers this instant"
+question is a binary search instead of a CSV parse. When a compiled
+``solar_terms.bin`` (see ``solar_term_binary``) sits next to the CSVs, the
+columns are memory-mapped from it instead.
+
+Layout (parallel ``array`` columns, sorted by UTC instant):
+    epochs        int64   UTC epoch seconds
+    term_ids      uint8   index into ``term_names``
+    lambda_deg    float64 solar longitude
+    delta_t       float64 ΔT seconds
+    meta_ids      uint8   index into ``meta`` ((source, algo_version) pairs)
+
+Usage:
+    >>> from saju_common import get_solar_term_index
+    >>> index = get_solar_term_index()
+    >>> index.major_term_at(datetime(1992, 7, 15, 14, 40, tzinfo=timezone.utc)).term
+    '小暑'
+
+Version: 1.0.0
+Date: 2025-10-16
+"""
+
+from __future__ import annotations
+
+import csv
+import logging
+import threading
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TERM_DATA_PATH = Path(__file__).resolve().parents[3] / "data"
+
+# 節 (jie) terms that open each saju month
+MAJOR_TERMS = frozenset(
+    ["立春", "驚蟄", "清明", "立夏", "芒種", "小暑", "立秋", "白露", "寒露", "立冬", "大雪", "小寒"]
+)
+
+
+@dataclass(frozen=True, slots=True)
+class SolarTermRecord:
+    """One row of the solar term table, materialised on demand."""
+
+    term: str
+    lambda_deg: float
+    utc_time: datetime
+    delta_t_seconds: float
+    source: str
+    algo_version: str
+
+
+class SolarTermIndex:
+    """Sorted, read-only solar term table answering lookups in O(log n).
+
+    Instances are never mutated after construction and can be shared freely
+    across threads and services.
+    """
+
+    __slots__ = (
+        "_epochs",
+        "_term_ids",
+        "_lambda_deg",
+        "_delta_t",
+        "_meta_ids",
+        "_term_names",
+        "_meta",
+        "_major_epochs",
+        "_major_rows",
+        "_year_bounds",
+        "_buffer",
+    )
+
+    def __init__(
+        self,
+        *,
+        epochs: Sequence[int],
+        term_ids: Sequence[int],
+        lambda_deg: Sequence[float],
+        delta_t: Sequence[float],
+        meta_ids: Sequence[int],
+        term_names: Tuple[str, ...],
+        meta: Tuple[Tuple[str, str], ...],
+        buffer: Any = None,
+    ) -> None:
+        """Wrap pre-sorted columns (``array`` objects or mmap-backed views).
+
+        ``buffer`` keeps an underlying mapping (e.g. ``mmap``) alive for as
+        long as the index references it.
+        """
+        self._epochs = epochs
+        self._term_ids = term_ids
+        self._lambda_deg = lambda_deg
+        self._delta_t = delta_t
+        self._meta_ids = meta_ids
+        self._term_names = term_names
+        self._meta = meta
+        self._buffer = buffer
+
+        major_ids = {i for i, name in enumerate(term_names) if name in MAJOR_TERMS}
+        self._major_epochs = array("q")
+        self._major_rows = array("q")
+        self._year_bounds: Dict[int, Tuple[int, int]] = {}
+        for i in range(len(epochs)):
+            epoch = epochs[i]
+            if term_ids[i] in major_ids:
+                self._major_epochs.append(epoch)
+                self._major_rows.append(i)
+            year = datetime.fromtimestamp(epoch, tz=timezone.utc).year
+            lo, _ = self._year_bounds.get(year, (i, i))
+            self._year_bounds[year] = (lo, i + 1)
+
+    @classmethod
+    def from_rows(cls, rows: List[Tuple[int, str, float, float, str, str]]) -> "SolarTermIndex":
+        """Build from ``(epoch, term, lambda_deg, delta_t, source, algo_version)`` rows."""
+        rows = sorted(rows, key=lambda r: r[0])
+        term_names: Dict[str, int] = {}
+        meta: Dict[Tuple[str, str], int] = {}
+        epochs, term_ids, meta_ids = array("q"), array("B"), array("B")
+        lambda_deg, delta_t = array("d"), array("d")
+        for epoch, term, lam, dt, source, algo_version in rows:
+            epochs.append(epoch)
+            term_ids.append(term_names.setdefault(term, len(term_names)))
+            lambda_deg.append(lam)
+            delta_t.append(dt)
+            meta_ids.append(meta.setdefault((source, algo_version), len(meta)))
+        return cls(
+            epochs=epochs,
+            term_ids=term_ids,
+            lambda_deg=lambda_deg,
+            delta_t=delta_t,
+            meta_ids=meta_ids,
+            term_names=tuple(term_names),
+            meta=tuple(meta),
+        )
+
+    @classmethod
+    def from_directory(cls, table_path: Path) -> "SolarTermIndex":
+        """Parse every ``terms_YYYY.csv`` under ``table_path`` once."""
+        return cls.from_rows(read_term_rows(table_path))
+
+    def __len__(self) -> int:
+        return len(self._epochs)
+
+    @property
+    def years(self) -> Tuple[int, ...]:
+        """Calendar years (UTC) with at least one term."""
+        return tuple(sorted(self._year_bounds))
+
+    def has_year(self, year: int) -> bool:
+        return year in self._year_bounds
+
+    def record(self, row: int) -> SolarTermRecord:
+        """Materialise row ``row`` as a :class:`SolarTermRecord`."""
+        source, algo_version = self._meta[self._meta_ids[row]]
+        return SolarTermRecord(
+            term=self._term_names[self._term_ids[row]],
+            lambda_deg=self._lambda_deg[row],
+            utc_time=datetime.fromtimestamp(self._epochs[row], tz=timezone.utc),
+            delta_t_seconds=self._delta_t[row],
+            source=source,
+            algo_version=algo_version,
+        )
+
+    def year_entries(self, year: int) -> List[SolarTermRecord]:
+        """All terms whose UTC instant falls in ``year`` (empty if absent)."""
+        lo, hi = self._year_bounds.get(year, (0, 0))
+        return [self.record(i) for i in range(lo, hi)]
+
+    def prev_term(self, instant: datetime) -> Optional[SolarTermRecord]:
+        """Latest term at or before ``instant`` (aware datetime)."""
+        i = bisect_right(self._epochs, instant.timestamp())
+        return self.record(i - 1) if i > 0 else None
+
+    def next_term(self, instant: datetime) -> Optional[SolarTermRecord]:
+        """Earliest term strictly after ``instant`` (aware datetime)."""
+        i = bisect_right(self._epochs, instant.timestamp())
+        return self.record(i) if i < len(self._epochs) else None
+
+    def window(
+        self, instant: datetime
+    ) -> Tuple[Optional[SolarTermRecord], Optional[SolarTermRecord]]:
+        """``(prev_term, next_term)`` around ``instant`` with a single bisect."""
+        i = bisect_right(self._epochs, instant.timestamp())
+        prev_term = self.record(i - 1) if i > 0 else None
+        next_term = self.record(i) if i < len(self._epochs) else None
+        return prev_term, next_term
+
+    def major_term_at(self, instant: datetime) -> Optional[SolarTermRecord]:
+        """Major (節) term covering ``instant``, i.e. the latest one at or before it."""
+        i = bisect_right(self._major_epochs, instant.timestamp())
+        return self.record(self._major_rows[i - 1]) if i > 0 else None
+
+
+def read_term_rows(table_path: Path) -> List[Tuple[int, str, float, float, str, str]]:
+    """Parse ``terms_YYYY.csv`` files into ``(epoch, term, λ, ΔT, source, algo)`` rows."""
+    rows: List[Tuple[int, str, float, float, str, str]] = []
+    if not table_path.is_dir():
+        return rows
+    for file_path in sorted(table_path.glob("terms_*.csv")):
+        with file_path.open("r", encoding="utf-8") as csvfile:
+            for row in csv.DictReader(csvfile):
+                utc_time = datetime.fromisoformat(row["utc_time"].replace("Z", "+00:00"))
+                rows.append(
+                    (
+                        int(utc_time.timestamp()),
+                        row["term"],
+                        float(row["lambda_deg"]),
+                        float(row["delta_t_seconds"]),
+                        row["source"],
+                        row["algo_version"],
+                    )
+                )
+    return rows
+
+
+_indexes: Dict[Path, SolarTermIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_solar_term_index(table_path: Path | None = None) -> SolarTermIndex:
+    """Return the process-wide index for ``table_path`` (default: repo ``data/``)."""
+    path = Path(table_path or DEFAULT_TERM_DATA_PATH)
+    # Hot path: the path as given was seen before, skip resolve() (filesystem calls)
+    index = _indexes.get(path)
+    if index is None:
+        key = path.resolve()
+        with _indexes_lock:
+            index = _indexes.get(key)
+            if index is None:
+                index = _load_index(key)
+                _indexes[key] = index
+            _indexes[path] = index
+    return index
+
+
+def _load_index(table_path: Path) -> SolarTermIndex:
+    """Prefer the compiled mmap table; fall back to parsing the CSVs."""
+    # Imported lazily: solar_term_binary builds on this module.
+    from .solar_term_binary import COMPILED_TABLE_NAME, SolarTermTableError, load_term_table
+
+    compiled = table_path / COMPILED_TABLE_NAME
+    if compiled.exists():
+        try:
+            return load_term_table(compiled)
+        except (OSError, SolarTermTableError) as exc:
+            logger.warning("Ignoring compiled solar term table %s: %s", compiled, exc)
+    return SolarTermIndex.from_directory(table_path)
@@ -8,14 +8,20 @@ Handles:
 - City-specific LMT offsets (pre-1908)
 - DST gap/overlap time detection
 
+All period tables are compiled once at import into sorted boundary arrays, so
+every lookup is a single bisect and the handler itself holds no state (one
+instance can be shared across threads).
+
 Based on:
 - IANA TZDB Asia/Seoul
 - Korean government records (관보)
 - National Archives of Korea
 """
 
+from bisect import bisect_right
 from datetime import datetime, timedelta
-from typing import Dict, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
 
 # DST (Summer Time) periods in Korea
 DST_PERIODS = [
@@ -35,6 +41,18 @@ DST_PERIODS = [
     {"start": datetime(1988, 5, 8, 2, 0), "end": datetime(1988, 10, 9, 3, 0)},
 ]
 
+# Non-existent local hours on DST start dates (clocks moved forward)
+DST_GAP_PERIODS = [
+    (datetime(1987, 5, 10, 2, 0), datetime(1987, 5, 10, 3, 0)),
+    (datetime(1988, 5, 8, 2, 0), datetime(1988, 5, 8, 3, 0)),
+]
+
+# Repeated local hours on DST end dates (clocks moved back)
+DST_OVERLAP_PERIODS = [
+    (datetime(1987, 10, 11, 2, 0), datetime(1987, 10, 11, 3, 0)),
+    (datetime(1988, 10, 9, 2, 0), datetime(1988, 10, 9, 3, 0)),
+]
+
 # City-specific LMT offsets (minutes from UTC, pre-1908)
 # Based on geographical longitude
 CITY_LMT_OFFSETS = {
@@ -69,18 +87,93 @@ class TimezoneWarning:
     HISTORICAL_LMT = "HIST_LMT"  # Pre-1908 LMT uncertainty
 
 
+# Start of standard time in Korea; earlier births use city LMT
+LMT_CUTOFF = datetime(1908, 4, 1)
+
+# South Korean standard offsets (hours) between boundaries; None = city LMT
+_SOUTH_OFFSET_BOUNDS = (
+    LMT_CUTOFF,
+    datetime(1912, 1, 1),
+    datetime(1954, 3, 21),
+    datetime(1961, 8, 10),
+)
+_SOUTH_OFFSETS = (None, 8.5, 9.0, 8.5, 9.0)
+
+# North Korea: Pyongyang Time (UTC+8:30) between these dates, UTC+9 otherwise
+_PYONGYANG_TIME = (datetime(2015, 8, 15), datetime(2018, 5, 5))
+
+# Segment flags
+_DST = 1
+_GAP = 2
+_OVERLAP = 4
+
+
+def _compile_segments(
+    spans: Iterable[Tuple[datetime, datetime, int]],
+) -> Tuple[Tuple[datetime, ...], Tuple[int, ...]]:
+    """Flatten possibly overlapping ``[start, end)`` spans into sorted segments.
+
+    Returns ``(bounds, flags)`` where ``flags[bisect_right(bounds, dt)]`` is the
+    OR of the flags of every span containing ``dt`` (``flags[0]`` covers
+    everything before the first boundary).
+    """
+    spans = list(spans)
+    bounds = sorted({t for start, end, _ in spans for t in (start, end)})
+    flags = [0]
+    for bound in bounds:
+        mask = 0
+        for start, end, flag in spans:
+            if start <= bound < end:
+                mask |= flag
+        flags.append(mask)
+    return tuple(bounds), tuple(flags)
+
+
+_SEGMENT_BOUNDS, _SEGMENT_FLAGS = _compile_segments(
+    [(p["start"], p["end"], _DST) for p in DST_PERIODS]
+    + [(start, end, _GAP) for start, end in DST_GAP_PERIODS]
+    + [(start, end, _OVERLAP) for start, end in DST_OVERLAP_PERIODS]
+)
+
+
+def _flags_at(dt: datetime) -> int:
+    return _SEGMENT_FLAGS[bisect_right(_SEGMENT_BOUNDS, dt)]
+
+
+def _gap_message(dt: datetime) -> str:
+    return f"Time {dt.strftime('%H:%M')} doesn't exist (DST gap, clocks moved forward)"
+
+
+def _overlap_message(dt: datetime) -> str:
+    return f"Time {dt.strftime('%H:%M')} occurs twice (DST overlap, using standard time)"
+
+
+@lru_cache(maxsize=256)
+def _lmt_offsets(location: str) -> Tuple[int, int]:
+    """``(pre-1908, post-1908)`` LMT offsets in minutes for ``location``."""
+    city = location.split(",")[0].strip() if "," in location else location
+    city = city.replace("Asia/", "")
+    historical = int(CITY_LMT_OFFSETS.get(city, 507.8) - 540)  # 540 = 9 hours * 60
+
+    if location.startswith("Asia/"):
+        modern = MODERN_LMT_OFFSETS.get(location, -32)
+    else:
+        modern = MODERN_LMT_OFFSETS.get(f"Asia/{location.split(',')[0].strip()}", -32)
+    return historical, modern
+
+
 class KoreanTimezoneHandler:
-    """Handle Korean timezone complexities for saju calculations."""
+    """Handle Korean timezone complexities for saju calculations.
+
+    Stateless: every call builds its own result and warning list, so a single
+    handler can serve concurrent requests.
+    """
 
-    def __init__(self):
-        self.warnings = []
+    __slots__ = ()
 
     def is_dst_period(self, dt: datetime) -> bool:
         """Check if datetime falls within DST period."""
-        for period in DST_PERIODS:
-            if period["start"] <= dt < period["end"]:
-                return True
-        return False
+        return bool(_flags_at(dt) & _DST)
 
     def is_dst_gap(self, dt: datetime) -> Tuple[bool, Optional[str]]:
         """
@@ -89,19 +182,8 @@ class KoreanTimezoneHandler:
         Returns:
             (is_gap, message)
         """
-        # 1987-1988: 02:00-02:59:59 doesn't exist on start date
-        gap_periods = [
-            (datetime(1987, 5, 10, 2, 0), datetime(1987, 5, 10, 3, 0)),
-            (datetime(1988, 5, 8, 2, 0), datetime(1988, 5, 8, 3, 0)),
-        ]
-
-        for start, end in gap_periods:
-            if start <= dt < end:
-                return (
-                    True,
-                    f"Time {dt.strftime('%H:%M')} doesn't exist (DST gap, clocks moved forward)",
-                )
-
+        if _flags_at(dt) & _GAP:
+            return True, _gap_message(dt)
         return False, None
 
     def is_dst_overlap(self, dt: datetime) -> Tuple[bool, Optional[str]]:
@@ -111,22 +193,11 @@ class KoreanTimezoneHandler:
         Returns:
             (is_overlap, message)
         """
-        # 1987-1988: 02:00-02:59:59 repeats on end date
-        overlap_periods = [
-            (datetime(1987, 10, 11, 2, 0), datetime(1987, 10, 11, 3, 0)),
-            (datetime(1988, 10, 9, 2, 0), datetime(1988, 10, 9, 3, 0)),
-        ]
-
-        for start, end in overlap_periods:
-            if start <= dt < end:
-                return (
-                    True,
-                    f"Time {dt.strftime('%H:%M')} occurs twice (DST overlap, using standard time)",
-                )
-
+        if _flags_at(dt) & _OVERLAP:
+            return True, _overlap_message(dt)
         return False, None
 
-    def get_standard_time_offset(self, dt: datetime, location: str = "Seoul") -> int:
+    def get_standard_time_offset(self, dt: datetime, location: str = "Seoul") -> float:
         """
         Get standard time offset (hours) for given datetime and location.
 
@@ -141,30 +212,15 @@ class KoreanTimezoneHandler:
         """
         # North Korea special handling
         if "Pyongyang" in location:
-            if datetime(2015, 8, 15) <= dt < datetime(2018, 5, 5):
+            if _PYONGYANG_TIME[0] <= dt < _PYONGYANG_TIME[1]:
                 return 8.5  # Pyongyang Time
             return 9.0
 
-        # South Korea timeline
-        if dt < datetime(1908, 4, 1):
+        offset = _SOUTH_OFFSETS[bisect_right(_SOUTH_OFFSET_BOUNDS, dt)]
+        if offset is None:
             # Pre-1908: Use city-specific LMT
             return CITY_LMT_OFFSETS.get(location, 507.8) / 60.0  # Default Seoul
-
-        elif dt < datetime(1912, 1, 1):
-            # 1908-1912: UTC+8:30
-            return 8.5
-
-        elif dt < datetime(1954, 3, 21):
-            # 1912-1954: UTC+9:00
-            return 9.0
-
-        elif dt < datetime(1961, 8, 10):
-            # 1954-1961 (South Korea only): UTC+8:30
-            return 8.5
-
-        else:
-            # 1961-present: UTC+9:00
-            return 9.0
+        return offset
 
     def apply_dst_adjustment(self, dt: datetime) -> Tuple[datetime, bool]:
         """
@@ -173,7 +229,7 @@ class KoreanTimezoneHandler:
         Returns:
             (adjusted_datetime, dst_applied)
         """
-        if self.is_dst_period(dt):
+        if _flags_at(dt) & _DST:
             # During DST, subtract 1 hour to get standard time
             return dt - timedelta(hours=1), True
         return dt, False
@@ -189,22 +245,8 @@ class KoreanTimezoneHandler:
         Returns:
             Offset in minutes from standard meridian
         """
-        # Pre-1908: Use historical LMT
-        if dt < datetime(1908, 4, 1):
-            city = location.split(",")[0].strip() if "," in location else location
-            city = city.replace("Asia/", "")
-            lmt_minutes = CITY_LMT_OFFSETS.get(city, 507.8)
-            # Convert to offset from UTC
-            return int(lmt_minutes - 540)  # 540 = 9 hours * 60
-
-        # Post-1908: Use modern LMT offsets for saju
-        if location.startswith("Asia/"):
-            return MODERN_LMT_OFFSETS.get(location, -32)
-
-        # Try to match city name
-        city = location.split(",")[0].strip()
-        tz_name = f"Asia/{city}"
-        return MODERN_LMT_OFFSETS.get(tz_name, -32)
+        historical, modern = _lmt_offsets(location)
+        return historical if dt < LMT_CUTOFF else modern
 
     def convert_to_saju_time(
         self,
@@ -232,54 +274,23 @@ class KoreanTimezoneHandler:
             - warnings: List of warning messages
             - metadata: Additional context
         """
-        self.warnings = []
-        result = {
-            "original_time": birth_dt,
-            "adjusted_time": birth_dt,
-            "dst_applied": False,
-            "lmt_offset": 0,
-            "warnings": [],
-            "metadata": {},
-        }
-
-        # Check for DST gap/overlap
-        is_gap, gap_msg = self.is_dst_gap(birth_dt)
-        if is_gap:
-            self.warnings.append({"type": TimezoneWarning.DST_GAP, "message": gap_msg})
-            # Auto-correct: move forward 1 hour
-            birth_dt = birth_dt + timedelta(hours=1)
-            result["metadata"]["dst_gap_corrected"] = True
-
-        is_overlap, overlap_msg = self.is_dst_overlap(birth_dt)
-        if is_overlap:
-            self.warnings.append({"type": TimezoneWarning.DST_OVERLAP, "message": overlap_msg})
-            result["metadata"]["dst_overlap"] = True
-
-        # Step 1: Apply DST if applicable
-        if apply_dst:
-            adjusted, dst_applied = self.apply_dst_adjustment(birth_dt)
-            result["dst_applied"] = dst_applied
-            result["adjusted_time"] = adjusted
-            if dst_applied:
-                result["metadata"]["dst_period"] = True
-
-        # Step 2: Apply LMT offset
-        if apply_lmt:
-            lmt_offset = self.get_lmt_offset(location, birth_dt)
-            result["lmt_offset"] = lmt_offset
-            result["adjusted_time"] = result["adjusted_time"] - timedelta(minutes=abs(lmt_offset))
-
-        # Check for historical LMT uncertainty
-        if birth_dt < datetime(1908, 4, 1):
-            self.warnings.append(
-                {
-                    "type": TimezoneWarning.HISTORICAL_LMT,
-                    "message": "Pre-1908 birth: City LMT may vary ±8 minutes from calculated value",
-                }
-            )
-
-        result["warnings"] = self.warnings
-        return result
+        return _convert(birth_dt, _lmt_offsets(location), apply_dst, apply_lmt)
+
+    def convert_many(
+        self,
+        births: Iterable[datetime],
+        location: str = "Seoul",
+        apply_dst: bool = True,
+        apply_lmt: bool = True,
+    ) -> List[Dict]:
+        """
+        Convert many birth datetimes for one location.
+
+        Same per-item result as ``convert_to_saju_time``; the location's LMT
+        offsets are resolved once for the whole batch.
+        """
+        lmt_offsets = _lmt_offsets(location)
+        return [_convert(birth_dt, lmt_offsets, apply_dst, apply_lmt) for birth_dt in births]
 
     def validate_input_time(self, dt: datetime) -> Tuple[bool, Optional[str]]:
         """
@@ -288,12 +299,73 @@ class KoreanTimezoneHandler:
         Returns:
             (is_valid, error_message)
         """
-        is_gap, msg = self.is_dst_gap(dt)
-        if is_gap:
-            return False, msg
+        if _flags_at(dt) & _GAP:
+            return False, _gap_message(dt)
         return True, None
 
 
+def _convert(
+    birth_dt: datetime, lmt_offsets: Tuple[int, int], apply_dst: bool, apply_lmt: bool
+) -> Dict:
+    warnings = []
+    metadata = {}
+    result = {
+        "original_time": birth_dt,
+        "adjusted_time": birth_dt,
+        "dst_applied": False,
+        "lmt_offset": 0,
+        "warnings": warnings,
+        "metadata": metadata,
+    }
+
+    # Check for DST gap/overlap
+    flags = _flags_at(birth_dt)
+    if flags & _GAP:
+        warnings.append({"type": TimezoneWarning.DST_GAP, "message": _gap_message(birth_dt)})
+        # Auto-correct: move forward 1 hour
+        birth_dt = birth_dt + timedelta(hours=1)
+        metadata["dst_gap_corrected"] = True
+        flags = _flags_at(birth_dt)
+
+    if flags & _OVERLAP:
+        warnings.append(
+            {"type": TimezoneWarning.DST_OVERLAP, "message": _overlap_message(birth_dt)}
+        )
+        metadata["dst_overlap"] = True
+
+    # Step 1: Apply DST if applicable
+    if apply_dst:
+        dst_applied = bool(flags & _DST)
+        result["dst_applied"] = dst_applied
+        if dst_applied:
+            result["adjusted_time"] = birth_dt - timedelta(hours=1)
+            metadata["dst_period"] = True
+        else:
+            result["adjusted_time"] = birth_dt
+
+    pre_standard_time = birth_dt < LMT_CUTOFF
+
+    # Step 2: Apply LMT offset
+    if apply_lmt:
+        lmt_offset = lmt_offsets[0] if pre_standard_time else lmt_offsets[1]
+        result["lmt_offset"] = lmt_offset
+        result["adjusted_time"] = result["adjusted_time"] - timedelta(minutes=abs(lmt_offset))
+
+    # Check for historical LMT uncertainty
+    if pre_standard_time:
+        warnings.append(
+            {
+                "type": TimezoneWarning.HISTORICAL_LMT,
+                "message": "Pre-1908 birth: City LMT may vary ±8 minutes from calculated value",
+            }
+        )
+
+    return result
+
+
+_DEFAULT_HANDLER = KoreanTimezoneHandler()
+
+
 # Convenience function
 def get_saju_adjusted_time(
     birth_dt: datetime, location: str = "Seoul", apply_dst: bool = True, apply_lmt: bool = True
@@ -309,5 +381,4 @@ def get_saju_adjusted_time(
         >>> print(result['adjusted_time'])  # Auto-corrected from DST gap
         >>> print(result['warnings'])  # Shows DST gap warning
     """
-    handler = KoreanTimezoneHandler()
-    return handler.convert_to_saju_time(birth_dt, location, apply_dst, apply_lmt)
+    return _DEFAULT_HANDLER.convert_to_saju_time(birth_dt, location, apply_dst, apply_lmt)
@@ -0,0 +1,210 @@
+"""
+Shared timezone registry.
+
+Interns ``ZoneInfo`` objects by IANA name and precomputes, per zone, the
+UTC-offset transitions between 1900 and 2050. Hot paths (pillars, luck,
+tz-time-service) then answer "offset at t" and "is there an offset change
+within ±48h" with a bisect over plain epoch-second tuples instead of
+constructing aware datetimes.
+
+Local (wall-clock) lookups follow ``zoneinfo`` fold=0 semantics, i.e. the same
+result as ``local_dt.replace(tzinfo=ZoneInfo(name))``: times in a gap or an
+overlap resolve with the offset in effect before the transition.
+
+Usage:
+    >>> from saju_common.tz_registry import get_transitions, to_utc
+    >>> to_utc(datetime(1988, 5, 8, 1, 30), "Asia/Seoul")
+    datetime.datetime(1988, 5, 7, 16, 30, tzinfo=zoneinfo.ZoneInfo(key='UTC'))
+    >>> get_transitions("Asia/Seoul").offset_at(0)  # 1970-01-01T00:00Z
+    32400
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+UTC = ZoneInfo("UTC")
+
+# Years covered by the precomputed transition tables
+TRANSITION_YEARS = (1900, 2050)
+
+# Sampling step when scanning for offset changes. Every change is then located
+# to the second by bisection; a change that reverts within one step is missed.
+_SCAN_STEP_SECONDS = 86400
+
+# Lookups closer than this to the table edges fall back to zoneinfo
+# (covers the widest UTC offset plus a ±48h transition window).
+_EDGE_MARGIN_SECONDS = 4 * 86400
+
+_EPOCH = datetime(1970, 1, 1)
+
+# Comma-separated IANA names whose tables ``prewarm_zones`` builds at startup
+PREWARM_ZONES_ENV = "SAJU_PREWARM_ZONES"
+DEFAULT_PREWARM_ZONES = ("Asia/Seoul",)
+
+
+def local_epoch(local_dt: datetime) -> float:
+    """Wall-clock seconds since 1970-01-01 for a naive local datetime."""
+    return (local_dt - _EPOCH).total_seconds()
+
+
+@dataclass(frozen=True, slots=True)
+class ZoneTransitions:
+    """UTC-offset segments of one zone.
+
+    ``offsets[i]`` (seconds) applies between boundary ``i - 1`` and ``i``;
+    ``utc_bounds`` are the transition instants and ``wall_bounds`` the local
+    wall-clock times at which fold=0 lookups switch to the next offset.
+    """
+
+    name: str
+    start: int
+    end: int
+    utc_bounds: Tuple[int, ...]
+    wall_bounds: Tuple[int, ...]
+    offsets: Tuple[int, ...]
+
+    @classmethod
+    def scan(cls, name: str, zone: ZoneInfo) -> "ZoneTransitions":
+        first, last = TRANSITION_YEARS
+        start = int(datetime(first, 1, 1, tzinfo=timezone.utc).timestamp())
+        end = int(datetime(last + 1, 1, 1, tzinfo=timezone.utc).timestamp())
+
+        def offset(ts: int) -> int:
+            return int(datetime.fromtimestamp(ts, zone).utcoffset().total_seconds())
+
+        utc_bounds = []
+        offsets = [offset(start)]
+        cursor = start
+        while cursor < end:
+            probe = min(cursor + _SCAN_STEP_SECONDS, end)
+            if offset(probe) == offsets[-1]:
+                cursor = probe
+                continue
+            lo, hi = cursor, probe  # offset(lo) == offsets[-1] != offset(hi)
+            while hi - lo > 1:
+                mid = (lo + hi) // 2
+                if offset(mid) == offsets[-1]:
+                    lo = mid
+                else:
+                    hi = mid
+            utc_bounds.append(hi)
+            offsets.append(offset(hi))
+            cursor = hi
+
+        wall_bounds = [
+            bound + max(offsets[i], offsets[i + 1]) for i, bound in enumerate(utc_bounds)
+        ]
+        return cls(
+            name=name,
+            start=start,
+            end=end,
+            utc_bounds=tuple(utc_bounds),
+            wall_bounds=tuple(wall_bounds),
+            offsets=tuple(offsets),
+        )
+
+    def covers(self, epoch: float) -> bool:
+        return self.start + _EDGE_MARGIN_SECONDS <= epoch < self.end - _EDGE_MARGIN_SECONDS
+
+    def offset_at(self, utc_epoch: float) -> int:
+        """UTC offset (seconds) in effect at ``utc_epoch``."""
+        return self.offsets[bisect_right(self.utc_bounds, utc_epoch)]
+
+    def local_offset(self, wall_epoch: float) -> int:
+        """UTC offset (seconds) for a local wall-clock epoch (fold=0)."""
+        return self.offsets[bisect_right(self.wall_bounds, wall_epoch)]
+
+    def offset_changes_near(self, wall_epoch: float, window_seconds: float) -> bool:
+        """Whether the wall-clock offset ``window_seconds`` before or after differs."""
+        bounds, offsets = self.wall_bounds, self.offsets
+        current = offsets[bisect_right(bounds, wall_epoch)]
+        return (
+            offsets[bisect_right(bounds, wall_epoch - window_seconds)] != current
+            or offsets[bisect_right(bounds, wall_epoch + window_seconds)] != current
+        )
+
+
+_zones: Dict[str, ZoneInfo] = {"UTC": UTC}
+_transitions: Dict[str, ZoneTransitions] = {}
+_scan_locks: Dict[str, threading.Lock] = {}
+_lock = threading.Lock()
+
+
+def get_zone(name: str) -> ZoneInfo:
+    """Return the interned ``ZoneInfo`` for ``name``."""
+    zone = _zones.get(name)
+    if zone is None:
+        zone = ZoneInfo(name)  # raises ZoneInfoNotFoundError for unknown names
+        with _lock:
+            zone = _zones.setdefault(name, zone)
+    return zone
+
+
+def get_transitions(name: str) -> ZoneTransitions:
+    """Return the precomputed offset table for ``name`` (built on first use).
+
+    The scan (~0.1s) runs under a per-zone lock, so a cold zone only blocks
+    callers asking for that same zone.
+    """
+    table = _transitions.get(name)
+    if table is None:
+        zone = get_zone(name)
+        with _lock:
+            scan_lock = _scan_locks.setdefault(name, threading.Lock())
+        with scan_lock:
+            table = _transitions.get(name)
+            if table is None:
+                table = _transitions[name] = ZoneTransitions.scan(name, zone)
+    return table
+
+
+def configured_zones() -> Tuple[str, ...]:
+    """Zones named in ``SAJU_PREWARM_ZONES`` (default: Asia/Seoul)."""
+    raw = os.getenv(PREWARM_ZONES_ENV, "")
+    names = tuple(name.strip() for name in raw.split(",") if name.strip())
+    return names or DEFAULT_PREWARM_ZONES
+
+
+def prewarm_zones(names: Optional[Iterable[str]] = None) -> Tuple[str, ...]:
+    """Build the offset tables for ``names`` (default: ``configured_zones()``) now."""
+    names = tuple(names) if names is not None else configured_zones()
+    for name in names:
+        get_transitions(name)
+    return names
+
+
+def to_utc(local_dt: datetime, name: str) -> datetime:
+    """Convert ``local_dt`` to UTC; naive values are wall time in zone ``name``.
+
+    zoneinfo already bisects its own transition list in C, so this only saves
+    the zone construction and the ``ZoneInfo("UTC")`` lookup per call.
+    """
+    if local_dt.tzinfo is None:
+        local_dt = local_dt.replace(tzinfo=get_zone(name))
+    return local_dt.astimezone(UTC)
+
+
+def has_offset_change_near(local_dt: datetime, name: str, window_seconds: float) -> bool:
+    """Whether the UTC offset ``window_seconds`` of wall time away from ``local_dt`` differs.
+
+    Equivalent to comparing ``(aware ± window).utcoffset()`` with
+    ``aware.utcoffset()`` for ``aware = local_dt.replace(tzinfo=ZoneInfo(name))``,
+    without building the two probe datetimes.
+    """
+    if local_dt.tzinfo is not None:
+        local_dt = local_dt.replace(tzinfo=None)
+    table = _transitions.get(name) or get_transitions(name)
+    wall = (local_dt - _EPOCH).total_seconds()
+    if table.start + _EDGE_MARGIN_SECONDS <= wall < table.end - _EDGE_MARGIN_SECONDS:
+        return table.offset_changes_near(wall, window_seconds)
+    aware = local_dt.replace(tzinfo=get_zone(name))
+    current = aware.utcoffset()
+    window = timedelta(seconds=window_seconds)
+    return (aware - window).utcoffset() != current or (aware + window).utcoffset() != current
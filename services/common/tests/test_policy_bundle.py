@@ -0,0 +1,145 @@
+"""
+Tests for the frozen policy bundle.
+
+Tests verify:
+1. By-name lookups follow search order; extra dirs are reachable by path only
+2. Policy data is read-only but serializes, compares and deep-copies as plain JSON
+3. Embedded signatures are classified and enforced in strict mode
+4. bundle_hash tracks file contents
+"""
+
+import copy
+import json
+import pickle
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from saju_common.policy_bundle import (
+    MISMATCH,
+    UNSIGNED,
+    VERIFIED,
+    PolicyBundle,
+    PolicySignatureError,
+    freeze,
+)
+from saju_common.signing import sha256_signature
+
+
+def _write(directory: Path, name: str, data) -> Path:
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / name
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+def _signed(data):
+    return {**data, "policy_signature": sha256_signature(data)}
+
+
+@pytest.fixture
+def dirs(tmp_path):
+    first, second, extra = tmp_path / "first", tmp_path / "second", tmp_path / "extra"
+    _write(first, "a.json", {"v": 1})
+    _write(second, "a.json", {"v": 2})
+    _write(second, "b.json", {"items": [{"k": "x"}]})
+    _write(extra, "c.json", {"v": 3})
+    return first, second, extra
+
+
+class TestLookup:
+    def test_first_directory_wins(self, dirs):
+        first, second, extra = dirs
+        bundle = PolicyBundle.build([first, second], [extra])
+
+        assert bundle.get("a.json") == {"v": 1}
+        assert bundle.get_path(second / "a.json") == {"v": 2}
+        assert bundle.path("b.json") == (second / "b.json").resolve()
+        assert len(bundle) == 4
+
+    def test_extra_dirs_only_by_path(self, dirs):
+        first, second, extra = dirs
+        bundle = PolicyBundle.build([first, second], [extra])
+
+        assert "c.json" not in bundle
+        assert bundle.get_path(extra / "c.json") == {"v": 3}
+        with pytest.raises(FileNotFoundError):
+            bundle.get("c.json")
+
+    def test_missing_directories_are_skipped(self, dirs, tmp_path):
+        first, _, _ = dirs
+        bundle = PolicyBundle.build([tmp_path / "nope", first], [])
+        assert bundle.get("a.json") == {"v": 1}
+
+    def test_repo_bundle_matches_policy_loader(self):
+        from policy_loader import load_policy_json
+
+        bundle = PolicyBundle.build()
+        for name in ("gyeokguk_policy_v1.json", "zanggan_table.json", "climate_map_v1.json"):
+            assert bundle.get(name) == load_policy_json(name)
+
+
+class TestFrozen:
+    def test_mutation_is_rejected(self, dirs):
+        bundle = PolicyBundle.build(dirs[1:2], [])
+        policy = bundle.get("b.json")
+
+        with pytest.raises(TypeError):
+            policy["new"] = 1
+        with pytest.raises(TypeError):
+            policy["items"].append({})
+        with pytest.raises(TypeError):
+            policy["items"][0].setdefault("k", "y")
+
+    def test_behaves_like_plain_json(self):
+        data = {"a": [1, {"b": [2, 3]}], "c": "한"}
+        frozen = freeze(data)
+
+        assert frozen == data and isinstance(frozen, dict) and isinstance(frozen["a"], list)
+        assert json.dumps(frozen, ensure_ascii=False) == json.dumps(data, ensure_ascii=False)
+        assert sha256_signature(frozen) == sha256_signature(data)
+        assert pickle.loads(pickle.dumps(frozen)) == data
+
+        thawed = copy.deepcopy(frozen)
+        thawed["a"][1]["b"].append(4)
+        assert type(thawed) is dict and frozen["a"][1]["b"] == [2, 3]
+
+
+class TestSignatures:
+    def test_classification(self, tmp_path):
+        _write(tmp_path, "ok.json", _signed({"x": 1}))
+        _write(tmp_path, "bad.json", {**_signed({"x": 1}), "x": 2})
+        _write(tmp_path, "pending.json", {"x": 1, "policy_signature": "PENDING"})
+        _write(tmp_path, "plain.json", [1, 2])
+
+        signatures = PolicyBundle.build([tmp_path], [], strict=False).signatures()
+        by_name = {Path(p).name: status for p, status in signatures.items()}
+        assert by_name == {
+            "ok.json": VERIFIED,
+            "bad.json": MISMATCH,
+            "pending.json": UNSIGNED,
+            "plain.json": UNSIGNED,
+        }
+
+    def test_strict_rejects_mismatch(self, tmp_path, monkeypatch):
+        _write(tmp_path, "bad.json", {**_signed({"x": 1}), "x": 2})
+        monkeypatch.setenv("POLICY_BUNDLE_STRICT", "1")
+        with pytest.raises(PolicySignatureError):
+            PolicyBundle.build([tmp_path], [])
+
+    def test_invalid_json_fails_the_build(self, tmp_path):
+        (tmp_path / "broken.json").write_text("{", encoding="utf-8")
+        with pytest.raises(ValueError, match="broken.json"):
+            PolicyBundle.build([tmp_path], [])
+
+
+def test_bundle_hash_tracks_contents(dirs):
+    first, second, extra = dirs
+    before = PolicyBundle.build([first, second], [extra]).bundle_hash
+    assert PolicyBundle.build([first, second], [extra]).bundle_hash == before
+
+    _write(extra, "c.json", {"v": 4})
+    assert PolicyBundle.build([first, second], [extra]).bundle_hash != before
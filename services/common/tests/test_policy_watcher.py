@@ -0,0 +1,112 @@
+"""
+Tests for policy hot-reload.
+
+Tests verify:
+1. A changed file publishes a new bundle after the hooks ran
+2. Unchanged or merely touched files do not reload
+3. Invalid JSON and failing hooks keep the previous bundle live
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from saju_common.policy_bundle import PolicyBundle, get_policy_bundle, set_policy_bundle
+from saju_common.policy_watcher import PolicyWatcher, start_policy_watcher
+
+
+@pytest.fixture
+def policy_dir(tmp_path):
+    (tmp_path / "gyeokguk.json").write_text(json.dumps({"threshold": 10}), encoding="utf-8")
+    (tmp_path / "other.json").write_text(json.dumps({"v": 1}), encoding="utf-8")
+    return tmp_path
+
+
+@pytest.fixture
+def watcher(policy_dir):
+    def build():
+        return PolicyBundle.build([policy_dir], [])
+
+    set_policy_bundle(build())
+    seen = []
+    watcher = PolicyWatcher([seen.append], interval=0.01, build=build)
+    watcher.seen = seen
+    yield watcher
+    watcher.stop()
+    set_policy_bundle(None)
+
+
+def _edit(path: Path, data) -> None:
+    path.write_text(json.dumps(data), encoding="utf-8")
+    # Guarantee a new mtime even on coarse-grained filesystems
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def test_change_publishes_new_bundle(watcher, policy_dir):
+    old = get_policy_bundle()
+    assert watcher.check() is False
+
+    _edit(policy_dir / "gyeokguk.json", {"threshold": 12})
+    assert watcher.check() is True
+
+    new = get_policy_bundle()
+    assert new is not old and watcher.bundle is new
+    assert watcher.seen == [new]
+    assert new.get("gyeokguk.json") == {"threshold": 12}
+    # Holders of the old snapshot are unaffected
+    assert old.get("gyeokguk.json") == {"threshold": 10}
+    assert old.changed_files(new) == [(policy_dir / "gyeokguk.json").resolve().as_posix()]
+
+
+def test_touch_without_change_does_not_reload(watcher, policy_dir):
+    _edit(policy_dir / "other.json", {"v": 1})
+    assert watcher.check() is False
+    assert watcher.seen == [] and watcher.reloads == 0
+
+
+def test_invalid_json_keeps_old_bundle(watcher, policy_dir):
+    old = get_policy_bundle()
+    (policy_dir / "gyeokguk.json").write_text("{", encoding="utf-8")
+
+    assert watcher.check() is False
+    assert get_policy_bundle() is old and watcher.failures == 1
+    # Not retried until the file changes again
+    assert watcher.check() is False and watcher.failures == 1
+
+    _edit(policy_dir / "gyeokguk.json", {"threshold": 11})
+    assert watcher.check() is True
+
+
+def test_failing_hook_rejects_reload(watcher, policy_dir):
+    old = get_policy_bundle()
+
+    def broken(bundle):
+        raise KeyError("missing section")
+
+    watcher.hooks.insert(0, broken)
+    _edit(policy_dir / "gyeokguk.json", {"threshold": 13})
+
+    assert watcher.check() is False
+    assert get_policy_bundle() is old and watcher.seen == []
+
+
+def test_background_thread_picks_up_changes(watcher, policy_dir):
+    watcher.start()
+    _edit(policy_dir / "other.json", {"v": 2, "extra": True})
+    for _ in range(500):
+        if watcher.reloads:
+            break
+        watcher._stop.wait(0.01)
+    assert watcher.reloads == 1
+    assert get_policy_bundle().get("other.json") == {"v": 2, "extra": True}
+
+
+def test_disabled_without_env(monkeypatch):
+    monkeypatch.delenv("POLICY_HOT_RELOAD", raising=False)
+    assert start_policy_watcher() is None
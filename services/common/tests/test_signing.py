@@ -0,0 +1,123 @@
+"""
+Tests for the shared canonical JSON signing module.
+
+Tests verify:
+1. canonical_dumps/sha256_signature match the json.dumps form engines used before
+2. exclude= drops top-level keys without touching the input
+3. policy_signature is memoized per object in a bounded cache
+4. Canonical fragments compose to the same bytes as a full serialization
+"""
+
+import hashlib
+import json
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from saju_common import signing
+from saju_common.signing import (
+    Canonical,
+    canonical_dumps,
+    canonical_object,
+    object_signature,
+    policy_signature,
+    sha256_signature,
+)
+
+
+def _legacy_signature(obj):
+    data = json.dumps(obj, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def _random_value(rng, depth=0):
+    kind = rng.randrange(6 if depth < 3 else 4)
+    if kind == 0:
+        return rng.randint(-1000, 1000)
+    if kind == 1:
+        return round(rng.random(), 4)
+    if kind == 2:
+        return rng.choice(["甲子", "wood", "공망", "", None, True])
+    if kind == 3:
+        return rng.choice(["子", "丑", "寅"])
+    if kind == 4:
+        return [_random_value(rng, depth + 1) for _ in range(rng.randrange(4))]
+    return {rng.choice("abcxyz가나") + str(i): _random_value(rng, depth + 1) for i in range(3)}
+
+
+def test_matches_legacy_signature_on_random_objects():
+    rng = random.Random(7)
+    for _ in range(500):
+        obj = {str(i): _random_value(rng) for i in range(rng.randrange(1, 6))}
+        assert sha256_signature(obj) == _legacy_signature(obj)
+
+
+def test_exclude_drops_top_level_key_without_mutating_input():
+    out = {"policy_version": "v1", "pillars": [{"pillar": "甲子"}], "policy_signature": "old"}
+    sig = sha256_signature(out, exclude=("policy_signature",))
+
+    assert out["policy_signature"] == "old"
+    assert sig == _legacy_signature({"policy_version": "v1", "pillars": [{"pillar": "甲子"}]})
+
+
+def test_int_keys_sort_like_json_dumps():
+    spec = {10: ["子", "丑"], 2: ["戌", "亥"]}
+    assert canonical_dumps(spec) == json.dumps(
+        spec, ensure_ascii=False, sort_keys=True, separators=(",", ":")
+    )
+
+
+def test_policy_signature_is_memoized_per_object(monkeypatch):
+    policy = {"version": "p1", "rules": [1, 2, 3]}
+    first = policy_signature(policy)
+
+    calls = []
+    monkeypatch.setattr(signing, "sha256_signature", lambda *a: calls.append(a) or "x")
+    assert policy_signature(policy) == first
+    assert calls == []
+
+    # An equal but distinct object is signed on its own
+    assert policy_signature(dict(policy)) == "x"
+
+
+def test_policy_signature_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(signing, "POLICY_SIGNATURE_CACHE_SIZE", 4)
+    monkeypatch.setattr(signing, "_POLICY_SIGNATURES", signing.OrderedDict())
+    policies = [{"version": f"p{i}"} for i in range(10)]
+    for policy in policies:
+        policy_signature(policy)
+
+    assert len(signing._POLICY_SIGNATURES) == 4
+    assert [entry[0] for entry in signing._POLICY_SIGNATURES.values()] == policies[-4:]
+
+
+def test_canonical_object_splices_fragments():
+    section = {"type": "void", "payload": {"kong": ["戌", "亥"], "day_index": 0}}
+    fields = {k: Canonical(canonical_dumps(v)) for k, v in section.items()}
+
+    assert canonical_object(fields) == canonical_dumps(section)
+    assert object_signature(fields) == sha256_signature(section)
+
+
+def test_nested_fragments_match_full_serialization():
+    sections = [
+        {"type": "void", "payload": {"kong": ["戌", "亥"]}},
+        {"type": "yuanjin", "payload": {"hits": [["子", "未"]]}},
+    ]
+    fragments = [
+        canonical_object({k: Canonical(canonical_dumps(v)) for k, v in s.items()}) for s in sections
+    ]
+    envelope = {"evidence_version": "evidence_v1.0.0", "sections": sections}
+
+    assert object_signature({"evidence_version": "evidence_v1.0.0", "sections": fragments}) == (
+        _legacy_signature(envelope)
+    )
+
+
+def test_canonical_object_rejects_non_str_keys():
+    with pytest.raises(TypeError):
+        canonical_object({1: "x"})
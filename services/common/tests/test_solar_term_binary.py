@@ -0,0 +1,142 @@
+"""
+Tests for the compiled (mmap) solar term table.
+
+Tests verify:
+1. Compiled table round-trips to the same records as the CSV index
+2. Header/version/checksum validation rejects corrupt or stale tables
+3. get_solar_term_index prefers the compiled table and falls back to CSV
+"""
+
+import shutil
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from saju_common.solar_term_binary import (
+    COMPILED_TABLE_NAME,
+    HEADER,
+    VERIFY_SOURCES_ENV,
+    SolarTermTableError,
+    compile_term_table,
+    load_term_table,
+)
+from saju_common.solar_term_index import (
+    DEFAULT_TERM_DATA_PATH,
+    SolarTermIndex,
+    get_solar_term_index,
+)
+
+
+@pytest.fixture()
+def table_dir(tmp_path):
+    for year in (1999, 2000, 2001):
+        shutil.copy(DEFAULT_TERM_DATA_PATH / f"terms_{year}.csv", tmp_path)
+    return tmp_path
+
+
+def test_compiled_table_matches_csv_index(table_dir):
+    compiled = compile_term_table(table_dir)
+    assert compiled.name == COMPILED_TABLE_NAME
+
+    from_csv = SolarTermIndex.from_directory(table_dir)
+    from_bin = load_term_table(compiled)
+    assert len(from_bin) == len(from_csv) == 36
+    assert from_bin.years == from_csv.years
+    for row in range(len(from_csv)):
+        assert from_bin.record(row) == from_csv.record(row)
+
+    instant = datetime(2000, 2, 4, 12, 35, 59, tzinfo=timezone.utc)
+    assert from_bin.window(instant) == from_csv.window(instant)
+    assert from_bin.major_term_at(instant).term == "立春"
+
+
+def test_stale_table_is_rejected(table_dir):
+    compiled = compile_term_table(table_dir)
+    csv_path = table_dir / "terms_2000.csv"
+    csv_path.write_text(csv_path.read_text(encoding="utf-8") + "\n", encoding="utf-8")
+
+    with pytest.raises(SolarTermTableError, match="stale"):
+        load_term_table(compiled)
+
+
+def test_same_size_edit_is_rejected(table_dir, monkeypatch):
+    compiled = compile_term_table(table_dir)
+    csv_path = table_dir / "terms_2000.csv"
+    data = bytearray(csv_path.read_bytes())
+    pos = data.rindex(b"Z,") - 1  # last digit of the final term's UTC seconds
+    data[pos] = ord("0") if data[pos] != ord("0") else ord("1")
+    csv_path.write_bytes(bytes(data))
+
+    # Names and sizes still match; the content digest does not
+    monkeypatch.delenv(VERIFY_SOURCES_ENV, raising=False)
+    with pytest.raises(SolarTermTableError, match="stale"):
+        load_term_table(compiled)
+
+    # Opt-out: only names and sizes are compared
+    assert len(load_term_table(compiled, verify_sources=False)) == 36
+    monkeypatch.setenv(VERIFY_SOURCES_ENV, "0")
+    assert len(load_term_table(compiled)) == 36
+
+
+def test_integer_columns_are_zero_copy(table_dir):
+    index = load_term_table(compile_term_table(table_dir))
+    assert isinstance(index._epochs, memoryview)
+    assert index._epochs.obj is index._buffer
+
+
+def test_corrupt_payload_is_rejected(table_dir):
+    compiled = compile_term_table(table_dir)
+    data = bytearray(compiled.read_bytes())
+    data[-3] ^= 0xFF
+    compiled.write_bytes(bytes(data))
+
+    with pytest.raises(SolarTermTableError, match="checksum"):
+        load_term_table(compiled)
+
+
+def test_bad_magic_is_rejected(table_dir):
+    compiled = compile_term_table(table_dir)
+    data = bytearray(compiled.read_bytes())
+    data[:8] = b"NOTTERMS"
+    compiled.write_bytes(bytes(data))
+
+    with pytest.raises(SolarTermTableError, match="magic"):
+        load_term_table(compiled)
+
+
+def test_truncated_header_is_rejected(table_dir):
+    compiled = table_dir / COMPILED_TABLE_NAME
+    compiled.write_bytes(b"\0" * (HEADER.size - 1))
+
+    with pytest.raises(SolarTermTableError, match="truncated"):
+        load_term_table(compiled)
+
+
+def test_index_factory_prefers_compiled_table(table_dir):
+    compile_term_table(table_dir)
+    index = get_solar_term_index(table_dir)
+    assert index._buffer is not None
+    assert index.years == (1999, 2000, 2001)
+
+
+def test_index_factory_falls_back_to_csv_when_stale(table_dir, tmp_path_factory):
+    compiled = compile_term_table(table_dir)
+    stale_dir = tmp_path_factory.mktemp("stale")
+    for path in table_dir.glob("terms_*.csv"):
+        shutil.copy(path, stale_dir)
+    shutil.copy(compiled, stale_dir)
+    (stale_dir / "terms_2001.csv").unlink()
+
+    index = get_solar_term_index(stale_dir)
+    assert index._buffer is None
+    assert index.years == (1999, 2000)
+
+
+def test_repository_table_is_current():
+    compiled = DEFAULT_TERM_DATA_PATH / COMPILED_TABLE_NAME
+    index = load_term_table(compiled)
+    assert index.years[0] == 1900 and index.years[-1] == 2050
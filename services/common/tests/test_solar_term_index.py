@@ -0,0 +1,106 @@
+"""
+Tests for the shared in-memory SolarTermIndex.
+
+Tests verify:
+1. Index loads the full data/ CSV set once and is cached per directory
+2. prev/next/major lookups agree with a linear scan of the raw CSV rows
+3. Legacy loaders delegate to the index without changing their output
+"""
+
+import csv
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from saju_common import FileSolarTermLoader, SolarTermIndex, get_solar_term_index
+from saju_common.solar_term_index import DEFAULT_TERM_DATA_PATH, MAJOR_TERMS
+
+
+def _raw_rows(years):
+    rows = []
+    for year in years:
+        with (DEFAULT_TERM_DATA_PATH / f"terms_{year}.csv").open(encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                utc = datetime.fromisoformat(row["utc_time"].replace("Z", "+00:00"))
+                rows.append((utc, row["term"]))
+    return sorted(rows)
+
+
+@pytest.fixture(scope="module")
+def index() -> SolarTermIndex:
+    return get_solar_term_index()
+
+
+class TestSolarTermIndex:
+    def test_covers_1900_to_2050(self, index):
+        assert index.years[0] == 1900
+        assert index.years[-1] == 2050
+        assert len(index) == 12 * 151
+
+    def test_cached_per_directory(self, index):
+        assert get_solar_term_index(DEFAULT_TERM_DATA_PATH) is index
+
+    def test_missing_directory_is_empty(self, tmp_path):
+        empty = get_solar_term_index(tmp_path / "missing")
+        assert len(empty) == 0
+        assert empty.prev_term(datetime(2000, 1, 1, tzinfo=timezone.utc)) is None
+        assert empty.major_term_at(datetime(2000, 1, 1, tzinfo=timezone.utc)) is None
+
+    @pytest.mark.parametrize(
+        "instant",
+        [
+            datetime(1992, 7, 15, 14, 40, tzinfo=timezone.utc),
+            datetime(2000, 1, 3, 0, 0, tzinfo=timezone.utc),
+            datetime(2000, 2, 4, 12, 35, 59, tzinfo=timezone.utc),  # exactly on 立春
+            datetime(2000, 2, 4, 12, 35, 58, 999999, tzinfo=timezone.utc),
+            datetime(2024, 12, 31, 23, 59, tzinfo=timezone.utc),
+        ],
+    )
+    def test_window_matches_linear_scan(self, index, instant):
+        rows = _raw_rows([instant.year - 1, instant.year, instant.year + 1])
+        expected_prev = [r for r in rows if r[0] <= instant][-1]
+        expected_next = next(r for r in rows if r[0] > instant)
+
+        prev_term, next_term = index.window(instant)
+        assert (prev_term.utc_time, prev_term.term) == expected_prev
+        assert (next_term.utc_time, next_term.term) == expected_next
+        assert index.prev_term(instant) == prev_term
+        assert index.next_term(instant) == next_term
+
+        expected_major = [r for r in rows if r[0] <= instant and r[1] in MAJOR_TERMS][-1]
+        major = index.major_term_at(instant)
+        assert (major.utc_time, major.term) == expected_major
+
+    def test_year_entries_match_csv(self, index):
+        records = index.year_entries(2000)
+        assert [(r.utc_time, r.term) for r in records] == _raw_rows([2000])
+        assert records[0].source == "SAJU_LITE_REFINED"
+        assert records[0].delta_t_seconds == pytest.approx(62.93)
+        assert index.year_entries(1850) == []
+
+    def test_records_are_immutable(self, index):
+        record = index.prev_term(datetime(2000, 6, 1, tzinfo=timezone.utc))
+        with pytest.raises(AttributeError):
+            record.term = "立春"
+
+
+class TestLoaderDelegation:
+    def test_file_loader_uses_shared_index(self, index):
+        loader = FileSolarTermLoader(DEFAULT_TERM_DATA_PATH)
+        assert loader.index is index
+        entries = list(loader.load_year(1992))
+        assert [(e.utc_time, e.term) for e in entries] == _raw_rows([1992])
+
+    def test_file_loader_missing_year_raises(self):
+        loader = FileSolarTermLoader(DEFAULT_TERM_DATA_PATH)
+        with pytest.raises(FileNotFoundError):
+            loader.load_year(2300)
+
+    def test_lookup_is_stable_across_dst_offsets(self, index):
+        kst = timezone(timedelta(hours=9))
+        local = datetime(1992, 7, 15, 23, 40, tzinfo=kst)
+        assert index.major_term_at(local) == index.major_term_at(local.astimezone(timezone.utc))
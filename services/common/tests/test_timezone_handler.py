@@ -0,0 +1,89 @@
+"""
+Tests for the compiled KoreanTimezoneHandler.
+
+Tests verify:
+1. Bisect lookups agree with a linear scan of the DST/gap/overlap tables
+2. convert_to_saju_time handles gap, overlap and pre-1908 births
+3. convert_many matches per-item conversion and the handler holds no state
+"""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from saju_common import DST_PERIODS, KoreanTimezoneHandler, TimezoneWarning
+from saju_common.timezone_handler import DST_GAP_PERIODS, DST_OVERLAP_PERIODS
+
+
+def _probe_points():
+    edges = [p["start"] for p in DST_PERIODS] + [p["end"] for p in DST_PERIODS]
+    edges += [start for start, _ in DST_GAP_PERIODS + DST_OVERLAP_PERIODS]
+    return [edge + timedelta(minutes=m) for edge in edges for m in (-61, -1, 0, 1, 30, 59, 60)]
+
+
+class TestCompiledLookups:
+    def test_dst_period_matches_linear_scan(self):
+        handler = KoreanTimezoneHandler()
+        for dt in _probe_points():
+            expected = any(p["start"] <= dt < p["end"] for p in DST_PERIODS)
+            assert handler.is_dst_period(dt) is expected, dt
+
+    def test_gap_and_overlap_match_linear_scan(self):
+        handler = KoreanTimezoneHandler()
+        for dt in _probe_points():
+            in_gap = any(start <= dt < end for start, end in DST_GAP_PERIODS)
+            in_overlap = any(start <= dt < end for start, end in DST_OVERLAP_PERIODS)
+            assert handler.is_dst_gap(dt)[0] is in_gap, dt
+            assert handler.is_dst_overlap(dt)[0] is in_overlap, dt
+            assert handler.validate_input_time(dt)[0] is not in_gap, dt
+
+    def test_standard_time_offsets(self):
+        handler = KoreanTimezoneHandler()
+        assert handler.get_standard_time_offset(datetime(1900, 1, 1), "Busan") == 516.3 / 60.0
+        assert handler.get_standard_time_offset(datetime(1910, 1, 1)) == 8.5
+        assert handler.get_standard_time_offset(datetime(1954, 3, 21)) == 8.5
+        assert handler.get_standard_time_offset(datetime(1961, 8, 10)) == 9.0
+        assert handler.get_standard_time_offset(datetime(2016, 1, 1), "Pyongyang") == 8.5
+
+
+class TestConvert:
+    def test_gap_is_corrected_forward(self):
+        result = KoreanTimezoneHandler().convert_to_saju_time(
+            datetime(1987, 5, 10, 2, 30), "Seoul", apply_lmt=False
+        )
+        assert [w["type"] for w in result["warnings"]] == [TimezoneWarning.DST_GAP]
+        assert result["metadata"] == {"dst_gap_corrected": True, "dst_period": True}
+        assert result["adjusted_time"] == datetime(1987, 5, 10, 2, 30)
+
+    def test_overlap_and_lmt(self):
+        result = KoreanTimezoneHandler().convert_to_saju_time(
+            datetime(1988, 10, 9, 2, 15), "Asia/Seoul"
+        )
+        assert [w["type"] for w in result["warnings"]] == [TimezoneWarning.DST_OVERLAP]
+        assert result["dst_applied"] is True
+        assert result["lmt_offset"] == -32
+        assert result["adjusted_time"] == datetime(1988, 10, 9, 0, 43)
+
+    def test_pre_1908_uses_city_lmt(self):
+        result = KoreanTimezoneHandler().convert_to_saju_time(datetime(1900, 1, 1, 12), "Busan")
+        assert result["lmt_offset"] == int(516.3 - 540)
+        assert [w["type"] for w in result["warnings"]] == [TimezoneWarning.HISTORICAL_LMT]
+
+    def test_convert_many_matches_single(self):
+        handler = KoreanTimezoneHandler()
+        births = _probe_points() + [datetime(1900, 1, 1), datetime(2000, 1, 1)]
+        assert handler.convert_many(births, "Daegu") == [
+            handler.convert_to_saju_time(dt, "Daegu") for dt in births
+        ]
+
+    def test_shared_handler_is_reentrant(self):
+        handler = KoreanTimezoneHandler()
+        assert not hasattr(handler, "__dict__")
+        births = _probe_points()
+        expected = [handler.convert_to_saju_time(dt) for dt in births]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(handler.convert_to_saju_time, births))
+        assert results == expected
@@ -0,0 +1,122 @@
+"""
+Tests for the shared timezone registry.
+
+Tests verify:
+1. Zones are interned per name
+2. Precomputed offset tables agree with zoneinfo (fold=0) around every transition
+3. has_offset_change_near matches the aware-datetime ±window probe it replaces
+4. A cold zone scan does not block lookups of other zones; prewarm_zones reads env
+"""
+
+import sys
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from saju_common import (
+    BasicTimeResolver,
+    get_transitions,
+    get_zone,
+    has_offset_change_near,
+    prewarm_zones,
+    tz_registry,
+)
+from saju_common.tz_registry import UTC, ZoneTransitions, local_epoch, to_utc
+
+ZONES = ["Asia/Seoul", "Asia/Pyongyang", "America/New_York", "Australia/Lord_Howe"]
+WINDOW = 48 * 3600
+
+
+def _probes(name):
+    table = get_transitions(name)
+    points = [datetime(1950, 6, 1), datetime(1992, 7, 15, 23, 40), datetime(2040, 1, 1)]
+    for bound in table.wall_bounds:
+        edge = datetime(1970, 1, 1) + timedelta(seconds=bound)
+        for minutes in (-61, -60, -1, 0, 1, 30, 59, 60, 2880, -2880, 2881, -2881):
+            points.append(edge + timedelta(minutes=minutes))
+    return points
+
+
+def test_zones_are_interned():
+    assert get_zone("Asia/Seoul") is get_zone("Asia/Seoul")
+    assert get_zone("UTC") is UTC
+
+
+@pytest.mark.parametrize("name", ZONES)
+def test_offsets_match_zoneinfo(name):
+    table = get_transitions(name)
+    zone = ZoneInfo(name)
+    assert table.utc_bounds  # every zone above has at least one change since 1900
+    for local_dt in _probes(name):
+        aware = local_dt.replace(tzinfo=zone)
+        assert table.local_offset(local_epoch(local_dt)) == aware.utcoffset().total_seconds()
+        assert to_utc(local_dt, name) == aware.astimezone(UTC)
+        utc_epoch = aware.timestamp()
+        expected = datetime.fromtimestamp(utc_epoch, zone).utcoffset().total_seconds()
+        assert table.offset_at(utc_epoch) == expected
+
+
+@pytest.mark.parametrize("name", ZONES)
+def test_offset_change_near_matches_datetime_probe(name):
+    zone = ZoneInfo(name)
+    window = timedelta(seconds=WINDOW)
+    for local_dt in _probes(name):
+        aware = local_dt.replace(tzinfo=zone)
+        current = aware.utcoffset()
+        expected = (aware - window).utcoffset() != current or (
+            aware + window
+        ).utcoffset() != current
+        assert has_offset_change_near(local_dt, name, WINDOW) is expected, local_dt
+
+
+def test_outside_table_range_falls_back_to_zoneinfo():
+    local_dt = datetime(1890, 1, 1, 12)
+    assert to_utc(local_dt, "Asia/Seoul") == local_dt.replace(
+        tzinfo=ZoneInfo("Asia/Seoul")
+    ).astimezone(timezone.utc)
+    assert has_offset_change_near(local_dt, "Asia/Seoul", WINDOW) is False
+
+
+def test_basic_time_resolver_uses_registry():
+    resolver = BasicTimeResolver()
+    utc = resolver.to_utc(datetime(1988, 5, 8, 1, 30), "Asia/Seoul")
+    assert utc == datetime(1988, 5, 7, 16, 30, tzinfo=timezone.utc)
+    assert resolver.from_utc(utc, "Asia/Seoul").tzinfo is get_zone("Asia/Seoul")
+
+
+def test_cold_scan_does_not_block_other_zones(monkeypatch):
+    get_transitions("Asia/Seoul")
+    monkeypatch.delitem(tz_registry._transitions, "Europe/Lisbon", raising=False)
+    started, release = threading.Event(), threading.Event()
+    scan = ZoneTransitions.scan
+
+    def slow_scan(name, zone):
+        started.set()
+        release.wait(5)
+        return scan(name, zone)
+
+    monkeypatch.setattr(ZoneTransitions, "scan", staticmethod(slow_scan))
+    worker = threading.Thread(target=get_transitions, args=("Europe/Lisbon",))
+    worker.start()
+    try:
+        assert started.wait(5)
+        # Would deadlock on a registry-wide lock until the Lisbon scan finished
+        assert get_zone("Asia/Tokyo").key == "Asia/Tokyo"
+        assert get_transitions("Asia/Seoul").name == "Asia/Seoul"
+    finally:
+        release.set()
+        worker.join(5)
+    assert get_transitions("Europe/Lisbon").name == "Europe/Lisbon"
+
+
+def test_prewarm_zones_reads_env(monkeypatch):
+    monkeypatch.setenv(tz_registry.PREWARM_ZONES_ENV, " Asia/Pyongyang, ,America/New_York")
+    assert prewarm_zones() == ("Asia/Pyongyang", "America/New_York")
+    assert "Asia/Pyongyang" in tz_registry._transitions
+    monkeypatch.delenv(tz_registry.PREWARM_ZONES_ENV)
+    assert prewarm_zones() == tz_registry.DEFAULT_PREWARM_ZONES
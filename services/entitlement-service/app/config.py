@@ -62,10 +62,13 @@ class Settings(BaseSettings):
         description="Role required to access admin endpoints",
     )
 
-    # Rate limiting (requests per minute)
+    # Rate limiting (token bucket: requests per minute refill, optional burst capacity)
     rate_limit_consume_rpm: int = Field(default=10, description="Consume endpoint rate limit (per user)")
     rate_limit_reward_rpm: int = Field(default=3, description="Reward endpoint rate limit (per user)")
     rate_limit_entitlements_rpm: int = Field(default=60, description="Entitlements fetch rate limit (per user)")
+    rate_limit_consume_burst: int | None = Field(default=None, description="Consume bucket capacity (defaults to the RPM)")
+    rate_limit_reward_burst: int | None = Field(default=None, description="Reward SSV bucket capacity (defaults to the RPM)")
+    rate_limit_entitlements_burst: int | None = Field(default=None, description="Entitlements bucket capacity (defaults to the RPM)")
 
     # Ad reward configuration
     ad_cooldown_seconds: int = Field(default=3600, description="Cooldown between ad rewards (1 hour)")
@@ -73,8 +76,14 @@ class Settings(BaseSettings):
     ad_monthly_cap: int = Field(default=60, description="Maximum ad rewards per month")
     ad_reward_expiry_minutes: int = Field(default=5, description="SSV pending reward expiry time")
 
+    # Entitlement snapshot cache (Redis)
+    entitlement_cache_enabled: bool = Field(default=True, description="Serve GET /entitlements from Redis when fresh")
+    entitlement_cache_ttl_seconds: int = Field(default=300, description="Upper bound on entitlement snapshot lifetime")
+
     # Timezone and scheduling
     timezone: str = Field(default="Asia/Seoul", description="Application timezone (KST)")
+    daily_reset_batch_size: int = Field(default=1000, description="Entitlement rows reset per transaction by the 00:00 KST job")
+    daily_reset_pause_seconds: float = Field(default=0.05, description="Pause between daily reset batches")
 
     # Observability
     metrics_enabled: bool = Field(default=True, description="Enable Prometheus metrics")
@@ -82,6 +91,9 @@ class Settings(BaseSettings):
 
     # Security
     idempotency_ttl_hours: int = Field(default=24, description="Idempotency key TTL in hours")
+    idempotency_pending_ttl_seconds: int = Field(default=30, description="In-flight idempotency claim TTL (refreshed while the request runs)")
+    idempotency_wait_seconds: float = Field(default=10.0, description="How long a duplicate request waits for the in-flight one")
+    idempotency_archive_fallback: bool = Field(default=False, description="Look up Redis misses in the Postgres archive (enable after Redis data loss)")
 
     class Config:
         env_file = ".env"
@@ -7,9 +7,12 @@ from .metrics import (
     ad_reward_total,
     ad_reward_fraud,
     daily_quota_reset_total,
+    daily_reset_batches,
+    daily_reset_batch_duration,
     monthly_quota_reset_total,
     token_consume_duration,
     entitlement_fetch_duration,
+    entitlement_cache_lookups,
     token_buckets_gauge,
 )
 
@@ -19,8 +22,11 @@ __all__ = [
     "ad_reward_total",
     "ad_reward_fraud",
     "daily_quota_reset_total",
+    "daily_reset_batches",
+    "daily_reset_batch_duration",
     "monthly_quota_reset_total",
     "token_consume_duration",
     "entitlement_fetch_duration",
+    "entitlement_cache_lookups",
     "token_buckets_gauge",
 ]
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 """
 Prometheus Metrics for Entitlement Service
-8 core metrics for observability
+Core metrics for observability
 """
 
 from prometheus_client import Counter, Histogram, Gauge
@@ -49,6 +49,17 @@ daily_quota_reset_total = Counter(
     "Daily quota resets (00:00 KST)"
 )
 
+daily_reset_batches = Counter(
+    "saju_daily_reset_batches_total",
+    "Chunks committed by the scheduled daily reset"
+)
+
+daily_reset_batch_duration = Histogram(
+    "saju_daily_reset_batch_duration_seconds",
+    "Scheduled daily reset chunk latency (seconds)",
+    buckets=[0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5]
+)
+
 monthly_quota_reset_total = Counter(
     "saju_monthly_quota_resets_total",
     "Monthly quota resets (plan renewal)"
@@ -67,6 +78,15 @@ entitlement_fetch_duration = Histogram(
     buckets=[0.01, 0.025, 0.05, 0.1, 0.2, 0.5]
 )
 
+# Entitlement snapshot cache
+entitlement_cache_lookups = Counter(
+    "saju_entitlement_cache_lookups_total",
+    "Entitlement snapshot cache lookups",
+    ["result"]
+)
+# Labels:
+# - result: "hit"|"miss"|"stale"|"error"
+
 # Token bucket gauges (for monitoring)
 token_buckets_gauge = Gauge(
     "saju_token_buckets",
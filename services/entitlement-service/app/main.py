@@ -4,7 +4,7 @@ Entitlement Service - FastAPI Application
 
 Complete server with 6 endpoints:
 1. GET /api/v1/entitlements - Fetch user entitlements with KST-aligned resets
-2. POST /api/v1/tokens/consume - Consume tokens with optimistic locking
+2. POST /api/v1/tokens/consume - Consume tokens atomically (single statement)
 3. POST /api/v1/tokens/reward/ssv - Verify AdMob SSV signature
 4. POST /api/v1/tokens/reward/claim - Claim verified ad reward
 5. POST /api/v1/tokens/refund - Refund tokens (support/admin)
@@ -13,7 +13,7 @@ Complete server with 6 endpoints:
 Features:
 - RFC-8785 idempotency middleware
 - Firebase JWT authentication
-- Redis rate limiting
+- Redis token-bucket rate limiting (single Lua call)
 - Prometheus metrics
 - APScheduler for scheduled resets
 """
@@ -21,7 +21,6 @@ Features:
 import logging
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 from uuid import UUID
 
@@ -39,15 +38,23 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from .config import settings
 from .database import engine
 from .models import User, Entitlement, TokenLedger, AdReward
-from .services.token_service import (
-    consume_tokens_once,
-    OptimisticLockError,
-    InsufficientTokensError,
+from .services.token_service import consume_tokens_atomic, InsufficientTokensError
+from .services.quota_service import (
+    lazy_daily_reset_if_needed,
+    monthly_plan_reset_if_due,
+    run_daily_reset,
 )
-from .services.quota_service import lazy_daily_reset_if_needed, monthly_plan_reset_if_due
+from .services.entitlement_cache import (
+    build_snapshot,
+    get_snapshot,
+    invalidate_snapshot,
+    snapshot_ttl,
+    store_snapshot,
+)
+from .services.idempotency_archiver import IdempotencyArchiver
 from .services.ssv_verifier import verify_admob_ssv, SSVVerificationError
 from .services.fraud_detector import detect_fraud, FraudDecision
-from .rate_limiter import check_rate_limit, RateLimitExceeded
+from .rate_limiter import check_route_rate_limit, RateLimitExceeded
 from .middleware.idempotency import idempotency_middleware
 from .instrumentation.metrics import (
     token_consume_total,
@@ -108,11 +115,17 @@ async def lifespan(app: FastAPI):
     redis_pool = Redis.from_url(settings.redis_url, decode_responses=False)
     await redis_pool.ping()
     logger.info("Redis connected: %s", settings.redis_url)
+    app.state.redis = redis_pool
 
     # Database connection
     app.state.db = SessionLocal
     logger.info("Database connected: %s", settings.database_url.split("@")[-1])
 
+    # Idempotency records: Redis serves replays, Postgres is a batched archive
+    archiver = IdempotencyArchiver(SessionLocal)
+    await archiver.start()
+    app.state.idempotency_archiver = archiver
+
     # APScheduler: Daily reset at 00:00 KST
     if scheduler.running:
         scheduler.shutdown(wait=False)
@@ -124,6 +137,8 @@ async def lifespan(app: FastAPI):
         minute=0,
         timezone=settings.timezone,
         id="daily_reset",
+        max_instances=1,
+        coalesce=True,
     )
     scheduler.start()
     logger.info("Scheduler started: daily reset at 00:00 %s", settings.timezone)
@@ -132,6 +147,7 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Shutting down Entitlement Service")
+    await archiver.stop()
     await redis_pool.aclose()
     scheduler.shutdown()
     await engine.dispose()
@@ -153,21 +169,17 @@ app.middleware("http")(idempotency_middleware)
 
 
 async def scheduled_daily_reset():
-    """Scheduled job: Reset daily quotas for all users at 00:00 KST."""
+    """Scheduled job: Reset daily quotas for all users at 00:00 KST (chunked, resumable)."""
     logger.info("Running scheduled daily reset...")
 
-    async with SessionLocal() as session:
-        # Reset all entitlements (light_daily_used, ad_rewards_today)
-        result = await session.execute(
-            update(Entitlement).values(
-                light_daily_used=0,
-                ad_rewards_today=0,
-                light_last_reset_date=func.current_date(),
-                updated_at=func.now(),
-            )
-        )
-        await session.commit()
-        logger.info("Daily reset completed: %d users", result.rowcount)
+    report = await run_daily_reset(SessionLocal, redis_pool)
+    logger.info(
+        "Daily reset completed for %s: %d users in %d batches (resumed from %s)",
+        report.day,
+        report.users_reset,
+        report.batches,
+        report.resumed_from,
+    )
 
 
 # -----------------------------------------------------------------------------
@@ -383,6 +395,42 @@ async def get_admin_user(
     return user
 
 
+def _entitlements_response(user_id: str, snapshot: Dict[str, Any]) -> EntitlementsResponse:
+    """Build the GET /entitlements payload from an entitlement snapshot."""
+    total_tokens = (
+        snapshot["plan_tokens_available"]
+        + snapshot["earned_tokens_available"]
+        + snapshot["bonus_tokens_available"]
+    )
+    light_daily_left = max(0, snapshot["light_daily_limit"] - snapshot["light_daily_used"])
+
+    # Ad suggestion (cooldown check)
+    # TODO: Check last ad reward timestamp in Redis for cooldown
+    ads_suggest = (
+        snapshot["ad_rewards_today"] < settings.ad_daily_cap
+        and snapshot["ad_rewards_this_month"] < settings.ad_monthly_cap
+    )
+
+    return EntitlementsResponse(
+        user_id=user_id,
+        plan_tier=snapshot["plan_tier"],
+        plan_tokens_available=snapshot["plan_tokens_available"],
+        earned_tokens_available=snapshot["earned_tokens_available"],
+        bonus_tokens_available=snapshot["bonus_tokens_available"],
+        total_tokens=total_tokens,
+        light_daily_limit=snapshot["light_daily_limit"],
+        light_daily_used=snapshot["light_daily_used"],
+        light_daily_left=light_daily_left,
+        deep_tokens_limit=snapshot["deep_tokens_limit"],
+        ad_rewards_today=snapshot["ad_rewards_today"],
+        ad_rewards_this_month=snapshot["ad_rewards_this_month"],
+        ad_cooldown_seconds=settings.ad_cooldown_seconds,
+        ad_daily_cap=settings.ad_daily_cap,
+        ad_monthly_cap=settings.ad_monthly_cap,
+        ads_suggest=ads_suggest,
+    )
+
+
 # -----------------------------------------------------------------------------
 # Endpoints
 # -----------------------------------------------------------------------------
@@ -418,6 +466,7 @@ async def get_entitlements(
     GET /api/v1/entitlements - Fetch user entitlements with lazy resets.
 
     Features:
+    - Redis snapshot cache (skips Postgres on hit)
     - Lazy daily reset (00:00 KST boundary)
     - Monthly plan reset (subscription renewal date)
     - Rate limiting (60 RPM)
@@ -428,18 +477,18 @@ async def get_entitlements(
         user_id = current_user.user_id
 
         try:
-            await check_rate_limit(
-                redis,
-                f"entitlements:{user_id}",
-                settings.rate_limit_entitlements_rpm,
-                window_sec=60,
-            )
+            await check_route_rate_limit(redis, "entitlements", user_id)
         except RateLimitExceeded as e:
             raise HTTPException(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 detail=f"Rate limit exceeded. Retry after {e.retry_after}s",
             )
 
+        # Snapshot cache hit: no Postgres round trip
+        snapshot = await get_snapshot(redis, user_id)
+        if snapshot is not None:
+            return _entitlements_response(user_id, snapshot)
+
         # Fetch user and entitlement
         user = await session.get(User, UUID(user_id))
         if not user:
@@ -457,44 +506,11 @@ async def get_entitlements(
 
         # Refresh entitlement after resets
         await session.refresh(ent)
-
-        # Calculate total tokens
-        total_tokens = (
-            ent.plan_tokens_available
-            + ent.earned_tokens_available
-            + ent.bonus_tokens_available
-        )
-
-        # Calculate light daily left
-        light_daily_left = max(0, ent.light_daily_limit - ent.light_daily_used)
-
-        # Ad suggestion (cooldown check)
-        # TODO: Check last ad reward timestamp in Redis for cooldown
-        ads_suggest = (
-            ent.ad_rewards_today < settings.ad_daily_cap
-            and ent.ad_rewards_this_month < settings.ad_monthly_cap
-        )
-
         await session.commit()
 
-        return EntitlementsResponse(
-            user_id=user_id,
-            plan_tier=user.plan_tier,
-            plan_tokens_available=ent.plan_tokens_available,
-            earned_tokens_available=ent.earned_tokens_available,
-            bonus_tokens_available=ent.bonus_tokens_available,
-            total_tokens=total_tokens,
-            light_daily_limit=ent.light_daily_limit,
-            light_daily_used=ent.light_daily_used,
-            light_daily_left=light_daily_left,
-            deep_tokens_limit=ent.deep_tokens_limit,
-            ad_rewards_today=ent.ad_rewards_today,
-            ad_rewards_this_month=ent.ad_rewards_this_month,
-            ad_cooldown_seconds=settings.ad_cooldown_seconds,
-            ad_daily_cap=settings.ad_daily_cap,
-            ad_monthly_cap=settings.ad_monthly_cap,
-            ads_suggest=ads_suggest,
-        )
+        snapshot = build_snapshot(ent, user.plan_tier)
+        await store_snapshot(redis, user_id, snapshot, snapshot_ttl(ent))
+        return _entitlements_response(user_id, snapshot)
 
 
 @app.post("/api/v1/tokens/consume", response_model=ConsumeResponse)
@@ -508,11 +524,11 @@ async def consume_tokens(
     user_agent: Optional[str] = Header(None),
 ):
     """
-    POST /api/v1/tokens/consume - Consume tokens with optimistic locking.
+    POST /api/v1/tokens/consume - Consume tokens in one atomic statement.
 
     Features:
     - Three-bucket draw (earned → bonus → plan)
-    - Optimistic locking with automatic retry
+    - Draw, balance update and ledger insert in a single round trip (no retry loop)
     - Business-entity uniqueness (prevents double-deduction)
     - Idempotency-Key header support
     - Rate limiting (10 RPM)
@@ -522,12 +538,7 @@ async def consume_tokens(
         user_id = current_user.user_id
         # Rate limiting
         try:
-            await check_rate_limit(
-                redis,
-                f"consume:{user_id}",
-                settings.rate_limit_consume_rpm,
-                window_sec=60,
-            )
+            await check_route_rate_limit(redis, "consume", user_id)
         except RateLimitExceeded as e:
             token_consume_errors.labels(error_code="RATE_LIMIT").inc()
             raise HTTPException(
@@ -545,63 +556,47 @@ async def consume_tokens(
                     status_code=400, detail="Idempotency-Key must be a valid UUID"
                 )
 
-        # Retry loop (up to 3 attempts)
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                ledger = await consume_tokens_once(
-                    session=session,
-                    user_id=user_id,
-                    amount=request.amount,
-                    idem_key=idempotency_key,
-                    related_type=request.related_entity_type,
-                    related_id=request.related_entity_id,
-                    reason=request.reason,
-                    ip=x_forwarded_for,
-                    ua=user_agent,
-                )
+        try:
+            result = await consume_tokens_atomic(
+                session=session,
+                user_id=user_id,
+                amount=request.amount,
+                idem_key=idempotency_key,
+                related_type=request.related_entity_type,
+                related_id=request.related_entity_id,
+                reason=request.reason,
+                ip=x_forwarded_for,
+                ua=user_agent,
+            )
+        except InsufficientTokensError as e:
+            token_consume_errors.labels(error_code="INSUFFICIENT_TOKENS").inc()
+            raise HTTPException(
+                status_code=402,
+                detail={
+                    "error": "INSUFFICIENT_TOKENS",
+                    "required": e.required,
+                    "available": e.available,
+                },
+            )
 
-                # Success
-                token_consume_total.labels(
-                    action="consume",
-                    plan="unknown",  # TODO: Fetch user plan
-                    idempotent=str(idempotency_key is not None),
-                ).inc()
+        if not result.replayed:
+            await invalidate_snapshot(redis, user_id, result.version)
 
-                # Check if replay (ledger already existed)
-                idempotent_replay = ledger.created_at < datetime.now(timezone.utc).replace(
-                    second=0, microsecond=0
-                )
+        token_consume_total.labels(
+            action="consume",
+            plan="unknown",  # TODO: Fetch user plan
+            idempotent=str(idempotency_key is not None),
+        ).inc()
 
-                return ConsumeResponse(
-                    success=True,
-                    ledger_id=ledger.id,
-                    tokens_before=ledger.tokens_before,
-                    tokens_after=ledger.tokens_after,
-                    token_delta=ledger.token_delta,
-                    idempotent_replay=idempotent_replay,
-                )
-
-            except OptimisticLockError:
-                # Retry
-                logger.warning("Optimistic lock collision (attempt %d)", attempt + 1)
-                if attempt == max_retries - 1:
-                    token_consume_errors.labels(error_code="OPTIMISTIC_LOCK").inc()
-                    raise HTTPException(
-                        status_code=409, detail="Concurrent modification detected"
-                    )
-                continue
-
-            except InsufficientTokensError as e:
-                token_consume_errors.labels(error_code="INSUFFICIENT_TOKENS").inc()
-                raise HTTPException(
-                    status_code=402,
-                    detail={
-                        "error": "INSUFFICIENT_TOKENS",
-                        "required": e.required,
-                        "available": e.available,
-                    },
-                )
+        ledger = result.ledger
+        return ConsumeResponse(
+            success=True,
+            ledger_id=ledger.id,
+            tokens_before=ledger.tokens_before,
+            tokens_after=ledger.tokens_after,
+            token_delta=ledger.token_delta,
+            idempotent_replay=result.replayed,
+        )
 
 
 @app.post("/api/v1/tokens/reward/ssv", response_model=SSVVerifyResponse)
@@ -621,12 +616,7 @@ async def verify_reward_ssv(
     """
     # Rate limiting
     try:
-        await check_rate_limit(
-            redis,
-            f"reward_ssv:{request.user_id}",
-            settings.rate_limit_reward_rpm,
-            window_sec=60,
-        )
+        await check_route_rate_limit(redis, "reward_ssv", request.user_id)
     except RateLimitExceeded as e:
         raise HTTPException(
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
@@ -769,6 +759,7 @@ async def claim_reward(
             ad_rewards_today=Entitlement.ad_rewards_today + 1,
             ad_rewards_this_month=Entitlement.ad_rewards_this_month + 1,
             updated_at=func.now(),
+            version=Entitlement.version + 1,
         )
     )
 
@@ -791,6 +782,7 @@ async def claim_reward(
 
     # Refresh entitlement
     await session.refresh(ent)
+    await invalidate_snapshot(redis, user_id, ent.version)
 
     ad_reward_total.labels(status="granted").inc()
 
@@ -808,6 +800,7 @@ async def refund_tokens(
     request: RefundRequest,
     current_user: AuthenticatedUser = Depends(get_current_user),
     session: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis),
 ):
     """
     POST /api/v1/tokens/refund - Refund tokens (support/admin use case).
@@ -864,6 +857,7 @@ async def refund_tokens(
         .values(
             plan_tokens_available=Entitlement.plan_tokens_available + refund_amount,
             updated_at=func.now(),
+            version=Entitlement.version + 1,
         )
     )
 
@@ -883,6 +877,7 @@ async def refund_tokens(
 
     # Refresh entitlement
     await session.refresh(ent)
+    await invalidate_snapshot(redis, user_id, ent.version)
     tokens_after = (
         ent.plan_tokens_available
         + ent.earned_tokens_available
@@ -900,6 +895,7 @@ async def refund_tokens(
 async def admin_reset_entitlements(
     request: AdminResetRequest,
     session: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis),
     admin_user: AuthenticatedUser = Depends(get_admin_user),
 ):
     """
@@ -926,6 +922,8 @@ async def admin_reset_entitlements(
         # Daily reset
         await lazy_daily_reset_if_needed(session, ent)
         await session.commit()
+        await session.refresh(ent)
+        await invalidate_snapshot(redis, request.user_id, ent.version)
         return AdminResetResponse(
             success=True,
             message=f"Daily quota reset for user {request.user_id}",
@@ -935,6 +933,8 @@ async def admin_reset_entitlements(
         # Monthly reset
         await monthly_plan_reset_if_due(session, ent, user.plan_tier)
         await session.commit()
+        await session.refresh(ent)
+        await invalidate_snapshot(redis, request.user_id, ent.version)
         return AdminResetResponse(
             success=True,
             message=f"Monthly plan reset for user {request.user_id}",
@@ -3,21 +3,31 @@
 RFC-8785 Canonical JSON Idempotency Middleware
 Features:
 - Deterministic JSON hashing (canonical key ordering)
-- Request body caching (24h TTL)
-- Replay detection with conflict handling
-- Automatic response replay
+- Atomic key claim in Redis (SET NX), compressed response replay (24h TTL)
+- Claim kept alive while the handler runs, so slow requests never re-execute
+- Concurrent duplicates wait for the first request instead of re-executing
+- Postgres archival via a batched background writer, consulted on Redis misses
+- Database-only fallback when Redis is unavailable
 """
 
 from fastapi import Request, Response
 from fastapi.responses import JSONResponse
-from sqlalchemy.ext.asyncio import AsyncSession
+from redis.exceptions import NoScriptError, RedisError
+import asyncio
 import hashlib
 import json
+import logging
+import time
+import zlib
 from canonicaljson import encode_canonical_json
 from datetime import datetime, timedelta, timezone
-from uuid import UUID
+from uuid import UUID, uuid4
 
+from ..config import settings
 from ..models import IdempotencyKey
+from ..services.idempotency_archiver import archive_record, write_records
+
+logger = logging.getLogger(__name__)
 
 
 IDEMPOTENT_ENDPOINTS = (
@@ -26,6 +36,30 @@ IDEMPOTENT_ENDPOINTS = (
     "/api/v1/tokens/refund",
 )
 
+REDIS_KEY = "idem:{key}"
+
+# Bodies below this size are stored uncompressed
+COMPRESS_MIN_BYTES = 256
+
+# KEYS[1] = idempotency key; ARGV = our pending claim, ttl seconds
+# Extends the claim only while it is still ours
+REFRESH_CLAIM_LUA = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('EXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+REFRESH_CLAIM_SHA = hashlib.sha1(REFRESH_CLAIM_LUA.encode()).hexdigest()
+
+# KEYS[1] = idempotency key; ARGV = our pending claim
+RELEASE_CLAIM_LUA = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+RELEASE_CLAIM_SHA = hashlib.sha1(RELEASE_CLAIM_LUA.encode()).hexdigest()
+
 
 async def extract_body(request: Request) -> bytes:
     """
@@ -41,6 +75,61 @@ async def extract_body(request: Request) -> bytes:
     return body
 
 
+def _encode_record(header: dict, body: bytes = b"") -> bytes:
+    """Redis value: one JSON header line, then the (optionally zlib'd) body."""
+    if len(body) >= COMPRESS_MIN_BYTES:
+        header["z"] = 1
+        body = zlib.compress(body)
+    return json.dumps(header, separators=(",", ":")).encode() + b"\n" + body
+
+
+def _decode_record(raw: bytes) -> tuple[dict, bytes]:
+    line, _, body = raw.partition(b"\n")
+    header = json.loads(line)
+    if header.get("z"):
+        body = zlib.decompress(body)
+    return header, body
+
+
+def _conflict(idem_uuid: UUID) -> JSONResponse:
+    return JSONResponse(
+        status_code=409,
+        content={
+            "error": "IDEMPOTENCY_CONFLICT",
+            "message": "Request body differs from cached request for this Idempotency-Key",
+            "idempotency_key": str(idem_uuid),
+        },
+        headers={"X-Idempotent-Replay": "mismatch"}
+    )
+
+
+def _cacheable(response: Response) -> bool:
+    """JSON responses worth replaying (retrying a 429/5xx should re-execute)."""
+    media_type = response.headers.get("content-type", "")
+    return (
+        media_type.startswith("application/json")
+        and response.status_code < 500
+        and response.status_code != 429
+    )
+
+
+async def _read_body(response: Response) -> bytes:
+    return b"".join([chunk async for chunk in response.body_iterator])
+
+
+def _replay_archived(rec: IdempotencyKey, idem_uuid: UUID, request_hash: str) -> JSONResponse:
+    if rec.request_hash != request_hash:
+        # Body mismatch - reject with 409 Conflict
+        return _conflict(idem_uuid)
+
+    # Body matches - replay cached response
+    return JSONResponse(
+        status_code=rec.response_status,
+        content=rec.response_body,
+        headers={"X-Idempotent-Replay": "true"}
+    )
+
+
 async def idempotency_middleware(request: Request, call_next):
     """
     RFC-8785 canonical JSON idempotency middleware.
@@ -49,13 +138,21 @@ async def idempotency_middleware(request: Request, call_next):
     1. Check if endpoint requires idempotency
     2. Extract Idempotency-Key header
     3. Compute RFC-8785 canonical hash of request body
-    4. Check database for existing idempotency key
-    5. If exists:
-       - If body hash matches: replay cached response
+    4. Claim the key in Redis (SET NX, short pending TTL)
+    5. If the key was already claimed:
        - If body hash differs: return 409 Conflict
-    6. If not exists:
-       - Proceed with request
-       - Cache response with idempotency key (24h TTL)
+       - If the first request finished: replay its cached response
+       - If it is still running: wait for it (bounded), then replay
+    6. If we claimed it:
+       - With IDEMPOTENCY_ARCHIVE_FALLBACK, replay from the Postgres archive
+         if the key is there (Redis lost it); off by default, so a new key
+         costs no database work here
+       - Proceed with request, refreshing the claim until it completes
+       - Store compressed response in Redis (24h TTL)
+       - Hand the record to the Postgres archiver (no inline transaction)
+
+    Falls back to the database-only flow when app.state.redis is missing or
+    Redis fails before the request is executed.
 
     Args:
         request: FastAPI Request
@@ -66,7 +163,7 @@ async def idempotency_middleware(request: Request, call_next):
 
     Headers:
         Idempotency-Key: UUID (required for idempotent endpoints)
-        X-Idempotent-Replay: "true"|"false"|"mismatch" (added to response)
+        X-Idempotent-Replay: "true"|"false"|"mismatch"|"pending" (added to response)
     """
     # Only process POST requests to idempotent endpoints
     if request.method != "POST":
@@ -106,6 +203,187 @@ async def idempotency_middleware(request: Request, call_next):
     canonical = encode_canonical_json(body_json)
     request_hash = hashlib.sha256(canonical).hexdigest()
 
+    redis = getattr(request.app.state, "redis", None)
+    if redis is None:
+        return await _db_idempotency(request, call_next, idem_uuid, request_hash)
+
+    key = REDIS_KEY.format(key=idem_uuid)
+    deadline = time.monotonic() + settings.idempotency_wait_seconds
+    delay = 0.02
+
+    claim = _encode_record({"hash": request_hash, "state": "pending", "owner": uuid4().hex})
+
+    while True:
+        try:
+            claimed = await redis.set(
+                key,
+                claim,
+                nx=True,
+                ex=settings.idempotency_pending_ttl_seconds,
+            )
+            raw = None if claimed else await redis.get(key)
+        except RedisError as exc:
+            logger.warning("Idempotency store unavailable, using database: %s", exc)
+            return await _db_idempotency(request, call_next, idem_uuid, request_hash)
+
+        if claimed:
+            break
+        if raw is None:
+            # Released or expired between SET and GET - try to claim again
+            continue
+
+        header, cached_body = _decode_record(raw)
+        if header["hash"] != request_hash:
+            # Body mismatch - reject with 409 Conflict
+            return _conflict(idem_uuid)
+
+        if header["state"] == "done":
+            # Body matches - replay cached response
+            return Response(
+                content=cached_body,
+                status_code=header["status"],
+                media_type=header["media_type"],
+                headers={"X-Idempotent-Replay": "true"},
+            )
+
+        # Same request still executing elsewhere: wait for its result
+        if time.monotonic() >= deadline:
+            return JSONResponse(
+                status_code=409,
+                content={
+                    "error": "IDEMPOTENCY_IN_PROGRESS",
+                    "message": "A request with this Idempotency-Key is still being processed",
+                    "idempotency_key": str(idem_uuid),
+                },
+                headers={"X-Idempotent-Replay": "pending"},
+            )
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, 0.2)
+
+    # Redis has no record: a new key, or (after Redis data loss) a completed one
+    if settings.idempotency_archive_fallback:
+        archived = await _find_archived(request, idem_uuid)
+        if archived is not None:
+            await _release(redis, key, claim)
+            return _replay_archived(archived, idem_uuid, request_hash)
+
+    # We own the key - proceed with request, keeping the claim alive
+    heartbeat = asyncio.create_task(_keep_claim(redis, key, claim))
+    try:
+        try:
+            response: Response = await call_next(request)
+        except BaseException:
+            await _release(redis, key, claim)
+            raise
+
+        if not _cacheable(response):
+            await _release(redis, key, claim)
+            return response
+
+        response_body = await _read_body(response)
+        now = datetime.now(timezone.utc)
+        ttl = timedelta(hours=settings.idempotency_ttl_hours)
+
+        try:
+            await redis.set(
+                key,
+                _encode_record(
+                    {
+                        "hash": request_hash,
+                        "state": "done",
+                        "status": response.status_code,
+                        "media_type": response.headers.get("content-type"),
+                    },
+                    response_body,
+                ),
+                ex=int(ttl.total_seconds()),
+            )
+        except RedisError as exc:
+            logger.warning("Failed to cache idempotent response %s: %s", idem_uuid, exc)
+    finally:
+        heartbeat.cancel()
+
+    await _archive(
+        request,
+        archive_record(
+            idempotency_key=idem_uuid,
+            user_id=getattr(request.state, "user_id", None),
+            endpoint=request.url.path,
+            request_hash=request_hash,
+            response_status=response.status_code,
+            response_body=response_body,
+            created_at=now,
+            expires_at=now + ttl,
+        ),
+    )
+
+    new_response = Response(
+        content=response_body,
+        status_code=response.status_code,
+        headers=dict(response.headers)
+    )
+    new_response.headers["X-Idempotent-Replay"] = "false"
+
+    return new_response
+
+
+async def _eval_script(redis, script: str, sha: str, key: str, *args):
+    try:
+        return await redis.evalsha(sha, 1, key, *args)
+    except NoScriptError:
+        await redis.script_load(script)
+        return await redis.evalsha(sha, 1, key, *args)
+
+
+async def _keep_claim(redis, key: str, claim: bytes) -> None:
+    """Extend our pending claim until cancelled, so a slow handler keeps it."""
+    ttl = settings.idempotency_pending_ttl_seconds
+    while True:
+        await asyncio.sleep(ttl / 3)
+        try:
+            if not await _eval_script(
+                redis, REFRESH_CLAIM_LUA, REFRESH_CLAIM_SHA, key, claim, ttl
+            ):
+                logger.warning("Lost idempotency claim %s while executing", key)
+                return
+        except RedisError as exc:
+            logger.warning("Failed to refresh idempotency claim %s: %s", key, exc)
+
+
+async def _release(redis, key: str, claim: bytes) -> None:
+    """Drop our pending claim so a retry can execute."""
+    try:
+        await _eval_script(redis, RELEASE_CLAIM_LUA, RELEASE_CLAIM_SHA, key, claim)
+    except RedisError as exc:
+        logger.warning("Failed to release idempotency claim %s: %s", key, exc)
+
+
+async def _find_archived(request: Request, idem_uuid: UUID) -> IdempotencyKey | None:
+    """Archived record for a key Redis no longer has (None if absent or unreachable)."""
+    try:
+        async with request.app.state.db() as session:
+            return await session.get(IdempotencyKey, idem_uuid)
+    except Exception:
+        logger.exception("Idempotency archive lookup failed for %s", idem_uuid)
+        return None
+
+
+async def _archive(request: Request, record: dict) -> None:
+    """Queue the record for batched Postgres archival (inline if no archiver runs)."""
+    archiver = getattr(request.app.state, "idempotency_archiver", None)
+    if archiver is not None:
+        archiver.submit(record)
+        return
+
+    try:
+        async with request.app.state.db() as session:
+            await write_records(session, [record])
+    except Exception:
+        logger.exception("Failed to archive idempotency record %s", record["idempotency_key"])
+
+
+async def _db_idempotency(request: Request, call_next, idem_uuid: UUID, request_hash: str):
+    """Database-only idempotency (used when Redis is unavailable)."""
     # Lookup existing idempotency key in database
     # Note: request.app.state.db is an async session factory (set in startup)
     async with request.app.state.db() as session:
@@ -113,35 +391,14 @@ async def idempotency_middleware(request: Request, call_next):
 
         if rec:
             # Idempotency key exists - check for conflicts
-            if rec.request_hash != request_hash:
-                # Body mismatch - reject with 409 Conflict
-                return JSONResponse(
-                    status_code=409,
-                    content={
-                        "error": "IDEMPOTENCY_CONFLICT",
-                        "message": "Request body differs from cached request for this Idempotency-Key",
-                        "idempotency_key": str(idem_uuid),
-                    },
-                    headers={"X-Idempotent-Replay": "mismatch"}
-                )
-
-            # Body matches - replay cached response
-            return JSONResponse(
-                status_code=rec.response_status,
-                content=rec.response_body,
-                headers={"X-Idempotent-Replay": "true"}
-            )
+            return _replay_archived(rec, idem_uuid, request_hash)
 
     # No existing idempotency key - proceed with request
     response: Response = await call_next(request)
 
     # Cache response for future replays (only JSON responses)
     try:
-        # Read response body
-        response_body = b""
-        async for chunk in response.body_iterator:
-            response_body += chunk
-
+        response_body = await _read_body(response)
         content = json.loads(response_body.decode("utf-8"))
     except Exception:
         # Non-JSON response or read error - skip caching
@@ -149,7 +406,7 @@ async def idempotency_middleware(request: Request, call_next):
 
     # Store idempotency key with response
     now = datetime.now(timezone.utc)
-    expires = now + timedelta(hours=24)
+    expires = now + timedelta(hours=settings.idempotency_ttl_hours)
 
     async with request.app.state.db() as session:
         ik = IdempotencyKey(
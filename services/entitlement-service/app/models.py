@@ -86,7 +86,9 @@ class TokenLedger(Base):
     """Immutable audit trail for all token transactions."""
     __tablename__ = "token_ledger"
 
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True
+    )
     user_id: Mapped[UUID] = mapped_column(
         GUID(),
         ForeignKey("users.user_id", ondelete="CASCADE"),
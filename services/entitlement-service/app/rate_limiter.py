@@ -1,10 +1,24 @@
 # -*- coding: utf-8 -*-
 """
 Redis-based rate limiting
-Fixed window rate limiter (can be upgraded to token bucket with Lua script)
+Token bucket evaluated server-side in a single Lua call (EVALSHA, cached script)
+Features:
+- One Redis round trip per check (no INCR/EXPIRE/TTL sequence)
+- Smooth refill: no 2x bursts at fixed-window edges
+- Per-route rules (entitlements, consume, reward SSV) read from settings
+- In-process shedding of callers Redis has already rejected
 """
 
+import hashlib
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
 from redis.asyncio import Redis
+from redis.exceptions import NoScriptError
+
+from .config import settings
 
 
 class RateLimitExceeded(Exception):
@@ -15,9 +29,158 @@ class RateLimitExceeded(Exception):
         super().__init__(f"Rate limit exceeded. Retry after {retry_after} seconds.")
 
 
+# KEYS[1] = bucket hash; ARGV = capacity, refill tokens/sec, cost
+# Returns {allowed (0|1), retry_after_ms, tokens_left (floored)}
+TOKEN_BUCKET_LUA = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2]) / 1000.0
+local cost = tonumber(ARGV[3])
+
+local t = redis.call('TIME')
+local now = t[1] * 1000 + math.floor(t[2] / 1000)
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+
+local allowed = 0
+local retry_ms = 0
+if tokens >= cost then
+    tokens = tokens - cost
+    allowed = 1
+else
+    retry_ms = math.ceil((cost - tokens) / rate)
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate))
+return {allowed, retry_ms, math.floor(tokens)}
+"""
+TOKEN_BUCKET_SHA = hashlib.sha1(TOKEN_BUCKET_LUA.encode()).hexdigest()
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    """Token bucket shape: burst ``capacity``, refilled at ``refill_per_sec``."""
+
+    capacity: int
+    refill_per_sec: float
+
+    @classmethod
+    def per_window(cls, limit: int, window_sec: int = 60, burst: int | None = None):
+        """``limit`` requests per ``window_sec`` on average, bursting to ``burst``."""
+        return cls(capacity=burst or limit, refill_per_sec=limit / window_sec)
+
+
+def route_rule(route: str) -> RateLimitRule:
+    """
+    Rule for a named route, read from settings on every call.
+
+    Routes: "entitlements", "consume", "reward_ssv".
+    """
+    if route == "entitlements":
+        return RateLimitRule.per_window(
+            settings.rate_limit_entitlements_rpm, burst=settings.rate_limit_entitlements_burst
+        )
+    if route == "consume":
+        return RateLimitRule.per_window(
+            settings.rate_limit_consume_rpm, burst=settings.rate_limit_consume_burst
+        )
+    if route == "reward_ssv":
+        return RateLimitRule.per_window(
+            settings.rate_limit_reward_rpm, burst=settings.rate_limit_reward_burst
+        )
+    raise ValueError(f"Unknown rate limit route: {route}")
+
+
+class _LocalShedder:
+    """
+    Per-process "blocked until" table for keys Redis has just rejected.
+
+    A rejected caller cannot be allowed again before its retry-after elapses,
+    so repeat attempts inside that window are refused without a Redis call.
+    Bounded LRU so abusive key churn cannot grow it without limit.
+    """
+
+    def __init__(self, max_entries: int = 10_000):
+        self.max_entries = max_entries
+        self._blocked: OrderedDict[str, float] = OrderedDict()
+
+    def retry_after(self, key: str, now: float) -> float | None:
+        until = self._blocked.get(key)
+        if until is None:
+            return None
+        if until <= now:
+            del self._blocked[key]
+            return None
+        return until - now
+
+    def block(self, key: str, until: float) -> None:
+        self._blocked[key] = until
+        self._blocked.move_to_end(key)
+        while len(self._blocked) > self.max_entries:
+            self._blocked.popitem(last=False)
+
+    def clear(self) -> None:
+        self._blocked.clear()
+
+
+local_shedder = _LocalShedder()
+
+
+async def _eval_bucket(redis: Redis, key: str, rule: RateLimitRule, cost: int):
+    args = (rule.capacity, rule.refill_per_sec, cost)
+    try:
+        return await redis.evalsha(TOKEN_BUCKET_SHA, 1, key, *args)
+    except NoScriptError:
+        # Script cache flushed or new Redis node: load once, then EVALSHA again
+        await redis.script_load(TOKEN_BUCKET_LUA)
+        return await redis.evalsha(TOKEN_BUCKET_SHA, 1, key, *args)
+
+
+async def consume_rate_limit(redis: Redis, key: str, rule: RateLimitRule, cost: int = 1) -> int:
+    """
+    Take ``cost`` tokens from the bucket at ``key``.
+
+    Args:
+        redis: Redis client instance
+        key: Bucket key (e.g., "rl:consume:user_id")
+        rule: Bucket capacity and refill rate
+        cost: Tokens this request uses (default: 1)
+
+    Returns:
+        Whole tokens left in the bucket
+
+    Raises:
+        RateLimitExceeded: If the bucket cannot cover ``cost``
+    """
+    now = time.monotonic()
+    pending = local_shedder.retry_after(key, now)
+    if pending is not None:
+        raise RateLimitExceeded(retry_after=math.ceil(pending))
+
+    allowed, retry_ms, tokens_left = await _eval_bucket(redis, key, rule, cost)
+    if not allowed:
+        local_shedder.block(key, now + retry_ms / 1000)
+        raise RateLimitExceeded(retry_after=math.ceil(retry_ms / 1000))
+
+    return tokens_left
+
+
+async def check_route_rate_limit(redis: Redis, route: str, subject: str) -> int:
+    """
+    Apply the per-route rule to ``subject`` (user id).
+
+    Example:
+        await check_route_rate_limit(redis, "consume", user_id)
+    """
+    return await consume_rate_limit(redis, f"rl:{route}:{subject}", route_rule(route))
+
+
 async def check_rate_limit(redis: Redis, key: str, limit: int, window_sec: int = 60):
     """
-    Check and increment rate limit counter using fixed window algorithm.
+    Token-bucket check allowing ``limit`` requests per ``window_sec``.
 
     Args:
         redis: Redis client instance
@@ -31,16 +194,4 @@ async def check_rate_limit(redis: Redis, key: str, limit: int, window_sec: int =
     Example:
         await check_rate_limit(redis, f"rl:consume:{user_id}", 10, 60)
     """
-    cur = await redis.incr(key)
-
-    if cur == 1:
-        # First request in window - set expiry
-        await redis.expire(key, window_sec)
-
-    if cur > limit:
-        # Rate limit exceeded
-        ttl = await redis.ttl(key)
-        ttl = max(ttl, 0)  # Handle expired keys
-        raise RateLimitExceeded(retry_after=ttl)
-
-    return cur
+    return await consume_rate_limit(redis, key, RateLimitRule.per_window(limit, window_sec))
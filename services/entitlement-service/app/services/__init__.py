@@ -3,6 +3,8 @@
 
 from .token_service import (
     consume_tokens_once,
+    consume_tokens_atomic,
+    ConsumeResult,
     OptimisticLockError,
     InsufficientTokensError,
     compute_bucket_draw,
@@ -10,12 +12,22 @@ from .token_service import (
 from .quota_service import (
     lazy_daily_reset_if_needed,
     monthly_plan_reset_if_due,
+    run_daily_reset,
+    DailyResetReport,
 )
 from .ssv_verifier import (
     verify_admob_ssv,
     ssv_request_hash,
     fetch_keys,
 )
+from .entitlement_cache import (
+    get_snapshot,
+    store_snapshot,
+    invalidate_snapshot,
+)
+from .idempotency_archiver import (
+    IdempotencyArchiver,
+)
 from .fraud_detector import (
     detect_fraud,
     FraudDecision,
@@ -23,14 +35,22 @@ from .fraud_detector import (
 
 __all__ = [
     "consume_tokens_once",
+    "consume_tokens_atomic",
+    "ConsumeResult",
     "OptimisticLockError",
     "InsufficientTokensError",
     "compute_bucket_draw",
     "lazy_daily_reset_if_needed",
     "monthly_plan_reset_if_due",
+    "run_daily_reset",
+    "DailyResetReport",
     "verify_admob_ssv",
     "ssv_request_hash",
     "fetch_keys",
+    "get_snapshot",
+    "store_snapshot",
+    "invalidate_snapshot",
+    "IdempotencyArchiver",
     "detect_fraud",
     "FraudDecision",
 ]
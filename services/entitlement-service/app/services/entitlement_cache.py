@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""
+Entitlement Snapshot Cache - Redis read-through cache for GET /entitlements
+Features:
+- One MGET per hit (snapshot + version floor), no Postgres access
+- Entitlement ``version`` column as the coherence token
+- TTL capped at the next daily (00:00 KST) and monthly reset boundary
+- Fails open: Redis errors fall back to the database path
+"""
+
+import hashlib
+import json
+import logging
+from datetime import datetime, timedelta, timezone
+
+from redis.asyncio import Redis
+from redis.exceptions import NoScriptError, RedisError
+
+from ..config import settings
+from ..instrumentation.metrics import entitlement_cache_lookups
+from ..models import Entitlement
+from ..utils.time_kst import ensure_utc, midnight_kst
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_KEY = "ent:snap:{user_id}"
+FLOOR_KEY = "ent:floor:{user_id}"
+
+# Mirrors monthly_plan_reset_if_due
+MONTHLY_RESET_INTERVAL = timedelta(days=30)
+
+# KEYS[1] = floor key; ARGV = version, ttl seconds
+# Only ever raises the floor, so writers publishing out of order cannot lower it
+RAISE_FLOOR_LUA = """
+local current = tonumber(redis.call('GET', KEYS[1]))
+local version = tonumber(ARGV[1])
+if current == nil or version > current then
+    redis.call('SET', KEYS[1], version, 'EX', ARGV[2])
+    return version
+end
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+return current
+"""
+RAISE_FLOOR_SHA = hashlib.sha1(RAISE_FLOOR_LUA.encode()).hexdigest()
+
+
+def build_snapshot(ent: Entitlement, plan_tier: str) -> dict:
+    """Serializable entitlement snapshot (everything GET /entitlements needs)."""
+    return {
+        "version": ent.version,
+        "plan_tier": plan_tier,
+        "plan_tokens_available": ent.plan_tokens_available,
+        "earned_tokens_available": ent.earned_tokens_available,
+        "bonus_tokens_available": ent.bonus_tokens_available,
+        "light_daily_limit": ent.light_daily_limit,
+        "light_daily_used": ent.light_daily_used,
+        "deep_tokens_limit": ent.deep_tokens_limit,
+        "ad_rewards_today": ent.ad_rewards_today,
+        "ad_rewards_this_month": ent.ad_rewards_this_month,
+    }
+
+
+def snapshot_ttl(ent: Entitlement, now: datetime | None = None) -> int:
+    """
+    Seconds a snapshot of ``ent`` may live.
+
+    Capped so no hit can outlive a lazy reset: the next 00:00 KST (daily
+    quotas) and the monthly plan refill. Returns 0 when a reset is already due.
+    """
+    now = now or datetime.now(timezone.utc)
+    expires = midnight_kst(now) + timedelta(days=1)
+
+    last_reset = ent.deep_tokens_last_reset or ent.plan_renewal_anchor
+    if last_reset is not None:
+        expires = min(expires, ensure_utc(last_reset) + MONTHLY_RESET_INTERVAL)
+
+    ttl = int((expires - now).total_seconds())
+    return max(0, min(ttl, settings.entitlement_cache_ttl_seconds))
+
+
+async def get_snapshot(redis: Redis, user_id: str) -> dict | None:
+    """
+    Return the cached snapshot, or None on miss.
+
+    A snapshot older than the published version floor counts as a miss.
+    """
+    if not settings.entitlement_cache_enabled:
+        return None
+
+    try:
+        raw, floor = await redis.mget(
+            SNAPSHOT_KEY.format(user_id=user_id), FLOOR_KEY.format(user_id=user_id)
+        )
+    except RedisError as exc:
+        logger.warning("Entitlement cache read failed for %s: %s", user_id, exc)
+        entitlement_cache_lookups.labels(result="error").inc()
+        return None
+
+    if raw is None:
+        entitlement_cache_lookups.labels(result="miss").inc()
+        return None
+
+    snapshot = json.loads(raw)
+    if floor is not None and snapshot["version"] < int(floor):
+        entitlement_cache_lookups.labels(result="stale").inc()
+        return None
+
+    entitlement_cache_lookups.labels(result="hit").inc()
+    return snapshot
+
+
+async def store_snapshot(redis: Redis, user_id: str, snapshot: dict, ttl: int) -> None:
+    """Write a snapshot read from the database (no-op when ``ttl`` is 0)."""
+    if not settings.entitlement_cache_enabled or ttl <= 0:
+        return
+
+    try:
+        await redis.set(
+            SNAPSHOT_KEY.format(user_id=user_id),
+            json.dumps(snapshot, separators=(",", ":")),
+            ex=ttl,
+        )
+    except RedisError as exc:
+        logger.warning("Entitlement cache write failed for %s: %s", user_id, exc)
+
+
+async def invalidate_snapshot(redis: Redis, user_id: str, version: int) -> None:
+    """
+    Publish ``version`` as the floor for cached snapshots of ``user_id``.
+
+    Call after committing a write that bumped the entitlement version. A
+    reader that loaded an older row and stores it after this call is still
+    rejected on the next lookup, which a plain DEL would not catch. The floor
+    outlives any snapshot stored before it and never moves backwards, so
+    concurrent writers may publish in any order.
+    """
+    if not settings.entitlement_cache_enabled:
+        return
+
+    key = FLOOR_KEY.format(user_id=user_id)
+    args = (version, settings.entitlement_cache_ttl_seconds)
+    try:
+        try:
+            await redis.evalsha(RAISE_FLOOR_SHA, 1, key, *args)
+        except NoScriptError:
+            await redis.script_load(RAISE_FLOOR_LUA)
+            await redis.evalsha(RAISE_FLOOR_SHA, 1, key, *args)
+    except RedisError as exc:
+        logger.warning("Entitlement cache invalidation failed for %s: %s", user_id, exc)
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""
+Idempotency Archiver - batched Postgres write-behind for idempotency records
+Features:
+- Request path only enqueues (no DB transaction per idempotent POST)
+- Multi-row INSERT ... ON CONFLICT DO NOTHING per batch
+- Bounded queue; drains on shutdown
+"""
+
+import asyncio
+import json
+import logging
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from ..models import IdempotencyKey
+
+logger = logging.getLogger(__name__)
+
+
+def archive_record(
+    idempotency_key: UUID,
+    user_id: str | None,
+    endpoint: str,
+    request_hash: str,
+    response_status: int,
+    response_body: bytes,
+    created_at: datetime,
+    expires_at: datetime,
+) -> dict:
+    """Archive row for one completed idempotent request (body still raw JSON bytes)."""
+    return {
+        "idempotency_key": idempotency_key,
+        "user_id": UUID(user_id) if user_id else None,
+        "endpoint": endpoint,
+        "request_hash": request_hash,
+        "response_status": response_status,
+        "response_body": response_body,
+        "created_at": created_at,
+        "expires_at": expires_at,
+    }
+
+
+async def write_records(session: AsyncSession, records: list[dict]) -> None:
+    """Insert archive rows, skipping keys already archived."""
+    rows = []
+    for record in records:
+        row = dict(record)
+        try:
+            row["response_body"] = json.loads(record["response_body"])
+        except ValueError:
+            row["response_body"] = None
+        rows.append(row)
+
+    dialect = session.get_bind().dialect.name
+    if dialect == "postgresql":
+        stmt = postgresql.insert(IdempotencyKey).on_conflict_do_nothing()
+    elif dialect == "sqlite":
+        stmt = sqlite.insert(IdempotencyKey).on_conflict_do_nothing()
+    else:
+        stmt = IdempotencyKey.__table__.insert()
+
+    await session.execute(stmt, rows)
+    await session.commit()
+
+
+class IdempotencyArchiver:
+    """
+    Background task that persists idempotency records in batches.
+
+    Redis is the serving store; the Postgres table is the durable archive.
+    Records are flushed when ``batch_size`` accumulate or ``flush_interval``
+    seconds pass, whichever comes first.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        batch_size: int = 200,
+        flush_interval: float = 0.5,
+        max_pending: int = 10_000,
+    ):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: asyncio.Queue[dict] = asyncio.Queue(maxsize=max_pending)
+        self._task: asyncio.Task | None = None
+        self._inflight: asyncio.Future | None = None
+
+    def submit(self, record: dict) -> None:
+        """Enqueue a record without waiting; drops it (logged) when the queue is full."""
+        try:
+            self._queue.put_nowait(record)
+        except asyncio.QueueFull:
+            logger.warning("Idempotency archive queue full; dropping %s", record["idempotency_key"])
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="idempotency-archiver")
+
+    async def stop(self) -> None:
+        """Stop the worker and flush whatever is still queued."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._inflight is not None:
+            await self._inflight
+            self._inflight = None
+        await self.flush()
+
+    async def flush(self) -> None:
+        """Write everything currently queued."""
+        while not self._queue.empty():
+            size = min(self.batch_size, self._queue.qsize())
+            batch = [self._queue.get_nowait() for _ in range(size)]
+            await self._write(batch)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            try:
+                deadline = loop.time() + self.flush_interval
+                while len(batch) < self.batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+            finally:
+                # Records already dequeued are written even if we are being stopped
+                self._inflight = asyncio.ensure_future(self._write(batch))
+                await asyncio.shield(self._inflight)
+
+    async def _write(self, batch: list[dict]) -> None:
+        try:
+            async with self.session_factory() as session:
+                await write_records(session, batch)
+        except Exception:
+            logger.exception("Failed to archive %d idempotency records", len(batch))
@@ -2,19 +2,175 @@
 """
 Quota Service - KST-aligned quota reset logic
 Features:
-- Lazy daily resets (00:00 KST)
+- Scheduled daily reset in keyset-paginated, resumable chunks (00:00 KST)
+- Lazy daily resets as a per-user fallback
 - Monthly plan resets (subscription renewal date)
 - Ledger entries for monthly resets
 """
 
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
 from sqlalchemy import update, func, select
-from sqlalchemy.ext.asyncio import AsyncSession
-from datetime import datetime, timedelta, timezone
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from datetime import date, datetime, timedelta, timezone
 from uuid import UUID
 
-from ..utils.time_kst import today_kst
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from ..config import settings
+from ..utils.time_kst import ensure_utc, today_kst
 from ..models import Entitlement, TokenLedger
-from ..instrumentation.metrics import daily_quota_reset_total, monthly_quota_reset_total
+from ..instrumentation.metrics import (
+    daily_quota_reset_total,
+    daily_reset_batches,
+    daily_reset_batch_duration,
+    monthly_quota_reset_total,
+)
+
+logger = logging.getLogger(__name__)
+
+# Last user_id committed by the scheduled reset for a KST day
+DAILY_RESET_CURSOR_KEY = "quota:daily_reset:{day}"
+DAILY_RESET_CURSOR_TTL = int(timedelta(days=2).total_seconds())
+
+
+@dataclass
+class DailyResetReport:
+    """Outcome of one run_daily_reset call."""
+
+    day: date
+    users_reset: int = 0
+    batches: int = 0
+    resumed_from: UUID | None = None
+    cursor: UUID | None = None
+
+
+async def reset_daily_quota_batch(
+    session: AsyncSession,
+    after: UUID | None,
+    today: date,
+    batch_size: int,
+) -> tuple[int, UUID | None]:
+    """
+    Reset the next chunk of users still on an earlier day, in one transaction.
+
+    Keyset pagination on the primary key: the chunk is the first
+    ``batch_size`` users past ``after`` whose light_last_reset_date < today.
+    Rows reset lazily in the meantime fail the same predicate and are skipped.
+
+    Returns:
+        (rows reset, last user_id of the chunk), or (0, None) when done
+    """
+    pending = (
+        select(Entitlement.user_id)
+        .where(Entitlement.light_last_reset_date < today)
+        .order_by(Entitlement.user_id)
+        .limit(batch_size)
+    )
+    if after is not None:
+        pending = pending.where(Entitlement.user_id > after)
+
+    keys = (await session.execute(pending)).scalars().all()
+    if not keys:
+        return 0, None
+
+    bounds = [Entitlement.user_id <= keys[-1]]
+    if after is not None:
+        bounds.append(Entitlement.user_id > after)
+
+    result = await session.execute(
+        update(Entitlement)
+        .where(*bounds, Entitlement.light_last_reset_date < today)
+        .values(
+            light_daily_used=0,
+            light_last_reset_date=today,
+            ad_rewards_today=0,
+            updated_at=func.now(),
+            version=Entitlement.version + 1,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    await session.commit()
+    return result.rowcount, keys[-1]
+
+
+async def run_daily_reset(
+    session_factory: async_sessionmaker[AsyncSession],
+    redis: Redis | None = None,
+    today: date | None = None,
+    batch_size: int | None = None,
+    pause_seconds: float | None = None,
+) -> DailyResetReport:
+    """
+    Reset daily quotas for every user, chunk by chunk.
+
+    Each chunk is its own short transaction, so row locks are held for one
+    batch only and consumes arriving at midnight are not stalled behind a
+    table-wide UPDATE. The committed cursor is kept in Redis; a rerun for the
+    same day (after a crash or deploy) continues from it.
+
+    Args:
+        session_factory: Async session factory
+        redis: Optional Redis client for the resume cursor
+        today: KST day to reset to (default: today_kst())
+        batch_size: Rows per chunk (default: settings.daily_reset_batch_size)
+        pause_seconds: Sleep between chunks (default: settings.daily_reset_pause_seconds)
+
+    Returns:
+        DailyResetReport
+    """
+    today = today or today_kst()
+    batch_size = batch_size or settings.daily_reset_batch_size
+    if pause_seconds is None:
+        pause_seconds = settings.daily_reset_pause_seconds
+
+    cursor_key = DAILY_RESET_CURSOR_KEY.format(day=today.isoformat())
+    after = await _load_cursor(redis, cursor_key)
+    report = DailyResetReport(day=today, resumed_from=after, cursor=after)
+
+    while True:
+        started = time.perf_counter()
+        async with session_factory() as session:
+            count, last = await reset_daily_quota_batch(session, after, today, batch_size)
+        if last is None:
+            break
+
+        after = last
+        report.users_reset += count
+        report.batches += 1
+        report.cursor = after
+        daily_quota_reset_total.inc(count)
+        daily_reset_batches.inc()
+        daily_reset_batch_duration.observe(time.perf_counter() - started)
+        await _save_cursor(redis, cursor_key, after)
+
+        if pause_seconds > 0:
+            await asyncio.sleep(pause_seconds)
+
+    return report
+
+
+async def _load_cursor(redis: Redis | None, key: str) -> UUID | None:
+    if redis is None:
+        return None
+    try:
+        raw = await redis.get(key)
+    except RedisError as exc:
+        logger.warning("Daily reset cursor unavailable, starting over: %s", exc)
+        return None
+    return UUID(raw.decode() if isinstance(raw, bytes) else raw) if raw else None
+
+
+async def _save_cursor(redis: Redis | None, key: str, cursor: UUID) -> None:
+    if redis is None:
+        return
+    try:
+        await redis.set(key, str(cursor), ex=DAILY_RESET_CURSOR_TTL)
+    except RedisError as exc:
+        logger.warning("Failed to save daily reset cursor: %s", exc)
 
 
 async def lazy_daily_reset_if_needed(session: AsyncSession, ent: Entitlement):
@@ -30,8 +186,8 @@ async def lazy_daily_reset_if_needed(session: AsyncSession, ent: Entitlement):
         session: Async SQLAlchemy session
         ent: Entitlement record to check/reset
 
-    Note: This is called on every /entitlements fetch for automatic reset.
-          APScheduler can also run this as a scheduled job at 00:00 KST.
+    Note: Fallback for users the scheduled run_daily_reset has not reached
+          yet; called on every /entitlements fetch.
     """
     tk = today_kst()
 
@@ -45,6 +201,7 @@ async def lazy_daily_reset_if_needed(session: AsyncSession, ent: Entitlement):
                 light_last_reset_date=tk,
                 ad_rewards_today=0,
                 updated_at=func.now(),
+                version=Entitlement.version + 1,
             )
         )
 
@@ -76,7 +233,7 @@ async def monthly_plan_reset_if_due(
     """
     now = datetime.now(timezone.utc)
     anchor = ent.plan_renewal_anchor or now
-    last_reset = ent.deep_tokens_last_reset or anchor
+    last_reset = ensure_utc(ent.deep_tokens_last_reset or anchor)
 
     # Check if approximately 30 days have passed since last reset
     # For production: use dateutil.relativedelta for exact month calculations
@@ -94,6 +251,7 @@ async def monthly_plan_reset_if_due(
                     deep_tokens_last_reset=now,
                     ad_rewards_this_month=0,
                     updated_at=func.now(),
+                    version=Entitlement.version + 1,
                 )
             )
 
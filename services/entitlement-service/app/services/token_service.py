@@ -3,21 +3,43 @@
 Token Service - Core token consumption logic
 Features:
 - Three-bucket token system (earned → bonus → plan)
-- Optimistic locking with automatic retry
+- Single-statement atomic draw (bucket split, balance update and ledger insert)
 - Business-entity uniqueness (prevents double-deduction)
 - Complete audit trail
 """
 
-from sqlalchemy import select, update, func
-from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Dict
+from dataclasses import dataclass
 from uuid import UUID
 
+from sqlalchemy import (
+    String,
+    Text,
+    and_,
+    case,
+    exists,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    true,
+    update,
+)
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..db_types import GUID, Inet
 from ..models import Entitlement, TokenLedger
 
 
 class OptimisticLockError(Exception):
-    """Raised when optimistic lock version check fails."""
+    """
+    Raised when optimistic lock version check fails.
+
+    The atomic consume path serialises on the entitlement row lock instead of
+    a version check, so it never raises this; kept for existing callers.
+    """
+
     pass
 
 
@@ -30,6 +52,15 @@ class InsufficientTokensError(Exception):
         super().__init__(f"Insufficient tokens: need {required}, have {available}")
 
 
+@dataclass(frozen=True)
+class ConsumeResult:
+    """Ledger row written (or replayed) by a consume call."""
+
+    ledger: TokenLedger
+    replayed: bool
+    version: int | None = None  # entitlement version after the draw; None on replay
+
+
 # CRITICAL: Spend order ensures fairness (use free tokens before paid plan tokens)
 BUCKET_ORDER = ("earned", "bonus", "plan")
 
@@ -70,7 +101,231 @@ async def compute_bucket_draw(available: dict, amount: int) -> dict:
     return draw
 
 
-async def consume_tokens_once(
+_BUCKET_COLUMNS = {
+    "earned": Entitlement.earned_tokens_available,
+    "bonus": Entitlement.bonus_tokens_available,
+    "plan": Entitlement.plan_tokens_available,
+}
+
+_LEDGER_COLUMNS = tuple(TokenLedger.__table__.c)
+
+
+def _total_tokens():
+    """SQL expression: sum of the three bucket balances."""
+    return (
+        Entitlement.earned_tokens_available
+        + Entitlement.bonus_tokens_available
+        + Entitlement.plan_tokens_available
+    )
+
+
+def _bucket_draw_values(amount: int) -> dict:
+    """
+    SQL mirror of compute_bucket_draw: SET clauses for one UPDATE.
+
+    Each bucket gives min(balance, remaining) in BUCKET_ORDER; the last one
+    takes the remainder outright. Every expression reads the pre-update row, so
+    the split is computed under the same row lock that applies it. Callers must
+    guard the UPDATE with total >= amount.
+    """
+    values = {}
+    remaining = literal(amount)
+    for bucket in BUCKET_ORDER:
+        column = _BUCKET_COLUMNS[bucket]
+        if bucket == BUCKET_ORDER[-1]:
+            take = remaining
+        else:
+            take = case((column < remaining, column), else_=remaining)
+        values[column.key] = column - take
+        remaining = remaining - take
+    return values
+
+
+def _draw_statement(user_id: UUID, amount: int, *guards):
+    """Conditional UPDATE drawing ``amount``; returns new total and version, or no row."""
+    return (
+        update(Entitlement)
+        .where(Entitlement.user_id == user_id, _total_tokens() >= amount, *guards)
+        .values(
+            **_bucket_draw_values(amount),
+            version=Entitlement.version + 1,
+            updated_at=func.now(),
+        )
+        .returning(_total_tokens().label("tokens_after"), Entitlement.version)
+    )
+
+
+def _replay_clause(
+    user_id: UUID,
+    idem_key: UUID | None,
+    related_type: str | None,
+    related_id: str | None,
+):
+    """Match an earlier consume by Idempotency-Key or business entity (or None)."""
+    matches = []
+    if idem_key is not None:
+        matches.append(TokenLedger.idempotency_key == idem_key)
+    if related_type and related_id:
+        matches.append(
+            and_(
+                TokenLedger.transaction_type == "consume",
+                TokenLedger.related_entity_type == related_type,
+                TokenLedger.related_entity_id == related_id,
+            )
+        )
+    if not matches:
+        return None
+    return and_(TokenLedger.user_id == user_id, or_(*matches))
+
+
+async def _find_replay(session: AsyncSession, replay) -> TokenLedger | None:
+    if replay is None:
+        return None
+    res = await session.execute(select(TokenLedger).where(replay).limit(1))
+    return res.scalar_one_or_none()
+
+
+def _ledger_from_row(row, prefix: str) -> TokenLedger:
+    """Detached TokenLedger built from prefixed CTE columns (no extra SELECT)."""
+    return TokenLedger(**{col.key: getattr(row, prefix + col.name) for col in _LEDGER_COLUMNS})
+
+
+async def _consume_postgres(
+    session: AsyncSession,
+    user_id: UUID,
+    amount: int,
+    idem_key: UUID | None,
+    related_type: str | None,
+    related_id: str | None,
+    reason: str,
+    ip: str | None,
+    ua: str | None,
+) -> ConsumeResult:
+    """
+    One round trip: replay lookup, bucket draw, balance update and ledger insert.
+
+    All CTEs share one snapshot. ``balance`` therefore reports the pre-update
+    total; the UPDATE itself re-checks ``total >= amount`` against the latest
+    row version after waiting on the row lock, so concurrent consumers queue
+    instead of failing a version check.
+    """
+    replay = _replay_clause(user_id, idem_key, related_type, related_id)
+    guards = []
+    prior = None
+    if replay is not None:
+        prior = select(*_LEDGER_COLUMNS).where(replay).limit(1).cte("prior")
+        guards.append(~exists(select(prior.c.id)))
+
+    drawn = _draw_statement(user_id, amount, *guards).cte("drawn")
+    ledger = (
+        insert(TokenLedger)
+        .from_select(
+            [
+                "user_id",
+                "transaction_type",
+                "token_delta",
+                "tokens_before",
+                "tokens_after",
+                "reason",
+                "related_entity_type",
+                "related_entity_id",
+                "idempotency_key",
+                "ip_address",
+                "user_agent",
+            ],
+            select(
+                literal(user_id, GUID()),
+                literal("consume", String),
+                literal(-amount),
+                drawn.c.tokens_after + amount,
+                drawn.c.tokens_after,
+                literal(reason, String),
+                literal(related_type, String),
+                literal(related_id, String),
+                literal(idem_key, GUID()),
+                literal(ip, Inet()),
+                literal(ua, Text),
+            ),
+        )
+        .returning(*_LEDGER_COLUMNS)
+        .cte("ledger")
+    )
+
+    balance = (
+        select(_total_tokens().label("available"))
+        .where(Entitlement.user_id == user_id)
+        .subquery("balance")
+    )
+    columns = [balance.c.available, drawn.c.version]
+    columns += [col.label(f"new_{col.name}") for col in ledger.c]
+    source = balance.outerjoin(ledger, true()).outerjoin(drawn, true())
+    if prior is not None:
+        columns += [col.label(f"prior_{col.name}") for col in prior.c]
+        source = source.outerjoin(prior, true())
+
+    row = (await session.execute(select(*columns).select_from(source))).one_or_none()
+    if row is None:
+        raise ValueError(f"Entitlement not found for user {user_id}")
+    if row.new_id is not None:
+        return ConsumeResult(
+            ledger=_ledger_from_row(row, "new_"), replayed=False, version=row.version
+        )
+    if prior is not None and row.prior_id is not None:
+        return ConsumeResult(ledger=_ledger_from_row(row, "prior_"), replayed=True)
+    raise InsufficientTokensError(required=amount, available=row.available)
+
+
+async def _consume_portable(
+    session: AsyncSession,
+    user_id: UUID,
+    amount: int,
+    idem_key: UUID | None,
+    related_type: str | None,
+    related_id: str | None,
+    reason: str,
+    ip: str | None,
+    ua: str | None,
+) -> ConsumeResult:
+    """
+    Fallback for dialects without data-modifying CTEs (SQLite in tests).
+
+    Same conditional UPDATE as the Postgres path, followed by the ledger insert
+    in the same transaction.
+    """
+    existing = await _find_replay(
+        session, _replay_clause(user_id, idem_key, related_type, related_id)
+    )
+    if existing is not None:
+        return ConsumeResult(ledger=existing, replayed=True)
+
+    res = await session.execute(_draw_statement(user_id, amount))
+    drawn = res.one_or_none()
+    if drawn is None:
+        res = await session.execute(select(_total_tokens()).where(Entitlement.user_id == user_id))
+        available = res.scalar_one_or_none()
+        if available is None:
+            raise ValueError(f"Entitlement not found for user {user_id}")
+        raise InsufficientTokensError(required=amount, available=available)
+
+    ledger = TokenLedger(
+        user_id=user_id,
+        transaction_type="consume",
+        token_delta=-amount,
+        tokens_before=drawn.tokens_after + amount,
+        tokens_after=drawn.tokens_after,
+        reason=reason,
+        related_entity_type=related_type,
+        related_entity_id=related_id,
+        idempotency_key=idem_key,
+        ip_address=ip,
+        user_agent=ua,
+    )
+    session.add(ledger)
+    await session.flush()
+    return ConsumeResult(ledger=ledger, replayed=False, version=drawn.version)
+
+
+async def consume_tokens_atomic(
     session: AsyncSession,
     user_id: str,
     amount: int,
@@ -80,15 +335,14 @@ async def consume_tokens_once(
     reason: str,
     ip: str | None,
     ua: str | None,
-) -> TokenLedger:
+) -> ConsumeResult:
     """
-    Consume tokens exactly once using dual idempotency.
+    Consume tokens exactly once in a single atomic statement.
 
-    Features:
-    - Business-entity uniqueness (same entity can only be charged once)
-    - Idempotency-Key header support (replay detection)
-    - Optimistic locking with three bucket preconditions
-    - Atomic ledger insertion
+    On PostgreSQL the replay lookup, the earned → bonus → plan draw, the
+    balance update and the ledger insert run as one data-modifying CTE, so a
+    consume costs one statement plus the commit. Concurrent consumers for the
+    same user wait on the row lock rather than retrying.
 
     Args:
         session: Async SQLAlchemy session
@@ -102,124 +356,60 @@ async def consume_tokens_once(
         ua: User-Agent header (for audit)
 
     Returns:
-        TokenLedger record (either newly created or replayed)
+        ConsumeResult with the ledger row and whether it was a replay
 
     Raises:
-        OptimisticLockError: If concurrent modification detected
         InsufficientTokensError: If user has insufficient tokens
         ValueError: If entitlement record not found
     """
-    # Step 1: Business-entity idempotency check (CRITICAL)
-    # Same business entity (e.g., chat message) can only be charged once,
-    # even if client uses different Idempotency-Key headers
-    if related_type and related_id:
-        existing = await session.execute(
-            select(TokenLedger).where(
-                TokenLedger.user_id == UUID(user_id),
-                TokenLedger.transaction_type == "consume",
-                TokenLedger.related_entity_type == related_type,
-                TokenLedger.related_entity_id == related_id,
-            )
-        )
-        row = existing.scalar_one_or_none()
-        if row:
-            # Already charged for this entity - replay success
-            return row
-
-    # Step 2: Read current entitlement balances (no FOR UPDATE needed)
-    ent = await session.get(Entitlement, UUID(user_id), with_for_update=False)
-    if ent is None:
-        raise ValueError(f"Entitlement not found for user {user_id}")
+    uid = UUID(user_id)
+    idem = UUID(idem_key) if idem_key else None
+    if session.get_bind().dialect.name == "postgresql":
+        consume = _consume_postgres
+    else:
+        consume = _consume_portable
 
-    # Step 3: Compute bucket draw amounts
-    avail = {
-        "earned": ent.earned_tokens_available,
-        "bonus": ent.bonus_tokens_available,
-        "plan": ent.plan_tokens_available,
-    }
-    draw = await compute_bucket_draw(avail, amount)
-
-    # Step 4: Optimistic update with version check + bucket preconditions
-    # This prevents both lost updates AND negative balances
-    stmt = (
-        update(Entitlement)
-        .where(
-            Entitlement.user_id == UUID(user_id),
-            Entitlement.version == ent.version,  # Optimistic lock
-            Entitlement.earned_tokens_available >= draw["earned"],  # Prevent race
-            Entitlement.bonus_tokens_available >= draw["bonus"],  # Prevent race
-            Entitlement.plan_tokens_available >= draw["plan"],  # Prevent race
-        )
-        .values(
-            earned_tokens_available=Entitlement.earned_tokens_available - draw["earned"],
-            bonus_tokens_available=Entitlement.bonus_tokens_available - draw["bonus"],
-            plan_tokens_available=Entitlement.plan_tokens_available - draw["plan"],
-            version=Entitlement.version + 1,
-            updated_at=func.now(),
-        )
-        .returning(
-            Entitlement.earned_tokens_available,
-            Entitlement.bonus_tokens_available,
-            Entitlement.plan_tokens_available,
-        )
-    )
+    try:
+        result = await consume(session, uid, amount, idem, related_type, related_id, reason, ip, ua)
+    except IntegrityError:
+        # A duplicate committed after our snapshot; the statement rolled back
+        # as a whole, so the committed row is the answer.
+        await session.rollback()
+        existing = await _find_replay(session, _replay_clause(uid, idem, related_type, related_id))
+        if existing is None:
+            raise
+        return ConsumeResult(ledger=existing, replayed=True)
 
-    res = await session.execute(stmt)
-    row = res.first()
+    await session.commit()
+    return result
 
-    if row is None:
-        # Concurrent modification or insufficient balance
-        raise OptimisticLockError("Concurrent modification or insufficient balance")
 
-    # Step 5: Calculate before/after totals for ledger
-    tokens_before = sum(avail.values())
-    tokens_after = sum(row)  # Three returned columns (earned, bonus, plan)
-    delta = tokens_after - tokens_before  # Should be -amount
+async def consume_tokens_once(
+    session: AsyncSession,
+    user_id: str,
+    amount: int,
+    idem_key: str | None,
+    related_type: str | None,
+    related_id: str | None,
+    reason: str,
+    ip: str | None,
+    ua: str | None,
+) -> TokenLedger:
+    """
+    Consume tokens exactly once using dual idempotency.
 
-    # Step 6: Insert ledger entry (idempotent via unique constraints)
-    ledger = TokenLedger(
-        user_id=UUID(user_id),
-        transaction_type="consume",
-        token_delta=delta,
-        tokens_before=tokens_before,
-        tokens_after=tokens_after,
+    Thin wrapper over consume_tokens_atomic returning only the ledger row
+    (either newly created or replayed).
+    """
+    result = await consume_tokens_atomic(
+        session=session,
+        user_id=user_id,
+        amount=amount,
+        idem_key=idem_key,
+        related_type=related_type,
+        related_id=related_id,
         reason=reason,
-        related_entity_type=related_type,
-        related_entity_id=related_id,
-        idempotency_key=UUID(idem_key) if idem_key else None,
-        ip_address=ip,
-        user_agent=ua,
+        ip=ip,
+        ua=ua,
     )
-
-    session.add(ledger)
-
-    try:
-        await session.flush()
-    except Exception:
-        # Idempotency replay: check both idempotency_key and business entity
-        if idem_key:
-            lr = await session.execute(
-                select(TokenLedger).where(TokenLedger.idempotency_key == UUID(idem_key))
-            )
-            existing = lr.scalar_one_or_none()
-            if existing:
-                return existing
-
-        if related_type and related_id:
-            lr = await session.execute(
-                select(TokenLedger).where(
-                    TokenLedger.user_id == UUID(user_id),
-                    TokenLedger.transaction_type == "consume",
-                    TokenLedger.related_entity_type == related_type,
-                    TokenLedger.related_entity_id == related_id,
-                )
-            )
-            existing = lr.scalar_one_or_none()
-            if existing:
-                return existing
-
-        # Not an idempotency conflict - re-raise
-        raise
-
-    await session.commit()
-    return ledger
+    return result.ledger
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 """Utility modules for entitlement service."""
 
-from .time_kst import now_utc, now_kst, today_kst, midnight_kst, to_kst, from_kst_date
+from .time_kst import now_utc, now_kst, today_kst, midnight_kst, to_kst, from_kst_date, ensure_utc
 
 __all__ = [
     "now_utc",
@@ -10,4 +10,5 @@ __all__ = [
     "midnight_kst",
     "to_kst",
     "from_kst_date",
+    "ensure_utc",
 ]
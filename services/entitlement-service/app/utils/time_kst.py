@@ -15,6 +15,11 @@ def now_utc() -> datetime:
     return datetime.now(timezone.utc)
 
 
+def ensure_utc(dt: datetime) -> datetime:
+    """Attach UTC to naive datetimes (SQLite returns TIMESTAMPTZ columns naive)."""
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+
 def now_kst() -> datetime:
     """Get current time in KST with timezone awareness."""
     return datetime.now(KST)
@@ -5,6 +5,8 @@ from __future__ import annotations
 import os
 import sys
 import asyncio
+import hashlib
+import math
 import time
 import warnings
 from pathlib import Path
@@ -22,10 +24,12 @@ except ModuleNotFoundError:  # pragma: no cover - fallback when fakeredis unavai
         def __init__(self) -> None:
             self._data: dict[str, bytes] = {}
             self._expiry: dict[str, float] = {}
+            self._buckets: dict[str, tuple[float, float]] = {}
 
         async def flushall(self) -> None:
             self._data.clear()
             self._expiry.clear()
+            self._buckets.clear()
 
         async def incr(self, key: str) -> int:
             self._expire_if_needed(key)
@@ -47,14 +51,67 @@ except ModuleNotFoundError:  # pragma: no cover - fallback when fakeredis unavai
             self._expire_if_needed(key)
             return self._data.get(key)
 
-        async def set(self, key: str, value, ex: int | None = None) -> None:
+        async def mget(self, *keys: str) -> list[bytes | None]:
+            return [await self.get(key) for key in keys]
+
+        async def set(self, key: str, value, ex: int | None = None, nx: bool = False) -> bool | None:
+            self._expire_if_needed(key)
+            if nx and key in self._data:
+                return None
             if isinstance(value, (bytes, bytearray)):
                 payload = bytes(value)
             else:
                 payload = str(value).encode()
             self._data[key] = payload
+            self._expiry.pop(key, None)
             if ex:
                 self._expiry[key] = time.time() + ex
+            return True
+
+        async def delete(self, *keys: str) -> int:
+            removed = 0
+            for key in keys:
+                self._expiry.pop(key, None)
+                removed += self._data.pop(key, None) is not None
+            return removed
+
+        async def script_load(self, script: str) -> str:
+            return hashlib.sha1(script.encode()).hexdigest()
+
+        async def script_flush(self) -> None:
+            return None
+
+        async def evalsha(self, sha: str, numkeys: int, key: str, *args):
+            """Emulates the rate limiter, cache floor and idempotency claim scripts."""
+            from app.middleware.idempotency import REFRESH_CLAIM_SHA, RELEASE_CLAIM_SHA
+            from app.services.entitlement_cache import RAISE_FLOOR_SHA
+
+            if sha in (REFRESH_CLAIM_SHA, RELEASE_CLAIM_SHA):
+                if await self.get(key) != args[0]:
+                    return 0
+                if sha == RELEASE_CLAIM_SHA:
+                    return await self.delete(key)
+                await self.expire(key, int(args[1]))
+                return 1
+
+            if sha == RAISE_FLOOR_SHA:
+                current = await self.get(key)
+                version, ttl = int(args[0]), int(args[1])
+                if current is None or version > int(current):
+                    await self.set(key, version, ex=ttl)
+                    return version
+                await self.expire(key, ttl)
+                return int(current)
+
+            capacity, rate, cost = float(args[0]), float(args[1]) / 1000.0, float(args[2])
+            now = time.time() * 1000
+            tokens, ts = self._buckets.get(key, (capacity, now))
+            tokens = min(capacity, tokens + max(0.0, now - ts) * rate)
+            if tokens >= cost:
+                self._buckets[key] = (tokens - cost, now)
+                return [1, 0, int(tokens - cost)]
+            self._buckets[key] = (tokens, now)
+            return [0, math.ceil((cost - tokens) / rate), int(tokens)]
 
         def _expire_if_needed(self, key: str) -> None:
             expires = self._expiry.get(key)
@@ -129,6 +186,7 @@ from app.main import (
     get_db,
     get_redis,
 )
+from app.rate_limiter import local_shedder  # noqa: E402
 from .utils import create_user_with_entitlement  # noqa: E402
 
 # Use valid UUID for default test user (middleware expects UUID format)
@@ -174,6 +232,12 @@ async def reset_fake_redis(fake_redis: FakeRedis) -> AsyncIterator[None]:
     yield
 
 
+@pytest.fixture(autouse=True)
+def reset_local_rate_limits() -> None:
+    """Forget keys shed in-process by earlier tests."""
+    local_shedder.clear()
+
+
 @pytest_asyncio.fixture
 async def db_session() -> AsyncIterator[AsyncSession]:
     async with SessionLocal() as session:
@@ -218,6 +282,7 @@ def override_dependencies(fake_redis: FakeRedis) -> AsyncIterator[None]:
         return _build_user(user_id)
 
     app.state.db = SessionLocal
+    app.state.redis = fake_redis
     app.dependency_overrides[get_db] = override_get_db
     app.dependency_overrides[get_redis] = override_get_redis
     app.dependency_overrides[get_current_user] = override_current_user
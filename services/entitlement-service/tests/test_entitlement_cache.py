@@ -0,0 +1,89 @@
+"""Tests for the Redis-backed entitlement snapshot cache."""
+
+from __future__ import annotations
+
+from uuid import UUID
+
+import pytest
+from app.models import Entitlement
+from app.services.entitlement_cache import (
+    FLOOR_KEY,
+    SNAPSHOT_KEY,
+    get_snapshot,
+    invalidate_snapshot,
+    store_snapshot,
+)
+from sqlalchemy import update
+
+from .utils import create_user_with_entitlement
+
+
+@pytest.mark.asyncio
+async def test_second_fetch_is_served_from_cache(api_client, db_session, fake_redis) -> None:
+    user_id = await create_user_with_entitlement(db_session, plan_tokens=30)
+    headers = {"X-Test-User": user_id}
+
+    first = await api_client.get("/api/v1/entitlements", headers=headers)
+    assert first.status_code == 200, first.text
+    assert await fake_redis.get(SNAPSHOT_KEY.format(user_id=user_id)) is not None
+
+    # Out-of-band write without invalidation: a cache hit must not see it
+    await db_session.execute(
+        update(Entitlement)
+        .where(Entitlement.user_id == UUID(user_id))
+        .values(plan_tokens_available=1)
+    )
+    await db_session.commit()
+
+    second = await api_client.get("/api/v1/entitlements", headers=headers)
+    assert second.json() == first.json()
+
+
+@pytest.mark.asyncio
+async def test_consume_invalidates_cached_snapshot(api_client, db_session) -> None:
+    user_id = await create_user_with_entitlement(db_session, plan_tokens=30)
+    headers = {"X-Test-User": user_id}
+
+    before = await api_client.get("/api/v1/entitlements", headers=headers)
+    assert before.json()["total_tokens"] == 30
+
+    consume = await api_client.post(
+        "/api/v1/tokens/consume",
+        json={
+            "amount": 4,
+            "related_entity_type": "chat",
+            "related_entity_id": "c-1",
+            "reason": "chat",
+        },
+        headers=headers,
+    )
+    assert consume.status_code == 200, consume.text
+
+    after = await api_client.get("/api/v1/entitlements", headers=headers)
+    assert after.json()["total_tokens"] == 26
+
+
+@pytest.mark.asyncio
+async def test_snapshot_older_than_floor_is_a_miss(fake_redis) -> None:
+    user_id = "00000000-0000-0000-0000-00000000abcd"
+    await invalidate_snapshot(fake_redis, user_id, version=5)
+
+    # A reader that loaded version 4 before the write stores it afterwards
+    await store_snapshot(fake_redis, user_id, {"version": 4}, ttl=60)
+    assert await get_snapshot(fake_redis, user_id) is None
+
+    await store_snapshot(fake_redis, user_id, {"version": 5}, ttl=60)
+    assert await get_snapshot(fake_redis, user_id) == {"version": 5}
+
+
+@pytest.mark.asyncio
+async def test_floor_never_moves_backwards(fake_redis) -> None:
+    user_id = "00000000-0000-0000-0000-00000000abce"
+
+    # Writers for v5 and v6 committed concurrently; v6 publishes first
+    await invalidate_snapshot(fake_redis, user_id, version=6)
+    await invalidate_snapshot(fake_redis, user_id, version=5)
+    assert int(await fake_redis.get(FLOOR_KEY.format(user_id=user_id))) == 6
+
+    await store_snapshot(fake_redis, user_id, {"version": 5}, ttl=60)
+    assert await get_snapshot(fake_redis, user_id) is None
@@ -2,27 +2,42 @@
 
 from __future__ import annotations
 
-from fastapi import FastAPI, Request
-from fastapi.testclient import TestClient
+import asyncio
+from uuid import UUID
 
+import httpx
+from app.config import settings
 from app.main import SessionLocal
 from app.middleware.idempotency import idempotency_middleware
+from app.models import IdempotencyKey
+from app.services.idempotency_archiver import IdempotencyArchiver
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from httpx import ASGITransport
 
 
-def _build_test_app() -> FastAPI:
+def _build_test_app(redis=None, delay: float = 0.0) -> FastAPI:
     test_app = FastAPI()
     test_app.state.db = SessionLocal
+    test_app.state.redis = redis
+    test_app.state.calls = 0
     test_app.middleware("http")(idempotency_middleware)
 
     @test_app.post("/api/v1/tokens/consume")
     async def echo(request: Request):  # pragma: no cover - executed via TestClient
         request.state.user_id = request.headers["x-test-user"]
         payload = await request.json()
-        return {"ok": True, "payload": payload}
+        test_app.state.calls += 1
+        await asyncio.sleep(delay)
+        return {"ok": True, "payload": payload, "call": test_app.state.calls}
 
     return test_app
 
 
+def _client(app: FastAPI) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=ASGITransport(app=app), base_url="http://testserver")
+
+
 def test_idempotency_replays_cached_response(test_user_id):
     app = _build_test_app()
     client = TestClient(app)
@@ -65,3 +80,146 @@ def test_idempotency_conflict_detected(test_user_id):
     )
     assert conflict.status_code == 409
     assert conflict.headers["X-Idempotent-Replay"] == "mismatch"
+
+
+async def test_redis_replay_archives_record(test_user_id, fake_redis):
+    app = _build_test_app(fake_redis)
+    idem_key = "0f6a2c39-5b6e-4d59-9a53-56c7a0cfa1d2"
+    headers = {"Idempotency-Key": idem_key, "X-Test-User": test_user_id}
+    payload = {"amount": 1, "note": "x" * 400}  # large enough to be compressed
+
+    async with _client(app) as client:
+        first = await client.post("/api/v1/tokens/consume", json=payload, headers=headers)
+        second = await client.post("/api/v1/tokens/consume", json=payload, headers=headers)
+        conflict = await client.post("/api/v1/tokens/consume", json={"amount": 2}, headers=headers)
+
+    assert first.headers["X-Idempotent-Replay"] == "false"
+    assert second.headers["X-Idempotent-Replay"] == "true"
+    assert second.json() == first.json()
+    assert conflict.status_code == 409
+    assert conflict.headers["X-Idempotent-Replay"] == "mismatch"
+    assert app.state.calls == 1
+    assert await fake_redis.get(f"idem:{idem_key}") is not None
+
+    # No archiver running: record is written inline
+    async with SessionLocal() as session:
+        rec = await session.get(IdempotencyKey, UUID(idem_key))
+    assert rec is not None
+    assert rec.response_body == first.json()
+
+
+async def test_concurrent_duplicates_execute_once(test_user_id, fake_redis):
+    app = _build_test_app(fake_redis, delay=0.2)
+    headers = {
+        "Idempotency-Key": "5d7c8a0e-3f41-4b8e-8a0b-9a51f0e4c6b7",
+        "X-Test-User": test_user_id,
+    }
+
+    async with _client(app) as client:
+        responses = await asyncio.gather(
+            *[
+                client.post("/api/v1/tokens/consume", json={"amount": 1}, headers=headers)
+                for _ in range(3)
+            ]
+        )
+
+    assert app.state.calls == 1
+    assert sorted(r.headers["X-Idempotent-Replay"] for r in responses) == [
+        "false",
+        "true",
+        "true",
+    ]
+    assert len({r.content for r in responses}) == 1
+
+
+async def test_archiver_batches_records(test_user_id, fake_redis):
+    app = _build_test_app(fake_redis)
+    archiver = IdempotencyArchiver(SessionLocal, batch_size=2, flush_interval=60)
+    app.state.idempotency_archiver = archiver
+    keys = [
+        "8a1e0c59-2a2f-4a56-9f8e-0b3c1f2d4e01",
+        "8a1e0c59-2a2f-4a56-9f8e-0b3c1f2d4e02",
+        "8a1e0c59-2a2f-4a56-9f8e-0b3c1f2d4e03",
+    ]
+
+    async with _client(app) as client:
+        for key in keys:
+            await client.post(
+                "/api/v1/tokens/consume",
+                json={"amount": 1},
+                headers={"Idempotency-Key": key, "X-Test-User": test_user_id},
+            )
+
+    async with SessionLocal() as session:
+        assert await session.get(IdempotencyKey, UUID(keys[0])) is None
+
+    await archiver.flush()
+    async with SessionLocal() as session:
+        for key in keys:
+            assert await session.get(IdempotencyKey, UUID(key)) is not None
+
+
+async def test_slow_request_keeps_its_claim(test_user_id, fake_redis, monkeypatch):
+    monkeypatch.setattr(settings, "idempotency_pending_ttl_seconds", 1)
+    app = _build_test_app(fake_redis, delay=1.6)
+    headers = {
+        "Idempotency-Key": "3c1b7f0e-9d6a-4c2e-8f57-1a2b3c4d5e6f",
+        "X-Test-User": test_user_id,
+    }
+
+    async def retry_later(client):
+        # Arrives after the initial claim TTL has elapsed
+        await asyncio.sleep(1.2)
+        return await client.post("/api/v1/tokens/consume", json={"amount": 1}, headers=headers)
+
+    async with _client(app) as client:
+        first, retry = await asyncio.gather(
+            client.post("/api/v1/tokens/consume", json={"amount": 1}, headers=headers),
+            retry_later(client),
+        )
+
+    assert app.state.calls == 1
+    assert first.headers["X-Idempotent-Replay"] == "false"
+    assert retry.headers["X-Idempotent-Replay"] == "true"
+
+
+async def test_redis_miss_falls_back_to_archive(test_user_id, fake_redis, monkeypatch):
+    monkeypatch.setattr(settings, "idempotency_archive_fallback", True)
+    app = _build_test_app(fake_redis)
+    idem_key = "6e0d4b1a-7c2f-4f3e-9a8b-2c1d0e9f8a7b"
+    headers = {"Idempotency-Key": idem_key, "X-Test-User": test_user_id}
+
+    async with _client(app) as client:
+        first = await client.post("/api/v1/tokens/consume", json={"amount": 1}, headers=headers)
+        # Evicted from Redis after it was archived
+        await fake_redis.delete(f"idem:{idem_key}")
+        retry = await client.post("/api/v1/tokens/consume", json={"amount": 1}, headers=headers)
+        conflict = await client.post("/api/v1/tokens/consume", json={"amount": 2}, headers=headers)
+
+    assert app.state.calls == 1
+    assert retry.headers["X-Idempotent-Replay"] == "true"
+    assert retry.json() == first.json()
+    assert conflict.status_code == 409
+
+
+async def test_new_key_does_no_archive_lookup_by_default(test_user_id, fake_redis):
+    app = _build_test_app(fake_redis)
+    sessions = []
+
+    def counting_db():
+        sessions.append(1)
+        return SessionLocal()
+
+    app.state.db = counting_db
+    app.state.idempotency_archiver = IdempotencyArchiver(SessionLocal)
+    headers = {
+        "Idempotency-Key": "0c9b8a7d-6e5f-4a3b-8c2d-1e0f9a8b7c6d",
+        "X-Test-User": test_user_id,
+    }
+
+    async with _client(app) as client:
+        response = await client.post("/api/v1/tokens/consume", json={"amount": 1}, headers=headers)
+
+    assert response.status_code == 200
+    assert response.headers["X-Idempotent-Replay"] == "false"
+    assert sessions == []
@@ -6,10 +6,16 @@ from datetime import date, datetime, timedelta, timezone
 from uuid import UUID
 
 import pytest
+from app.database import SessionLocal
+from app.models import Entitlement, TokenLedger
+from app.services.quota_service import (
+    DAILY_RESET_CURSOR_KEY,
+    lazy_daily_reset_if_needed,
+    monthly_plan_reset_if_due,
+    run_daily_reset,
+)
 from sqlalchemy import select
 
-from app.models import Entitlement, TokenLedger
-from app.services.quota_service import lazy_daily_reset_if_needed, monthly_plan_reset_if_due
 from .utils import create_user_with_entitlement
 
 
@@ -51,3 +57,66 @@ async def test_monthly_plan_reset_refills_plan_bucket_and_adds_ledger(db_session
     ledgers = result.scalars().all()
     assert len(ledgers) == 1
     assert ledgers[0].reason.startswith("Monthly plan reset")
+
+
+async def _users_with_daily_usage(db_session, count: int) -> list[UUID]:
+    user_ids = []
+    for _ in range(count):
+        user_id = UUID(await create_user_with_entitlement(db_session))
+        ent = await db_session.get(Entitlement, user_id)
+        ent.light_daily_used = 3
+        ent.ad_rewards_today = 1
+        user_ids.append(user_id)
+    await db_session.commit()
+    return sorted(user_ids)
+
+
+@pytest.mark.asyncio
+async def test_run_daily_reset_chunks_and_skips_reset_rows(db_session, fake_redis) -> None:
+    today = date(2030, 1, 2)
+    user_ids = await _users_with_daily_usage(db_session, 5)
+    already = await db_session.get(Entitlement, user_ids[2])
+    already.light_last_reset_date = today
+    await db_session.commit()
+
+    report = await run_daily_reset(
+        SessionLocal, fake_redis, today=today, batch_size=2, pause_seconds=0
+    )
+
+    assert report.users_reset == 4
+    assert report.batches == 2
+    assert report.cursor == user_ids[-1]
+    cursor = await fake_redis.get(DAILY_RESET_CURSOR_KEY.format(day=today.isoformat()))
+    assert UUID(cursor.decode()) == user_ids[-1]
+
+    db_session.expire_all()
+    rows = (
+        (await db_session.execute(select(Entitlement).where(Entitlement.user_id.in_(user_ids))))
+        .scalars()
+        .all()
+    )
+    for ent in rows:
+        assert ent.light_last_reset_date == today
+        # Row reset before the run keeps its counters
+        skipped = ent.user_id == user_ids[2]
+        assert ent.light_daily_used == (3 if skipped else 0)
+        assert ent.ad_rewards_today == (1 if skipped else 0)
+
+
+@pytest.mark.asyncio
+async def test_run_daily_reset_resumes_from_cursor(db_session, fake_redis) -> None:
+    today = date(2030, 1, 2)
+    user_ids = await _users_with_daily_usage(db_session, 4)
+    await fake_redis.set(DAILY_RESET_CURSOR_KEY.format(day=today.isoformat()), str(user_ids[1]))
+
+    report = await run_daily_reset(
+        SessionLocal, fake_redis, today=today, batch_size=10, pause_seconds=0
+    )
+
+    assert report.resumed_from == user_ids[1]
+    assert report.users_reset == 2
+
+    db_session.expire_all()
+    for index, user_id in enumerate(user_ids):
+        ent = await db_session.get(Entitlement, user_id)
+        assert ent.light_daily_used == (3 if index <= 1 else 0)
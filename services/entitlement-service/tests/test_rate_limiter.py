@@ -0,0 +1,68 @@
+"""Unit tests for the Lua token-bucket rate limiter."""
+
+from __future__ import annotations
+
+import pytest
+
+from app.config import settings as app_settings
+from app.rate_limiter import (
+    RateLimitExceeded,
+    RateLimitRule,
+    check_route_rate_limit,
+    consume_rate_limit,
+    local_shedder,
+    route_rule,
+)
+
+
+@pytest.mark.asyncio
+async def test_bucket_allows_capacity_then_rejects(fake_redis) -> None:
+    rule = RateLimitRule(capacity=3, refill_per_sec=0.5)
+    left = [await consume_rate_limit(fake_redis, "rl:test:a", rule) for _ in range(3)]
+    assert left == [2, 1, 0]
+
+    with pytest.raises(RateLimitExceeded) as exc_info:
+        await consume_rate_limit(fake_redis, "rl:test:a", rule)
+    assert 1 <= exc_info.value.retry_after <= 2
+
+
+@pytest.mark.asyncio
+async def test_rejected_key_is_shed_without_redis(fake_redis) -> None:
+    rule = RateLimitRule(capacity=1, refill_per_sec=0.1)
+    await consume_rate_limit(fake_redis, "rl:test:b", rule)
+    with pytest.raises(RateLimitExceeded):
+        await consume_rate_limit(fake_redis, "rl:test:b", rule)
+
+    # Bucket state gone from Redis; the in-process table still refuses
+    await fake_redis.flushall()
+    with pytest.raises(RateLimitExceeded):
+        await consume_rate_limit(fake_redis, "rl:test:b", rule)
+
+    local_shedder.clear()
+    assert await consume_rate_limit(fake_redis, "rl:test:b", rule) == 0
+
+
+@pytest.mark.asyncio
+async def test_script_is_reloaded_after_script_flush(fake_redis) -> None:
+    rule = RateLimitRule(capacity=2, refill_per_sec=1)
+    await consume_rate_limit(fake_redis, "rl:test:c", rule)
+    await fake_redis.script_flush()
+    assert await consume_rate_limit(fake_redis, "rl:test:c", rule) == 0
+
+
+@pytest.mark.asyncio
+async def test_route_rules_follow_settings(fake_redis, monkeypatch) -> None:
+    monkeypatch.setattr(app_settings, "rate_limit_consume_rpm", 30)
+    monkeypatch.setattr(app_settings, "rate_limit_consume_burst", 2)
+    assert route_rule("consume") == RateLimitRule(capacity=2, refill_per_sec=0.5)
+    assert route_rule("reward_ssv").capacity == app_settings.rate_limit_reward_rpm
+
+    await check_route_rate_limit(fake_redis, "consume", "user-1")
+    await check_route_rate_limit(fake_redis, "consume", "user-1")
+    with pytest.raises(RateLimitExceeded):
+        await check_route_rate_limit(fake_redis, "consume", "user-1")
+    # Other users have their own bucket
+    await check_route_rate_limit(fake_redis, "consume", "user-2")
+
+    with pytest.raises(ValueError):
+        route_rule("unknown")
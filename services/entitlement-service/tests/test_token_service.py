@@ -2,16 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
 from uuid import UUID
 
 import pytest
 from hypothesis import given, settings
 from hypothesis import strategies as st
 
+from app.database import SessionLocal
 from app.models import Entitlement
 from app.services.token_service import (
     InsufficientTokensError,
     compute_bucket_draw,
+    consume_tokens_atomic,
     consume_tokens_once,
 )
 from .utils import create_user_with_entitlement
@@ -126,3 +129,87 @@ async def test_consume_tokens_once_retries_on_conflict(db_session) -> None:
             ip=None,
             ua=None,
         )
+
+
+@pytest.mark.asyncio
+async def test_consume_tokens_atomic_reports_replay_and_draw_order(db_session) -> None:
+    user_id = await create_user_with_entitlement(
+        db_session, plan_tokens=10, earned_tokens=2, bonus_tokens=3
+    )
+    first = await consume_tokens_atomic(
+        session=db_session,
+        user_id=user_id,
+        amount=6,
+        idem_key=None,
+        related_type="report",
+        related_id="rep-1",
+        reason="pdf_report",
+        ip=None,
+        ua=None,
+    )
+    assert not first.replayed
+    assert (first.ledger.tokens_before, first.ledger.tokens_after) == (15, 9)
+
+    replay = await consume_tokens_atomic(
+        session=db_session,
+        user_id=user_id,
+        amount=6,
+        idem_key=None,
+        related_type="report",
+        related_id="rep-1",
+        reason="pdf_report",
+        ip=None,
+        ua=None,
+    )
+    assert replay.replayed
+    assert replay.ledger.id == first.ledger.id
+
+    ent = await db_session.get(Entitlement, UUID(user_id))
+    await db_session.refresh(ent)
+    assert (ent.earned_tokens_available, ent.bonus_tokens_available) == (0, 0)
+    assert ent.plan_tokens_available == 9
+    assert ent.version == 2
+
+
+@pytest.mark.asyncio
+async def test_consume_tokens_atomic_insufficient_reports_available(db_session) -> None:
+    user_id = await create_user_with_entitlement(db_session, plan_tokens=2, earned_tokens=1)
+    with pytest.raises(InsufficientTokensError) as exc_info:
+        await consume_tokens_atomic(
+            session=db_session,
+            user_id=user_id,
+            amount=5,
+            idem_key=None,
+            related_type=None,
+            related_id=None,
+            reason="chat_message",
+            ip=None,
+            ua=None,
+        )
+    assert exc_info.value.available == 3
+
+
+@pytest.mark.asyncio
+async def test_concurrent_consumes_do_not_lose_updates(db_session) -> None:
+    user_id = await create_user_with_entitlement(db_session, plan_tokens=10)
+
+    async def consume(idx: int):
+        async with SessionLocal() as session:
+            return await consume_tokens_atomic(
+                session=session,
+                user_id=user_id,
+                amount=1,
+                idem_key=None,
+                related_type="chat",
+                related_id=f"burst-{idx}",
+                reason="chat_message",
+                ip=None,
+                ua=None,
+            )
+
+    results = await asyncio.gather(*(consume(i) for i in range(8)))
+    assert not any(result.replayed for result in results)
+
+    ent = await db_session.get(Entitlement, UUID(user_id))
+    await db_session.refresh(ent)
+    assert ent.plan_tokens_available == 2
@@ -4,25 +4,48 @@ from __future__ import annotations
 
 from fastapi import APIRouter, Depends, status
 
-from ..core import PillarsEngine
-from ..models import PillarsComputeRequest, PillarsComputeResponse
+from services.common.responses import FastJSONResponse
+
+from ..core import PillarsEngine, get_default_engine
+from ..models import (
+    PillarsBatchRequest,
+    PillarsBatchResponse,
+    PillarsComputeRequest,
+    PillarsComputeResponse,
+)
 
 router = APIRouter(tags=["pillars"])
 
 
 def get_engine() -> PillarsEngine:
-    """Provide a pillars engine instance."""
-    return PillarsEngine()
+    """Provide the process-wide pillars engine (built once, shared by all requests)."""
+    return get_default_engine()
 
 
 @router.post(
     "/pillars/compute",
     response_model=PillarsComputeResponse,
+    response_class=FastJSONResponse,
     status_code=status.HTTP_200_OK,
 )
 def compute_pillars(
     payload: PillarsComputeRequest,
     engine: PillarsEngine = Depends(get_engine),
-) -> PillarsComputeResponse:
+) -> FastJSONResponse:
     """Compute the four pillars for the given birth details."""
-    return engine.compute(payload)
+    # The engine builds a validated model; serialize it once, skip re-validation
+    return FastJSONResponse(engine.compute(payload))
+
+
+@router.post(
+    "/pillars/compute:batch",
+    response_model=PillarsBatchResponse,
+    response_class=FastJSONResponse,
+    status_code=status.HTTP_200_OK,
+)
+def compute_pillars_batch(
+    payload: PillarsBatchRequest,
+    engine: PillarsEngine = Depends(get_engine),
+) -> FastJSONResponse:
+    """Compute the four pillars for many birth instants in one call."""
+    return FastJSONResponse(engine.compute_batch(payload))
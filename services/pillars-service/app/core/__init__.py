@@ -1,6 +1,11 @@
 """Core computation logic for four pillars."""
 
-from .engine import PillarsEngine
+from .engine import PillarsEngine, get_default_engine, reload_default_engine
 from .policies import DayBoundaryPolicy
 
-__all__ = ["PillarsEngine", "DayBoundaryPolicy"]
+__all__ = [
+    "PillarsEngine",
+    "DayBoundaryPolicy",
+    "get_default_engine",
+    "reload_default_engine",
+]
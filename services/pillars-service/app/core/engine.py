@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Any
 
 from services.common import TraceMetadata
 
 from ..models import (
     PillarComponent,
     PillarResult,
+    PillarsBatchRequest,
+    PillarsBatchResponse,
+    PillarsBatchResult,
     PillarsComputeRequest,
     PillarsComputeResponse,
     TraceInfo,
@@ -17,14 +22,28 @@ from ..models import (
 from .evidence import EvidenceBuilder
 from .pillars import PillarsCalculator, default_calculator
 
+# Canned chart used by ``PillarsEngine.prewarm``
+PREWARM_LOCAL_DATETIME = datetime(1992, 7, 15, 23, 40)
+PREWARM_TIMEZONE = "Asia/Seoul"
+
 
 @dataclass(slots=True)
 class PillarsEngine:
-    """KR_classic v1.4 compliant engine (initial implementation)."""
+    """KR_classic v1.4 compliant engine (initial implementation).
+
+    Construction reads the strength, wang, climate, school and luck policies;
+    the API shares one instance per process (see ``get_default_engine``).
+    Nothing is mutated after construction, so sharing across threads is safe.
+    """
 
     calculator: PillarsCalculator = field(default_factory=default_calculator)
     evidence_builder: EvidenceBuilder = field(default_factory=EvidenceBuilder.default)
 
+    @classmethod
+    def from_bundle(cls, bundle: Any) -> "PillarsEngine":
+        """Engine whose evidence policies come from ``bundle`` (a ``PolicyBundle``)."""
+        return cls(evidence_builder=EvidenceBuilder.default(bundle))
+
     def compute(self, request: PillarsComputeRequest) -> PillarsComputeResponse:
         result = self.calculator.compute(request.localDateTime, request.timezone)
 
@@ -88,3 +107,63 @@ class PillarsEngine:
             ),
         )
         return PillarsComputeResponse(pillars=pillars, trace=trace_payload)
+
+    def prewarm(self) -> None:
+        """Compute one canned chart so lazy tables (solar terms, tz offsets) load now.
+
+        Offset tables for every zone in ``SAJU_PREWARM_ZONES`` are built as well.
+        """
+        from saju_common.tz_registry import prewarm_zones  # on sys.path via .evidence
+
+        prewarm_zones()
+        self.compute(
+            PillarsComputeRequest(localDateTime=PREWARM_LOCAL_DATETIME, timezone=PREWARM_TIMEZONE)
+        )
+
+    def compute_batch(self, request: PillarsBatchRequest) -> PillarsBatchResponse:
+        """Compute pillars only (no evidence) for every item in ``request``."""
+        rows = self.calculator.compute_many(
+            (item.localDateTime, item.timezone) for item in request.items
+        )
+        results = [
+            PillarsBatchResult(
+                year=row.year,
+                month=row.month,
+                day=row.day,
+                hour=row.hour,
+                monthTerm=row.month_term,
+                monthTermUTC=row.month_term_utc,
+            )
+            for row in rows
+        ]
+        return PillarsBatchResponse(rule_id=request.rules, count=len(results), results=results)
+
+
+_default_engine: PillarsEngine | None = None
+_default_engine_lock = threading.Lock()
+
+
+def get_default_engine() -> PillarsEngine:
+    """Return the process-wide engine, building it on first use."""
+    global _default_engine
+    engine = _default_engine
+    if engine is None:
+        with _default_engine_lock:
+            engine = _default_engine
+            if engine is None:
+                engine = _default_engine = PillarsEngine()
+    return engine
+
+
+def reload_default_engine(bundle: Any) -> PillarsEngine:
+    """Build and prewarm an engine from ``bundle``, then make it the default.
+
+    Used as the policy hot-reload hook: the replacement is complete before the
+    swap, and requests that already hold the previous engine keep using it.
+    """
+    global _default_engine
+    engine = PillarsEngine.from_bundle(bundle)
+    engine.prewarm()
+    with _default_engine_lock:
+        _default_engine = engine
+    return engine
@@ -2,21 +2,20 @@
 
 from __future__ import annotations
 
-import json
-
 # Import real implementations from shared common package
 import sys
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from pathlib import Path as _Path
-from typing import Dict, Iterable, Tuple
-from zoneinfo import ZoneInfo
+from typing import Any, Dict, Iterable, Tuple
 
 sys.path.insert(0, str(_Path(__file__).resolve().parents[4] / "services" / "common"))
 from saju_common.engines import LuckCalculator, LuckContext, ShenshaCatalog
+from saju_common.tz_registry import get_zone
 
 from .month import SimpleSolarTermLoader
+from .policies import read_policy
 from .strength import StrengthEvaluator
 from .wang import WangStateMapper
 
@@ -43,22 +42,27 @@ class EvidenceBuilder:
     school_profiles: Dict[str, object] | None = None
 
     @classmethod
-    def default(cls) -> "EvidenceBuilder":
+    def default(cls, bundle: Any = None) -> "EvidenceBuilder":
+        """Load every policy from disk, or from ``bundle`` (a ``PolicyBundle``)."""
         climate_data: Dict[str, Dict[str, Dict[str, str]]] = {}
         if CLIMATE_POLICY_PATH.exists():
-            with CLIMATE_POLICY_PATH.open("r", encoding="utf-8") as f:
-                climate_data = json.load(f).get("bias", {})
+            climate_data = read_policy(CLIMATE_POLICY_PATH, bundle).get("bias", {})
         school_data = {}
         if SCHOOL_POLICY_PATH.exists():
-            with SCHOOL_POLICY_PATH.open("r", encoding="utf-8") as sf:
-                school_data = json.load(sf)
+            school_data = read_policy(SCHOOL_POLICY_PATH, bundle)
+        if bundle is not None:
+            luck_calculator = LuckCalculator(bundle.get("luck_policy_v1.json"))
+            shensha_catalog = ShenshaCatalog(bundle.get("shensha_catalog_v1.json"))
+        else:
+            luck_calculator = LuckCalculator()
+            shensha_catalog = ShenshaCatalog()
         return cls(
-            strength_evaluator=StrengthEvaluator.from_files(),
-            wang_mapper=WangStateMapper.from_file(),
+            strength_evaluator=StrengthEvaluator.from_files(bundle),
+            wang_mapper=WangStateMapper.from_file(bundle=bundle),
             climate_map=climate_data,
             term_loader=SimpleSolarTermLoader(TERM_DATA_PATH),
-            luck_calculator=LuckCalculator(),
-            shensha_catalog=ShenshaCatalog(),
+            luck_calculator=luck_calculator,
+            shensha_catalog=shensha_catalog,
             school_profiles=school_data,
         )
 
@@ -74,18 +78,7 @@ class EvidenceBuilder:
     def _solar_term_window(self, utc_dt: datetime) -> Tuple[object | None, object | None]:
         if not self.term_loader:
             return None, None
-        terms = list(self.term_loader.load_year(utc_dt.year)) + list(
-            self.term_loader.load_year(utc_dt.year + 1)
-        )
-        prev_term = None
-        next_term = None
-        for entry in terms:
-            if entry.utc_time <= utc_dt:
-                prev_term = entry
-            if entry.utc_time > utc_dt:
-                next_term = entry
-                break
-        return prev_term, next_term
+        return self.term_loader.index.window(utc_dt)
 
     def build(
         self,
@@ -100,12 +93,19 @@ class EvidenceBuilder:
         visible_counts: Dict[str, int] | None = None,
         branch_roots: Iterable[str] | None = None,
         tzdb_version: str = "2025a",
+        term_window: Tuple[object | None, object | None] | None = None,
     ) -> Dict[str, object]:
+        """Build the evidence log for one chart.
+
+        ``term_window`` is the ``(prev_term, next_term)`` pair around the birth
+        instant; when omitted it is looked up once here and shared with the
+        luck start-age calculation.
+        """
         combos = combos or {}
         visible_counts = visible_counts or {}
         branch_roots = list(branch_roots or [])
 
-        tz = ZoneInfo(timezone_name)
+        tz = get_zone(timezone_name)
         localized = local_dt.replace(tzinfo=tz)
         utc_dt = localized.astimezone(timezone.utc)
         offset = localized.utcoffset() or timedelta(0)
@@ -120,7 +120,9 @@ class EvidenceBuilder:
             combos=combos,
         )
 
-        prev_term_entry, next_term_entry = self._solar_term_window(utc_dt)
+        if term_window is None and self.term_loader:
+            term_window = self._solar_term_window(utc_dt)
+        prev_term_entry, next_term_entry = term_window or (None, None)
         prev_term_name = getattr(prev_term_entry, "term", None) if prev_term_entry else None
         next_term_name = getattr(next_term_entry, "term", None) if next_term_entry else None
         prev_term_iso = (
@@ -161,7 +163,7 @@ class EvidenceBuilder:
         luck_direction = {"direction": None, "method": None, "sex_at_birth": None}
         if self.luck_calculator:
             luck_context = LuckContext(local_dt=local_dt, timezone=timezone_name)
-            luck_calc = self.luck_calculator.compute_start_age(luck_context)
+            luck_calc = self.luck_calculator.compute_start_age(luck_context, window=term_window)
             luck_direction = self.luck_calculator.luck_direction(luck_context)
 
         shensha = (
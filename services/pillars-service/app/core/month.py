@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
-import csv
+import sys
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Iterable
-from zoneinfo import ZoneInfo
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[4] / "services" / "common"))
+from saju_common.solar_term_index import SolarTermIndex, SolarTermRecord, get_solar_term_index
+from saju_common.tz_registry import get_zone
 
 from .resolve import TimeResolver
 
@@ -53,27 +56,30 @@ class TermEntry:
     algo_version: str
 
 
+def _to_term_entry(record: SolarTermRecord) -> TermEntry:
+    return TermEntry(
+        term=record.term,
+        lambda_deg=record.lambda_deg,
+        utc_time=record.utc_time,
+        local_time=record.utc_time,
+        delta_t_seconds=record.delta_t_seconds,
+        source=record.source,
+        algo_version=record.algo_version,
+    )
+
+
 @dataclass(slots=True)
 class SimpleSolarTermLoader:
+    """Per-year view over the shared, in-memory :class:`SolarTermIndex`."""
+
     table_path: Path
 
+    @property
+    def index(self) -> SolarTermIndex:
+        return get_solar_term_index(self.table_path)
+
     def load_year(self, year: int) -> Iterable[TermEntry]:
-        file_path = self.table_path / f"terms_{year}.csv"
-        if not file_path.exists():
-            return []
-        with file_path.open("r", encoding="utf-8") as csvfile:
-            reader = csv.DictReader(csvfile)
-            for row in reader:
-                utc_time = datetime.fromisoformat(row["utc_time"].replace("Z", "+00:00"))
-                yield TermEntry(
-                    term=row["term"],
-                    lambda_deg=float(row["lambda_deg"]),
-                    utc_time=utc_time,
-                    local_time=utc_time,
-                    delta_t_seconds=float(row["delta_t_seconds"]),
-                    source=row["source"],
-                    algo_version=row["algo_version"],
-                )
+        return [_to_term_entry(record) for record in self.index.year_entries(year)]
 
 
 @dataclass(slots=True)
@@ -85,36 +91,16 @@ class MonthBranchResolver:
 
     def resolve(self, local_dt: datetime, timezone: str) -> tuple[str, TermEntry]:
         utc_dt, _ = self.time_resolver.resolve(local_dt, timezone)
+        index = self.loader.index
         year = utc_dt.year
-        terms = list(self.loader.load_year(year))
-        if not terms:
-            terms = list(self.loader.load_year(year - 1))
-            if not terms:
-                raise ValueError(f"No solar term data for year {year}")
-        if utc_dt < terms[0].utc_time:
-            previous_year_terms = list(self.loader.load_year(year - 1))
-            terms = previous_year_terms + terms
-
-        major_entries = [entry for entry in terms if entry.term in MAJOR_TERMS]
-        major_entries.sort(key=lambda e: e.utc_time)
-        current = None
-        for entry in major_entries:
-            if entry.utc_time <= utc_dt:
-                current = entry
-            else:
-                break
+        if not (index.has_year(year) or index.has_year(year - 1)):
+            raise ValueError(f"No solar term data for year {year}")
+        current = index.major_term_at(utc_dt)
         if current is None:
-            current = major_entries[-1]
+            raise ValueError(f"No solar term data before {utc_dt.isoformat()}")
         branch = TERM_TO_BRANCH[current.term]
-        local_current = TermEntry(
-            term=current.term,
-            lambda_deg=current.lambda_deg,
-            utc_time=current.utc_time,
-            local_time=current.utc_time.astimezone(ZoneInfo(timezone)),
-            delta_t_seconds=current.delta_t_seconds,
-            source=current.source,
-            algo_version=current.algo_version,
-        )
+        local_current = _to_term_entry(current)
+        local_current.local_time = current.utc_time.astimezone(get_zone(timezone))
         return branch, local_current
 
 
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Tuple
+from datetime import timezone as dt_timezone
+from typing import Dict, Iterable, List, Tuple
 
 from .constants import (
     DAY_ANCHOR,
@@ -16,8 +18,8 @@ from .constants import (
     YEAR_ANCHOR,
     YEAR_STEM_TO_MONTH_START,
 )
-from .month import MonthBranchResolver, default_month_resolver
-from .resolve import DayBoundaryCalculator, TimeResolver
+from .month import TERM_TO_BRANCH, MonthBranchResolver, default_month_resolver
+from .resolve import DayBoundaryCalculator, TimeResolver, get_zone
 
 
 def year_pillar(year: int) -> str:
@@ -68,6 +70,37 @@ def hour_pillar(day_stem: str, hour_branch: str) -> str:
     return HEAVENLY_STEMS[stem_index] + hour_branch
 
 
+# Lookup tables for the batch path (equivalent to the scalar helpers above).
+_DAY_ANCHOR_ORDINAL = datetime(*DAY_ANCHOR[:3]).toordinal()
+_DAY_ANCHOR_INDEX = SEXAGENARY_CYCLE.index(DAY_ANCHOR[3])
+_MONTH_PILLARS = {
+    (stem, branch): month_pillar(stem, branch)
+    for stem in HEAVENLY_STEMS
+    for branch in EARTHLY_BRANCHES
+}
+_HOUR_PILLARS = {
+    (stem, branch): hour_pillar(stem, branch) for stem in HEAVENLY_STEMS for branch in HOUR_BRANCHES
+}
+_HOUR_TO_BRANCH = [hour_branch_for_time(datetime(2000, 1, 1, h)) for h in range(24)]
+
+# Widest real-world UTC offset (±14h) plus margin. If both ends of
+# [local - margin, local + margin] fall under the same major term, the exact
+# offset cannot change the month branch and the tz conversion is skipped.
+_OFFSET_MARGIN_SECONDS = 15 * 3600
+
+
+@dataclass(frozen=True, slots=True)
+class BatchPillars:
+    """Four pillars for one batch item (same values as ``PillarsCalculator.compute``)."""
+
+    year: str
+    month: str
+    day: str
+    hour: str
+    month_term: str
+    month_term_utc: datetime
+
+
 @dataclass(slots=True)
 class PillarsCalculator:
     """High-level calculator composing resolvers."""
@@ -102,6 +135,70 @@ class PillarsCalculator:
             "hour_range": hour_range_values,
         }
 
+    def compute_many(self, items: Iterable[Tuple[datetime, str]]) -> List[BatchPillars]:
+        """Compute pillars for many ``(local_dt, timezone)`` pairs.
+
+        Items are grouped by (timezone, year) so each group resolves its zone
+        and major-term window once; every pillar is then a table lookup or a
+        bisect over that window. Output order matches input order.
+        """
+        items = list(items)
+        index = self.month_resolver.loader.index
+        results: List[BatchPillars | None] = [None] * len(items)
+
+        groups: Dict[Tuple[str, int], List[int]] = {}
+        for position, (local_dt, timezone) in enumerate(items):
+            groups.setdefault((timezone, local_dt.year), []).append(position)
+
+        for (timezone, year), positions in groups.items():
+            tz = get_zone(timezone)
+            if not (index.has_year(year) or index.has_year(year - 1)):
+                raise ValueError(f"No solar term data for year {year}")
+
+            year_p = year_pillar(year)
+            year_stem = year_p[0]
+            window_epochs, window_terms = _major_window(index, year)
+            if not window_epochs:
+                raise ValueError(f"No solar term data for year {year}")
+
+            for position in positions:
+                local_dt = items[position][0].replace(tzinfo=None)
+                local_epoch = local_dt.replace(tzinfo=dt_timezone.utc).timestamp()
+                lo = bisect_right(window_epochs, local_epoch - _OFFSET_MARGIN_SECONDS)
+                hi = bisect_right(window_epochs, local_epoch + _OFFSET_MARGIN_SECONDS)
+                if lo == hi:
+                    slot = lo
+                else:
+                    slot = bisect_right(window_epochs, local_dt.replace(tzinfo=tz).timestamp())
+                if slot == 0:
+                    raise ValueError(f"No solar term data before {local_dt.isoformat()}")
+                term = window_terms[slot - 1]
+
+                day_p = SEXAGENARY_CYCLE[
+                    (_DAY_ANCHOR_INDEX + local_dt.toordinal() - _DAY_ANCHOR_ORDINAL) % 60
+                ]
+                results[position] = BatchPillars(
+                    year=year_p,
+                    month=_MONTH_PILLARS[(year_stem, TERM_TO_BRANCH[term.term])],
+                    day=day_p,
+                    hour=_HOUR_PILLARS[(day_p[0], _HOUR_TO_BRANCH[local_dt.hour])],
+                    month_term=term.term,
+                    month_term_utc=term.utc_time,
+                )
+        return results  # type: ignore[return-value]
+
+
+def _major_window(index, year: int) -> Tuple[List[float], List[object]]:
+    """Major terms from two years before ``year`` through the year after it."""
+    epochs: List[float] = []
+    terms: List[object] = []
+    for y in range(year - 2, year + 2):
+        for record in index.year_entries(y):
+            if record.term in TERM_TO_BRANCH:
+                epochs.append(record.utc_time.timestamp())
+                terms.append(record)
+    return epochs, terms
+
 
 def default_calculator() -> PillarsCalculator:
     return PillarsCalculator(
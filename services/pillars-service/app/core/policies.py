@@ -1,12 +1,23 @@
-"""Boundary policy helpers (e.g., zi-start-23)."""
+"""Boundary policy helpers (e.g., zi-start-23) and policy file reading."""
 
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass
 from datetime import datetime, time, timedelta
+from pathlib import Path
+from typing import Any
 from zoneinfo import ZoneInfo
 
 
+def read_policy(path: Path, bundle: Any = None) -> Any:
+    """Policy JSON at ``path``; taken from ``bundle`` (a ``PolicyBundle``) when given."""
+    if bundle is not None:
+        return bundle.get_path(path)
+    with path.open("r", encoding="utf-8") as f:
+        return json.load(f)
+
+
 @dataclass(slots=True)
 class DayBoundaryPolicy:
     """Apply KR_classic_v1.4 day boundary rules (子時 23:00)."""
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
-from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
+from datetime import datetime
+from pathlib import Path
 
 from services.common import TraceMetadata
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[4] / "services" / "common"))
+from saju_common.tz_registry import UTC, get_zone, has_offset_change_near
+
 
 @dataclass(slots=True)
 class TimeResolver:
@@ -17,11 +21,12 @@ class TimeResolver:
     transition_window_hours: int = 48
 
     def resolve(self, local_dt: datetime, timezone: str) -> tuple[datetime, TraceMetadata]:
-        tz = ZoneInfo(timezone)
-        localized = local_dt.replace(tzinfo=tz)
-        utc_dt = localized.astimezone(ZoneInfo("UTC"))
+        localized = local_dt.replace(tzinfo=get_zone(timezone))
+        utc_dt = localized.astimezone(UTC)
 
-        flags = {"tzTransition": self._has_recent_transition(localized)}
+        # Offset change within ±transition_window_hours (bisect over the zone table)
+        window_seconds = self.transition_window_hours * 3600
+        flags = {"tzTransition": has_offset_change_near(local_dt, timezone, window_seconds)}
         trace = TraceMetadata(
             rule_id="KR_classic_v1.4",
             delta_t_seconds=57.4,
@@ -32,18 +37,6 @@ class TimeResolver:
         )
         return utc_dt, trace
 
-    def _has_recent_transition(self, localized: datetime) -> bool:
-        """Detect tz offset changes within the transition window."""
-        tz = localized.tzinfo
-        if tz is None:
-            return False
-        current_offset = localized.utcoffset()
-        for delta_hours in (-self.transition_window_hours, self.transition_window_hours):
-            moment = localized + timedelta(hours=delta_hours)
-            if moment.utcoffset() != current_offset:
-                return True
-        return False
-
 
 @dataclass(slots=True)
 class DayBoundaryCalculator:
@@ -52,8 +45,7 @@ class DayBoundaryCalculator:
     epsilon_ms: int = 1
 
     def compute(self, local_dt: datetime, timezone: str) -> datetime:
-        tz = ZoneInfo(timezone)
-        localized = local_dt.replace(tzinfo=tz)
+        localized = local_dt.replace(tzinfo=get_zone(timezone))
         # Day starts at midnight (00:00) of the same calendar day
         boundary = localized.replace(hour=0, minute=0, second=0, microsecond=0)
         return boundary
@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Iterable, List
+from typing import Any, Dict, Iterable, List
 
 from .constants import STEM_TO_ELEMENT
+from .policies import read_policy
 from .wang import WangStateMapper
 
 ZANGGAN_PATH = Path(__file__).resolve().parents[4] / "rulesets" / "zanggan_table.json"
@@ -42,17 +42,15 @@ class RootSealScorer:
     policy_version: str | None = None
 
     @classmethod
-    def from_files(cls) -> "RootSealScorer":
-        with ZANGGAN_PATH.open("r", encoding="utf-8") as f:
-            zanggan = json.load(f)
-        with STRENGTH_CRITERIA_PATH.open("r", encoding="utf-8") as f:
-            criteria = json.load(f)
+    def from_files(cls, bundle: Any = None) -> "RootSealScorer":
+        """Load criteria and optional policies from disk, or from ``bundle``."""
+        zanggan = read_policy(ZANGGAN_PATH, bundle)
+        criteria = read_policy(STRENGTH_CRITERIA_PATH, bundle)
         state_points = None
         month_stem_adjust = None
         seal_checks = None
         if STRENGTH_SCALE_PATH.exists():
-            with STRENGTH_SCALE_PATH.open("r", encoding="utf-8") as sf:
-                scale_data = json.load(sf)
+            scale_data = read_policy(STRENGTH_SCALE_PATH, bundle)
             state_points = scale_data.get("state_points")
             month_stem_adjust = scale_data.get("month_stem_adjust")
             seal_checks = scale_data.get("seal_validity_checks")
@@ -60,21 +58,19 @@ class RootSealScorer:
         validity_rules = {}
         policy_version = None
         if ROOT_SEAL_POLICY_PATH.exists():
-            with ROOT_SEAL_POLICY_PATH.open("r", encoding="utf-8") as pf:
-                root_policy = json.load(pf)
+            root_policy = read_policy(ROOT_SEAL_POLICY_PATH, bundle)
             wealth_policy = root_policy.get("wealth_location_bonus", {"enabled": False})
             validity_rules = root_policy.get("validity", {})
             policy_version = root_policy.get("version")
         yugi_policy = None
         if YUGI_POLICY_PATH.exists():
-            with YUGI_POLICY_PATH.open("r", encoding="utf-8") as yf:
-                yugi_policy = json.load(yf)
+            yugi_policy = read_policy(YUGI_POLICY_PATH, bundle)
         return cls(
             zanggan=zanggan,
             weights=criteria["weights"],
             thresholds=criteria["thresholds"],
             outputs=criteria["outputs"],
-            wang_mapper=WangStateMapper.from_file(),
+            wang_mapper=WangStateMapper.from_file(bundle=bundle),
             state_points=state_points,
             month_stem_adjust=month_stem_adjust,
             seal_validity_checks=seal_checks,
@@ -236,8 +232,8 @@ class StrengthEvaluator:
     scorer: RootSealScorer
 
     @classmethod
-    def from_files(cls) -> "StrengthEvaluator":
-        return cls(scorer=RootSealScorer.from_files())
+    def from_files(cls, bundle: Any = None) -> "StrengthEvaluator":
+        return cls(scorer=RootSealScorer.from_files(bundle))
 
     def evaluate(
         self,
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict
+from typing import Any, Dict
+
+from .policies import read_policy
 
 SEASONS_WANG_MAP_PATH = (
     Path(__file__).resolve().parents[4] / "policies" / "seasons_wang_map_v2.json"
@@ -19,10 +20,8 @@ class WangStateMapper:
     mapping: Dict[str, Dict[str, str]]
 
     @classmethod
-    def from_file(cls, path: Path = SEASONS_WANG_MAP_PATH) -> "WangStateMapper":
-        with path.open("r", encoding="utf-8") as f:
-            payload = json.load(f)["map"]
-        return cls(mapping=payload)
+    def from_file(cls, path: Path = SEASONS_WANG_MAP_PATH, bundle: Any = None) -> "WangStateMapper":
+        return cls(mapping=read_policy(path, bundle)["map"])
 
     def state_for(self, branch: str, element: str) -> str:
         for branches, states in self.mapping.items():
@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+
 from services.common import create_service_app
 
 from .api import router
+from .core import get_default_engine, reload_default_engine
 
 APP_META = {
     "app": "saju-pillars-service",
@@ -12,10 +17,31 @@ APP_META = {
     "rule_id": "KR_classic_v1.4",
 }
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Load the shared engine (policies, term index, tz tables) once before serving.
+
+    With ``POLICY_HOT_RELOAD=1`` a policy watcher swaps in a new engine when a
+    policy file changes; new requests use it, in-flight ones finish on the old one.
+    """
+    # saju_common is importable once .core has put services/common on sys.path
+    from saju_common.policy_watcher import start_policy_watcher
+
+    engine = get_default_engine()
+    engine.prewarm()
+    app.state.engine = engine
+    watcher = start_policy_watcher(reload_default_engine)
+    yield
+    if watcher is not None:
+        watcher.stop()
+
+
 app = create_service_app(
     app_name=APP_META["app"],
     version=APP_META["version"],
     rule_id=APP_META["rule_id"],
+    lifespan=lifespan,
 )
 
 app.include_router(router, prefix="/v2")
@@ -3,6 +3,10 @@
 from .pillars import (
     PillarComponent,
     PillarResult,
+    PillarsBatchItem,
+    PillarsBatchRequest,
+    PillarsBatchResponse,
+    PillarsBatchResult,
     PillarsComputeRequest,
     PillarsComputeResponse,
     TraceInfo,
@@ -11,6 +15,10 @@ from .pillars import (
 __all__ = [
     "PillarsComputeRequest",
     "PillarsComputeResponse",
+    "PillarsBatchItem",
+    "PillarsBatchRequest",
+    "PillarsBatchResult",
+    "PillarsBatchResponse",
     "PillarComponent",
     "PillarResult",
     "TraceInfo",
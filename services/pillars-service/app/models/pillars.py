@@ -15,6 +15,20 @@ class PillarsComputeRequest(BaseModel):
     rules: str = Field("KR_classic_v1.4", pattern=r"^KR_classic_v1\.4$")
 
 
+class PillarsBatchItem(BaseModel):
+    """Single birth instant inside a batch request."""
+
+    localDateTime: datetime
+    timezone: str
+
+
+class PillarsBatchRequest(BaseModel):
+    """Input payload for batch four pillars computation."""
+
+    items: list[PillarsBatchItem] = Field(..., min_length=1, max_length=10_000)
+    rules: str = Field("KR_classic_v1.4", pattern=r"^KR_classic_v1\.4$")
+
+
 class PillarComponent(BaseModel):
     """Single pillar element (e.g., year, month, day, hour)."""
 
@@ -58,3 +72,22 @@ class PillarsComputeResponse(BaseModel):
 
     class Config:
         allow_population_by_field_name = True
+
+
+class PillarsBatchResult(BaseModel):
+    """Pillars for one batch item (no per-item evidence/trace)."""
+
+    year: str
+    month: str
+    day: str
+    hour: str
+    monthTerm: str
+    monthTermUTC: datetime
+
+
+class PillarsBatchResponse(BaseModel):
+    """API response wrapper for batch pillars computation."""
+
+    rule_id: str = "KR_classic_v1.4"
+    count: int
+    results: list[PillarsBatchResult]
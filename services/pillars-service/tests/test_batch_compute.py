@@ -0,0 +1,105 @@
+import random
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+from app.core.pillars import default_calculator
+from app.main import app
+from fastapi.testclient import TestClient
+
+client = TestClient(app)
+
+TIMEZONES = [
+    "Asia/Seoul",
+    "America/New_York",
+    "Europe/London",
+    "Asia/Kolkata",
+    "Pacific/Kiritimati",
+]
+
+
+def _scalar(calculator, local_dt, timezone):
+    result = calculator.compute(local_dt, timezone)
+    term = result["month_term"]
+    return (result["year"], result["month"], result["day"], result["hour"], term.term)
+
+
+def _batch(rows):
+    return [(r.year, r.month, r.day, r.hour, r.month_term) for r in rows]
+
+
+def test_compute_many_matches_scalar_for_random_charts() -> None:
+    calculator = default_calculator()
+    rng = random.Random(20251016)
+    start = datetime(1901, 1, 1)
+    span_minutes = int((datetime(2050, 12, 31) - start).total_seconds() // 60)
+    items = [
+        (start + timedelta(minutes=rng.randrange(span_minutes)), rng.choice(TIMEZONES))
+        for _ in range(2000)
+    ]
+
+    expected = [_scalar(calculator, dt, tz) for dt, tz in items]
+    assert _batch(calculator.compute_many(items)) == expected
+
+
+def test_compute_many_matches_scalar_near_term_boundaries() -> None:
+    calculator = default_calculator()
+    index = calculator.month_resolver.loader.index
+    items = []
+    for year in (1948, 1987, 1988, 2000, 2024):
+        for record in index.year_entries(year):
+            for tz in ("Asia/Seoul", "America/New_York"):
+                local = record.utc_time.astimezone(ZoneInfo(tz)).replace(tzinfo=None)
+                for seconds in (-3600, -1, 0, 1, 3600):
+                    items.append((local + timedelta(seconds=seconds), tz))
+
+    expected = [_scalar(calculator, dt, tz) for dt, tz in items]
+    assert _batch(calculator.compute_many(items)) == expected
+
+
+def test_compute_many_preserves_order_and_term_instant() -> None:
+    calculator = default_calculator()
+    items = [
+        (datetime(2000, 1, 1, 0, 30), "Asia/Seoul"),
+        (datetime(1992, 7, 15, 23, 40), "Asia/Seoul"),
+        (datetime(2000, 1, 1, 0, 30), "America/New_York"),
+    ]
+    rows = calculator.compute_many(items)
+    assert [r.year for r in rows] == ["庚辰", "壬申", "庚辰"]
+    scalar = calculator.compute(*items[1])
+    assert rows[1].month_term_utc == scalar["month_term"].utc_time
+
+
+def test_compute_many_raises_without_data() -> None:
+    calculator = default_calculator()
+    with pytest.raises(ValueError, match="No solar term data"):
+        calculator.compute_many([(datetime(1850, 5, 1, 12, 0), "Asia/Seoul")])
+
+
+def test_batch_endpoint_returns_results_in_order() -> None:
+    payload = {
+        "items": [
+            {"localDateTime": "1992-07-15T23:40:00", "timezone": "Asia/Seoul"},
+            {"localDateTime": "2000-09-14T10:00:00", "timezone": "Asia/Seoul"},
+        ],
+        "rules": "KR_classic_v1.4",
+    }
+    response = client.post("/v2/pillars/compute:batch", json=payload)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["count"] == 2
+    assert data["rule_id"] == "KR_classic_v1.4"
+    first = data["results"][0]
+    single = client.post(
+        "/v2/pillars/compute",
+        json={"localDateTime": "1992-07-15T23:40:00", "timezone": "Asia/Seoul"},
+    ).json()["pillars"]
+    assert [first[k] for k in ("year", "month", "day", "hour")] == [
+        single[k]["pillar"] for k in ("year", "month", "day", "hour")
+    ]
+    assert first["monthTerm"] == single["month"]["term"]
+
+
+def test_batch_endpoint_rejects_empty_batch() -> None:
+    response = client.post("/v2/pillars/compute:batch", json={"items": []})
+    assert response.status_code == 422
@@ -0,0 +1,41 @@
+from datetime import datetime
+
+from app.api.routes import get_engine
+from app.core import engine as engine_module
+from app.core.engine import PillarsEngine, get_default_engine, reload_default_engine
+from app.models import PillarsComputeRequest
+from saju_common.engines import LuckContext
+from saju_common.policy_bundle import PolicyBundle
+
+
+def test_routes_share_one_engine() -> None:
+    assert get_engine() is get_engine() is get_default_engine()
+
+
+def test_shared_term_window_matches_standalone_luck_calc() -> None:
+    engine = PillarsEngine()
+    local_dt = datetime(1992, 7, 15, 23, 40)
+    request = PillarsComputeRequest(
+        localDateTime=local_dt, timezone="Asia/Seoul", rules="KR_classic_v1.4"
+    )
+    evidence = engine.compute(request).trace.evidence
+
+    standalone = engine.evidence_builder.luck_calculator.compute_start_age(
+        LuckContext(local_dt=local_dt, timezone="Asia/Seoul")
+    )
+    assert evidence["luck_calc"] == standalone
+    assert evidence["solar_terms"]["next_term"] == standalone["next_term"]
+
+
+def test_reload_swaps_default_engine(monkeypatch) -> None:
+    old = get_default_engine()
+    monkeypatch.setattr(engine_module, "_default_engine", old)
+    request = PillarsComputeRequest(
+        localDateTime=datetime(1992, 7, 15, 23, 40), timezone="Asia/Seoul", rules="KR_classic_v1.4"
+    )
+
+    new = reload_default_engine(PolicyBundle.build())
+
+    assert get_engine() is new and new is not old
+    # Same policy files, so bundle-built and file-built engines agree
+    assert new.compute(request) == old.compute(request)
@@ -4,10 +4,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from zoneinfo import ZoneInfo
 
 from services.common import TraceMetadata
 from services.common.saju_common import SimpleDeltaT
+from services.common.saju_common.tz_registry import get_zone
 
 from ..models import TimeConversionRequest, TimeConversionResponse
 from .events import TimeEventDetector
@@ -16,7 +16,7 @@ from .events import TimeEventDetector
 def _ensure_awareness(instant: datetime, tz_name: str) -> datetime:
     """Attach a timezone if the datetime is naive."""
     if instant.tzinfo is None:
-        return instant.replace(tzinfo=ZoneInfo(tz_name))
+        return instant.replace(tzinfo=get_zone(tz_name))
     return instant
 
 
@@ -35,8 +35,8 @@ class TimezoneConverter:
 
     def convert(self, request: TimeConversionRequest) -> TimeConversionResponse:
         src = _ensure_awareness(request.instant, request.source_tz)
-        src = src.astimezone(ZoneInfo(request.source_tz))
-        converted = src.astimezone(ZoneInfo(request.target_tz))
+        src = src.astimezone(get_zone(request.source_tz))
+        converted = src.astimezone(get_zone(request.target_tz))
         events = self.event_detector.detect(request)
 
         # Calculate Delta-T for astronomical accuracy
@@ -4,7 +4,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from zoneinfo import ZoneInfo
+
+from services.common.saju_common.tz_registry import UTC
 
 from ..models import TimeConversionRequest, TimeEvent
 
@@ -49,6 +50,12 @@ KOREAN_TZ_EVENTS = [
     },
 ]
 
+# (zone, UTC epoch, event) per event; naive effective_from values are read as UTC
+_EVENT_EPOCHS = [
+    (event["iana"], event["effective_from"].replace(tzinfo=UTC).timestamp(), event)
+    for event in KOREAN_TZ_EVENTS
+]
+
 
 @dataclass(slots=True)
 class TimeEventDetector:
@@ -56,28 +63,6 @@ class TimeEventDetector:
 
     transition_window_hours: int = 48
 
-    def _is_relevant_event(self, event_time: datetime, request_time: datetime) -> bool:
-        """Check if event is within temporal window of request.
-
-        Args:
-            event_time: When the timezone event occurred
-            request_time: The instant being converted
-
-        Returns:
-            True if event is within transition_window_hours of request
-        """
-        # Ensure both datetimes are timezone-aware for comparison
-        if event_time.tzinfo is None:
-            event_time = event_time.replace(tzinfo=ZoneInfo("UTC"))
-        if request_time.tzinfo is None:
-            request_time = request_time.replace(tzinfo=ZoneInfo("UTC"))
-
-        # Calculate time delta in seconds
-        delta_seconds = abs((event_time - request_time).total_seconds())
-        window_seconds = self.transition_window_hours * 3600
-
-        return delta_seconds <= window_seconds
-
     def detect(self, request: TimeConversionRequest) -> list[TimeEvent]:
         """Analyze timezone transitions relevant to the request.
 
@@ -89,25 +74,17 @@ class TimeEventDetector:
         Returns:
             List of relevant timezone events (empty if none within window)
         """
-        relevant_events: list[TimeEvent] = []
-        instant = request.instant
         zones = {request.source_tz, request.target_tz}
-
+        instant = request.instant
         # Ensure request instant is timezone-aware
         if instant.tzinfo is None:
-            instant = instant.replace(tzinfo=ZoneInfo("UTC"))
+            instant = instant.replace(tzinfo=UTC)
+        instant_epoch = instant.timestamp()
+        window_seconds = self.transition_window_hours * 3600
 
         # Filter KOREAN_TZ_EVENTS by zone and temporal relevance
-        for event_data in KOREAN_TZ_EVENTS:
-            # Check if event's zone is in request zones
-            if event_data["iana"] not in zones:
-                continue
-
-            # Check if event is within temporal window
-            if not self._is_relevant_event(event_data["effective_from"], instant):
-                continue
-
-            # Event is relevant - add to results
-            relevant_events.append(TimeEvent(**event_data))
-
-        return relevant_events
+        return [
+            TimeEvent(**event_data)
+            for iana, event_epoch, event_data in _EVENT_EPOCHS
+            if iana in zones and abs(event_epoch - instant_epoch) <= window_seconds
+        ]
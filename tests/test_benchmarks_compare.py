@@ -0,0 +1,60 @@
+"""Regression gate of benchmarks/compare.py."""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.compare import compare, main
+from benchmarks.stats import StageRecorder, percentile
+
+
+def _stage(p50, p95):
+    return {"p50_ms": p50, "p95_ms": p95}
+
+
+def test_percentile_nearest_rank():
+    samples = [float(i) for i in range(1, 101)]
+    assert percentile(samples, 50) == 50.0
+    assert percentile(samples, 95) == 95.0
+    assert percentile(samples, 99) == 99.0
+    assert percentile([], 50) == 0.0
+
+
+def test_recorder_skips_samples_while_disabled():
+    recorder = StageRecorder()
+    recorder.enabled = False
+    recorder.time("stage", lambda: None)
+    recorder.enabled = True
+    recorder.time("stage", lambda: None)
+
+    summary = recorder.summary()["stage"]
+    assert summary["count"] == 1
+    assert summary["p50_ms"] <= summary["p99_ms"]
+
+
+def test_regression_beyond_tolerance_is_reported():
+    baseline = {"analyze": _stage(1.0, 2.0)}
+    current = {"analyze": _stage(1.1, 2.6)}
+
+    regressions = compare(baseline, current, tolerance=0.2)
+    assert [(r.stage, r.metric) for r in regressions] == [("analyze", "p95_ms")]
+
+
+def test_tiny_absolute_changes_are_noise():
+    baseline = {"shensha": _stage(0.002, 0.003)}
+    current = {"shensha": _stage(0.004, 0.009)}
+
+    assert compare(baseline, current, tolerance=0.2, min_delta_ms=0.05) == []
+
+
+def test_missing_stage_fails_and_new_stage_does_not(tmp_path):
+    base = tmp_path / "base.json"
+    cur = tmp_path / "cur.json"
+    base.write_text(json.dumps({"stages": {"a": _stage(1, 1)}}))
+    cur.write_text(json.dumps({"stages": {"b": _stage(1, 1)}}))
+    assert main([str(base), str(cur)]) == 1
+
+    cur.write_text(json.dumps({"stages": {"a": _stage(1, 1), "b": _stage(9, 9)}}))
+    assert main([str(base), str(cur)]) == 0
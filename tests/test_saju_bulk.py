@@ -0,0 +1,136 @@
+"""saju-bulk: streaming export, error rows and crash resume."""
+
+import importlib
+import json
+import os
+import subprocess
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from saju_bulk import engines
+from saju_bulk.cli import BulkConfig, run
+from saju_bulk.sinks import Checkpoint
+
+BIRTHS = [
+    ("a", "1992-07-15T23:40:00", "Asia/Seoul", "M"),
+    ("b", "1988-05-08T01:30:00", "Asia/Seoul", "F"),
+    ("c", "1975-01-02T12:00:00", "America/New_York", "M"),
+    ("d", "2000-09-14T10:00:00+09:00", "Asia/Seoul", "F"),
+    ("e", "1963-12-13T06:15:00", "Asia/Tokyo", "M"),
+    ("f", "2010-02-03T23:59:00", "Europe/London", "F"),
+    ("g", "1954-03-21T00:30:00", "Asia/Seoul", "M"),
+]
+
+
+@pytest.fixture
+def births(tmp_path, monkeypatch):
+    # Run away from the repo root: policy paths must not depend on the cwd
+    monkeypatch.chdir(tmp_path)
+    path = tmp_path / "births.jsonl"
+    lines = [
+        json.dumps({"id": i, "local_datetime": dt, "timezone": tz, "gender": g})
+        for i, dt, tz, g in BIRTHS
+    ]
+    lines.insert(3, "{not json")
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+def _read(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def _config(births, out, **kwargs):
+    kwargs.setdefault("analysis", False)
+    return BulkConfig(
+        input=births, output=out, workers=0, chunk_size=2, progress_interval=0, **kwargs
+    )
+
+
+def test_pillars_only_export_keeps_order_and_error_rows(births, tmp_path):
+    out = tmp_path / "out.jsonl"
+    stats = run(_config(births, out))
+
+    rows = _read(out)
+    assert [r["row"] for r in rows] == list(range(len(BIRTHS) + 1))
+    assert stats.rows == len(rows) and stats.errors == 1 and stats.complete
+    assert rows[3]["error"].startswith("ValueError: invalid JSON")
+    calculator = importlib.import_module("pillars_app.core.pillars").default_calculator()
+    for row, (_, dt, tz, _) in zip(rows[:3], BIRTHS):
+        single = calculator.compute(datetime.fromisoformat(dt), tz)
+        assert row["pillars"] == {k: single[k] for k in ("year", "month", "day", "hour")}
+    assert rows[4]["id"] == "d" and rows[4]["birth_dt"] == "2000-09-14T10:00:00+09:00"
+    assert "analysis" not in rows[0]
+    assert Path.cwd() == tmp_path
+
+
+def test_analysis_error_rows_are_counted(births, tmp_path, monkeypatch):
+    process = engines.BulkWorker.process
+
+    def failing_analysis(self, rows):
+        out = process(self, rows)
+        for row in out:
+            if row["id"] == "b":
+                row["analysis"] = {"status": "error", "error_message": "boom"}
+        return out
+
+    monkeypatch.setattr(engines.BulkWorker, "process", failing_analysis)
+    stats = run(_config(births, tmp_path / "out.jsonl"))
+    assert stats.errors == 2  # the invalid JSON line plus the failed analysis
+
+
+def test_resume_truncates_partial_tail(births, tmp_path):
+    expected = tmp_path / "expected.jsonl"
+    run(_config(births, expected))
+
+    out = tmp_path / "out.jsonl"
+    first = run(_config(births, out, limit=4))
+    assert not first.complete
+    # Simulate a crash mid-write after the last checkpoint
+    with out.open("ab") as fh:
+        fh.write(b'{"row": 4, "id": "d", "pil')
+
+    second = run(_config(births, out, resume=True))
+    assert second.resumed_from == 4 and second.complete
+    assert out.read_bytes() == expected.read_bytes()
+    assert run(_config(births, out, resume=True)).rows == 0
+
+
+def test_resume_rejects_other_run(births, tmp_path):
+    out = tmp_path / "out.jsonl"
+    run(_config(births, out, limit=2))
+    with pytest.raises(ValueError, match="different run"):
+        run(_config(births, out, resume=True, analysis=True))
+    assert Checkpoint.load(out).rows_done == 2
+
+
+def test_process_pool_with_analysis(births, tmp_path):
+    # A separate interpreter: unlike this test process, the CLI's parent has no
+    # analysis-service on sys.path, so worker results must unpickle without it
+    out = tmp_path / "out.jsonl"
+    env = {**os.environ, "PYTHONPATH": str(REPO_ROOT)}
+    proc = subprocess.run(
+        [sys.executable, "-m", "saju_bulk", str(births), str(out)]
+        + ["--workers", "2", "--chunk-size", "3", "--progress-interval", "0"],
+        cwd=tmp_path,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=600,
+    )
+    assert proc.returncode == 0, proc.stderr[-2000:]
+
+    stats = json.loads(proc.stdout.strip().splitlines()[-1])
+    rows = _read(out)
+    assert stats["rows"] == len(rows) == len(BIRTHS) + 1
+    assert stats["rows_per_s"] > 0
+    ok = [r for r in rows if "error" not in r]
+    assert len(ok) == len(BIRTHS)
+    assert all(r["analysis"]["status"] == "success" for r in ok)
+    assert stats["errors"] == 1